@@ -80,30 +80,14 @@ class InfinityClient(BaseClient):
         _, ext = os.path.splitext(dataset_path)
         if ext == ".json":
             with open(dataset_path, "r") as f:
-                actions = []
-                for i, line in enumerate(f):
-                    if i % batch_size == 0 and i != 0:
-                        table_obj.insert(actions)
-                        actions = []
-                    record = json.loads(line)
-                    action = {}
-                    for feature in features:
-                        action[feature] = record.get(feature, "")
-                    actions.append(action)
-                if actions:
-                    table_obj.insert(actions)
+                records = (json.loads(line) for line in f)
+                actions = ({feature: record.get(feature, "") for feature in features} for record in records)
+                infinity.bulk.load(table_obj, actions, batch_rows=batch_size)
         elif ext == ".hdf5":
             with h5py.File(dataset_path, "r") as f:
-                actions = []
                 # line is vector
-                for i, line in enumerate(f["train"]):
-                    if i % batch_size == 0 and i != 0:
-                        table_obj.insert(actions)
-                        actions = []
-                    record = {self.data["vector_name"]: line.tolist()}
-                    actions.append(record)
-                if actions:
-                    table_obj.insert(actions)
+                actions = ({self.data["vector_name"]: line.tolist()} for line in f["train"])
+                infinity.bulk.load(table_obj, actions, batch_rows=batch_size)
         elif ext == ".csv":
             if self.data["use_import"]:
                 table_obj.import_data(dataset_path, import_options={"delimiter": "\t"})
@@ -150,6 +134,15 @@ class InfinityClient(BaseClient):
         else:
             raise TypeError("Unsupport file type!")
 
+    def run_experiment(self, args):
+        # "metrics_url" (the server /metrics endpoint) logs the server side latencies of the run next to the client ones
+        metrics_url = self.data.get("metrics_url")
+        if metrics_url is None:
+            return BaseClient.run_experiment(self, args)
+        before = infinity.metrics.scrape(metrics_url)
+        BaseClient.run_experiment(self, args)
+        logging.info(f"server side metrics:\n{(infinity.metrics.scrape(metrics_url) - before).summary()}")
+
     def setup_clients(self, num_threads=1):
         host, port = self.data["host"].split(":")
         self.clients = list()
@@ -0,0 +1,63 @@
+import argparse
+import statistics
+import subprocess
+import sys
+
+# dependencies that `import infinity` must not load, they are imported by the calls that need them
+LAZY_MODULES = ("pandas", "polars", "pyarrow", "sqlglot")
+
+MEASURE = """
+import sys, time
+start = time.perf_counter()
+import infinity
+print(time.perf_counter() - start)
+print(",".join(name for name in {lazy_modules!r} if name in sys.modules))
+"""
+
+
+def measure_import(python: str) -> (float, list[str]):
+    # a fresh interpreter per run, so nothing is imported yet
+    output = subprocess.run([python, "-c", MEASURE.format(lazy_modules=LAZY_MODULES)], check=True,
+                            capture_output=True, text=True).stdout.splitlines()
+    return float(output[0]), [name for name in output[1].split(",") if name]
+
+
+def slowest_imports(python: str, count: int) -> list[(int, str)]:
+    stderr = subprocess.run([python, "-X", "importtime", "-c", "import infinity"], check=True,
+                            capture_output=True, text=True).stderr
+    imports = []
+    for line in stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        imports.append((int(cumulative), name.rstrip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Time `import infinity` in fresh interpreters")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="exit with 1 if the median import time exceeds it")
+    parser.add_argument("--top", type=int, default=15, help="print the slowest imports")
+    parser.add_argument("--python", default=sys.executable)
+    args = parser.parse_args()
+
+    durations = []
+    loaded = set()
+    for _ in range(args.runs):
+        duration, modules = measure_import(args.python)
+        durations.append(duration)
+        loaded.update(modules)
+    median = statistics.median(durations)
+    print(f"import infinity: median {median * 1000:.1f} ms, min {min(durations) * 1000:.1f} ms, "
+          f"max {max(durations) * 1000:.1f} ms over {args.runs} runs")
+    for cumulative, name in slowest_imports(args.python, args.top):
+        print(f"{cumulative / 1000:10.1f} ms  {name}")
+
+    failed = False
+    if loaded:
+        print(f"import infinity loaded {sorted(loaded)}, they should only be imported on first use")
+        failed = True
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"median import time {median:.3f} s exceeds {args.max_seconds} s")
+        failed = True
+    sys.exit(1 if failed else 0)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+
 from infinity_embedded.errors import ErrorCode as PyErrorCode
 from infinity_embedded.common import LOCAL_INFINITY_PATH, LOCAL_INFINITY_CONFIG_PATH
 from infinity_embedded.embedded_infinity_ext import *
@@ -44,19 +46,49 @@ class LocalQueryResult:
         self.extra_result = extra_result
 
 
+class LocalSession:
+    # a session of the embedded instance, closed when the thread owning it exits
+    def __init__(self, connected: threading.Event):
+        self.connected = connected
+        self.infinity = Infinity.LocalConnect()
+
+    def __del__(self):
+        if self.connected.is_set():
+            self.infinity.LocalDisconnect()
+
+
 class LocalInfinityClient:
+    """
+    Thread safety: a LocalInfinityClient may be shared by any number of threads. Every thread gets its own session
+    on first use, since a session runs one request at a time, and requests run without the GIL, so searches from a
+    thread pool use as many cores as there are threads. disconnect() shuts the embedded instance down and must only
+    be called once the other threads are done with the client.
+    """
+
     def __init__(self, path: str = LOCAL_INFINITY_PATH, config_path=LOCAL_INFINITY_CONFIG_PATH):
         self.path = path
+        self._connected = threading.Event()
+        self._sessions = threading.local()
         Infinity.LocalInit(path, config_path)
-        self.client = Infinity.LocalConnect()
+        self._connected.set()
+
+    @property
+    def client(self):
+        # the session of the calling thread, None once disconnected
+        if not self._connected.is_set():
+            return None
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = self._sessions.session = LocalSession(self._connected)
+        return session.infinity
 
     def __del__(self):
-        if self.client is not None:
+        if self._connected.is_set():
             self.disconnect()
 
     def disconnect(self):
+        self._connected.clear()
         Infinity.LocalUnInit()
-        self.client = None
         return LocalQueryResult(PyErrorCode.OK, "")
 
     def hello(self):
@@ -190,11 +222,24 @@ class LocalInfinityClient:
                 retry += 1
         return PyErrorCode.TOO_MANY_CONNECTIONS, "insert failed with exception: " + str(inner_ex)
 
+    def insert_columns(self, db_name: str, table_name: str, columns: list[WrapInsertColumn], row_count: int):
+        if self.client is None:
+            raise Exception("Local infinity is not connected")
+        return self.convert_res(self.client.InsertColumns(db_name, table_name, columns, row_count))
+
     def import_data(self, db_name: str, table_name: str, file_name: str, import_options):
         if self.client is None:
             raise Exception("Local infinity is not connected")
         return self.convert_res(self.client.Import(db_name, table_name, file_name, import_options))
 
+    def import_arrow(self, db_name: str, table_name: str, data):
+        # data is an arrow IPC stream, handed to the engine without a file in between
+        if self.client is None:
+            raise Exception("Local infinity is not connected")
+        import_options = ImportOptions()
+        import_options.copy_file_type = CopyFileType.kARROW
+        return self.convert_res(self.client.ImportData(db_name, table_name, data, import_options))
+
     def export_data(self, db_name: str, table_name: str, file_name: str, export_options, columns: list[str]):
         if self.client is None:
             raise Exception("Local infinity is not connected")
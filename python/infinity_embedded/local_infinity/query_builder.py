@@ -26,13 +26,26 @@ from sqlglot import condition, maybe_parse
 
 from infinity_embedded.common import VEC, SparseVector, InfinityException, SortType
 from infinity_embedded.embedded_infinity_ext import *
-from infinity_embedded.local_infinity.types import logic_type_to_dtype, make_match_tensor_expr
+from infinity_embedded.local_infinity.types import logic_type_to_dtype, make_match_tensor_expr, build_result
 from infinity_embedded.local_infinity.utils import traverse_conditions, parse_expr
 from infinity_embedded.local_infinity.utils import get_search_optional_filter_from_opt_params
 from infinity_embedded.table import ExplainType as BaseExplainType
 from infinity_embedded.errors import ErrorCode
 
 
+def build_df_result(res: WrapQueryResult) -> (pd.DataFrame, {}):
+    df_dict = {}
+    data_dict, data_type_dict, extra_result = build_result(res, as_numpy=True)
+    for k, v in data_dict.items():
+        if isinstance(v, np.ndarray) and v.ndim == 2:
+            # one row view per embedding instead of a python list of floats
+            data_series = pd.Series(list(v), dtype=object)
+        else:
+            data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
+        df_dict[k] = data_series
+    return pd.DataFrame(df_dict), extra_result
+
+
 class Query(ABC):
     def __init__(
             self,
@@ -704,6 +717,9 @@ class InfinityLocalQueryBuilder(ABC):
         return self
 
     def to_result(self) -> tuple[dict[str, list[Any]], dict[str, Any], {}]:
+        return self._to_result(build_result)
+
+    def _to_result(self, result_builder) -> tuple[dict[str, Any], dict[str, Any], {}]:
         query = Query(
             columns=self._columns,
             highlight=self._highlight,
@@ -717,15 +733,10 @@ class InfinityLocalQueryBuilder(ABC):
             total_hits_count=self._total_hits_count,
         )
         self.reset()
-        return self._table._execute_query(query)
+        return self._table._execute_query(query, result_builder)
 
     def to_df(self) -> (pd.DataFrame, {}):
-        df_dict = {}
-        data_dict, data_type_dict, extra_result = self.to_result()
-        for k, v in data_dict.items():
-            data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
-            df_dict[k] = data_series
-        return pd.DataFrame(df_dict), extra_result
+        return self._to_result(build_df_result)
 
     def to_pl(self) -> (pl.DataFrame, {}):
         dataframe, extra_result = self.to_df()
@@ -16,6 +16,11 @@ import functools
 import inspect
 from typing import Optional, Union, List, Any
 
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
 from infinity_embedded.embedded_infinity_ext import ConflictType as LocalConflictType
 from infinity_embedded.embedded_infinity_ext import ImportOptions, CopyFileType, WrapParsedExpr, \
     ParsedExprType, WrapUpdateExpr, ExportOptions, WrapOptimizeOptions, WrapOrderByExpr, WrapInsertRowExpr
@@ -24,7 +29,8 @@ from infinity_embedded.common import INSERT_DATA, VEC, SparseVector, InfinityExc
 from infinity_embedded.errors import ErrorCode
 from infinity_embedded.index import IndexInfo
 from infinity_embedded.local_infinity.query_builder import Query, InfinityLocalQueryBuilder, ExplainQuery
-from infinity_embedded.local_infinity.types import build_result
+from infinity_embedded.local_infinity.types import build_result, values_to_insert_column, arrow_column_to_values, \
+    arrow_to_import_stream
 from infinity_embedded.local_infinity.utils import traverse_conditions, select_res_to_polars
 from infinity_embedded.local_infinity.utils import get_local_constant_expr_from_python_value
 from infinity_embedded.local_infinity.utils import name_validity_check, check_valid_name, get_ordinary_info
@@ -177,6 +183,42 @@ class LocalTable():
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
+    def insert_columns(self, columns: dict[str, Any]):
+        # {"c1": np.array([1, 2]), "c2": np.random.rand(2, 128).astype(np.float32), "c3": ["a", "b"]}
+        row_count = None
+        for column_name, values in columns.items():
+            if row_count is None:
+                row_count = len(values)
+            elif len(values) != row_count:
+                raise InfinityException(ErrorCode.COLUMN_COUNT_MISMATCH,
+                                        f"Column {column_name} has {len(values)} rows, expected {row_count}")
+        if not columns or row_count == 0:
+            raise InfinityException(ErrorCode.INSERT_WITHOUT_VALUES, "Insert without values")
+
+        insert_columns = [values_to_insert_column(column_name, values) for column_name, values in columns.items()]
+        if any(insert_column is None for insert_column in insert_columns):
+            # sparse, tensor and multivector columns only go through the row insert
+            column_values = [values.to_pylist() if isinstance(values, pa.Array) else list(values)
+                             for values in columns.values()]
+            return self.insert([{column_name: value.tolist() if isinstance(value, np.ndarray | np.generic) else value
+                                 for column_name, value in zip(columns.keys(), row)} for row in zip(*column_values)])
+
+        res = self._conn.insert_columns(db_name=self._db_name, table_name=self._table_name, columns=insert_columns,
+                                        row_count=row_count)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def insert_arrow(self, data: pa.Table):
+        return self.insert_columns(
+            {column_name: arrow_column_to_values(data.column(column_name)) for column_name in data.column_names})
+
+    def insert_df(self, data: Union[pd.DataFrame, pl.DataFrame]):
+        if isinstance(data, pl.DataFrame):
+            return self.insert_arrow(data.to_arrow())
+        return self.insert_columns({column_name: data[column_name].to_numpy() for column_name in data.columns})
+
     def import_data(self, file_path: str, import_options: {} = None):
         options = ImportOptions()
         options.header = False
@@ -199,6 +241,10 @@ class LocalTable():
                         options.copy_file_type = CopyFileType.kCSR
                     elif file_type == 'bvecs':
                         options.copy_file_type = CopyFileType.kBVECS
+                    elif file_type == 'parquet':
+                        options.copy_file_type = CopyFileType.kPARQUET
+                    elif file_type in ('arrow', 'feather'):
+                        options.copy_file_type = CopyFileType.kARROW
                     else:
                         raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
                                                 f"Unrecognized export file type: {file_type}")
@@ -226,6 +272,22 @@ class LocalTable():
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
+    def import_arrow(self, data: pa.Table | pa.RecordBatchReader):
+        # the rows go through the same segment building as import_data, handed over as an arrow stream
+        columns = self.show_columns()
+        stream = arrow_to_import_stream(data, dict(zip(columns["name"], columns["type"])))
+        res = self._conn.import_arrow(db_name=self._db_name, table_name=self._table_name,
+                                      data=np.frombuffer(stream, dtype=np.uint8))
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def import_df(self, data: Union[pd.DataFrame, pl.DataFrame]):
+        if isinstance(data, pl.DataFrame):
+            return self.import_arrow(data.to_arrow())
+        return self.import_arrow(pa.Table.from_pandas(data, preserve_index=False))
+
     def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
         options = ExportOptions()
         options.header = False
@@ -242,6 +304,10 @@ class LocalTable():
                         options.copy_file_type = CopyFileType.kJSONL
                     elif file_type == 'fvecs':
                         options.copy_file_type = CopyFileType.kFVECS
+                    elif file_type == 'parquet':
+                        options.copy_file_type = CopyFileType.kPARQUET
+                    elif file_type in ('arrow', 'feather'):
+                        options.copy_file_type = CopyFileType.kARROW
                     else:
                         raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
                                                 f"Unrecognized export file type: {file_type}")
@@ -447,7 +513,7 @@ class LocalTable():
 
         return ""
 
-    def _execute_query(self, query: Query):
+    def _execute_query(self, query: Query, result_builder=build_result):
         # execute the query
         highlight = []
         if query.highlight is not None:
@@ -479,7 +545,7 @@ class LocalTable():
 
         # process the results
         if res.error_code == ErrorCode.OK:
-            return build_result(res)
+            return result_builder(res)
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
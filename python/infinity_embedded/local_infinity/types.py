@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 import struct
 import json
 from collections import defaultdict
 from typing import Any
 import numpy as np
+import pyarrow as pa
 from numpy import dtype
 from infinity_embedded.common import VEC, SparseVector, InfinityException
 from infinity_embedded.embedded_infinity_ext import *
@@ -261,58 +263,81 @@ def parse_single_tensorarray_bytes(column_data_type: WrapDataType, bytes_data, o
     return tensorarray_data, offset
 
 
+POD_COLUMN_DTYPES = {
+    LogicalType.kBoolean: np.dtype('?'),
+    LogicalType.kTinyInt: np.dtype('<i1'),
+    LogicalType.kSmallInt: np.dtype('<i2'),
+    LogicalType.kInteger: np.dtype('<i4'),
+    LogicalType.kBigInt: np.dtype('<i8'),
+    LogicalType.kFloat16: np.dtype('<f2'),
+    LogicalType.kFloat: np.dtype('<f4'),
+    LogicalType.kDouble: np.dtype('<f8'),
+}
+
+EMBEDDING_ELEMENT_DTYPES = {
+    EmbeddingDataType.kElemUInt8: np.dtype('<u1'),
+    EmbeddingDataType.kElemInt8: np.dtype('<i1'),
+    EmbeddingDataType.kElemInt16: np.dtype('<i2'),
+    EmbeddingDataType.kElemInt32: np.dtype('<i4'),
+    EmbeddingDataType.kElemFloat16: np.dtype('<f2'),
+    EmbeddingDataType.kElemFloat: np.dtype('<f4'),
+    EmbeddingDataType.kElemDouble: np.dtype('<f8'),
+}
+
+
+def column_vectors_to_array(column_vectors, dtype: np.dtype) -> np.ndarray:
+    # the engine hands fixed-width columns over as read-only views of the result, one per data block,
+    # a single block is wrapped as is and several are copied once
+    if len(column_vectors) == 1:
+        return np.frombuffer(column_vectors[0], dtype=dtype)
+    if not column_vectors:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate([np.frombuffer(column_vector, dtype=dtype) for column_vector in column_vectors])
+
+
+def fixed_width_column_to_array(column_type, column_data_type, column_vectors) -> np.ndarray | None:
+    if column_type in POD_COLUMN_DTYPES:
+        return column_vectors_to_array(column_vectors, POD_COLUMN_DTYPES[column_type])
+    if column_type == LogicalType.kEmbedding:
+        embedding_type = column_data_type.embedding_type
+        if embedding_type.element_type in EMBEDDING_ELEMENT_DTYPES:
+            flat = column_vectors_to_array(column_vectors, EMBEDDING_ELEMENT_DTYPES[embedding_type.element_type])
+            return flat.reshape(-1, embedding_type.dimension)
+    return None
+
+
+def column_vector_to_array(column_type, column_data_type, column_vectors) -> np.ndarray | list[Any, ...]:
+    """
+    Decode a result column into a numpy array without building intermediate python objects.
+    Fixed-width columns become 1-D arrays and embedding columns become (rows, dimension) arrays,
+    both read-only views of the engine's result where possible. Other columns fall back to column_vector_to_list.
+    """
+    array = fixed_width_column_to_array(column_type, column_data_type, column_vectors)
+    if array is not None:
+        return array
+    if column_type == LogicalType.kBFloat16:
+        return np.array(bf16_bytes_to_float32_list(b''.join(column_vectors)), dtype=np.float32)
+    return column_vector_to_list(column_type, column_data_type, column_vectors)
+
+
 def column_vector_to_list(column_type, column_data_type, column_vectors) -> \
         list[Any, ...]:
+    array = fixed_width_column_to_array(column_type, column_data_type, column_vectors)
+    if array is not None:
+        return array.tolist()
     column_vector = b''.join(column_vectors)
     match column_type:
-        case LogicalType.kInteger:
-            return list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
-        case LogicalType.kBigInt:
-            return list(struct.unpack('<{}q'.format(len(column_vector) // 8), column_vector))
-        case LogicalType.kFloat:
-            return list(struct.unpack('<{}f'.format(len(column_vector) // 4), column_vector))
-        case LogicalType.kDouble:
-            return list(struct.unpack('<{}d'.format(len(column_vector) // 8), column_vector))
-        case LogicalType.kFloat16:
-            return list(struct.unpack('<{}e'.format(len(column_vector) // 2), column_vector))
         case LogicalType.kBFloat16:
             return bf16_bytes_to_float32_list(column_vector)
         case LogicalType.kVarchar:
             return list(parse_bytes(column_vector))
-        case LogicalType.kBoolean:
-            return list(struct.unpack('<{}?'.format(len(column_vector)), column_vector))
-        case LogicalType.kTinyInt:
-            return list(struct.unpack('<{}b'.format(len(column_vector)), column_vector))
-        case LogicalType.kSmallInt:
-            return list(struct.unpack('<{}h'.format(len(column_vector) // 2), column_vector))
         case LogicalType.kRowID:
             all_list = list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
             return [all_list[i:i + 2] for i in range(0, len(all_list), 2)]
         case LogicalType.kEmbedding:
             dimension = column_data_type.embedding_type.dimension
             element_type = column_data_type.embedding_type.element_type
-            if element_type == EmbeddingDataType.kElemUInt8:
-                all_list = list(struct.unpack('<{}B'.format(len(column_vector)), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif element_type == EmbeddingDataType.kElemInt8:
-                all_list = list(struct.unpack('<{}b'.format(len(column_vector)), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif element_type == EmbeddingDataType.kElemInt16:
-                all_list = list(struct.unpack('<{}h'.format(len(column_vector) // 2), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif element_type == EmbeddingDataType.kElemInt32:
-                all_list = list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif element_type == EmbeddingDataType.kElemFloat:
-                all_list = list(struct.unpack('<{}f'.format(len(column_vector) // 4), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif element_type == EmbeddingDataType.kElemDouble:
-                all_list = list(struct.unpack('<{}d'.format(len(column_vector) // 8), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif element_type == EmbeddingDataType.kElemFloat16:
-                all_list = list(struct.unpack('<{}e'.format(len(column_vector) // 2), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif element_type == EmbeddingDataType.kElemBFloat16:
+            if element_type == EmbeddingDataType.kElemBFloat16:
                 all_list = bf16_bytes_to_float32_list(column_vector)
                 return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
             elif element_type == EmbeddingDataType.kElemBit:
@@ -355,6 +380,185 @@ def column_vector_to_list(column_type, column_data_type, column_vectors) -> \
             raise NotImplementedError(f"Unsupported type {column_type}")
 
 
+INSERT_ELEMENT_TYPES = {dtype: element_type for element_type, dtype in EMBEDDING_ELEMENT_DTYPES.items()}
+INSERT_ELEMENT_TYPES[np.dtype('<i8')] = EmbeddingDataType.kElemInt64
+INSERT_ELEMENT_TYPES[np.dtype('bool')] = EmbeddingDataType.kElemBit
+
+# dtypes the engine has no type for are widened to the nearest one that holds every value
+INSERT_WIDENED_DTYPES = {
+    np.dtype('<u2'): np.dtype('<i4'),
+    np.dtype('<u4'): np.dtype('<i8'),
+    np.dtype('<u8'): np.dtype('<i8'),
+}
+
+
+def insert_array(data, elements: bool = False) -> np.ndarray:
+    data = np.asarray(data)
+    if data.dtype == object:
+        data = np.array(data.tolist())
+    elements = elements or data.ndim > 1
+    dtype = data.dtype.newbyteorder('<') if data.dtype.byteorder == '>' else data.dtype
+    dtype = INSERT_WIDENED_DTYPES.get(dtype, dtype)
+    if not elements and dtype == np.dtype('<u1'):
+        dtype = np.dtype('<i2')
+    return np.ascontiguousarray(data, dtype=dtype)
+
+
+def make_insert_column(column_name: str, data: np.ndarray, offsets: np.ndarray = None) -> WrapInsertColumn:
+    if data.dtype not in INSERT_ELEMENT_TYPES:
+        raise InfinityException(ErrorCode.INVALID_DATA_TYPE,
+                                f"Column {column_name}: unsupported element type {data.dtype} for columnar insert")
+    insert_column = WrapInsertColumn()
+    insert_column.column_name = column_name
+    insert_column.element_type = INSERT_ELEMENT_TYPES[data.dtype]
+    if data.ndim == 2 and data.dtype == np.dtype('bool'):
+        # bit embeddings, eight elements per byte
+        data = np.packbits(data, axis=1, bitorder='little')
+    insert_column.data = data.reshape(-1).view(np.uint8)
+    insert_column.offsets = np.empty(0, dtype='<i8') if offsets is None else offsets
+    return insert_column
+
+
+def varchar_insert_column(column_name: str, values) -> WrapInsertColumn:
+    if isinstance(values, pa.Array):
+        # arrow strings are passed as they are, the offsets only move to start at 0
+        _, offset_buffer, data_buffer = values.buffers()
+        offsets = np.frombuffer(offset_buffer, dtype='<i8')[values.offset:values.offset + len(values) + 1]
+        data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.empty(0, np.uint8)
+        data = data[offsets[0]:offsets[-1]]
+        offsets = offsets - offsets[0]
+    else:
+        chunks = [value.encode('utf-8') for value in values]
+        offsets = np.zeros(len(chunks) + 1, dtype='<i8')
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        data = np.frombuffer(b''.join(chunks), dtype=np.uint8)
+    insert_column = make_insert_column(column_name, np.empty(0, dtype=np.uint8), offsets)
+    insert_column.data = data
+    return insert_column
+
+
+def values_to_insert_column(column_name: str, values) -> WrapInsertColumn | None:
+    """
+    Wrap one column of insert values for Infinity::InsertColumns without copying numpy arrays that are already
+    contiguous and little endian. Numeric values become scalar columns, 2-D arrays (or lists of equally sized
+    vectors) embeddings and strings varchars. Returns None for values InsertColumns does not take, sparse vectors,
+    tensors and multivectors, which are inserted row by row instead.
+    """
+    if isinstance(values, pa.Array):
+        return varchar_insert_column(column_name, values)
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        first = None
+    else:
+        values = list(values)
+        if len(values) == 0:
+            raise InfinityException(ErrorCode.INSERT_WITHOUT_VALUES, f"Column {column_name} has no values")
+        if any(value is None for value in values):
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Column {column_name}: null values are not supported by columnar insert")
+        first = values[0]
+
+    if isinstance(first, str):
+        return varchar_insert_column(column_name, values)
+    if isinstance(first, (SparseVector, dict)) or (first is not None and np.ndim(first) > 1):
+        return None
+    if first is not None and np.ndim(first) == 1:
+        if len({len(value) for value in values}) != 1:
+            return None
+        data = insert_array(np.stack([np.asarray(value) for value in values]), True)
+    else:
+        data = insert_array(values)
+    if data.ndim > 2:
+        return None
+    return make_insert_column(column_name, data)
+
+
+def arrow_column_to_values(column: pa.Array | pa.ChunkedArray):
+    """
+    Turn an arrow column into values accepted by values_to_insert_column, keeping fixed-width, fixed size list
+    and string columns in their arrow buffers.
+    """
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    if column.null_count:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                "Null values are not supported by columnar insert")
+    if pa.types.is_fixed_size_list(column.type) and not pa.types.is_nested(column.type.value_type):
+        flat = column.flatten().to_numpy(zero_copy_only=False)
+        return flat.reshape(len(column), column.type.list_size)
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type) or pa.types.is_boolean(column.type):
+        return column.to_numpy(zero_copy_only=False)
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        return column.cast(pa.large_string())
+    if pa.types.is_struct(column.type):
+        # sparse vectors as produced by to_arrow: struct<indices: list, values: list>
+        return [SparseVector(**value) for value in column.to_pylist()]
+    return column.to_pylist()
+
+
+# arrow types import expects for the table column types (as listed by show_columns), columns of other types
+# are handed over as they are and have to match already
+IMPORT_ARROW_TYPES = {
+    "Boolean": pa.bool_(),
+    "TinyInt": pa.int8(),
+    "SmallInt": pa.int16(),
+    "Integer": pa.int32(),
+    "BigInt": pa.int64(),
+    "Float16": pa.float16(),
+    "Float": pa.float32(),
+    "Double": pa.float64(),
+    "Varchar": pa.string(),
+}
+
+IMPORT_ARROW_ELEMENT_TYPES = {
+    "uint8": pa.uint8(),
+    "int8": pa.int8(),
+    "int16": pa.int16(),
+    "int32": pa.int32(),
+    "int64": pa.int64(),
+    "float16": pa.float16(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+}
+
+
+def import_arrow_type(column_type: str) -> pa.DataType | None:
+    if column_type in IMPORT_ARROW_TYPES:
+        return IMPORT_ARROW_TYPES[column_type]
+    match = re.fullmatch(r"Embedding\((\w+),(\d+)\)", column_type)
+    if match is not None and match.group(1) in IMPORT_ARROW_ELEMENT_TYPES:
+        return pa.list_(IMPORT_ARROW_ELEMENT_TYPES[match.group(1)], int(match.group(2)))
+    return None
+
+
+def arrow_to_import_stream(data: pa.Table | pa.RecordBatchReader, column_types: dict[str, str]) -> pa.Buffer:
+    """
+    Serialize data as an arrow IPC stream for Infinity::ImportData, with the columns in table order and cast to the
+    arrow types the import expects, e.g. int64 to int32 for an integer column or lists of doubles to fixed size
+    lists of floats for a float embedding.
+    """
+    if isinstance(data, pa.RecordBatchReader):
+        data = data.read_all()
+    if set(data.column_names) != set(column_types) or len(data.column_names) != len(column_types):
+        raise InfinityException(ErrorCode.COLUMN_COUNT_MISMATCH,
+                                f"Columns {data.column_names} do not match the table columns {list(column_types)}")
+    columns = []
+    for column_name, column_type in column_types.items():
+        column = data.column(column_name)
+        arrow_type = import_arrow_type(column_type)
+        if arrow_type is not None and column.type != arrow_type:
+            try:
+                column = column.cast(arrow_type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise InfinityException(ErrorCode.DATA_TYPE_MISMATCH,
+                                        f"Column {column_name}: can't import {column.type} into {column_type}: {e}")
+        columns.append(column)
+    data = pa.Table.from_arrays(columns, names=list(column_types))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, data.schema) as writer:
+        writer.write_table(data)
+    return sink.getvalue()
+
+
 def parse_date_bytes(column_vector):
     parsed_list = list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
     date_list = []
@@ -526,7 +730,14 @@ def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embeddi
     match_tensor_expr.embedding_data = data
     return match_tensor_expr
 
-def build_result(res: WrapQueryResult) -> tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any], Any]:
+def build_result(res: WrapQueryResult, as_numpy: bool = False) -> \
+        tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any], Any]:
+    """
+    Decode a WrapQueryResult into (data_dict, data_type_dict, extra_result).
+    With as_numpy=True fixed-width and embedding columns are returned as numpy arrays (see column_vector_to_array)
+    instead of python lists.
+    """
+    decode_column = column_vector_to_array if as_numpy else column_vector_to_list
     data_dict = {}
     data_type_dict = {}
     column_counter = defaultdict(int)
@@ -540,7 +751,7 @@ def build_result(res: WrapQueryResult) -> tuple[dict[str | Any, list[Any, Any]],
         column_type = column_field.column_type
         column_data_type = column_def.column_type
         column_vectors = column_field.column_vectors
-        data_list = column_vector_to_list(column_type, column_data_type, column_vectors)
+        data_list = decode_column(column_type, column_data_type, column_vectors)
 
         data_dict[column_name] = data_list
         data_type_dict[column_name] = column_data_type
@@ -2,6 +2,8 @@ import re
 import time
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 import logging
 import json
 from test_pysdk.common.common_data import *
@@ -14,18 +16,45 @@ import pandas as pd
 import polars as pl
 import pyarrow as pa
 from infinity.table import ExplainType
-from typing import List
+from typing import List, Iterable, Callable
 from dataclasses import dataclass
 
+# connections kept open to the server, one per thread sending requests at the same time
+DEFAULT_POOL_SIZE = 10
+# rows per request of table_http.insert_stream
+DEFAULT_INSERT_CHUNK_SIZE = 1000
+
 
 class http_network_util:
     header_dict = baseHeader
     response_dict = baseResponse
     data_dict = baseData
 
-    def __init__(self, url: str = default_url):
+    def __init__(self, url: str = default_url, *, pool_size: int = DEFAULT_POOL_SIZE, keep_alive: bool = True,
+                 gzip: bool = False, timeout: float | None = None):
         self.base_url = url
         self.retry = False
+        self.timeout = timeout
+        # one session for all requests, so connections are reused instead of paying a TCP handshake per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.session.headers["Accept-Encoding"] = "gzip, deflate" if gzip else "identity"
+        # (database name, table name) -> {column name: column type}, see table_http.show_columns_type
+        self.column_types = {}
+
+    def close(self):
+        self.session.close()
+
+    def invalidate_column_types(self, database_name: str, table_name: str | None = None):
+        if table_name is not None:
+            self.column_types.pop((database_name, table_name), None)
+            return
+        for key in [key for key in self.column_types if key[0] == database_name]:
+            del self.column_types[key]
 
     def set_retry(self, retry: bool = True):
         self.retry = retry
@@ -89,16 +118,10 @@ class http_network_util:
         return self.request_inner(url, method, header, data)
 
     def request_inner(self, url, method, header={}, data={}):
-        match method:
-            case "get":
-                response = requests.get(url, headers=header, json=data)
-            case "post":
-                response = requests.post(url, headers=header, json=data)
-            case "put":
-                response = requests.put(url, headers=header, json=data)
-            case "delete":
-                response = requests.delete(url, headers=header, json=data)
-        return response
+        if isinstance(data, bytes):
+            # an already serialized body, e.g. the NDJSON chunks of table_http.insert_stream
+            return self.session.request(method.upper(), url, headers=header, data=data, timeout=self.timeout)
+        return self.session.request(method.upper(), url, headers=header, json=data, timeout=self.timeout)
 
     def raise_exception(self, resp, expect={}):
         logging.debug("status_code:" + str(resp.status_code))
@@ -142,14 +165,16 @@ class http_network_util:
 
 
 class infinity_http:
-    def __init__(self, *, net: http_network_util = None):
+    def __init__(self, *, net: http_network_util = None, url: str = default_url, pool_size: int = DEFAULT_POOL_SIZE,
+                 keep_alive: bool = True, gzip: bool = False, timeout: float | None = None):
         if net is not None:
             self.net = net
         else:
-            self.net = http_network_util(default_url)
+            self.net = http_network_util(url, pool_size=pool_size, keep_alive=keep_alive, gzip=gzip, timeout=timeout)
 
     def disconnect(self):
         print("disconnect")
+        self.net.close()
         return database_result()
 
     def set_role_standalone(self, node_name):
@@ -193,6 +218,7 @@ class infinity_http:
     # database
     def create_database(self, db_name, opt=ConflictType.Error):
         url = f"databases/{db_name}"
+        self.net.invalidate_column_types(db_name)
         h = self.net.set_up_header(["accept", "content-type"])
         if opt in [ConflictType.Error, ConflictType.Ignore, ConflictType.Replace]:
             d = self.net.set_up_data(
@@ -216,6 +242,7 @@ class infinity_http:
 
     def drop_database(self, db_name, opt=ConflictType.Error):
         url = f"databases/{db_name}"
+        self.net.invalidate_column_types(db_name)
         h = self.net.set_up_header(["accept", "content-type"])
         if opt in [ConflictType.Error, ConflictType.Ignore]:
             d = self.net.set_up_data(
@@ -379,6 +406,7 @@ class database_http:
         # print(fields)
 
         url = f"databases/{self.database_name}/tables/{table_name}"
+        self.net.invalidate_column_types(self.database_name, table_name)
         h = self.net.set_up_header(["accept", "content-type"])
         d = self.net.set_up_data(
             ["create_option"],
@@ -404,6 +432,7 @@ class database_http:
                 copt = baseDropOptions[conflict_type]
 
         url = f"databases/{self.database_name}/tables/{table_name}"
+        self.net.invalidate_column_types(self.database_name, table_name)
         h = self.net.set_up_header(["accept", "content-type"])
         d = self.net.set_up_data(["drop_option"], {"drop_option": copt})
         r = self.net.request(url, "delete", h, d)
@@ -476,6 +505,10 @@ class table_http:
         return res
 
     def show_columns_type(self):
+        # cached until the columns are changed through this client, to_result needs it for every query
+        res = self.net.column_types.get((self.database_name, self.table_name))
+        if res is not None:
+            return res
         url = f"databases/{self.database_name}/tables/{self.table_name}/columns"
         h = self.net.set_up_header(["accept"])
         r = self.net.request(url, "get", h)
@@ -483,6 +516,7 @@ class table_http:
         res = {}
         for col in r.json()["columns"]:
             res[col["name"]] = col["type"]
+        self.net.column_types[(self.database_name, self.table_name)] = res
         return res
 
     # index
@@ -599,6 +633,38 @@ class table_http:
         self.net.raise_exception(r)
         return database_result()
 
+    def insert_stream(self, rows: Iterable, chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE, retries: int = 3,
+                      on_chunk: Callable[[int, int], None] | None = None):
+        """
+        Insert rows read lazily from an iterable of row dicts, lists of row dicts, pandas or polars DataFrames.
+        Every chunk_size rows are sent as one NDJSON request and committed on their own, the next chunk is read only
+        once the server acknowledged the previous one, so memory stays bounded whatever the iterable yields.
+        on_chunk(chunk_index, inserted_rows) is called for every acknowledged chunk. A chunk is resent up to retries
+        times only when the connection could not be established, so the server never saw it. Any other error, including
+        a read timeout or a connection dropped after the chunk went out, is raised right away because the server may
+        have committed the chunk already. The acknowledged chunks stay inserted.
+        """
+        url = f"databases/{self.database_name}/tables/{self.table_name}/docs"
+        h = self.net.set_up_header(["accept"])
+        h["content-type"] = "application/x-ndjson"
+        inserted_rows = 0
+        for chunk_index, chunk in enumerate(_row_chunks(rows, chunk_size)):
+            body = "\n".join(json.dumps(row, default=_json_default) for row in chunk).encode()
+            for attempt in range(retries + 1):
+                try:
+                    r = self.net.request(url, "post", h, body)
+                    break
+                except requests.ConnectionError as e:
+                    if attempt == retries or not _request_not_sent(e):
+                        raise
+                    logging.warning(f"insert chunk {chunk_index} failed, retry {attempt + 1}")
+            self.net.raise_exception(r)
+            chunk_rows = r.json().get("inserted_rows", len(chunk))
+            inserted_rows += chunk_rows
+            if on_chunk is not None:
+                on_chunk(chunk_index, chunk_rows)
+        return database_result(inserted_rows=inserted_rows)
+
     def import_data(self, data_path="/home/infiniflow/Documents/development/infinity/test/data/csv/pysdk_test.csv",
                     import_options={}):
         data = {}
@@ -651,6 +717,7 @@ class table_http:
 
     def add_columns(self, columns_definition={}):
         url = f"databases/{self.database_name}/tables/{self.table_name}/columns"
+        self.net.invalidate_column_types(self.database_name, self.table_name)
         h = self.net.set_up_header(["accept", "content-type"])
         fields = []
         for col in columns_definition:
@@ -666,6 +733,7 @@ class table_http:
         if isinstance(column_name, str):
             column_name = [column_name]
         url = f"databases/{self.database_name}/tables/{self.table_name}/columns"
+        self.net.invalidate_column_types(self.database_name, self.table_name)
         h = self.net.set_up_header(["accept", "content-type"])
         d = self.net.set_up_data([], {"column_names": column_name})
         r = self.net.request(url, "delete", h, d)
@@ -702,6 +770,8 @@ class table_http_result:
         self.table_http = table_http
 
         self.output_res = []
+        # name and type of the output columns when the server answered in the columnar format
+        self.output_columns = None
         self._output = output
         self._highlight = []
         self._filter = ""
@@ -740,17 +810,22 @@ class table_http_result:
             tmp["limit"] = str(self._limit)
         if self._offset is not None:
             tmp["offset"] = str(self._offset)
-        if self._option is not None:
-            tmp["option"] = self._option
+        # one typed array per column, decoded without parsing every cell, servers that don't know it answer with rows
+        tmp["option"] = {"result_format": "columnar", **(self._option or {})}
         # print(tmp)
         d = self.table_http.net.set_up_data([], tmp)
         r = self.table_http.net.request(url, "get", h, d)
         self.table_http.net.raise_exception(r)
         # print(r.json())
         result_json = r.json()
-        if "output" in result_json:
+        if "column_data" in result_json:
+            self.output_columns = result_json["columns"]
+            self.output_res = result_json["column_data"]
+        elif "output" in result_json:
+            self.output_columns = None
             self.output_res = result_json["output"]
         else:
+            self.output_columns = None
             self.output_res = []
 
         if "total_hits_count" in result_json:
@@ -920,20 +995,43 @@ class table_http_result:
         self._search_exprs.append(tmp_fusion_expr)
         return self
 
+    def columnar_result(self):
+        # the server sends the type of every output column, so nothing is guessed from the expressions
+        df_dict = {}
+        df_type = {}
+        for column, cells in zip(self.output_columns, self.output_res):
+            col_name = column["name"]
+            if col_name in df_dict:
+                continue
+            col_dtype = type_to_dtype(column["type"])
+            if col_dtype is object:
+                # embeddings of numbers arrive as arrays, the other complex types as text
+                cells = [decode_text_cell(v) if isinstance(v, str) else v for v in cells]
+            elif col_dtype.kind in "biuf":
+                cells = np.asarray(cells, dtype=col_dtype)
+            df_dict[col_name] = cells
+            df_type[col_name] = col_dtype
+        extra_result = None
+        if self.total_hits_count is not None:
+            extra_result = {"total_hits_count": self.total_hits_count}
+        return df_dict, df_type, extra_result
+
     def to_result(self):
         if self.output_res == []:
             self.select()
+        if self.output_columns is not None:
+            return self.columnar_result()
 
         df_dict = {}
         col_types = self.table_http.show_columns_type()
         for output_col in self._output:
             if output_col in col_types:
-                df_dict[output_col] = ()
+                df_dict[output_col] = []
         # when output["*"] and output_res is empty
         for output_col in self._output:
             if output_col == "*":
                 for col in col_types:
-                    df_dict[col] = ()
+                    df_dict[col] = []
 
         line_i = 0
         for res in self.output_res:
@@ -941,30 +1039,14 @@ class table_http_result:
                 col_name = next(iter(col))
                 v = col[col_name]
                 if col_name not in df_dict:
-                    df_dict[col_name] = ()
-                tup = df_dict[col_name]
-                if len(tup) == line_i + 1:
+                    df_dict[col_name] = []
+                values = df_dict[col_name]
+                if len(values) == line_i + 1:
                     continue
                 if isinstance(v, (int, float)):
-                    new_tup = tup + (v,)
-                elif is_list(v):
-                    new_tup = tup + (ast.literal_eval(v),)
-                elif is_date(v):
-                    new_tup = tup + (v,)
-                elif is_time(v):
-                    new_tup = tup + (v,)
-                elif is_datetime(v):
-                    new_tup = tup + (v,)
-                elif is_sparse(v):  # sparse vector
-                    sparse_vec = str2sparse(v)
-                    new_tup = tup + (sparse_vec,)
+                    values.append(v)
                 else:
-                    if v.lower() == 'true':
-                        v = True
-                    elif v.lower() == 'false':
-                        v = False
-                    new_tup = tup + (v,)
-                df_dict[col_name] = new_tup
+                    values.append(decode_text_cell(v))
             line_i += 1
         # print(self.output_res)
         # print(df_dict)
@@ -1025,10 +1107,60 @@ class table_http_result:
         return pa.Table.from_pandas(dataframe), extra_result
 
 
+def _json_default(value):
+    # the values insert converts by walking the rows, serialized on the fly instead
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    if isinstance(value, SparseVector):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _row_chunks(rows: Iterable, chunk_size: int):
+    chunk = []
+    for item in rows:
+        if isinstance(item, pd.DataFrame):
+            item = item.to_dict("records")
+        elif isinstance(item, pl.DataFrame):
+            item = item.iter_rows(named=True)
+        elif isinstance(item, dict):
+            item = (item,)
+        for row in item:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _request_not_sent(e: requests.ConnectionError) -> bool:
+    # whether the request failed before the connection was established, so the server can't have seen the body
+    if isinstance(e, requests.ConnectTimeout):
+        return True
+    reason = getattr(e.args[0], "reason", None) if e.args else None
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+
+def decode_text_cell(v: str):
+    if is_list(v):
+        return ast.literal_eval(v)
+    elif is_date(v) or is_time(v) or is_datetime(v):
+        return v
+    elif is_sparse(v):  # sparse vector
+        return str2sparse(v)
+    elif v.lower() == 'true':
+        return True
+    elif v.lower() == 'false':
+        return False
+    return v
+
+
 @dataclass
 class database_result():
     def __init__(self, list=[], database_name: str = "", error_code=ErrorCode.OK, columns=[], index_list=[],
-                 node_name="", node_role="", node_status="", index_comment=None, deleted_rows=0, data={}, nodes=[]):
+                 node_name="", node_role="", node_status="", index_comment=None, deleted_rows=0, data={}, nodes=[],
+                 inserted_rows=0):
         self.db_names = list
         self.database_name = database_name  # get database
         self.error_code = error_code
@@ -1039,6 +1171,7 @@ class database_result():
         self.node_status = node_status
         self.index_comment = index_comment
         self.deleted_rows = deleted_rows
+        self.inserted_rows = inserted_rows
         self.data = data
         self.nodes = nodes
 
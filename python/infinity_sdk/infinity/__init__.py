@@ -23,12 +23,28 @@ import os
 
 from infinity.common import URI, NetworkAddress, LOCAL_HOST, LOCAL_INFINITY_PATH, InfinityException
 from infinity.infinity import InfinityConnection
-from infinity.remote_thrift.infinity import RemoteThriftInfinityConnection
+from infinity.remote_thrift.infinity import RemoteThriftInfinityConnection, AsyncRemoteThriftInfinityConnection
 from infinity.errors import ErrorCode
+from infinity.tracing import Tracer
+from infinity.result_cache import ResultCache
+from infinity import bulk, metrics, profile, result_cache
 
 
-def connect(uri=LOCAL_HOST, logger: logging.Logger = None) -> InfinityConnection:
+def connect(uri=LOCAL_HOST, logger: logging.Logger = None, tracer: Tracer = None,
+            result_cache: ResultCache = None) -> InfinityConnection:
+    """
+    tracer, e.g. infinity.tracing.PrometheusTracer(), is told the timings, bytes and retries of every call.
+    result_cache, e.g. infinity.result_cache.ResultCache(), answers repeated queries without asking the server.
+    """
     if isinstance(uri, NetworkAddress):
-        return RemoteThriftInfinityConnection(uri, logger)
+        return RemoteThriftInfinityConnection(uri, logger, tracer, result_cache)
+    else:
+        raise InfinityException(ErrorCode.INVALID_SERVER_ADDRESS, f"Unknown uri: {uri}")
+
+
+async def connect_async(uri=LOCAL_HOST, pool_size: int = 4, logger: logging.Logger = None) -> \
+        AsyncRemoteThriftInfinityConnection:
+    if isinstance(uri, NetworkAddress):
+        return await AsyncRemoteThriftInfinityConnection(uri, pool_size, logger).connect()
     else:
         raise InfinityException(ErrorCode.INVALID_SERVER_ADDRESS, f"Unknown uri: {uri}")
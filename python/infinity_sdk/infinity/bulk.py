@@ -0,0 +1,225 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+import infinity
+from infinity.common import InfinityException
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.types import arrow_column_to_values, columns_to_insert_columns
+from infinity.remote_thrift.utils import get_insert_fields
+from infinity.utils import LazyModule, is_instance_of
+
+pa = LazyModule("pyarrow")
+
+DEFAULT_BATCH_ROWS = 8192
+
+# the server rejected the whole batch and rolled it back, so sending it again can't insert any row twice.
+# A lost connection is not among them, the batch may have been committed before the connection dropped
+RETRYABLE_ERRORS = frozenset((ErrorCode.TXN_ROLLBACK, ErrorCode.TXN_CONFLICT, ErrorCode.OUT_OF_MEMORY,
+                              ErrorCode.INFINITY_IS_INITING))
+
+
+class LoadResult:
+    def __init__(self, rows: int, batches: int, retries: int, seconds: float):
+        self.rows = rows
+        self.batches = batches
+        self.retries = retries
+        self.seconds = seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self):
+        return (f"LoadResult(rows={self.rows}, batches={self.batches}, retries={self.retries}, "
+                f"seconds={self.seconds:.3f}, rows_per_second={self.rows_per_second:.1f})")
+
+
+def load(table, source, workers: int = 4, batch_rows: int = DEFAULT_BATCH_ROWS, column: str = None,
+         retries: int = 3, retry_interval: float = 0.5, progress=None) -> LoadResult:
+    """
+    Insert source into a remote table over `workers` connections:
+        table = infinity.connect(uri).get_database("default_db").get_table("t")
+        print(infinity.bulk.load(table, "data.parquet", workers=8))
+    source is an iterable of row dicts or of DataFrames / arrow tables, a pandas or polars DataFrame, an arrow table,
+    or the path of a .parquet or .fvecs file, the vectors of an fvecs file are inserted into `column`.
+    Batches of batch_rows rows are read on the calling thread while the workers encode and send the previous ones,
+    at most 2 * workers batches are buffered. A batch the server rolled back is resent up to retries times, any other
+    error stops the load and is raised once the batches in flight are done. A batch whose connection was lost is never
+    resent, the load stops with CANT_CONNECT_SERVER and the batch may or may not have been inserted.
+    progress(rows, seconds) is called after every inserted batch.
+    """
+    if workers < 1 or batch_rows < 1:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Invalid bulk load parameters: workers {workers}, batch_rows {batch_rows}")
+    batches = _batches(source, batch_rows, column)
+
+    # the table's own connection is the first worker's, the others get one each
+    worker_tables = [table]
+    connections = []
+    try:
+        for _ in range(workers - 1):
+            conn = infinity.connect(table._conn.uri)
+            connections.append(conn)
+            worker_tables.append(conn.get_database(table._db_name).get_table(table._table_name))
+        return _run(worker_tables, batches, retries, retry_interval, progress)
+    finally:
+        # the inserts of the other connections don't drop the results this connection cached for the table
+        table._invalidate_result_cache()
+        for conn in connections:
+            try:
+                conn.disconnect()
+            except Exception as e:
+                logging.warning(f"Failed to disconnect bulk load connection: {e}")
+
+
+def _run(worker_tables, batches, retries, retry_interval, progress) -> LoadResult:
+    pending = queue.Queue(maxsize=2 * len(worker_tables))
+    lock = threading.Lock()
+    stats = {"rows": 0, "batches": 0, "retries": 0}
+    errors = []
+    start = time.perf_counter()
+
+    def send(worker_table, insert, data) -> bool:
+        for attempt in range(retries + 1):
+            try:
+                insert(worker_table, data)
+                return True
+            except InfinityException as e:
+                if e.error_code not in RETRYABLE_ERRORS or attempt == retries:
+                    errors.append(e)
+                    return False
+                with lock:
+                    stats["retries"] += 1
+                time.sleep(retry_interval * (attempt + 1))
+            except Exception as e:
+                errors.append(e)
+                return False
+
+    def work(worker_table):
+        # after an error the remaining batches are only drained, so the producer never blocks on a full queue
+        while (batch := pending.get()) is not None:
+            insert, data, row_count = batch
+            if errors or not send(worker_table, insert, data):
+                continue
+            with lock:
+                stats["rows"] += row_count
+                stats["batches"] += 1
+                rows, seconds = stats["rows"], time.perf_counter() - start
+            if progress is not None:
+                progress(rows, seconds)
+
+    threads = [threading.Thread(target=work, args=(worker_table,), name=f"infinity-bulk-{i}", daemon=True)
+               for i, worker_table in enumerate(worker_tables)]
+    for thread in threads:
+        thread.start()
+    try:
+        for batch in batches:
+            if errors:
+                break
+            pending.put(batch)
+    finally:
+        for _ in threads:
+            pending.put(None)
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+    return LoadResult(stats["rows"], stats["batches"], stats["retries"], time.perf_counter() - start)
+
+
+def _insert_rows(table, rows):
+    _insert_once(table, fields=get_insert_fields(rows))
+
+
+def _insert_arrow(table, data):
+    _insert_columns(table, {column_name: arrow_column_to_values(data.column(column_name))
+                            for column_name in data.column_names})
+
+
+def _insert_columns(table, columns):
+    column_defs, column_fields = columns_to_insert_columns(columns)
+    _insert_once(table, column_defs=column_defs, column_fields=column_fields)
+
+
+def _insert_once(table, **kwargs):
+    # not through table.insert, whose connection resends the request after a transport error
+    res = table._conn.insert_once(db_name=table._db_name, table_name=table._table_name, **kwargs)
+    if res.error_code != ErrorCode.OK:
+        raise InfinityException(res.error_code, res.error_msg)
+
+
+def _batches(source, batch_rows: int, column: str | None):
+    # (insert function, data, row count) per batch
+    if isinstance(source, str):
+        if source.endswith(".parquet"):
+            return _parquet_batches(source, batch_rows)
+        if source.endswith(".fvecs"):
+            if column is None:
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "Loading an fvecs file needs a column")
+            return _fvecs_batches(source, batch_rows, column)
+        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized bulk load file: {source}")
+    if _is_table(source):
+        return _table_batches(source, batch_rows)
+    return _iterable_batches(source, batch_rows)
+
+
+def _is_table(data) -> bool:
+    return (is_instance_of(data, "pandas", "DataFrame") or is_instance_of(data, "polars", "DataFrame") or
+            is_instance_of(data, "pyarrow", "Table"))
+
+
+def _table_batches(data, batch_rows: int):
+    if is_instance_of(data, "pandas", "DataFrame"):
+        data = pa.Table.from_pandas(data, preserve_index=False)
+    elif is_instance_of(data, "polars", "DataFrame"):
+        data = data.to_arrow()
+    for offset in range(0, data.num_rows, batch_rows):
+        batch = data.slice(offset, batch_rows)
+        yield _insert_arrow, batch, batch.num_rows
+
+
+def _parquet_batches(path: str, batch_rows: int):
+    import pyarrow.parquet as pq
+    for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows):
+        yield _insert_arrow, pa.Table.from_batches([record_batch]), record_batch.num_rows
+
+
+def _fvecs_batches(path: str, batch_rows: int, column: str):
+    # every vector is its int32 dimension followed by that many float32
+    dimension = int(np.fromfile(path, dtype=np.int32, count=1)[0])
+    vectors = np.memmap(path, dtype=np.float32, mode="r").reshape(-1, dimension + 1)[:, 1:]
+    for offset in range(0, vectors.shape[0], batch_rows):
+        batch = np.ascontiguousarray(vectors[offset:offset + batch_rows])
+        yield _insert_columns, {column: batch}, batch.shape[0]
+
+
+def _iterable_batches(source, batch_rows: int):
+    rows = []
+    for item in source:
+        if _is_table(item):
+            yield from _table_batches(item, batch_rows)
+            continue
+        rows.append(item)
+        if len(rows) == batch_rows:
+            yield _insert_rows, rows, len(rows)
+            rows = []
+    if rows:
+        yield _insert_rows, rows, len(rows)
@@ -76,6 +76,15 @@ class Array:
         return str(self)
 
 
+@dataclass(frozen=True)
+class Param:
+    """
+    Named parameter of a prepared query, bound per call: match_dense("vec", Param("q"), ...).
+    Filters refer to parameters as ":name".
+    """
+    name: str
+
+
 URI = Union[NetworkAddress, Path]
 VEC = Union[list, np.ndarray]
 INSERT_DATA = dict[str, Union[str, int, float, list[Union[int, float]]], SparseVector, dict, Array]
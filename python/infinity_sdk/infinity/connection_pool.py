@@ -12,33 +12,148 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from threading import Lock
+import time
+import weakref
+from contextlib import contextmanager
+from threading import Lock, Condition
 import infinity
-from infinity.common import NetworkAddress
+from infinity.common import NetworkAddress, InfinityException
+from infinity.errors import ErrorCode
 import logging
 
+# how long a waiting get_conn sleeps before checking again whether a leaked connection was collected
+WAIT_SLICE = 0.1
+
 
 class ConnectionPool(object):
-    def __init__(self, uri=NetworkAddress("127.0.0.1", 23817), max_size=16):
+    """
+    Thread safe pool of infinity connections.
+
+    Connections are created lazily up to max_size, min_size of them are opened up front and kept even when idle.
+    get_conn blocks up to `timeout` seconds when max_size connections are in use. A connection idle for longer than
+    ping_interval is pinged before it is handed out and replaced if dead, idle connections above min_size are closed
+    after max_idle_time.
+    """
+
+    def __init__(self, uri=NetworkAddress("127.0.0.1", 23817), max_size=16, min_size=0, timeout=None,
+                 max_idle_time=300.0, ping_interval=30.0):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Invalid pool size: min_size {min_size}, max_size {max_size}")
         self.uri_ = uri
         self.max_size_ = max_size
+        self.min_size_ = min_size
+        self.timeout_ = timeout
+        self.max_idle_time_ = max_idle_time
+        self.ping_interval_ = ping_interval
+        # idle connections, the most recently released last
         self.free_pool_ = []
+        self.idle_since_ = {}
+        # a connection that is never released drops out of this set once it is garbage collected
+        self.in_use_ = weakref.WeakSet()
+        self.creating_ = 0
+        self.destroyed_ = False
         self.lock_ = Lock()
-        for i in range(max_size):
-            self._create_conn()
+        self.available_ = Condition(self.lock_)
+        self.metrics_ = {
+            "acquired": 0,
+            "created": 0,
+            "closed": 0,
+            "evicted": 0,
+            "ping_failed": 0,
+            "timeouts": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+        }
+        for i in range(min_size):
+            conn = self._create_conn()
+            self.free_pool_.append(conn)
+            self.idle_since_[conn] = time.monotonic()
 
     def _del__(self):
         self.destroy()
 
     def _create_conn(self):
-        infinity_coon = infinity.connect(self.uri_)
-        self.free_pool_.append(infinity_coon)
+        infinity_conn = infinity.connect(self.uri_)
+        with self.lock_:
+            self.metrics_["created"] += 1
+        return infinity_conn
 
-    def get_conn(self):
+    def _close_conn(self, conn):
+        try:
+            conn.disconnect()
+        except Exception as e:
+            logging.debug(f"close_conn: {str(e)}")
         with self.lock_:
-            if (len(self.free_pool_) == 0):
-                self._create_conn()
-            conn = self.free_pool_.pop()
+            self.metrics_["closed"] += 1
+
+    def _take_idle_conns(self, now):
+        # called with lock_ held, the connections returned are closed after the lock is released
+        stale = []
+        while len(self.free_pool_) > self.min_size_ and now - self.idle_since_[self.free_pool_[0]] > self.max_idle_time_:
+            conn = self.free_pool_.pop(0)
+            del self.idle_since_[conn]
+            stale.append(conn)
+        self.metrics_["evicted"] += len(stale)
+        return stale
+
+    def get_conn(self, timeout=None):
+        """
+        Lease a connection, waiting up to timeout seconds (the pool timeout if None, forever if both are None)
+        while max_size connections are in use.
+        """
+        timeout = self.timeout_ if timeout is None else timeout
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        while True:
+            conn = None
+            with self.lock_:
+                now = time.monotonic()
+                stale = self._take_idle_conns(now)
+                while True:
+                    if self.destroyed_:
+                        raise InfinityException(ErrorCode.CLIENT_CLOSE, "Connection pool is destroyed")
+                    if self.free_pool_:
+                        conn = self.free_pool_.pop()
+                        idle_time = now - self.idle_since_.pop(conn)
+                        self.in_use_.add(conn)
+                        break
+                    if len(self.in_use_) + self.creating_ < self.max_size_:
+                        self.creating_ += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self.metrics_["timeouts"] += 1
+                        raise InfinityException(ErrorCode.TOO_MANY_CONNECTIONS,
+                                                f"No connection available after {timeout} seconds, "
+                                                f"{self.max_size_} connections are in use")
+                    self.available_.wait(WAIT_SLICE if remaining is None else min(remaining, WAIT_SLICE))
+                    now = time.monotonic()
+            for stale_conn in stale:
+                self._close_conn(stale_conn)
+
+            if conn is None:
+                try:
+                    conn = self._create_conn()
+                finally:
+                    with self.lock_:
+                        self.creating_ -= 1
+                        if conn is not None:
+                            self.in_use_.add(conn)
+                        else:
+                            self.available_.notify()
+            elif idle_time > self.ping_interval_ and not conn.client.ping():
+                with self.lock_:
+                    self.in_use_.discard(conn)
+                    self.metrics_["ping_failed"] += 1
+                self._close_conn(conn)
+                continue
+
+            wait_time = time.monotonic() - start
+            with self.lock_:
+                self.metrics_["acquired"] += 1
+                self.metrics_["wait_time_total"] += wait_time
+                self.metrics_["wait_time_max"] = max(self.metrics_["wait_time_max"], wait_time)
             logging.debug("get_conn")
             return conn
 
@@ -46,14 +161,56 @@ class ConnectionPool(object):
         """
         Note: User is allowed to release a connection not created by ConnectionPool, or not releasing(due to exception or some other reasons) a connection created by ConnectionPool.
         """
+        close = False
         with self.lock_:
-            if (self.free_pool_.count(conn)):
+            if conn in self.idle_since_:
                 raise Exception("the connection has been released")
-            if (len(self.free_pool_) < self.max_size_):
+            self.in_use_.discard(conn)
+            if not self.destroyed_ and len(self.free_pool_) < self.max_size_:
                 self.free_pool_.append(conn)
+                self.idle_since_[conn] = time.monotonic()
+            else:
+                close = True
+            self.available_.notify()
             logging.debug("release_conn")
+        if close:
+            self._close_conn(conn)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        with pool.connection() as conn:
+            conn.list_databases()
+        """
+        conn = self.get_conn(timeout)
+        try:
+            yield conn
+        finally:
+            self.release_conn(conn)
+
+    def evict_idle(self):
+        with self.lock_:
+            stale = self._take_idle_conns(time.monotonic())
+        for conn in stale:
+            self._close_conn(conn)
+        return len(stale)
+
+    def metrics(self) -> dict:
+        with self.lock_:
+            metrics = dict(self.metrics_)
+            metrics["in_use"] = len(self.in_use_)
+            metrics["idle"] = len(self.free_pool_)
+            metrics["size"] = len(self.in_use_) + len(self.free_pool_)
+            metrics["max_size"] = self.max_size_
+            metrics["wait_time_avg"] = metrics["wait_time_total"] / metrics["acquired"] if metrics["acquired"] else 0.0
+        return metrics
 
     def destroy(self):
-        for conn in iter(self.free_pool_):
-            conn.disconnect()
-        self.free_pool_.clear()
+        with self.lock_:
+            self.destroyed_ = True
+            conns = self.free_pool_
+            self.free_pool_ = []
+            self.idle_since_.clear()
+            self.available_.notify_all()
+        for conn in conns:
+            self._close_conn(conn)
@@ -0,0 +1,201 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import math
+import re
+import time
+import urllib.error
+import urllib.request
+
+from infinity.common import InfinityException
+from infinity.errors import ErrorCode
+
+DEFAULT_METRICS_URL = "http://localhost:23820/metrics"
+DEFAULT_BUFFER_URL = "http://localhost:23820/instance/buffer"
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+def _labels_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+
+class MetricsSnapshot:
+    """
+    The samples of one scrape of the server /metrics endpoint, or the difference of two:
+        before = infinity.metrics.scrape()
+        ...  # run the benchmark
+        delta = infinity.metrics.scrape() - before
+        print(delta.summary())
+        print(delta.quantile("infinity_statement_duration_seconds", 0.99, operation="select"))
+    Counters and histograms of a difference are what happened in between, gauges keep the later value.
+    """
+
+    def __init__(self, samples: dict, types: dict, timestamp: float, seconds: float = None):
+        # (name, sorted label items) -> value
+        self.samples = samples
+        # metric family name -> counter / gauge / histogram / ...
+        self.types = types
+        self.timestamp = timestamp
+        # seconds between the two scrapes of a difference, None for a scrape
+        self.seconds = seconds
+
+    @classmethod
+    def parse(cls, text: str, timestamp: float = None) -> "MetricsSnapshot":
+        samples = {}
+        types = {}
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                parts = line.split(maxsplit=3)
+                if len(parts) == 4 and parts[1] == "TYPE":
+                    types[parts[2]] = parts[3]
+                continue
+            match = _SAMPLE.match(line)
+            if match is None:
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid metrics line: {line}")
+            name, labels, value = match.groups()
+            labels = dict(_LABEL.findall(labels)) if labels else {}
+            samples[(name, _labels_key(labels))] = float(value)
+        return cls(samples, types, time.time() if timestamp is None else timestamp)
+
+    def _type(self, name: str) -> str:
+        for suffix in ("_bucket", "_sum", "_count"):
+            if name.endswith(suffix) and self.types.get(name[:-len(suffix)]) == "histogram":
+                return "histogram"
+        return self.types.get(name, "untyped")
+
+    def __sub__(self, before: "MetricsSnapshot") -> "MetricsSnapshot":
+        samples = {}
+        for key, value in self.samples.items():
+            if self._type(key[0]) in ("counter", "histogram"):
+                # a restarted server starts its counters over
+                previous = before.samples.get(key, 0.0)
+                samples[key] = value - previous if value >= previous else value
+            else:
+                samples[key] = value
+        return MetricsSnapshot(samples, dict(self.types), self.timestamp, self.timestamp - before.timestamp)
+
+    def value(self, name: str, **labels) -> float:
+        return self.samples.get((name, _labels_key({k: str(v) for k, v in labels.items()})), 0.0)
+
+    def rate(self, name: str, **labels) -> float:
+        # per second over the time between the two scrapes of a difference
+        if not self.seconds:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "rate() needs the difference of two scrapes")
+        return self.value(name, **labels) / self.seconds
+
+    def label_values(self, name: str, label: str) -> list[str]:
+        values = set()
+        for sample_name, labels in self.samples:
+            if sample_name in (name, f"{name}_count"):
+                values.update(value for key, value in labels if key == label)
+        return sorted(values)
+
+    def quantile(self, name: str, q: float, **labels) -> float:
+        """
+        Estimates the q quantile of a histogram the way prometheus histogram_quantile does, interpolating linearly
+        inside the bucket it falls in. NaN when nothing was observed.
+        """
+        labels = {k: str(v) for k, v in labels.items()}
+        buckets = []
+        for (sample_name, sample_labels), count in self.samples.items():
+            if sample_name != f"{name}_bucket":
+                continue
+            sample_labels = dict(sample_labels)
+            bound = sample_labels.pop("le")
+            if sample_labels == labels:
+                buckets.append((math.inf if bound == "+Inf" else float(bound), count))
+        buckets.sort()
+        if not buckets or buckets[-1][1] == 0:
+            return math.nan
+        rank = q * buckets[-1][1]
+        lower_bound, lower_count = 0.0, 0.0
+        for bound, count in buckets:
+            if count >= rank:
+                if bound == math.inf:
+                    return lower_bound
+                if count == lower_count:
+                    return bound
+                return lower_bound + (bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+            lower_bound, lower_count = bound, count
+        return lower_bound
+
+    def summary(self) -> str:
+        lines = []
+        seconds = self.seconds
+        for metric, label in (("infinity_statement_duration_seconds", "operation"),
+                              ("infinity_background_task_duration_seconds", "task")):
+            for label_value in self.label_values(metric, label):
+                count = self.value(f"{metric}_count", **{label: label_value})
+                if count == 0:
+                    continue
+                total = self.value(f"{metric}_sum", **{label: label_value})
+                rate = f", {count / seconds:.1f}/s" if seconds else ""
+                p50, p99 = (self.quantile(metric, q, **{label: label_value}) * 1000 for q in (0.5, 0.99))
+                lines.append(f"{label_value}: {int(count)} calls{rate}, avg {total / count * 1000:.3f} ms, "
+                             f"p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+        requests = self.value("infinity_buffer_requests_total")
+        if requests:
+            misses = self.value("infinity_buffer_misses_total")
+            lines.append(f"buffer: {int(requests)} loads, hit ratio {1 - misses / requests:.4f}, "
+                         f"{int(self.value('infinity_buffer_evictions_total'))} evictions")
+        for pool in self.label_values("infinity_buffer_pool_requests_total", "pool"):
+            requests = self.value("infinity_buffer_pool_requests_total", pool=pool)
+            if requests:
+                misses = self.value("infinity_buffer_pool_misses_total", pool=pool)
+                lines.append(f"buffer {pool}: {int(requests)} loads, hit ratio {1 - misses / requests:.4f}, "
+                             f"{int(self.value('infinity_buffer_pool_evictions_total', pool=pool))} evictions")
+        hits = self.value("infinity_result_cache_hits_total")
+        lookups = hits + self.value("infinity_result_cache_misses_total")
+        if lookups:
+            lines.append(f"result cache: {int(lookups)} lookups, hit ratio {hits / lookups:.4f}, "
+                         f"{int(self.value('infinity_result_cache_evictions_total'))} evictions, "
+                         f"{int(self.value('infinity_result_cache_invalidations_total'))} invalidations")
+        flushes = self.value("infinity_wal_flush_duration_seconds_count")
+        if flushes:
+            lines.append(f"wal: {int(flushes)} flushes, {int(self.value('infinity_wal_flush_bytes_total'))} bytes, "
+                         f"p99 {self.quantile('infinity_wal_flush_duration_seconds', 0.99) * 1000:.3f} ms")
+        return "\n".join(lines)
+
+
+def scrape(url: str = DEFAULT_METRICS_URL, timeout: float = 5.0) -> MetricsSnapshot:
+    """
+    Fetches the server /metrics endpoint, served on the HTTP port.
+    """
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        text = response.read().decode("utf-8")
+    return MetricsSnapshot.parse(text)
+
+
+def show_buffer(url: str = DEFAULT_BUFFER_URL, timeout: float = 5.0) -> dict:
+    """
+    The buffer pool of each file type, from the server /instance/buffer endpoint:
+        pools = infinity.metrics.show_buffer()
+        print(pools["hnsw"]["hit_ratio"], pools["hnsw"]["evictions"])
+    Each pool has memory_usage, quota (0 without a buffer_manager_quota), requests, misses, hit_ratio and evictions.
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            body = json.loads(response.read().decode("utf-8"))
+    except urllib.error.HTTPError as e:
+        body = json.loads(e.read().decode("utf-8"))
+    if body.get("error_code", 0) != 0:
+        raise InfinityException(body["error_code"], body.get("error_message", ""))
+    return {pool["file_type"]: pool for pool in body.get("pools", [])}
+
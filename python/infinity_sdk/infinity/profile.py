@@ -0,0 +1,62 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from infinity.common import InfinityException
+from infinity.errors import ErrorCode
+from infinity.utils import LazyModule
+
+pd = LazyModule("pandas")
+
+OPERATOR_COLUMNS = ["fragment_id", "task_id", "times", "operator", "input_rows", "output_rows", "output_data_size",
+                    "elapsed_ms"]
+
+
+def _get_profile(extra_result: dict) -> dict:
+    # takes the extra_result of a query or the profile in it
+    if extra_result is not None and "profile" in extra_result:
+        return extra_result["profile"]
+    if extra_result is not None and "fragments" in extra_result:
+        return extra_result
+    raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                            'The result has no profile, run the query with option({"profile": True})')
+
+
+def operators_df(extra_result: dict) -> pd.DataFrame:
+    """
+    One row per operator run of the profiled query, the server profiles only the queries asking for it:
+        res, extra_result = table.output(["*"]).filter("c1 > 10").option({"profile": True}).to_df()
+        print(infinity.profile.operators_df(extra_result))
+    A task runs its operators again for every input it is given, "times" counts these runs.
+    """
+    profile = _get_profile(extra_result)
+    rows = []
+    for fragment in profile.get("fragments", []):
+        for task in fragment.get("tasks", []):
+            for operators in task.get("operators", []):
+                for info in operators.get("infos", []):
+                    rows.append((fragment["fragment_id"], task["task_id"], operators["times"], info["name"],
+                                 info["input_rows"], info["output_rows"], info["output_data_size"],
+                                 info["elapsed"] / 1e6))
+    return pd.DataFrame(rows, columns=OPERATOR_COLUMNS)
+
+
+def phases_df(extra_result: dict) -> pd.DataFrame:
+    """
+    Time of each phase of the profiled query: parsing, planning, optimizing, execution and commit.
+    """
+    profile = _get_profile(extra_result)
+    rows = [(phase["name"], phase["elapsed"] / 1e6) for phase in profile.get("phases", [])]
+    return pd.DataFrame(rows, columns=["phase", "elapsed_ms"])
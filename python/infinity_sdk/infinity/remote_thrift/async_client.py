@@ -0,0 +1,362 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import random
+import struct
+from collections import deque
+from functools import partial
+from typing import Iterable
+
+from thrift.Thrift import TApplicationException, TMessageType, TType
+from thrift.protocol import TBinaryProtocol
+from thrift.transport import TTransport
+from thrift.transport.TTransport import TTransportException
+
+from infinity import URI
+from infinity.common import InfinityException
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.client import ThriftInfinityClient, TRY_TIMES, CLIENT_VERSION
+from infinity.remote_thrift.infinity_thrift_rpc import InfinityService
+from infinity.remote_thrift.infinity_thrift_rpc.ttypes import CommonRequest, CommonResponse, ConnectRequest, \
+    ImportRequest
+
+POOL_SIZE = 4
+
+FIXED_WIDTH_TYPES = {
+    TType.BOOL: 1,
+    TType.BYTE: 1,
+    TType.I16: 2,
+    TType.I32: 4,
+    TType.I64: 8,
+    TType.DOUBLE: 8,
+}
+
+
+async def read_message(reader: asyncio.StreamReader) -> bytes:
+    """
+    Read one binary protocol message off the stream and return its raw bytes.
+    The unframed transport carries no message length, so the message is walked with the same rules
+    TProtocolBase.skip uses, reading exactly the bytes each field needs.
+    """
+    chunks = []
+
+    async def read(size: int) -> bytes:
+        data = await reader.readexactly(size)
+        chunks.append(data)
+        return data
+
+    async def skip(ttype: int):
+        if ttype in FIXED_WIDTH_TYPES:
+            await read(FIXED_WIDTH_TYPES[ttype])
+        elif ttype == TType.STRING:
+            size, = struct.unpack('!i', await read(4))
+            await read(size)
+        elif ttype == TType.STRUCT:
+            while True:
+                field_type, = struct.unpack('!b', await read(1))
+                if field_type == TType.STOP:
+                    break
+                await read(2)
+                await skip(field_type)
+        elif ttype == TType.MAP:
+            key_type, value_type, size = struct.unpack('!bbi', await read(6))
+            if key_type in FIXED_WIDTH_TYPES and value_type in FIXED_WIDTH_TYPES:
+                await read(size * (FIXED_WIDTH_TYPES[key_type] + FIXED_WIDTH_TYPES[value_type]))
+            else:
+                for _ in range(size):
+                    await skip(key_type)
+                    await skip(value_type)
+        elif ttype in (TType.LIST, TType.SET):
+            element_type, size = struct.unpack('!bi', await read(5))
+            if element_type in FIXED_WIDTH_TYPES:
+                await read(size * FIXED_WIDTH_TYPES[element_type])
+            else:
+                for _ in range(size):
+                    await skip(element_type)
+        else:
+            raise TTransportException(TTransportException.UNKNOWN, f"Unknown thrift type {ttype}")
+
+    version, = struct.unpack('!i', await read(4))
+    if version < 0:
+        name_size, = struct.unpack('!i', await read(4))
+        await read(name_size + 4)
+    else:
+        await read(version + 5)
+    await skip(TType.STRUCT)
+    return b''.join(chunks)
+
+
+class PipelinedConnection:
+    """
+    One non-blocking connection and its session. Requests are written as soon as they are issued, the server
+    answers them in order, so responses are matched to callers first in, first out.
+    """
+
+    def __init__(self, uri: URI):
+        self.uri = uri
+        self.session_id = -1
+        self._reader = None
+        self._writer = None
+        self._read_task = None
+        self._pending = deque()
+        self._seqid = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def open(self):
+        self._reader, self._writer = await asyncio.open_connection(self.uri.ip, self.uri.port)
+        self._read_task = asyncio.get_running_loop().create_task(self._read_loop())
+        res = await self.call("Connect", ConnectRequest(client_version=CLIENT_VERSION))
+        if res.error_code != ErrorCode.OK:
+            await self.close()
+            raise InfinityException(res.error_code, res.error_msg)
+        self.session_id = res.session_id
+
+    async def close(self):
+        if self._writer is None:
+            return
+        writer, self._writer = self._writer, None
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+        if self._read_task is not None:
+            self._read_task.cancel()
+            self._read_task = None
+        self._fail_pending(TTransportException(TTransportException.NOT_OPEN, "Connection closed"))
+
+    async def call(self, method: str, request):
+        if self._writer is None:
+            raise TTransportException(TTransportException.NOT_OPEN, "Connection closed")
+        if hasattr(request, "session_id") and method != "Connect":
+            request.session_id = self.session_id
+        self._seqid += 1
+        buffer = TTransport.TMemoryBuffer()
+        protocol = TBinaryProtocol.TBinaryProtocol(buffer)
+        protocol.writeMessageBegin(method, TMessageType.CALL, self._seqid)
+        getattr(InfinityService, f"{method}_args")(request=request).write(protocol)
+        protocol.writeMessageEnd()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((self._seqid, method, future))
+        self._writer.write(buffer.getvalue())
+        try:
+            await self._writer.drain()
+        except (ConnectionError, OSError) as e:
+            await self.close()
+            raise TTransportException(TTransportException.NOT_OPEN, str(e))
+        return await future
+
+    async def _read_loop(self):
+        future = None
+        try:
+            while True:
+                future = None
+                message = await read_message(self._reader)
+                if not self._pending:
+                    raise TApplicationException(TApplicationException.BAD_SEQUENCE_ID, "Response without a request")
+                seqid, method, future = self._pending.popleft()
+                protocol = TBinaryProtocol.TBinaryProtocol(TTransport.TMemoryBuffer(message))
+                _, message_type, response_seqid = protocol.readMessageBegin()
+                if message_type == TMessageType.EXCEPTION:
+                    error = TApplicationException()
+                    error.read(protocol)
+                    protocol.readMessageEnd()
+                    if not future.done():
+                        future.set_exception(error)
+                    continue
+                result = getattr(InfinityService, f"{method}_result")()
+                result.read(protocol)
+                protocol.readMessageEnd()
+                if future.done():
+                    continue
+                if response_seqid != seqid:
+                    future.set_exception(TApplicationException(TApplicationException.BAD_SEQUENCE_ID,
+                                                               f"{method} failed: out of sequence response"))
+                elif result.success is None:
+                    future.set_exception(TApplicationException(TApplicationException.MISSING_RESULT,
+                                                               f"{method} failed: unknown result"))
+                else:
+                    future.set_result(result.success)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # after a lost connection or a frame that can't be decoded the stream can't be resynchronized, so the
+            # connection is dropped and every request still waiting on it fails instead of hanging
+            if isinstance(e, (asyncio.IncompleteReadError, ConnectionError, OSError)):
+                e = TTransportException(TTransportException.END_OF_FILE, str(e))
+            writer, self._writer = self._writer, None
+            self._read_task = None
+            if writer is not None:
+                writer.close()
+            if future is not None and not future.done():
+                future.set_exception(e)
+            self._fail_pending(e)
+
+    def _fail_pending(self, error: Exception):
+        while self._pending:
+            _, _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+
+class AsyncServiceStub:
+    # stands in for InfinityService.Client so the request building of ThriftInfinityClient can be reused
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, method: str):
+        return partial(self._client.call, method)
+
+
+def async_request(name: str):
+    build_and_send = getattr(ThriftInfinityClient, name).__wrapped__
+
+    async def method(self, *args, **kwargs):
+        return await build_and_send(self, *args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = f"Awaitable version of ThriftInfinityClient.{name}"
+    return method
+
+
+class AsyncThriftInfinityClient:
+    """
+    asyncio client multiplexing concurrent requests over a small set of pipelined connections.
+    The request methods mirror ThriftInfinityClient and return the same thrift responses.
+    """
+
+    def __init__(self, uri: URI, *, pool_size: int = POOL_SIZE, try_times: int = TRY_TIMES,
+                 logger: logging.Logger = None):
+        if pool_size < 1:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid pool size: {pool_size}")
+        self.uri = uri
+        self.try_times = try_times
+        self.logger = logger if logger is not None else logging.getLogger("AsyncThriftInfinityClient")
+        # placeholder, every connection stamps its own session on the requests it sends
+        self.session_id = -1
+        self.client = AsyncServiceStub(self)
+        self._connections = [PipelinedConnection(uri) for _ in range(pool_size)]
+        self._is_connected = False
+
+    async def connect(self):
+        results = await asyncio.gather(*[connection.open() for connection in self._connections],
+                                       return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # don't leave the sessions of the connections that did open behind
+            for connection in self._connections:
+                if not connection.is_open:
+                    continue
+                try:
+                    await connection.call("Disconnect", CommonRequest())
+                except Exception as e:
+                    self.logger.debug(f"Disconnect after a failed connect failed: {str(e)}")
+                await connection.close()
+            raise errors[0]
+        self._is_connected = True
+        return self
+
+    async def call(self, method: str, request):
+        if not self._is_connected:
+            raise InfinityException(ErrorCode.CLIENT_CLOSE, "Client is disconnected")
+        for i in range(self.try_times):
+            connection = min(self._connections, key=lambda c: (not c.is_open, c.in_flight))
+            try:
+                if not connection.is_open:
+                    await connection.open()
+                return await connection.call(method, request)
+            except (TTransportException, ConnectionError, OSError) as e:
+                self.logger.debug(f"Tried {i} times, {method} failed: {str(e)}")
+                await connection.close()
+        return CommonResponse(ErrorCode.TOO_MANY_CONNECTIONS, f"Try {self.try_times} times, but still failed")
+
+    async def import_arrow(self, db_name: str, table_name: str, chunks: Iterable[bytes]):
+        # the server stages the chunks per session, so they all go over one connection and are never resent.
+        # Chunks staged when the chunks stop coming, e.g. on a cast error in the chunk generator, are aborted
+        if not self._is_connected:
+            raise InfinityException(ErrorCode.CLIENT_CLOSE, "Client is disconnected")
+        connection = min(self._connections, key=lambda c: (not c.is_open, c.in_flight))
+        import_id = random.getrandbits(63) or 1
+        staged = sending_last = False
+        chunks = iter(chunks)
+        chunk_index, chunk = 0, next(chunks)
+        try:
+            if not connection.is_open:
+                await connection.open()
+            while chunk is not None:
+                next_chunk = next(chunks, None)
+                sending_last = next_chunk is None
+                res = await connection.call("Import", ImportRequest(db_name=db_name,
+                                                                    table_name=table_name,
+                                                                    data=chunk,
+                                                                    import_id=import_id,
+                                                                    chunk_index=chunk_index,
+                                                                    last_chunk=sending_last))
+                if res.error_code != ErrorCode.OK:
+                    staged = False
+                    break
+                staged = next_chunk is not None
+                chunk_index, chunk = chunk_index + 1, next_chunk
+        except (TTransportException, ConnectionError, OSError) as e:
+            staged = False
+            await connection.close()
+            if sending_last:
+                error_msg = f"Connection lost sending the last chunk, check whether the rows were imported: {e}"
+            else:
+                error_msg = f"Connection lost, nothing was imported: {e}"
+            res = CommonResponse(ErrorCode.CANT_CONNECT_SERVER, error_msg)
+        finally:
+            if staged:
+                try:
+                    await connection.call("Import", ImportRequest(db_name=db_name, table_name=table_name,
+                                                                  import_id=import_id, abort_import=True))
+                except (TTransportException, ConnectionError, OSError) as e:
+                    self.logger.debug(f"Abort import {import_id} failed: {str(e)}")
+        return res
+
+    async def disconnect(self):
+        if not self._is_connected:
+            return CommonResponse(ErrorCode.OK, "Already disconnected")
+        self._is_connected = False
+        res = CommonResponse(ErrorCode.OK)
+        for connection in self._connections:
+            if not connection.is_open:
+                continue
+            try:
+                connection_res = await connection.call("Disconnect", CommonRequest())
+                if connection_res.error_code != ErrorCode.OK:
+                    res = connection_res
+            except Exception as e:
+                res = CommonResponse(ErrorCode.CLIENT_CLOSE, str(e))
+            await connection.close()
+        return res
+
+
+for _name in ("create_database", "drop_database", "list_databases", "show_database", "get_database",
+              "create_table", "drop_table", "list_tables", "show_table", "show_columns", "get_table",
+              "create_index", "show_index", "list_indexes", "drop_index", "insert", "insert_columns", "import_data",
+              "export_data", "select", "explain", "delete", "update", "show_tables", "show_segments", "show_segment",
+              "show_blocks", "show_block", "show_block_column", "show_current_node", "optimize", "add_columns",
+              "drop_columns", "cleanup", "command", "flush", "compact"):
+    setattr(AsyncThriftInfinityClient, _name, async_request(_name))
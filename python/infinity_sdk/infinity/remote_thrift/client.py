@@ -13,11 +13,14 @@
 # limitations under the License.
 
 import logging
+import random
+import time
 from functools import wraps
+from typing import Iterable
 from readerwriterlock import rwlock
 
 from thrift.protocol import TBinaryProtocol
-from thrift.transport import TSocket
+from thrift.transport import TSocket, TTransport
 from thrift.transport.TTransport import TTransportException
 
 from infinity import URI
@@ -25,16 +28,62 @@ from infinity.remote_thrift.infinity_thrift_rpc import *
 from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
 from infinity.errors import ErrorCode
 from infinity.common import InfinityException
+from infinity.tracing import Tracer, current_trace, trace_call
+from infinity.result_cache import ResultCache
 
 TRY_TIMES = 10
+CLIENT_VERSION = 29  # 0.6.0.dev3
+
+
+class CountingTransport(TTransport.TBufferedTransport):
+    # adds the bytes of every request and response to the active CallTrace
+    def write(self, buf):
+        trace = current_trace()
+        if trace is not None:
+            trace.bytes_sent += len(buf)
+        super().write(buf)
+
+    def read(self, sz):
+        buf = super().read(sz)
+        trace = current_trace()
+        if trace is not None:
+            trace.bytes_received += len(buf)
+        return buf
+
+
+class TracedServiceClient:
+    # stands in for InfinityService.Client and times the send and the receive half of every rpc
+    def __init__(self, client: InfinityService.Client):
+        self._client = client
+
+    def __getattr__(self, method: str):
+        send = getattr(self._client, f"send_{method}", None)
+        if send is None:
+            return getattr(self._client, method)
+        recv = getattr(self._client, f"recv_{method}")
+
+        def call(request):
+            trace = current_trace()
+            if trace is None:
+                send(request)
+                return recv()
+            with trace.phase("serialize"):
+                send(request)
+            with trace.phase("rpc"):
+                return recv()
+
+        return call
 
 
 class ThriftInfinityClient:
-    def __init__(self, uri: URI, *, try_times: int = TRY_TIMES, logger: logging.Logger = None):
+    def __init__(self, uri: URI, *, try_times: int = TRY_TIMES, logger: logging.Logger = None, tracer: Tracer = None,
+                 result_cache: ResultCache = None):
         self.lock = rwlock.RWLockRead()
 
         self.session_id = -1
         self.uri = uri
+        self.tracer = tracer
+        self.result_cache = result_cache
         self.transport = None
         self._reconnect()
         self._is_connected = True
@@ -64,11 +113,16 @@ class ThriftInfinityClient:
             self.transport.close()
             self.transport = None
         # self.transport = TTransport.TFramedTransport(TSocket.TSocket(self.uri.ip, self.uri.port))  # async
-        self.transport = TTransport.TBufferedTransport(
-            TSocket.TSocket(self.uri.ip, self.uri.port))  # sync
+        if self.tracer is None:
+            self.transport = TTransport.TBufferedTransport(
+                TSocket.TSocket(self.uri.ip, self.uri.port))  # sync
+        else:
+            self.transport = CountingTransport(TSocket.TSocket(self.uri.ip, self.uri.port))
         self.protocol = TBinaryProtocol.TBinaryProtocol(self.transport)
         # self.protocol = TCompactProtocol.TCompactProtocol(self.transport)
         self.client = InfinityService.Client(self.protocol)
+        if self.tracer is not None:
+            self.client = TracedServiceClient(self.client)
         self.transport.open()
 
         # version: 0.2.0.dev2, client_version: 1
@@ -100,7 +154,7 @@ class ThriftInfinityClient:
         # version: 0.5.0.dev6 and 0.5.0.dev7 and 0.5.0 and 0.5.1 and 0.5.2, client_version: 27
         # version: 0.6.0.dev1 and 0.6.0.dev2, client_version: 28
         # version: 0.6.0.dev3, client_version: 29
-        res = self.client.Connect(ConnectRequest(client_version=29)) # 0.6.0.dev3
+        res = self.client.Connect(ConnectRequest(client_version=CLIENT_VERSION))
         if res.error_code != 0:
             raise InfinityException(res.error_code, res.error_msg)
         self.session_id = res.session_id
@@ -108,27 +162,48 @@ class ThriftInfinityClient:
     def retry_wrapper(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            for i in range(self.try_times):
-                try:
-                    with self.lock.gen_rlock():
-                        old_session_i = self.session_i
-                        ret = func(self, *args, **kwargs)
-                        break
-                except TTransportException as e:
-                    with self.lock.gen_wlock():
-                        if old_session_i == self.session_i:
-                            self._reconnect()
-                            self.session_i += 1
-                            self.logger.debug(
-                                f"Tried {i} times, session_id: {self.session_id}, session_i: {self.session_i}, exception: {str(e)}")
-                except Exception as e:
-                    raise
-            else:
-                return CommonResponse(ErrorCode.TOO_MANY_CONNECTIONS, f"Try {self.try_times} times, but still failed")
+            with trace_call(self.tracer, func.__name__) as trace:
+                for i in range(self.try_times):
+                    try:
+                        with self.lock.gen_rlock():
+                            old_session_i = self.session_i
+                            if trace is None:
+                                ret = func(self, *args, **kwargs)
+                            else:
+                                # build is what the call took apart from writing and reading the messages
+                                io_time, start = trace.io_time, time.perf_counter()
+                                ret = func(self, *args, **kwargs)
+                                trace.add("build", time.perf_counter() - start - (trace.io_time - io_time))
+                            break
+                    except TTransportException as e:
+                        if trace is not None:
+                            trace.retries += 1
+                        with self.lock.gen_wlock():
+                            if old_session_i == self.session_i:
+                                self._reconnect()
+                                self.session_i += 1
+                                self.logger.debug(
+                                    f"Tried {i} times, session_id: {self.session_id}, session_i: {self.session_i}, exception: {str(e)}")
+                    except Exception as e:
+                        raise
+                else:
+                    ret = CommonResponse(ErrorCode.TOO_MANY_CONNECTIONS, f"Try {self.try_times} times, but still failed")
+                if trace is not None and getattr(ret, "error_code", ErrorCode.OK) != ErrorCode.OK:
+                    trace.error_code = ret.error_code
+                    trace.error_msg = getattr(ret, "error_msg", None)
             return ret
 
         return wrapper
 
+    def ping(self) -> bool:
+        # one round trip without the reconnecting retry_wrapper, a dead socket just reports False
+        try:
+            with self.lock.gen_rlock():
+                res = self.client.ShowCurrentNode(ShowCurrentNodeRequest(session_id=self.session_id))
+            return res.error_code == ErrorCode.OK
+        except Exception:
+            return False
+
     @retry_wrapper
     def create_database(self, db_name: str, conflict_type: CreateConflict = CreateConflict.Error, comment: str = None):
         db_comment: str
@@ -246,6 +321,45 @@ class ThriftInfinityClient:
             )
         )
 
+    @retry_wrapper
+    def insert_columns(self, db_name: str, table_name: str, column_defs: list[ColumnDef],
+                       column_fields: list[ColumnField]):
+        return self.client.Insert(
+            InsertRequest(
+                session_id=self.session_id,
+                db_name=db_name,
+                table_name=table_name,
+                column_defs=column_defs,
+                column_fields=column_fields,
+            )
+        )
+
+    def insert_once(self, db_name: str, table_name: str, fields: list[Field] = None,
+                    column_defs: list[ColumnDef] = None, column_fields: list[ColumnField] = None):
+        # insert or insert_columns without retry_wrapper: the server may have committed the rows before the connection
+        # dropped, so after a transport error the connection is reopened but the insert is not sent again
+        with trace_call(self.tracer, "insert_once") as trace:
+            try:
+                with self.lock.gen_rlock():
+                    old_session_i = self.session_i
+                    res = self.client.Insert(InsertRequest(session_id=self.session_id,
+                                                           db_name=db_name,
+                                                           table_name=table_name,
+                                                           fields=fields,
+                                                           column_defs=column_defs,
+                                                           column_fields=column_fields))
+            except TTransportException as e:
+                with self.lock.gen_wlock():
+                    if old_session_i == self.session_i:
+                        self._reconnect()
+                        self.session_i += 1
+                res = CommonResponse(ErrorCode.CANT_CONNECT_SERVER,
+                                     f"Connection lost during insert, check whether the rows were inserted: {e}")
+            if trace is not None and res.error_code != ErrorCode.OK:
+                trace.error_code = res.error_code
+                trace.error_msg = res.error_msg
+        return res
+
     @retry_wrapper
     def import_data(self, db_name: str, table_name: str, file_name: str, import_options):
         return self.client.Import(ImportRequest(session_id=self.session_id,
@@ -254,6 +368,66 @@ class ThriftInfinityClient:
                                                 file_name=file_name,
                                                 import_option=import_options))
 
+    def import_arrow(self, db_name: str, table_name: str, chunks: Iterable[bytes]):
+        # chunks are arrow IPC streams, staged by the server session and imported in one transaction with the last one.
+        # Not run through retry_wrapper: a reconnect drops the staged chunks and a resent last chunk may import twice.
+        # The server drops the staged chunks itself when it rejects a chunk, they are aborted here when the chunks stop
+        # coming for any other reason, e.g. a cast error in the chunk generator
+        import_id = random.getrandbits(63) or 1
+        staged = False
+        with trace_call(self.tracer, "import_arrow") as trace:
+            chunks = iter(chunks)
+            chunk_index, chunk = 0, next(chunks)
+            try:
+                while chunk is not None:
+                    next_chunk = next(chunks, None)
+                    try:
+                        with self.lock.gen_rlock():
+                            old_session_i = self.session_i
+                            res = self.client.Import(ImportRequest(session_id=self.session_id,
+                                                                   db_name=db_name,
+                                                                   table_name=table_name,
+                                                                   data=chunk,
+                                                                   import_id=import_id,
+                                                                   chunk_index=chunk_index,
+                                                                   last_chunk=next_chunk is None))
+                    except TTransportException as e:
+                        # the staged chunks go away with the old session
+                        staged = False
+                        with self.lock.gen_wlock():
+                            if old_session_i == self.session_i:
+                                self._reconnect()
+                                self.session_i += 1
+                        if next_chunk is None:
+                            error_msg = f"Connection lost sending the last chunk, check whether the rows were imported: {e}"
+                        else:
+                            error_msg = f"Connection lost, nothing was imported: {e}"
+                        res = CommonResponse(ErrorCode.CANT_CONNECT_SERVER, error_msg)
+                    if res.error_code != ErrorCode.OK:
+                        staged = False
+                        break
+                    staged = next_chunk is not None
+                    chunk_index, chunk = chunk_index + 1, next_chunk
+            finally:
+                if staged:
+                    self._abort_import(db_name, table_name, import_id)
+            if trace is not None and res.error_code != ErrorCode.OK:
+                trace.error_code = res.error_code
+                trace.error_msg = res.error_msg
+        return res
+
+    def _abort_import(self, db_name: str, table_name: str, import_id: int):
+        try:
+            with self.lock.gen_rlock():
+                self.client.Import(ImportRequest(session_id=self.session_id,
+                                                 db_name=db_name,
+                                                 table_name=table_name,
+                                                 import_id=import_id,
+                                                 abort_import=True))
+        except TTransportException as e:
+            # the staged chunks go away with the session or time out on the server
+            self.logger.debug(f"Abort import {import_id} failed: {str(e)}")
+
     @retry_wrapper
     def export_data(self, db_name: str, table_name: str, file_name: str, export_options: dict, columns: list[str]):
         return self.client.Export(ExportRequest(session_id=self.session_id,
@@ -265,7 +439,8 @@ class ThriftInfinityClient:
 
     @retry_wrapper
     def select(self, db_name: str, table_name: str, select_list, highlight_list, search_expr,
-               where_expr, group_by_list, having_expr, limit_expr, offset_expr, order_by_list, total_hits_count):
+               where_expr, group_by_list, having_expr, limit_expr, offset_expr, order_by_list, total_hits_count,
+               batch_embedding_data=None, profile=None):
         return self.client.Select(SelectRequest(session_id=self.session_id,
                                                 db_name=db_name,
                                                 table_name=table_name,
@@ -278,7 +453,9 @@ class ThriftInfinityClient:
                                                 limit_expr=limit_expr,
                                                 offset_expr=offset_expr,
                                                 order_by_list=order_by_list,
-                                                total_hits_count=total_hits_count
+                                                total_hits_count=total_hits_count,
+                                                batch_embedding_data=batch_embedding_data,
+                                                profile=profile
                                                 ))
 
     @retry_wrapper
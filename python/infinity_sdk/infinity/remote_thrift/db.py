@@ -18,12 +18,13 @@ import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
 import numpy as np
 from infinity.db import Database
 from infinity.errors import ErrorCode
-from infinity.remote_thrift.table import RemoteTable
+from infinity.remote_thrift.table import RemoteTable, AsyncRemoteTable
 from infinity.remote_thrift.utils import (
     check_valid_name,
     name_validity_check,
     select_res_to_polars,
     get_ordinary_info,
+    check_response,
 )
 from infinity.common import ConflictType
 from infinity.common import InfinityException
@@ -72,6 +73,9 @@ class RemoteDatabase(Database, ABC):
                                       conflict_type=create_table_conflict)
 
         if res.error_code == ErrorCode.OK:
+            if conflict_type == ConflictType.Replace and self._conn.result_cache is not None:
+                # the results of the replaced table would be returned for the new one
+                self._conn.result_cache.invalidate_table(self._db_name, table_name)
             return RemoteTable(self._conn, self._db_name, table_name)
         else:
             raise InfinityException(res.error_code, res.error_msg)
@@ -79,13 +83,16 @@ class RemoteDatabase(Database, ABC):
     @name_validity_check("table_name", "Table")
     def drop_table(self, table_name, conflict_type: ConflictType = ConflictType.Error):
         if conflict_type == ConflictType.Error:
-            return self._conn.drop_table(db_name=self._db_name, table_name=table_name,
-                                         conflict_type=ttypes.DropConflict.Error)
+            res = self._conn.drop_table(db_name=self._db_name, table_name=table_name,
+                                        conflict_type=ttypes.DropConflict.Error)
         elif conflict_type == ConflictType.Ignore:
-            return self._conn.drop_table(db_name=self._db_name, table_name=table_name,
-                                         conflict_type=ttypes.DropConflict.Ignore)
+            res = self._conn.drop_table(db_name=self._db_name, table_name=table_name,
+                                        conflict_type=ttypes.DropConflict.Ignore)
         else:
             raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+        if self._conn.result_cache is not None:
+            self._conn.result_cache.invalidate_table(self._db_name, table_name)
+        return res
 
     def list_tables(self):
         res = self._conn.list_tables(self._db_name)
@@ -118,3 +125,58 @@ class RemoteDatabase(Database, ABC):
             return select_res_to_polars(res)
         else:
             raise InfinityException(res.error_code, res.error_msg)
+
+
+class AsyncRemoteDatabase(RemoteDatabase):
+    """
+    RemoteDatabase over an AsyncThriftInfinityClient, every method is a coroutine.
+    """
+
+    @name_validity_check("table_name", "Table")
+    async def create_table(self, table_name: str, columns_definition,
+                           conflict_type: ConflictType = ConflictType.Error):
+        column_defs = []
+        for index, (column_name, column_info) in enumerate(columns_definition.items()):
+            check_valid_name(column_name, "Column")
+            get_ordinary_info(column_info, column_defs, column_name, index)
+
+        if conflict_type == ConflictType.Error:
+            create_table_conflict = ttypes.CreateConflict.Error
+        elif conflict_type == ConflictType.Ignore:
+            create_table_conflict = ttypes.CreateConflict.Ignore
+        elif conflict_type == ConflictType.Replace:
+            create_table_conflict = ttypes.CreateConflict.Replace
+        else:
+            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+
+        res = await self._conn.create_table(db_name=self._db_name, table_name=table_name,
+                                            column_defs=column_defs,
+                                            conflict_type=create_table_conflict)
+        check_response(res)
+        return AsyncRemoteTable(self._conn, self._db_name, table_name)
+
+    @name_validity_check("table_name", "Table")
+    async def drop_table(self, table_name, conflict_type: ConflictType = ConflictType.Error):
+        if conflict_type == ConflictType.Error:
+            drop_table_conflict = ttypes.DropConflict.Error
+        elif conflict_type == ConflictType.Ignore:
+            drop_table_conflict = ttypes.DropConflict.Ignore
+        else:
+            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+        return await self._conn.drop_table(db_name=self._db_name, table_name=table_name,
+                                           conflict_type=drop_table_conflict)
+
+    async def list_tables(self):
+        return check_response(await self._conn.list_tables(self._db_name))
+
+    @name_validity_check("table_name", "Table")
+    async def show_table(self, table_name):
+        return check_response(await self._conn.show_table(db_name=self._db_name, table_name=table_name))
+
+    @name_validity_check("table_name", "Table")
+    async def get_table(self, table_name):
+        check_response(await self._conn.get_table(db_name=self._db_name, table_name=table_name))
+        return AsyncRemoteTable(self._conn, self._db_name, table_name)
+
+    async def show_tables(self):
+        return select_res_to_polars(check_response(await self._conn.show_tables(self._db_name)))
@@ -19,16 +19,19 @@ import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
 from infinity import InfinityConnection
 from infinity.errors import ErrorCode
 from infinity.remote_thrift.client import ThriftInfinityClient
-from infinity.remote_thrift.db import RemoteDatabase
-from infinity.remote_thrift.utils import name_validity_check, select_res_to_polars
+from infinity.remote_thrift.async_client import AsyncThriftInfinityClient, POOL_SIZE
+from infinity.remote_thrift.db import RemoteDatabase, AsyncRemoteDatabase
+from infinity.remote_thrift.utils import name_validity_check, select_res_to_polars, check_response
 from infinity.common import ConflictType, InfinityException
+from infinity.tracing import Tracer
+from infinity.result_cache import ResultCache
 
 
 class RemoteThriftInfinityConnection(InfinityConnection, ABC):
-    def __init__(self, uri, logger: logging.Logger = None):
+    def __init__(self, uri, logger: logging.Logger = None, tracer: Tracer = None, result_cache: ResultCache = None):
         super().__init__(uri)
         self.db_name = "default_db"
-        self._client = ThriftInfinityClient(uri, logger=logger)
+        self._client = ThriftInfinityClient(uri, logger=logger, tracer=tracer, result_cache=result_cache)
         self._is_connected = True
 
     def __del__(self):
@@ -79,6 +82,8 @@ class RemoteThriftInfinityConnection(InfinityConnection, ABC):
             raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
 
         res = self._client.drop_database(db_name=db_name, conflict_type=drop_database_conflict)
+        if self._client.result_cache is not None:
+            self._client.result_cache.invalidate_database(db_name)
         if res.error_code == ErrorCode.OK:
             return res
         else:
@@ -140,3 +145,98 @@ class RemoteThriftInfinityConnection(InfinityConnection, ABC):
     @property
     def client(self):
         return self._client
+
+
+class AsyncRemoteThriftInfinityConnection(RemoteThriftInfinityConnection):
+    """
+    asyncio connection returned by infinity.connect_async(). Concurrent requests are multiplexed over
+    `pool_size` pipelined connections, every method is a coroutine.
+    """
+
+    def __init__(self, uri, pool_size: int = POOL_SIZE, logger: logging.Logger = None):
+        InfinityConnection.__init__(self, uri)
+        self.db_name = "default_db"
+        self._client = AsyncThriftInfinityClient(uri, pool_size=pool_size, logger=logger)
+        self._is_connected = False
+
+    def __del__(self):
+        pass
+
+    async def connect(self):
+        await self._client.connect()
+        self._is_connected = True
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+
+    @name_validity_check("db_name", "DB")
+    async def create_database(self, db_name: str, conflict_type: ConflictType = ConflictType.Error,
+                              comment: str = None):
+        if conflict_type == ConflictType.Error:
+            create_database_conflict = ttypes.CreateConflict.Error
+        elif conflict_type == ConflictType.Ignore:
+            create_database_conflict = ttypes.CreateConflict.Ignore
+        elif conflict_type == ConflictType.Replace:
+            create_database_conflict = ttypes.CreateConflict.Replace
+        else:
+            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+
+        check_response(await self._client.create_database(db_name=db_name, conflict_type=create_database_conflict,
+                                                          comment=comment))
+        return AsyncRemoteDatabase(self._client, db_name)
+
+    async def list_databases(self):
+        return check_response(await self._client.list_databases())
+
+    @name_validity_check("db_name", "DB")
+    async def show_database(self, db_name: str):
+        return check_response(await self._client.show_database(db_name=db_name))
+
+    @name_validity_check("db_name", "DB")
+    async def drop_database(self, db_name: str, conflict_type: ConflictType = ConflictType.Error):
+        if conflict_type == ConflictType.Error:
+            drop_database_conflict = ttypes.DropConflict.Error
+        elif conflict_type == ConflictType.Ignore:
+            drop_database_conflict = ttypes.DropConflict.Ignore
+        else:
+            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+        return check_response(await self._client.drop_database(db_name=db_name, conflict_type=drop_database_conflict))
+
+    @name_validity_check("db_name", "DB")
+    async def get_database(self, db_name: str):
+        check_response(await self._client.get_database(db_name))
+        return AsyncRemoteDatabase(self._client, db_name)
+
+    async def show_current_node(self):
+        return check_response(await self._client.show_current_node())
+
+    async def cleanup(self):
+        return check_response(await self._client.cleanup())
+
+    async def optimize(self, db_name: str, table_name: str, optimize_opt: ttypes.OptimizeOptions):
+        return check_response(await self._client.optimize(db_name, table_name, optimize_opt))
+
+    async def test_command(self, command_content: str):
+        command = ttypes.CommandRequest()
+        command.command_type = "test_command"
+        command.test_command_content = command_content
+        await self._client.command(command)
+
+    async def flush_data(self):
+        flush_request = ttypes.FlushRequest()
+        flush_request.flush_type = "data"
+        await self._client.flush(flush_request)
+
+    async def flush_delta(self):
+        flush_request = ttypes.FlushRequest()
+        flush_request.flush_type = "delta"
+        await self._client.flush(flush_request)
+
+    async def disconnect(self):
+        res = check_response(await self._client.disconnect())
+        self._is_connected = False
+        return res
@@ -284,6 +284,8 @@ class CopyFileType(object):
     FVECS = 3
     CSR = 4
     BVECS = 5
+    PARQUET = 6
+    ARROW = 7
 
     _VALUES_TO_NAMES = {
         0: "CSV",
@@ -292,6 +294,8 @@ class CopyFileType(object):
         3: "FVECS",
         4: "CSR",
         5: "BVECS",
+        6: "PARQUET",
+        7: "ARROW",
     }
 
     _NAMES_TO_VALUES = {
@@ -301,6 +305,8 @@ class CopyFileType(object):
         "FVECS": 3,
         "CSR": 4,
         "BVECS": 5,
+        "PARQUET": 6,
+        "ARROW": 7,
     }
 
 
@@ -1448,11 +1454,12 @@ class EmbeddingData(object):
      - f64_array_value
      - f16_array_value
      - bf16_array_value
+     - raw_data
 
     """
 
 
-    def __init__(self, bool_array_value=None, u8_array_value=None, i8_array_value=None, i16_array_value=None, i32_array_value=None, i64_array_value=None, f32_array_value=None, f64_array_value=None, f16_array_value=None, bf16_array_value=None,):
+    def __init__(self, bool_array_value=None, u8_array_value=None, i8_array_value=None, i16_array_value=None, i32_array_value=None, i64_array_value=None, f32_array_value=None, f64_array_value=None, f16_array_value=None, bf16_array_value=None, raw_data=None,):
         self.bool_array_value = bool_array_value
         self.u8_array_value = u8_array_value
         self.i8_array_value = i8_array_value
@@ -1463,6 +1470,7 @@ class EmbeddingData(object):
         self.f64_array_value = f64_array_value
         self.f16_array_value = f16_array_value
         self.bf16_array_value = bf16_array_value
+        self.raw_data = raw_data
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1573,6 +1581,11 @@ class EmbeddingData(object):
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.STRING:
+                    self.raw_data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1653,6 +1666,10 @@ class EmbeddingData(object):
                 oprot.writeDouble(iter83)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
+        if self.raw_data is not None:
+            oprot.writeFieldBegin('raw_data', TType.STRING, 11)
+            oprot.writeBinary(self.raw_data)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6139,12 +6156,16 @@ class InsertRequest(object):
      - table_name
      - fields
      - session_id
+     - column_defs
+     - column_fields
 
     """
 
 
     def __init__(self, db_name=None, table_name=None, fields=[
-    ], session_id=None,):
+    ], session_id=None, column_defs=[
+    ], column_fields=[
+    ],):
         self.db_name = db_name
         self.table_name = table_name
         if fields is self.thrift_spec[3][4]:
@@ -6152,6 +6173,14 @@ class InsertRequest(object):
             ]
         self.fields = fields
         self.session_id = session_id
+        if column_defs is self.thrift_spec[5][4]:
+            column_defs = [
+            ]
+        self.column_defs = column_defs
+        if column_fields is self.thrift_spec[6][4]:
+            column_fields = [
+            ]
+        self.column_fields = column_fields
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -6188,6 +6217,28 @@ class InsertRequest(object):
                     self.session_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.LIST:
+                    self.column_defs = []
+                    (_etype502, _size501) = iprot.readListBegin()
+                    for _i503 in range(_size501):
+                        _elem504 = ColumnDef()
+                        _elem504.read(iprot)
+                        self.column_defs.append(_elem504)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.LIST:
+                    self.column_fields = []
+                    (_etype508, _size507) = iprot.readListBegin()
+                    for _i509 in range(_size507):
+                        _elem510 = ColumnField()
+                        _elem510.read(iprot)
+                        self.column_fields.append(_elem510)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -6217,6 +6268,20 @@ class InsertRequest(object):
             oprot.writeFieldBegin('session_id', TType.I64, 4)
             oprot.writeI64(self.session_id)
             oprot.writeFieldEnd()
+        if self.column_defs is not None:
+            oprot.writeFieldBegin('column_defs', TType.LIST, 5)
+            oprot.writeListBegin(TType.STRUCT, len(self.column_defs))
+            for iter506 in self.column_defs:
+                iter506.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.column_fields is not None:
+            oprot.writeFieldBegin('column_fields', TType.LIST, 6)
+            oprot.writeListBegin(TType.STRUCT, len(self.column_fields))
+            for iter512 in self.column_fields:
+                iter512.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6243,16 +6308,26 @@ class ImportRequest(object):
      - file_name
      - import_option
      - session_id
+     - data
+     - import_id
+     - last_chunk
+     - chunk_index
+     - abort_import
 
     """
 
 
-    def __init__(self, db_name=None, table_name=None, file_name=None, import_option=None, session_id=None,):
+    def __init__(self, db_name=None, table_name=None, file_name=None, import_option=None, session_id=None, data=None, import_id=None, last_chunk=None, chunk_index=None, abort_import=None,):
         self.db_name = db_name
         self.table_name = table_name
         self.file_name = file_name
         self.import_option = import_option
         self.session_id = session_id
+        self.data = data
+        self.import_id = import_id
+        self.last_chunk = last_chunk
+        self.chunk_index = chunk_index
+        self.abort_import = abort_import
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -6289,6 +6364,31 @@ class ImportRequest(object):
                     self.session_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.I64:
+                    self.import_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.BOOL:
+                    self.last_chunk = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.I64:
+                    self.chunk_index = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.BOOL:
+                    self.abort_import = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -6319,6 +6419,26 @@ class ImportRequest(object):
             oprot.writeFieldBegin('session_id', TType.I64, 5)
             oprot.writeI64(self.session_id)
             oprot.writeFieldEnd()
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRING, 6)
+            oprot.writeBinary(self.data)
+            oprot.writeFieldEnd()
+        if self.import_id is not None:
+            oprot.writeFieldBegin('import_id', TType.I64, 7)
+            oprot.writeI64(self.import_id)
+            oprot.writeFieldEnd()
+        if self.last_chunk is not None:
+            oprot.writeFieldBegin('last_chunk', TType.BOOL, 8)
+            oprot.writeBool(self.last_chunk)
+            oprot.writeFieldEnd()
+        if self.chunk_index is not None:
+            oprot.writeFieldBegin('chunk_index', TType.I64, 9)
+            oprot.writeI64(self.chunk_index)
+            oprot.writeFieldEnd()
+        if self.abort_import is not None:
+            oprot.writeFieldBegin('abort_import', TType.BOOL, 10)
+            oprot.writeBool(self.abort_import)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6836,6 +6956,8 @@ class SelectRequest(object):
      - offset_expr
      - order_by_list
      - total_hits_count
+     - batch_embedding_data
+     - profile
 
     """
 
@@ -6844,7 +6966,8 @@ class SelectRequest(object):
     ], highlight_list=[
     ], search_expr=None, where_expr=None, group_by_list=[
     ], having_expr=None, limit_expr=None, offset_expr=None, order_by_list=[
-    ], total_hits_count=None,):
+    ], total_hits_count=None, batch_embedding_data=[
+    ], profile=None,):
         self.session_id = session_id
         self.db_name = db_name
         self.table_name = table_name
@@ -6870,6 +6993,11 @@ class SelectRequest(object):
             ]
         self.order_by_list = order_by_list
         self.total_hits_count = total_hits_count
+        if batch_embedding_data is self.thrift_spec[14][4]:
+            batch_embedding_data = [
+            ]
+        self.batch_embedding_data = batch_embedding_data
+        self.profile = profile
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -6974,6 +7102,22 @@ class SelectRequest(object):
                     self.total_hits_count = iprot.readBool()
                 else:
                     iprot.skip(ftype)
+            elif fid == 14:
+                if ftype == TType.LIST:
+                    self.batch_embedding_data = []
+                    (_etype514, _size513) = iprot.readListBegin()
+                    for _i515 in range(_size513):
+                        _elem516 = EmbeddingData()
+                        _elem516.read(iprot)
+                        self.batch_embedding_data.append(_elem516)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 15:
+                if ftype == TType.BOOL:
+                    self.profile = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -7048,6 +7192,17 @@ class SelectRequest(object):
             oprot.writeFieldBegin('total_hits_count', TType.BOOL, 13)
             oprot.writeBool(self.total_hits_count)
             oprot.writeFieldEnd()
+        if self.batch_embedding_data is not None:
+            oprot.writeFieldBegin('batch_embedding_data', TType.LIST, 14)
+            oprot.writeListBegin(TType.STRUCT, len(self.batch_embedding_data))
+            for iter518 in self.batch_embedding_data:
+                iter518.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.profile is not None:
+            oprot.writeFieldBegin('profile', TType.BOOL, 15)
+            oprot.writeBool(self.profile)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -7074,13 +7229,15 @@ class SelectResponse(object):
      - column_defs
      - column_fields
      - extra_result
+     - batch_block_counts
 
     """
 
 
     def __init__(self, error_code=None, error_msg=None, column_defs=[
     ], column_fields=[
-    ], extra_result=None,):
+    ], extra_result=None, batch_block_counts=[
+    ],):
         self.error_code = error_code
         self.error_msg = error_msg
         if column_defs is self.thrift_spec[3][4]:
@@ -7092,6 +7249,10 @@ class SelectResponse(object):
             ]
         self.column_fields = column_fields
         self.extra_result = extra_result
+        if batch_block_counts is self.thrift_spec[6][4]:
+            batch_block_counts = [
+            ]
+        self.batch_block_counts = batch_block_counts
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -7139,6 +7300,16 @@ class SelectResponse(object):
                     self.extra_result = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.LIST:
+                    self.batch_block_counts = []
+                    (_etype520, _size519) = iprot.readListBegin()
+                    for _i521 in range(_size519):
+                        _elem522 = iprot.readI64()
+                        self.batch_block_counts.append(_elem522)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -7175,6 +7346,13 @@ class SelectResponse(object):
             oprot.writeFieldBegin('extra_result', TType.STRING, 5)
             oprot.writeString(self.extra_result.encode('utf-8') if sys.version_info[0] == 2 else self.extra_result)
             oprot.writeFieldEnd()
+        if self.batch_block_counts is not None:
+            oprot.writeFieldBegin('batch_block_counts', TType.LIST, 6)
+            oprot.writeListBegin(TType.I64, len(self.batch_block_counts))
+            for iter524 in self.batch_block_counts:
+                oprot.writeI64(iter524)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9127,6 +9305,7 @@ EmbeddingData.thrift_spec = (
     (8, TType.LIST, 'f64_array_value', (TType.DOUBLE, None, False), None, ),  # 8
     (9, TType.LIST, 'f16_array_value', (TType.DOUBLE, None, False), None, ),  # 9
     (10, TType.LIST, 'bf16_array_value', (TType.DOUBLE, None, False), None, ),  # 10
+    (11, TType.STRING, 'raw_data', 'BINARY', None, ),  # 11
 )
 all_structs.append(InitParameter)
 InitParameter.thrift_spec = (
@@ -9517,6 +9696,10 @@ InsertRequest.thrift_spec = (
     (3, TType.LIST, 'fields', (TType.STRUCT, [Field, None], False), [
     ], ),  # 3
     (4, TType.I64, 'session_id', None, None, ),  # 4
+    (5, TType.LIST, 'column_defs', (TType.STRUCT, [ColumnDef, None], False), [
+    ], ),  # 5
+    (6, TType.LIST, 'column_fields', (TType.STRUCT, [ColumnField, None], False), [
+    ], ),  # 6
 )
 all_structs.append(ImportRequest)
 ImportRequest.thrift_spec = (
@@ -9526,6 +9709,11 @@ ImportRequest.thrift_spec = (
     (3, TType.STRING, 'file_name', 'UTF8', None, ),  # 3
     (4, TType.STRUCT, 'import_option', [ImportOption, None], None, ),  # 4
     (5, TType.I64, 'session_id', None, None, ),  # 5
+    (6, TType.STRING, 'data', 'BINARY', None, ),  # 6
+    (7, TType.I64, 'import_id', None, None, ),  # 7
+    (8, TType.BOOL, 'last_chunk', None, None, ),  # 8
+    (9, TType.I64, 'chunk_index', None, None, ),  # 9
+    (10, TType.BOOL, 'abort_import', None, None, ),  # 10
 )
 all_structs.append(ExportRequest)
 ExportRequest.thrift_spec = (
@@ -9588,6 +9776,9 @@ SelectRequest.thrift_spec = (
     (12, TType.LIST, 'order_by_list', (TType.STRUCT, [OrderByExpr, None], False), [
     ], ),  # 12
     (13, TType.BOOL, 'total_hits_count', None, None, ),  # 13
+    (14, TType.LIST, 'batch_embedding_data', (TType.STRUCT, [EmbeddingData, None], False), [
+    ], ),  # 14
+    (15, TType.BOOL, 'profile', None, None, ),  # 15
 )
 all_structs.append(SelectResponse)
 SelectResponse.thrift_spec = (
@@ -9599,6 +9790,8 @@ SelectResponse.thrift_spec = (
     (4, TType.LIST, 'column_fields', (TType.STRUCT, [ColumnField, None], False), [
     ], ),  # 4
     (5, TType.STRING, 'extra_result', 'UTF8', None, ),  # 5
+    (6, TType.LIST, 'batch_block_counts', (TType.I64, None, False), [
+    ], ),  # 6
 )
 all_structs.append(DeleteRequest)
 DeleteRequest.thrift_spec = (
@@ -18,21 +18,68 @@ from abc import ABC
 from typing import List, Optional, Any
 
 import numpy as np
-import pandas as pd
-import polars as pl
-import pyarrow as pa
-from pyarrow import Table
-from sqlglot import condition, maybe_parse
 
-from infinity.common import VEC, SparseVector, InfinityException, SortType
+from infinity.common import VEC, SparseVector, InfinityException, SortType, Param
 from infinity.errors import ErrorCode
 from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
+from infinity.utils import LazyModule
 from infinity.remote_thrift.types import (
+    build_result,
+    build_arrow_result,
+    split_batch_result,
     logic_type_to_dtype,
+    make_embedding_data,
+    embedding_element_type,
     make_match_tensor_expr,
     make_match_sparse_expr,
 )
-from infinity.remote_thrift.utils import traverse_conditions, parse_expr, get_search_optional_filter_from_opt_params
+from infinity.remote_thrift.utils import (
+    parse_condition,
+    parse_column,
+    get_search_optional_filter_from_opt_params,
+    EmbeddingParam,
+    bind_params,
+)
+
+# the dataframe libraries are imported by the first to_df / to_pl / to_arrow
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+pa = LazyModule("pyarrow")
+
+DEFAULT_BATCH_ROWS = 65536
+
+
+def build_df_result(res: SelectResponse) -> (pd.DataFrame, {}):
+    df_dict = {}
+    data_dict, data_type_dict, extra_result = build_result(res, as_numpy=True)
+    for k, v in data_dict.items():
+        if isinstance(v, np.ndarray) and v.ndim == 2:
+            # one row view per embedding instead of a python list of floats
+            data_series = pd.Series(list(v), dtype=object)
+        else:
+            data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
+        df_dict[k] = data_series
+    return pd.DataFrame(df_dict), extra_result
+
+
+def build_pl_result(res: SelectResponse) -> (pl.DataFrame, {}):
+    arrow_table, extra_result = build_arrow_result(res)
+    return pl.from_arrow(arrow_table), extra_result
+
+
+def build_arrow_batch(res: SelectResponse) -> pa.Table:
+    return build_arrow_result(res)[0]
+
+
+def build_numpy_batch(res: SelectResponse) -> dict[str, Any]:
+    return build_result(res, as_numpy=True)[0]
+
+
+def build_search_batch_result(res: SelectResponse) -> list[tuple[dict[str, list[Any]], dict[str, Any], {}]]:
+    if not res.batch_block_counts:
+        raise InfinityException(ErrorCode.NOT_SUPPORTED, "Batch search is not supported by the server")
+    return [build_result(query_res) for query_res in split_batch_result(res)]
+
 
 """FIXME: How to disable validation of only the search field?"""
 
@@ -49,7 +96,9 @@ class Query(ABC):
             limit: Optional[ParsedExpr],
             offset: Optional[ParsedExpr],
             sort: Optional[List[OrderByExpr]],
-            total_hits_count: Optional[bool]
+            total_hits_count: Optional[bool],
+            batch_embedding_data: Optional[List[EmbeddingData]] = None,
+            profile: Optional[bool] = None,
     ):
         self.columns = columns
         self.highlight = highlight
@@ -61,6 +110,8 @@ class Query(ABC):
         self.offset = offset
         self.sort = sort
         self.total_hits_count = total_hits_count
+        self.batch_embedding_data = batch_embedding_data
+        self.profile = profile
 
 
 class ExplainQuery(Query):
@@ -81,6 +132,130 @@ class ExplainQuery(Query):
         self.explain_type = explain_type
 
 
+def row_id_expr() -> ParsedExpr:
+    return ParsedExpr(type=ParsedExprType(function_expr=FunctionExpr(function_name="row_id", arguments=[])))
+
+
+def star_expr() -> ParsedExpr:
+    return ParsedExpr(type=ParsedExprType(column_expr=ColumnExpr(star=True, column_name=[])))
+
+
+def int64_expr(value: int) -> ParsedExpr:
+    return ParsedExpr(type=ParsedExprType(constant_expr=ConstantExpr(literal_type=LiteralType.Int64, i64_value=value)))
+
+
+class BatchQuery:
+    """
+    Keyset paging over a plain scan. Every batch is a select ordered by _row_id, limited to batch_rows, that resumes
+    after the last row id of the previous batch. The server doesn't push the _row_id bound down into the scan: every
+    batch still reads and filters the whole table and top-N sorts the rows past the bound, so scanning N rows costs
+    O(N * N / batch_rows) on the server. It bounds client memory, not server work.
+    """
+
+    def __init__(
+            self,
+            columns: List[ParsedExpr],
+            highlight: Optional[List[ParsedExpr]],
+            filter: Optional[ParsedExpr],
+            batch_rows: int,
+            result_builder,
+    ):
+        # without output() every column is scanned. _row_id is appended to every batch to find where to resume and
+        # dropped before the batch is built
+        if columns is None:
+            columns = [star_expr()]
+        self.columns = columns + [row_id_expr()]
+        self.highlight = highlight
+        self.filter = filter
+        self.batch_rows = batch_rows
+        self.result_builder = result_builder
+        self.last_row_id = None
+        self.done = False
+
+    def next_query(self) -> Query:
+        where_expr = self.filter
+        if self.last_row_id is not None:
+            row_id_filter = ParsedExpr(type=ParsedExprType(function_expr=FunctionExpr(
+                function_name=">", arguments=[row_id_expr(), int64_expr(self.last_row_id)])))
+            if where_expr is None:
+                where_expr = row_id_filter
+            else:
+                where_expr = ParsedExpr(type=ParsedExprType(function_expr=FunctionExpr(
+                    function_name="and", arguments=[where_expr, row_id_filter])))
+        return Query(
+            columns=self.columns,
+            highlight=self.highlight,
+            search=None,
+            filter=where_expr,
+            groupby=None,
+            having=None,
+            limit=int64_expr(self.batch_rows),
+            offset=None,
+            sort=[OrderByExpr(expr=row_id_expr(), asc=True)],
+            total_hits_count=None,
+        )
+
+    def read_batch(self, res: SelectResponse):
+        row_id_vectors = res.column_fields[-1].column_vectors
+        row_count = sum(len(row_id_vector) for row_id_vector in row_id_vectors) // 8
+        self.done = row_count < self.batch_rows
+        if row_count == 0:
+            return None
+        last_row_id_vector = next(row_id_vector for row_id_vector in reversed(row_id_vectors) if row_id_vector)
+        self.last_row_id = int(np.frombuffer(last_row_id_vector, dtype='<i8')[-1])
+        res.column_defs = res.column_defs[:-1]
+        res.column_fields = res.column_fields[:-1]
+        return self.result_builder(res)
+
+
+def bind_query(query: Query, params: dict[str, Any]) -> Query:
+    # raises for a parameter missing from params, returns the query itself when it has no parameters
+    search = bind_params(query.search, params)
+    filter = bind_params(query.filter, params)
+    having = bind_params(query.having, params)
+    if search is query.search and filter is query.filter and having is query.having:
+        return query
+    return Query(
+        columns=query.columns,
+        highlight=query.highlight,
+        search=search,
+        filter=filter,
+        groupby=query.groupby,
+        having=having,
+        limit=query.limit,
+        offset=query.offset,
+        sort=query.sort,
+        total_hits_count=query.total_hits_count,
+        batch_embedding_data=query.batch_embedding_data,
+        profile=query.profile,
+    )
+
+
+class PreparedQuery:
+    """
+    A query parsed once and run with new parameters on every call, see InfinityThriftQueryBuilder.prepare.
+    """
+
+    def __init__(self, table, query: Query):
+        self._table = table
+        self._query = query
+
+    def bind(self, **params) -> Query:
+        return bind_query(self._query, params)
+
+    def to_result(self, **params) -> tuple[dict[str, list[Any]], dict[str, Any], {}]:
+        return self._table._execute_query(self.bind(**params), build_result)
+
+    def to_df(self, **params) -> (pd.DataFrame, {}):
+        return self._table._execute_query(self.bind(**params), build_df_result)
+
+    def to_pl(self, **params) -> (pl.DataFrame, {}):
+        return self._table._execute_query(self.bind(**params), build_pl_result)
+
+    def to_arrow(self, **params) -> (pa.Table, {}):
+        return self._table._execute_query(self.bind(**params), build_arrow_result)
+
+
 class InfinityThriftQueryBuilder(ABC):
     def __init__(self, table):
         self._table = table
@@ -94,6 +269,7 @@ class InfinityThriftQueryBuilder(ABC):
         self._offset = None
         self._sort = None
         self._total_hits_count = None
+        self._profile = None
 
     def reset(self):
         self._columns = None
@@ -106,6 +282,7 @@ class InfinityThriftQueryBuilder(ABC):
         self._offset = None
         self._sort = None
         self._total_hits_count = None
+        self._profile = None
 
     def match_dense(
             self,
@@ -127,77 +304,11 @@ class InfinityThriftQueryBuilder(ABC):
                 ErrorCode.INVALID_TOPK_TYPE, f"Invalid topn, type should be embedded, but get {type(topn)}"
             )
 
-        # type casting
-        if isinstance(embedding_data, list):
-            embedding_data = embedding_data
-        elif isinstance(embedding_data, tuple):
-            embedding_data = embedding_data
-        elif isinstance(embedding_data, np.ndarray):
-            embedding_data = embedding_data.tolist()
-        else:
-            raise InfinityException(
-                ErrorCode.INVALID_DATA_TYPE,
-                f"Invalid embedding data, type should be embedded, but get {type(embedding_data)}",
-            )
-
-        if embedding_data_type == "bit":
-            if len(embedding_data) % 8 != 0:
-                raise InfinityException(
-                    ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
-                    f"Embeddings with data bit must have dimension of times of 8!"
-                )
-            else:
-                new_embedding_data = []
-                dimesions = int(len(embedding_data) / 8)
-                for i in range(dimesions):
-                    bitunit = 0
-                    for bit_idx in range(8):
-                        if embedding_data[i * 8 + bit_idx] > 0:
-                            bitunit |= (1 << bit_idx)
-                    new_embedding_data.append(bitunit)
-                embedding_data = new_embedding_data
-
-        if embedding_data_type in ["uint8", "int8", "int16", "int32", "int", "int64"]:
-            embedding_data = [int(x) for x in embedding_data]
-
-        if embedding_data_type in ["float", "float32", "double", "float64", "float16", "bfloat16"]:
-            embedding_data = [float(x) for x in embedding_data]
-
-        data = EmbeddingData()
-        elem_type = ElementType.ElementFloat32
-        if embedding_data_type == "bit":
-            elem_type = ElementType.ElementBit
-            data.u8_array_value = embedding_data
-        elif embedding_data_type == "uint8":
-            elem_type = ElementType.ElementUInt8
-            data.u8_array_value = embedding_data
-        elif embedding_data_type == "int8":
-            elem_type = ElementType.ElementInt8
-            data.i8_array_value = embedding_data
-        elif embedding_data_type == "int16":
-            elem_type = ElementType.ElementInt16
-            data.i16_array_value = embedding_data
-        elif embedding_data_type in ["int", "int32"]:
-            elem_type = ElementType.ElementInt32
-            data.i32_array_value = embedding_data
-        elif embedding_data_type == "int64":
-            elem_type = ElementType.ElementInt64
-            data.i64_array_value = embedding_data
-        elif embedding_data_type in ["float", "float32"]:
-            elem_type = ElementType.ElementFloat32
-            data.f32_array_value = embedding_data
-        elif embedding_data_type in ["double", "float64"]:
-            elem_type = ElementType.ElementFloat64
-            data.f64_array_value = embedding_data
-        elif embedding_data_type == "float16":
-            elem_type = ElementType.ElementFloat16
-            data.f16_array_value = embedding_data
-        elif embedding_data_type == "bfloat16":
-            elem_type = ElementType.ElementBFloat16
-            data.bf16_array_value = embedding_data
+        if isinstance(embedding_data, Param):
+            data, elem_type = EmbeddingParam(embedding_data.name, embedding_data_type), \
+                embedding_element_type(embedding_data_type)
         else:
-            raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
-                                    f"Invalid embedding {embedding_data[0]} type")
+            data, elem_type = make_embedding_data(embedding_data, embedding_data_type)
 
         dist_type = KnnDistanceType.L2
         if distance_type == "l2":
@@ -233,6 +344,44 @@ class InfinityThriftQueryBuilder(ABC):
         self._search.match_exprs.append(generic_match_expr)
         return self
 
+    def search_batch(
+            self,
+            vector_column_name: str,
+            queries: VEC,
+            embedding_data_type: str,
+            distance_type: str,
+            topn: int,
+            knn_params: {} = None,
+    ) -> list[tuple[dict[str, list[Any]], dict[str, Any], {}]]:
+        """
+        Send match_dense for every row of queries in one round trip and return one to_result() style tuple per
+        query, in order. Output, filter and the other clauses already set on the builder apply to every query.
+        This saves round trips only: the server still runs the whole select, session lookup, decoding, planning and
+        execution, once per query vector.
+        """
+        if isinstance(queries, np.ndarray) and queries.ndim != 2:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Batch queries should be a 2-D array, but get {queries.ndim} dimensions")
+        if len(queries) == 0:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "Batch queries are empty")
+        self.match_dense(vector_column_name, queries[0], embedding_data_type, distance_type, topn, knn_params)
+        query = Query(
+            columns=self._columns,
+            highlight=self._highlight,
+            search=self._search,
+            filter=self._filter,
+            groupby=self._groupby,
+            having=self._having,
+            limit=self._limit,
+            offset=self._offset,
+            sort=self._sort,
+            total_hits_count=self._total_hits_count,
+            profile=self._profile,
+            batch_embedding_data=[make_embedding_data(query_data, embedding_data_type)[0] for query_data in queries],
+        )
+        self.reset()
+        return self._table._execute_query(bind_query(query, {}), build_search_batch_result)
+
     def match_sparse(
             self,
             vector_column_name: str,
@@ -326,7 +475,7 @@ class InfinityThriftQueryBuilder(ABC):
         return self
 
     def filter(self, where: Optional[str]) -> InfinityThriftQueryBuilder:
-        where_expr = traverse_conditions(condition(where))
+        where_expr = parse_condition(where)
         self._filter = where_expr
         return self
 
@@ -349,14 +498,14 @@ class InfinityThriftQueryBuilder(ABC):
         if isinstance(columns, list):
             for column in columns:
                 column = column.lower()
-                group_by_list.append(parse_expr(maybe_parse(column)))
+                group_by_list.append(parse_column(column))
         else:
-            group_by_list.append(parse_expr(maybe_parse(columns)))
+            group_by_list.append(parse_column(columns))
         self._groupby = group_by_list
         return self
     
     def having(self, having: Optional[str]) -> InfinityThriftQueryBuilder:
-        having_expr = traverse_conditions(condition(having))
+        having_expr = parse_condition(having)
         self._having = having_expr
         return self
 
@@ -419,7 +568,7 @@ class InfinityThriftQueryBuilder(ABC):
                     parsed_expr = ParsedExpr(type=expr_type)
                     select_list.append(parsed_expr)
                 case _:
-                    select_list.append(parse_expr(maybe_parse(column)))
+                    select_list.append(parse_column(column))
 
         self._columns = select_list
         return self
@@ -429,7 +578,7 @@ class InfinityThriftQueryBuilder(ABC):
         for column in columns:
             if isinstance(column, str):
                 column = column.lower()
-            highlight_list.append(parse_expr(maybe_parse(column)))
+            highlight_list.append(parse_column(column))
 
         self._highlight = highlight_list
         return self
@@ -438,6 +587,10 @@ class InfinityThriftQueryBuilder(ABC):
         if 'total_hits_count' in option_kv:
             if isinstance(option_kv['total_hits_count'], bool):
                 self._total_hits_count = option_kv['total_hits_count']
+        if 'profile' in option_kv:
+            # the server profiles this query alone and returns the profile in extra_result, see infinity.profile
+            if isinstance(option_kv['profile'], bool):
+                self._profile = option_kv['profile']
         return self
 
     def sort(self, order_by_expr_list: Optional[List[list[str, SortType]]]) -> InfinityThriftQueryBuilder:
@@ -520,7 +673,7 @@ class InfinityThriftQueryBuilder(ABC):
                     order_by_expr = OrderByExpr(expr=parsed_expr, asc=order_by_flag)
                     sort_list.append(order_by_expr)
                 case _:
-                    parsed_expr = parse_expr(maybe_parse(order_by_expr_str))
+                    parsed_expr = parse_column(order_by_expr_str)
                     order_by_flag: bool = order_by_expr[1] == SortType.Asc
                     sort_list.append(OrderByExpr(expr=parsed_expr, asc=order_by_flag))
 
@@ -542,6 +695,15 @@ class InfinityThriftQueryBuilder(ABC):
         return self._table._to_string(query)
 
     def to_result(self) -> tuple[dict[str, list[Any]], dict[str, Any], {}]:
+        return self._to_result(build_result)
+
+    def prepare(self) -> PreparedQuery:
+        """
+        Freeze the query built so far. Filters may use ":name" parameters and match_dense may take Param("name")
+        as query vector, both are bound by keyword on every call without parsing the query again:
+            query = table.output(["id"]).filter("price < :p").match_dense("vec", Param("q"), "float", "l2", 10).prepare()
+            res, _, extra_result = query.to_result(p=100, q=[1.0, 2.0, 3.0, 4.0])
+        """
         query = Query(
             columns=self._columns,
             highlight=self._highlight,
@@ -553,25 +715,66 @@ class InfinityThriftQueryBuilder(ABC):
             offset=self._offset,
             sort=self._sort,
             total_hits_count=self._total_hits_count,
+            profile=self._profile,
         )
         self.reset()
-        return self._table._execute_query(query)
+        return PreparedQuery(self._table, query)
+
+    def _to_result(self, result_builder) -> tuple[dict[str, Any], dict[str, Any], {}]:
+        query = Query(
+            columns=self._columns,
+            highlight=self._highlight,
+            search=self._search,
+            filter=self._filter,
+            groupby=self._groupby,
+            having=self._having,
+            limit=self._limit,
+            offset=self._offset,
+            sort=self._sort,
+            total_hits_count=self._total_hits_count,
+            profile=self._profile,
+        )
+        self.reset()
+        return self._table._execute_query(bind_query(query, {}), result_builder)
 
     def to_df(self) -> (pd.DataFrame, {}):
-        df_dict = {}
-        data_dict, data_type_dict, extra_result = self.to_result()
-        for k, v in data_dict.items():
-            data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
-            df_dict[k] = data_series
-        return pd.DataFrame(df_dict), extra_result
+        return self._to_result(build_df_result)
+
+    def to_batches(self, batch_rows: int = DEFAULT_BATCH_ROWS, output_format: str = "arrow"):
+        """
+        Scan the result in batches of at most batch_rows rows, as pyarrow Tables (output_format="arrow") or dicts of
+        numpy arrays (output_format="numpy"). Only output, highlight and filter are supported, rows come in _row_id
+        order and client memory is bounded by one batch. Every batch is a separate select that scans the whole table,
+        so the server work grows quadratically with the row count, O(N * N / batch_rows); use a larger batch_rows for
+        big tables.
+        """
+        if any(clause is not None for clause in (self._search, self._groupby, self._having, self._limit,
+                                                 self._offset, self._sort)):
+            raise InfinityException(ErrorCode.NOT_SUPPORTED,
+                                    "to_batches only supports output, highlight and filter")
+        if batch_rows <= 0:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid batch_rows: {batch_rows}")
+        if output_format == "arrow":
+            result_builder = build_arrow_batch
+        elif output_format == "numpy":
+            result_builder = build_numpy_batch
+        else:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid output format: {output_format}")
+        batch_query = BatchQuery(
+            columns=self._columns,
+            highlight=self._highlight,
+            filter=bind_params(self._filter, {}),
+            batch_rows=batch_rows,
+            result_builder=result_builder,
+        )
+        self.reset()
+        return self._table._execute_batches(batch_query)
 
     def to_pl(self) -> (pl.DataFrame, {}):
-        dataframe, extra_result = self.to_df()
-        return pl.from_pandas(dataframe), extra_result
+        return self._to_result(build_pl_result)
 
-    def to_arrow(self) -> (Table, {}):
-        dataframe, extra_result = self.to_df()
-        return pa.Table.from_pandas(dataframe), extra_result
+    def to_arrow(self) -> (pa.Table, {}):
+        return self._to_result(build_arrow_result)
 
     def explain(self, explain_type=ExplainType.Physical) -> Any:
         query = ExplainQuery(
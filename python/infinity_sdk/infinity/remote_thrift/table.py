@@ -17,27 +17,38 @@ import functools
 import inspect
 from typing import Optional, Union, List, Any
 
-from sqlglot import condition
+from thrift.TSerialization import serialize
 
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
 from infinity.common import INSERT_DATA, VEC, InfinityException, SparseVector
 from infinity.errors import ErrorCode
 from infinity.index import IndexInfo
-from infinity.remote_thrift.query_builder import Query, InfinityThriftQueryBuilder, ExplainQuery
-from infinity.remote_thrift.types import build_result
+from infinity.remote_thrift.query_builder import Query, InfinityThriftQueryBuilder, ExplainQuery, BatchQuery, DEFAULT_BATCH_ROWS
+from infinity.remote_thrift.types import build_result, columns_to_insert_columns, arrow_column_to_values, \
+    arrow_to_import_chunks
 from infinity.remote_thrift.utils import (
-    traverse_conditions,
+    parse_condition,
     name_validity_check,
     select_res_to_polars,
     check_valid_name,
-    get_remote_constant_expr_from_python_value,
+    get_insert_fields,
+    get_update_exprs,
+    get_import_options,
+    get_export_options,
+    check_response,
     get_ordinary_info,
     parsed_expression_to_string,
     search_to_string
 )
 from infinity.table import ExplainType
 from infinity.common import ConflictType, DEFAULT_MATCH_VECTOR_TOPN, SortType
-from infinity.utils import deprecated_api
+from infinity.utils import deprecated_api, LazyModule, is_instance_of
+from infinity.tracing import trace_call
+
+# imported on first use, annotations naming them are quoted as params_type_check evaluates annotations
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+pa = LazyModule("pyarrow")
 
 
 class RemoteTable():
@@ -172,137 +183,66 @@ class RemoteTable():
 
     def insert(self, data: Union[INSERT_DATA, list[INSERT_DATA]]):
         # [{"c1": 1, "c2": 1.1}, {"c1": 2, "c2": 2.2}]
-        db_name = self._db_name
-        table_name = self._table_name
-        fields: list[ttypes.Field] = []
-
-        if isinstance(data, dict):
-            data = [data]
-
-        for row in data:
-            column_names = []
-            parse_exprs = []
-            for column_name, value in row.items():
-                column_names.append(column_name)
-                constant_expression = get_remote_constant_expr_from_python_value(value)
-                expr_type = ttypes.ParsedExprType(constant_expr=constant_expression)
-                paser_expr = ttypes.ParsedExpr(type=expr_type)
-                parse_exprs.append(paser_expr)
-
-            field = ttypes.Field(column_names=column_names, parse_exprs=parse_exprs)
-            fields.append(field)
-
-        res = self._conn.insert(db_name=db_name, table_name=table_name, fields=fields)
+        res = self._conn.insert(db_name=self._db_name, table_name=self._table_name, fields=get_insert_fields(data))
         if res.error_code == ErrorCode.OK:
+            self._invalidate_result_cache()
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
-    def import_data(self, file_path: str, import_options: {} = None):
-        options = ttypes.ImportOption()
-        options.has_header = False
-        options.delimiter = ','
-        options.copy_file_type = ttypes.CopyFileType.CSV
-        if import_options != None:
-            for k, v in import_options.items():
-                key = k.lower()
-                if key == 'file_type':
-                    file_type = v.lower()
-                    if file_type == 'csv':
-                        options.copy_file_type = ttypes.CopyFileType.CSV
-                    elif file_type == 'json':
-                        options.copy_file_type = ttypes.CopyFileType.JSON
-                    elif file_type == 'jsonl':
-                        options.copy_file_type = ttypes.CopyFileType.JSONL
-                    elif file_type == 'fvecs':
-                        options.copy_file_type = ttypes.CopyFileType.FVECS
-                    elif file_type == 'csr':
-                        options.copy_file_type = ttypes.CopyFileType.CSR
-                    elif file_type == 'bvecs':
-                        options.copy_file_type = ttypes.CopyFileType.BVECS
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                f"Unrecognized export file type: {file_type}")
-                elif key == 'delimiter':
-                    delimiter = v.lower()
-                    if len(delimiter) != 1:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                f"Unrecognized export file delimiter: {delimiter}")
-                    options.delimiter = delimiter[0]
-                elif key == 'header':
-                    if isinstance(v, bool):
-                        options.has_header = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                "Boolean value is expected in header field")
-                else:
-                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
+    def insert_columns(self, columns: dict[str, Any]):
+        # {"c1": np.array([1, 2]), "c2": np.random.rand(2, 128).astype(np.float32), "c3": ["a", "b"]}
+        column_defs, column_fields = columns_to_insert_columns(columns)
+        res = self._conn.insert_columns(db_name=self._db_name, table_name=self._table_name,
+                                        column_defs=column_defs, column_fields=column_fields)
+        if res.error_code == ErrorCode.OK:
+            self._invalidate_result_cache()
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def insert_arrow(self, data: "pa.Table"):
+        return self.insert_columns(
+            {column_name: arrow_column_to_values(data.column(column_name)) for column_name in data.column_names})
+
+    def insert_df(self, data: Union["pd.DataFrame", "pl.DataFrame"]):
+        if is_instance_of(data, "polars", "DataFrame"):
+            return self.insert_arrow(data.to_arrow())
+        return self.insert_columns({column_name: data[column_name].to_numpy() for column_name in data.columns})
 
+    def import_data(self, file_path: str, import_options: {} = None):
+        options = get_import_options(import_options)
         res = self._conn.import_data(db_name=self._db_name,
                                      table_name=self._table_name,
                                      file_name=file_path,
                                      import_options=options)
         if res.error_code == ErrorCode.OK:
+            self._invalidate_result_cache()
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
-    def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
-        options = ttypes.ExportOption()
-        options.has_header = False
-        options.delimiter = ','
-        options.copy_file_type = ttypes.CopyFileType.CSV
-        options.offset = 0
-        options.limit = 0
-        options.row_limit = 0
-
-        if export_options != None:
-            for k, v in export_options.items():
-                key = k.lower()
-                if key == 'file_type':
-                    file_type = v.lower()
-                    if file_type == 'csv':
-                        options.copy_file_type = ttypes.CopyFileType.CSV
-                    elif file_type == 'jsonl':
-                        options.copy_file_type = ttypes.CopyFileType.JSONL
-                    elif file_type == 'fvecs':
-                        options.copy_file_type = ttypes.CopyFileType.FVECS
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                f"Unrecognized export file type: {file_type}")
-                elif key == 'delimiter':
-                    delimiter = v.lower()
-                    if len(delimiter) != 1:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                f"Unrecognized export file delimiter: {delimiter}")
-                    options.delimiter = delimiter[0]
-                elif key == 'header':
-                    if isinstance(v, bool):
-                        options.has_header = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                "Boolean value is expected in header field")
-                elif key == 'offset':
-                    if isinstance(v, int):
-                        options.offset = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                "Integer value is expected in 'offset' field")
-                elif key == 'limit':
-                    if isinstance(v, int):
-                        options.limit = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                "Integer value is expected in 'limit' field")
-                elif key == 'row_limit':
-                    if isinstance(v, int):
-                        options.row_limit = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
-                                                "Integer value is expected in 'row_limit' field")
-                else:
-                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
+    def import_arrow(self, data: "pa.Table | pa.RecordBatchReader"):
+        # the rows go through the same segment building as import_data, sent along as arrow streams of bounded size
+        res = self._conn.import_arrow(db_name=self._db_name, table_name=self._table_name,
+                                      chunks=arrow_to_import_chunks(data, self._column_types()))
+        if res.error_code == ErrorCode.OK:
+            self._invalidate_result_cache()
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def import_df(self, data: Union["pd.DataFrame", "pl.DataFrame"]):
+        if is_instance_of(data, "polars", "DataFrame"):
+            return self.import_arrow(data.to_arrow())
+        return self.import_arrow(pa.Table.from_pandas(data, preserve_index=False))
+
+    def _column_types(self) -> dict[str, str]:
+        columns = self.show_columns()
+        return dict(zip(columns["name"], columns["type"]))
 
+    def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
+        options = get_export_options(export_options)
         res = self._conn.export_data(db_name=self._db_name,
                                      table_name=self._table_name,
                                      file_name=file_path,
@@ -318,27 +258,22 @@ class RemoteTable():
             case None:
                 where_expr = None
             case _:
-                where_expr = traverse_conditions(condition(cond))
+                where_expr = parse_condition(cond)
         res = self._conn.delete(
             db_name=self._db_name, table_name=self._table_name, where_expr=where_expr)
         if res.error_code == ErrorCode.OK:
+            self._invalidate_result_cache()
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
     def update(self, cond: str, data: dict[str, Any]):
         # {"c1": 1, "c2": 1.1}
-        where_expr = traverse_conditions(condition(cond))
-        update_expr_array: list[ttypes.UpdateExpr] = []
-        for column_name, value in data.items():
-            constant_expression = get_remote_constant_expr_from_python_value(value)
-            expr_type = ttypes.ParsedExprType(constant_expr=constant_expression)
-            paser_expr = ttypes.ParsedExpr(type=expr_type)
-            update_expr = ttypes.UpdateExpr(column_name=column_name, value=paser_expr)
-            update_expr_array.append(update_expr)
+        where_expr = parse_condition(cond)
         res = self._conn.update(db_name=self._db_name, table_name=self._table_name, where_expr=where_expr,
-                                update_expr_array=update_expr_array)
+                                update_expr_array=get_update_exprs(data))
         if res.error_code == ErrorCode.OK:
+            self._invalidate_result_cache()
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
@@ -349,6 +284,11 @@ class RemoteTable():
             vector_column_name, embedding_data, embedding_data_type, distance_type, topn, knn_params)
         return self
 
+    def search_batch(self, vector_column_name: str, queries: VEC, embedding_data_type: str, distance_type: str,
+                     topn: int = DEFAULT_MATCH_VECTOR_TOPN, knn_params: {} = None):
+        return self.query_builder.search_batch(
+            vector_column_name, queries, embedding_data_type, distance_type, topn, knn_params)
+
     def knn(self, *args, **kwargs):
         deprecated_api("knn is deprecated, please use match_dense instead")
         return self.match_dense(*args, **kwargs)
@@ -438,6 +378,12 @@ class RemoteTable():
     def to_arrow(self):
         return self.query_builder.to_arrow()
 
+    def prepare(self):
+        return self.query_builder.prepare()
+
+    def to_batches(self, batch_rows: int = DEFAULT_BATCH_ROWS, output_format: str = "arrow"):
+        return self.query_builder.to_batches(batch_rows, output_format)
+
     def explain(self, explain_type: ExplainType = ExplainType.Physical):
         return self.query_builder.explain(explain_type)
 
@@ -452,13 +398,17 @@ class RemoteTable():
         for index, (column_name, column_info) in enumerate(column_defs.items()):
             check_valid_name(column_name, "Column")
             get_ordinary_info(column_info, column_defs_list, column_name, index)
-        return self._conn.add_columns(db_name=self._db_name, table_name=self._table_name, column_defs=column_defs_list)
+        res = self._conn.add_columns(db_name=self._db_name, table_name=self._table_name, column_defs=column_defs_list)
+        self._invalidate_result_cache()
+        return res
 
     def drop_columns(self, column_names: list[str] | str):
         if isinstance(column_names, str):
             column_names = [column_names]
 
-        return self._conn.drop_columns(db_name=self._db_name, table_name=self._table_name, column_names=column_names)
+        res = self._conn.drop_columns(db_name=self._db_name, table_name=self._table_name, column_names=column_names)
+        self._invalidate_result_cache()
+        return res
 
     def compact(self):
         return self._conn.compact(db_name=self._db_name, table_name=self._table_name)
@@ -501,27 +451,76 @@ class RemoteTable():
 
         return json.dumps(res)
 
-    def _execute_query(self, query: Query) -> tuple[dict[str, list[Any]], dict[str, Any]]:
-
-        # execute the query
-        res = self._conn.select(db_name=self._db_name,
-                                table_name=self._table_name,
-                                select_list=query.columns,
-                                highlight_list=query.highlight,
-                                search_expr=query.search,
-                                where_expr=query.filter,
-                                group_by_list=query.groupby,
-                                having_expr=query.having,
-                                limit_expr=query.limit,
-                                offset_expr=query.offset,
-                                order_by_list=query.sort,
-                                total_hits_count=query.total_hits_count)
-
-        # process the results
-        if res.error_code == ErrorCode.OK:
-            return build_result(res)
-        else:
-            raise InfinityException(res.error_code, res.error_msg)
+    def _invalidate_result_cache(self):
+        # called after every write of this table
+        result_cache = self._conn.result_cache
+        if result_cache is not None and result_cache.invalidate_on_write:
+            result_cache.invalidate_table(self._db_name, self._table_name)
+
+    def _execute_query(self, query: Query, result_builder=build_result) -> tuple[dict[str, list[Any]], dict[str, Any]]:
+        result_cache = self._conn.result_cache
+        if result_cache is None or query.profile:
+            return self._select(query, result_builder)
+        # the request as sent minus the session, and the builder as to_result, to_df, ... decode differently
+        key = (result_builder, serialize(ttypes.SelectRequest(db_name=self._db_name,
+                                                              table_name=self._table_name,
+                                                              select_list=query.columns,
+                                                              highlight_list=query.highlight,
+                                                              search_expr=query.search,
+                                                              where_expr=query.filter,
+                                                              group_by_list=query.groupby,
+                                                              having_expr=query.having,
+                                                              limit_expr=query.limit,
+                                                              offset_expr=query.offset,
+                                                              order_by_list=query.sort,
+                                                              total_hits_count=query.total_hits_count,
+                                                              batch_embedding_data=query.batch_embedding_data)))
+        result = result_cache.get(key)
+        if result is not None:
+            return result
+        nbytes = 0
+
+        def build_and_measure(res):
+            nonlocal nbytes
+            nbytes = sum(len(column_vector) for column_field in res.column_fields
+                         for column_vector in column_field.column_vectors)
+            return result_builder(res)
+
+        result = self._select(query, build_and_measure)
+        result_cache.put(key, (self._db_name, self._table_name), result, nbytes + len(key[1]))
+        return result
+
+    def _select(self, query: Query, result_builder):
+        with trace_call(self._conn.tracer, "select") as trace:
+            # execute the query
+            res = self._conn.select(db_name=self._db_name,
+                                    table_name=self._table_name,
+                                    select_list=query.columns,
+                                    highlight_list=query.highlight,
+                                    search_expr=query.search,
+                                    where_expr=query.filter,
+                                    group_by_list=query.groupby,
+                                    having_expr=query.having,
+                                    limit_expr=query.limit,
+                                    offset_expr=query.offset,
+                                    order_by_list=query.sort,
+                                    total_hits_count=query.total_hits_count,
+                                    batch_embedding_data=query.batch_embedding_data,
+                                    profile=query.profile)
+
+            # process the results
+            if res.error_code != ErrorCode.OK:
+                raise InfinityException(res.error_code, res.error_msg)
+            if trace is None:
+                return result_builder(res)
+            with trace.phase("decode"):
+                return result_builder(res)
+
+    def _execute_batches(self, batch_query: BatchQuery):
+        while not batch_query.done:
+            batch = self._select(batch_query.next_query(), batch_query.read_batch)
+            if batch is not None:
+                yield batch
 
     def _explain_query(self, query: ExplainQuery) -> Any:
         res = self._conn.explain(db_name=self._db_name,
@@ -538,3 +537,188 @@ class RemoteTable():
             return select_res_to_polars(res)
         else:
             raise InfinityException(res.error_code, res.error_msg)
+
+
+class AsyncRemoteTable(RemoteTable):
+    """
+    RemoteTable over an AsyncThriftInfinityClient. Query building is shared with RemoteTable, every method that
+    talks to the server is a coroutine, including the to_result/to_df/to_pl/to_arrow/explain ends of a query.
+    """
+
+    @name_validity_check("index_name", "Index")
+    async def create_index(self, index_name: str, index_info: IndexInfo,
+                           conflict_type: ConflictType = ConflictType.Error, index_comment=""):
+        if conflict_type == ConflictType.Error:
+            create_index_conflict = ttypes.CreateConflict.Error
+        elif conflict_type == ConflictType.Ignore:
+            create_index_conflict = ttypes.CreateConflict.Ignore
+        elif conflict_type == ConflictType.Replace:
+            create_index_conflict = ttypes.CreateConflict.Replace
+        else:
+            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+
+        res = await self._conn.create_index(db_name=self._db_name,
+                                            table_name=self._table_name,
+                                            index_name=index_name.strip(),
+                                            index_info=index_info.to_ttype(),
+                                            conflict_type=create_index_conflict,
+                                            index_comment=index_comment)
+        return check_response(res)
+
+    @name_validity_check("index_name", "Index")
+    async def drop_index(self, index_name: str, conflict_type: ConflictType = ConflictType.Error):
+        if conflict_type == ConflictType.Error:
+            drop_index_conflict = ttypes.DropConflict.Error
+        elif conflict_type == ConflictType.Ignore:
+            drop_index_conflict = ttypes.DropConflict.Ignore
+        else:
+            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+
+        res = await self._conn.drop_index(db_name=self._db_name, table_name=self._table_name,
+                                          index_name=index_name, conflict_type=drop_index_conflict)
+        return check_response(res)
+
+    @name_validity_check("index_name", "Index")
+    async def show_index(self, index_name: str):
+        res = await self._conn.show_index(db_name=self._db_name, table_name=self._table_name, index_name=index_name)
+        return check_response(res)
+
+    async def list_indexes(self):
+        res = await self._conn.list_indexes(db_name=self._db_name, table_name=self._table_name)
+        return check_response(res)
+
+    async def show_columns(self):
+        res = await self._conn.show_columns(db_name=self._db_name, table_name=self._table_name)
+        return select_res_to_polars(check_response(res))
+
+    async def show_segments(self):
+        res = await self._conn.show_segments(db_name=self._db_name, table_name=self._table_name)
+        return select_res_to_polars(check_response(res))
+
+    async def show_segment(self, segment_id: int):
+        res = await self._conn.show_segment(db_name=self._db_name, table_name=self._table_name,
+                                            segment_id=segment_id)
+        return check_response(res)
+
+    async def show_blocks(self, segment_id: int):
+        res = await self._conn.show_blocks(db_name=self._db_name, table_name=self._table_name, segment_id=segment_id)
+        return select_res_to_polars(check_response(res))
+
+    async def show_block(self, segment_id: int, block_id: int):
+        res = await self._conn.show_block(db_name=self._db_name, table_name=self._table_name, segment_id=segment_id,
+                                          block_id=block_id)
+        return check_response(res)
+
+    async def show_block_column(self, segment_id: int, block_id: int, column_id: int):
+        res = await self._conn.show_block_column(db_name=self._db_name, table_name=self._table_name,
+                                                 segment_id=segment_id, block_id=block_id, column_id=column_id)
+        return check_response(res)
+
+    async def insert(self, data: Union[INSERT_DATA, list[INSERT_DATA]]):
+        res = await self._conn.insert(db_name=self._db_name, table_name=self._table_name,
+                                      fields=get_insert_fields(data))
+        return check_response(res)
+
+    async def insert_columns(self, columns: dict[str, Any]):
+        column_defs, column_fields = columns_to_insert_columns(columns)
+        res = await self._conn.insert_columns(db_name=self._db_name, table_name=self._table_name,
+                                              column_defs=column_defs, column_fields=column_fields)
+        return check_response(res)
+
+    async def import_data(self, file_path: str, import_options: {} = None):
+        res = await self._conn.import_data(db_name=self._db_name,
+                                           table_name=self._table_name,
+                                           file_name=file_path,
+                                           import_options=get_import_options(import_options))
+        return check_response(res)
+
+    async def import_arrow(self, data: "pa.Table | pa.RecordBatchReader"):
+        columns = await self.show_columns()
+        res = await self._conn.import_arrow(db_name=self._db_name, table_name=self._table_name,
+                                            chunks=arrow_to_import_chunks(data, dict(zip(columns["name"],
+                                                                                         columns["type"]))))
+        return check_response(res)
+
+    async def import_df(self, data: Union["pd.DataFrame", "pl.DataFrame"]):
+        if is_instance_of(data, "polars", "DataFrame"):
+            return await self.import_arrow(data.to_arrow())
+        return await self.import_arrow(pa.Table.from_pandas(data, preserve_index=False))
+
+    async def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
+        res = await self._conn.export_data(db_name=self._db_name,
+                                           table_name=self._table_name,
+                                           file_name=file_path,
+                                           export_options=get_export_options(export_options),
+                                           columns=columns)
+        return check_response(res)
+
+    async def delete(self, cond: Optional[str] = None):
+        where_expr = None if cond is None else parse_condition(cond)
+        res = await self._conn.delete(db_name=self._db_name, table_name=self._table_name, where_expr=where_expr)
+        return check_response(res)
+
+    async def update(self, cond: str, data: dict[str, Any]):
+        res = await self._conn.update(db_name=self._db_name, table_name=self._table_name,
+                                      where_expr=parse_condition(cond),
+                                      update_expr_array=get_update_exprs(data))
+        return check_response(res)
+
+    async def optimize(self, index_name: str, opt_params: dict[str, str]):
+        opt_options = ttypes.OptimizeOptions()
+        opt_options.index_name = index_name
+        opt_options.opt_params = [ttypes.InitParameter(k, v) for k, v in opt_params.items()]
+        return await self._conn.optimize(db_name=self._db_name, table_name=self._table_name,
+                                         optimize_opt=opt_options)
+
+    async def add_columns(self, column_defs: dict):
+        column_defs_list = []
+        for index, (column_name, column_info) in enumerate(column_defs.items()):
+            check_valid_name(column_name, "Column")
+            get_ordinary_info(column_info, column_defs_list, column_name, index)
+        return await self._conn.add_columns(db_name=self._db_name, table_name=self._table_name,
+                                            column_defs=column_defs_list)
+
+    async def drop_columns(self, column_names: list[str] | str):
+        if isinstance(column_names, str):
+            column_names = [column_names]
+        return await self._conn.drop_columns(db_name=self._db_name, table_name=self._table_name,
+                                             column_names=column_names)
+
+    async def compact(self):
+        return await self._conn.compact(db_name=self._db_name, table_name=self._table_name)
+
+    async def _execute_query(self, query: Query, result_builder=build_result):
+        res = await self._conn.select(db_name=self._db_name,
+                                      table_name=self._table_name,
+                                      select_list=query.columns,
+                                      highlight_list=query.highlight,
+                                      search_expr=query.search,
+                                      where_expr=query.filter,
+                                      group_by_list=query.groupby,
+                                      having_expr=query.having,
+                                      limit_expr=query.limit,
+                                      offset_expr=query.offset,
+                                      order_by_list=query.sort,
+                                      total_hits_count=query.total_hits_count,
+                                      batch_embedding_data=query.batch_embedding_data,
+                                      profile=query.profile)
+        return result_builder(check_response(res))
+
+    async def _explain_query(self, query: ExplainQuery) -> Any:
+        res = await self._conn.explain(db_name=self._db_name,
+                                       table_name=self._table_name,
+                                       select_list=query.columns,
+                                       highlight_list=query.highlight,
+                                       search_expr=query.search,
+                                       where_expr=query.filter,
+                                       group_by_list=None,
+                                       limit_expr=query.limit,
+                                       offset_expr=query.offset,
+                                       explain_type=query.explain_type.to_ttype())
+        return select_res_to_polars(check_response(res))
+
+    async def _execute_batches(self, batch_query: BatchQuery):
+        while not batch_query.done:
+            batch = await self._execute_query(batch_query.next_query(), batch_query.read_batch)
+            if batch is not None:
+                yield batch
@@ -12,21 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
+import re
 import struct
 import json
 import numpy as np
 from infinity.common import VEC, SparseVector, InfinityException
 from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
 from collections import defaultdict
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from datetime import date, time, datetime, timedelta
 
-import polars as pl
 from numpy import dtype
 from infinity.errors import ErrorCode
+from infinity.utils import LazyModule
 
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
 
+pa = LazyModule("pyarrow")
+
 
 def logic_type_to_dtype(ttype: ttypes.DataType):
     match ttype.logic_type:
@@ -76,12 +81,64 @@ def logic_type_to_dtype(ttype: ttypes.DataType):
             raise NotImplementedError(f"Unsupported type {ttype}")
 
 
-def bf16_bytes_to_float32_list(column_vector):
+def bf16_bytes_to_float32_array(column_vector) -> np.ndarray:
     tmp_u16 = np.frombuffer(column_vector, dtype='<i2')
     result_arr = np.zeros(2 * len(tmp_u16), dtype='<i2')
     result_arr[1::2] = tmp_u16
-    view_float32 = result_arr.view('<f4')
-    return list(view_float32)
+    return result_arr.view('<f4')
+
+
+def bf16_bytes_to_float32_list(column_vector):
+    return list(bf16_bytes_to_float32_array(column_vector))
+
+
+# little-endian numpy dtypes of fixed-width columns, used by the vectorized decode path
+POD_COLUMN_DTYPES = {
+    ttypes.ColumnType.ColumnBool: np.dtype('?'),
+    ttypes.ColumnType.ColumnInt8: np.dtype('<i1'),
+    ttypes.ColumnType.ColumnInt16: np.dtype('<i2'),
+    ttypes.ColumnType.ColumnInt32: np.dtype('<i4'),
+    ttypes.ColumnType.ColumnInt64: np.dtype('<i8'),
+    ttypes.ColumnType.ColumnFloat16: np.dtype('<f2'),
+    ttypes.ColumnType.ColumnFloat32: np.dtype('<f4'),
+    ttypes.ColumnType.ColumnFloat64: np.dtype('<f8'),
+    ttypes.ColumnType.ColumnRowID: np.dtype('<i8'),
+}
+
+EMBEDDING_ELEMENT_DTYPES = {
+    ttypes.ElementType.ElementUInt8: np.dtype('<u1'),
+    ttypes.ElementType.ElementInt8: np.dtype('<i1'),
+    ttypes.ElementType.ElementInt16: np.dtype('<i2'),
+    ttypes.ElementType.ElementInt32: np.dtype('<i4'),
+    ttypes.ElementType.ElementInt64: np.dtype('<i8'),
+    ttypes.ElementType.ElementFloat16: np.dtype('<f2'),
+    ttypes.ElementType.ElementFloat32: np.dtype('<f4'),
+    ttypes.ElementType.ElementFloat64: np.dtype('<f8'),
+}
+
+
+def column_vector_to_array(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType, column_vectors) -> \
+        np.ndarray | list[Any, ...]:
+    """
+    Decode a result column into a numpy array without building intermediate python objects.
+    Fixed-width columns become 1-D arrays and embedding columns become (rows, dimension) arrays,
+    both read-only views of the received buffer where possible. Other columns fall back to column_vector_to_list.
+    """
+    if column_type in POD_COLUMN_DTYPES:
+        column_vector = b''.join(column_vectors)
+        return np.frombuffer(column_vector, dtype=POD_COLUMN_DTYPES[column_type])
+    if column_type == ttypes.ColumnType.ColumnBFloat16:
+        return bf16_bytes_to_float32_array(b''.join(column_vectors))
+    if column_type == ttypes.ColumnType.ColumnEmbedding:
+        embedding_type = column_data_type.physical_type.embedding_type
+        dimension = embedding_type.dimension
+        if embedding_type.element_type in EMBEDDING_ELEMENT_DTYPES:
+            column_vector = b''.join(column_vectors)
+            flat = np.frombuffer(column_vector, dtype=EMBEDDING_ELEMENT_DTYPES[embedding_type.element_type])
+            return flat.reshape(-1, dimension)
+        if embedding_type.element_type == ttypes.ElementType.ElementBFloat16:
+            return bf16_bytes_to_float32_array(b''.join(column_vectors)).reshape(-1, dimension)
+    return column_vector_to_list(column_type, column_data_type, column_vectors)
 
 
 def column_vector_to_list(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType, column_vectors) -> \
@@ -179,6 +236,374 @@ def column_vector_to_list(column_type: ttypes.ColumnType, column_data_type: ttyp
             raise NotImplementedError(f"Unsupported type {column_type}")
 
 
+def split_length_prefixed_bytes(bytes_data) -> tuple[list[memoryview], list[int]]:
+    """
+    Split a buffer of (uint32 length, payload) records into payload views and cumulative byte offsets.
+    """
+    view = memoryview(bytes_data)
+    chunks = []
+    offsets = [0]
+    offset = 0
+    while offset < len(bytes_data):
+        length = struct.unpack_from('<I', bytes_data, offset)[0]
+        offset += 4
+        chunks.append(view[offset:offset + length])
+        offset += length
+        offsets.append(offsets[-1] + length)
+    return chunks, offsets
+
+
+def element_bytes_to_array(element_type: ttypes.ElementType, bytes_data) -> Optional[np.ndarray]:
+    if element_type in EMBEDDING_ELEMENT_DTYPES:
+        return np.frombuffer(bytes_data, dtype=EMBEDDING_ELEMENT_DTYPES[element_type])
+    if element_type == ttypes.ElementType.ElementBFloat16:
+        return bf16_bytes_to_float32_array(bytes_data)
+    return None
+
+
+def numpy_to_arrow(data: np.ndarray) -> pa.Array:
+    # arrow consumers (polars in particular) do not handle half floats, keep the float32 widening of to_df
+    if data.dtype == np.float16:
+        data = data.astype(np.float32)
+    if data.ndim == 2:
+        return pa.FixedSizeListArray.from_arrays(pa.array(data.reshape(-1)), data.shape[1])
+    return pa.array(data)
+
+
+def varchar_bytes_to_arrow(column_vector) -> pa.Array:
+    chunks, offsets = split_length_prefixed_bytes(column_vector)
+    return pa.Array.from_buffers(pa.large_string(), len(chunks),
+                                 [None, pa.py_buffer(np.asarray(offsets, dtype=np.int64)),
+                                  pa.py_buffer(b''.join(chunks))])
+
+
+def tensor_bytes_to_arrow(column_data_type: ttypes.DataType, column_vector) -> Optional[pa.Array]:
+    embedding_type = column_data_type.physical_type.embedding_type
+    chunks, offsets = split_length_prefixed_bytes(column_vector)
+    values = element_bytes_to_array(embedding_type.element_type, b''.join(chunks))
+    if values is None:
+        return None
+    vector_bytes = embedding_type.dimension * (values.itemsize if embedding_type.element_type !=
+                                               ttypes.ElementType.ElementBFloat16 else 2)
+    vectors = numpy_to_arrow(values.reshape(-1, embedding_type.dimension))
+    return pa.LargeListArray.from_arrays(pa.array(np.asarray(offsets, dtype=np.int64) // vector_bytes), vectors)
+
+
+def sparse_bytes_to_arrow(column_data_type: ttypes.DataType, column_vector) -> pa.Array:
+    element_type = column_data_type.physical_type.sparse_type.element_type
+    index_type = column_data_type.physical_type.sparse_type.index_type
+    if index_type not in (ttypes.ElementType.ElementInt8, ttypes.ElementType.ElementInt16,
+                          ttypes.ElementType.ElementInt32, ttypes.ElementType.ElementInt64):
+        raise NotImplementedError(f"Unsupported type {index_type}")
+    if element_type not in EMBEDDING_ELEMENT_DTYPES and element_type != ttypes.ElementType.ElementBFloat16:
+        raise NotImplementedError(f"Unsupported type {element_type}")
+    index_size = EMBEDDING_ELEMENT_DTYPES[index_type].itemsize
+    value_size = 2 if element_type == ttypes.ElementType.ElementBFloat16 else EMBEDDING_ELEMENT_DTYPES[
+        element_type].itemsize
+    view = memoryview(column_vector)
+    index_chunks = []
+    value_chunks = []
+    offsets = [0]
+    offset = 0
+    while offset < len(column_vector):
+        nnz = struct.unpack_from('<I', column_vector, offset)[0]
+        offset += 4
+        index_chunks.append(view[offset:offset + nnz * index_size])
+        offset += nnz * index_size
+        value_chunks.append(view[offset:offset + nnz * value_size])
+        offset += nnz * value_size
+        offsets.append(offsets[-1] + nnz)
+    arrow_offsets = pa.array(np.asarray(offsets, dtype=np.int64))
+    indices = np.frombuffer(b''.join(index_chunks), dtype=EMBEDDING_ELEMENT_DTYPES[index_type])
+    values = element_bytes_to_array(element_type, b''.join(value_chunks))
+    return pa.StructArray.from_arrays(
+        [pa.LargeListArray.from_arrays(arrow_offsets, numpy_to_arrow(indices)),
+         pa.LargeListArray.from_arrays(arrow_offsets, numpy_to_arrow(values))],
+        names=["indices", "values"])
+
+
+def column_vector_to_arrow(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType,
+                           column_vectors) -> pa.Array:
+    """
+    Decode a result column straight into an arrow array: embeddings become fixed size lists, multivectors and
+    tensors become lists of fixed size lists, varchars are built from their offsets and sparse vectors become
+    structs of (indices, values) lists. Types without a native layout go through column_vector_to_list.
+    """
+    match column_type:
+        case ttypes.ColumnType.ColumnVarchar:
+            return varchar_bytes_to_arrow(b''.join(column_vectors))
+        case ttypes.ColumnType.ColumnMultiVector | ttypes.ColumnType.ColumnTensor:
+            arrow_array = tensor_bytes_to_arrow(column_data_type, b''.join(column_vectors))
+            if arrow_array is not None:
+                return arrow_array
+        case ttypes.ColumnType.ColumnSparse:
+            return sparse_bytes_to_arrow(column_data_type, b''.join(column_vectors))
+    data = column_vector_to_array(column_type, column_data_type, column_vectors)
+    if isinstance(data, np.ndarray):
+        return numpy_to_arrow(data)
+    return pa.array(data)
+
+
+INSERT_COLUMN_TYPES = {
+    np.dtype('bool'): (ttypes.ColumnType.ColumnBool, ttypes.LogicType.Boolean),
+    np.dtype('<i1'): (ttypes.ColumnType.ColumnInt8, ttypes.LogicType.TinyInt),
+    np.dtype('<i2'): (ttypes.ColumnType.ColumnInt16, ttypes.LogicType.SmallInt),
+    np.dtype('<i4'): (ttypes.ColumnType.ColumnInt32, ttypes.LogicType.Integer),
+    np.dtype('<i8'): (ttypes.ColumnType.ColumnInt64, ttypes.LogicType.BigInt),
+    np.dtype('<f4'): (ttypes.ColumnType.ColumnFloat32, ttypes.LogicType.Float),
+    np.dtype('<f8'): (ttypes.ColumnType.ColumnFloat64, ttypes.LogicType.Double),
+}
+
+INSERT_ELEMENT_TYPES = {dtype: element_type for element_type, dtype in EMBEDDING_ELEMENT_DTYPES.items() if
+                        element_type != ttypes.ElementType.ElementFloat16}
+
+# dtypes without a wire representation are widened to the nearest one that holds every value
+INSERT_WIDENED_DTYPES = {
+    np.dtype('<u2'): np.dtype('<i4'),
+    np.dtype('<u4'): np.dtype('<i8'),
+    np.dtype('<u8'): np.dtype('<i8'),
+    np.dtype('<f2'): np.dtype('<f4'),
+}
+
+
+def insert_array(data, elements: bool = False) -> np.ndarray:
+    data = np.asarray(data)
+    elements = elements or data.ndim > 1
+    dtype = data.dtype.newbyteorder('<') if data.dtype.byteorder == '>' else data.dtype
+    dtype = INSERT_WIDENED_DTYPES.get(dtype, dtype)
+    if not elements and dtype == np.dtype('<u1'):
+        dtype = np.dtype('<i2')
+    if elements and dtype == np.dtype('bool'):
+        dtype = np.dtype('<u1')
+    return np.ascontiguousarray(data, dtype=dtype)
+
+
+def insert_element_type(column_name: str, data: np.ndarray) -> ttypes.ElementType:
+    if data.dtype not in INSERT_ELEMENT_TYPES:
+        raise InfinityException(ErrorCode.INVALID_DATA_TYPE,
+                                f"Column {column_name}: unsupported element type {data.dtype} for columnar insert")
+    return INSERT_ELEMENT_TYPES[data.dtype]
+
+
+def length_prefixed_bytes(chunks: list[bytes]) -> bytes:
+    lengths = np.fromiter((len(chunk) for chunk in chunks), dtype='<u4', count=len(chunks))
+    return b''.join(length.tobytes() + chunk for length, chunk in zip(lengths, chunks))
+
+
+def values_to_insert_column(column_name: str, values) -> tuple[ttypes.ColumnDef, ttypes.ColumnField]:
+    """
+    Encode one column of insert values with the same packed layout select results use. Numeric values become
+    fixed-width columns, 2-D arrays (or lists of equally sized vectors) embeddings, lists of 2-D arrays tensors,
+    strings varchars and SparseVector or dict values sparse vectors.
+    """
+    data_type = ttypes.DataType()
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        first = None
+    else:
+        values = list(values)
+        if len(values) == 0:
+            raise InfinityException(ErrorCode.INSERT_WITHOUT_VALUES, f"Column {column_name} has no values")
+        if any(value is None for value in values):
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Column {column_name}: null values are not supported by columnar insert")
+        first = values[0]
+
+    if isinstance(first, str):
+        column_type = ttypes.ColumnType.ColumnVarchar
+        data_type.logic_type = ttypes.LogicType.Varchar
+        data_type.physical_type = ttypes.PhysicalType(varchar_type=ttypes.VarcharType())
+        column_vector = length_prefixed_bytes([value.encode('utf-8') for value in values])
+    elif isinstance(first, (SparseVector, dict)):
+        column_type = ttypes.ColumnType.ColumnSparse
+        data_type.logic_type = ttypes.LogicType.Sparse
+        chunks = []
+        index_dtype = np.dtype('<i8')
+        value_arrays = []
+        for value in values:
+            if isinstance(value, dict):
+                value = SparseVector([int(k) for k in value.keys()], list(value.values()))
+            if value.values is None:
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                        f"Column {column_name}: sparse vectors without values are not supported "
+                                        f"by columnar insert")
+            value_arrays.append((np.asarray(value.indices, dtype=index_dtype), insert_array(value.values, True)))
+        value_dtype = np.result_type(*[value_array.dtype for _, value_array in value_arrays])
+        for index_array, value_array in value_arrays:
+            chunks.append(np.uint32(len(index_array)).tobytes() + index_array.tobytes() +
+                          value_array.astype(value_dtype, copy=False).tobytes())
+        column_vector = b''.join(chunks)
+        data_type.physical_type = ttypes.PhysicalType(
+            sparse_type=ttypes.SparseType(dimension=0,
+                                          element_type=insert_element_type(column_name, np.empty(0, value_dtype)),
+                                          index_type=ttypes.ElementType.ElementInt64))
+    elif first is not None and np.ndim(first) == 2:
+        column_type = ttypes.ColumnType.ColumnTensor
+        data_type.logic_type = ttypes.LogicType.Tensor
+        tensors = [insert_array(value, True) for value in values]
+        element_dtype = np.result_type(*[tensor.dtype for tensor in tensors])
+        dimensions = {tensor.shape[1] for tensor in tensors}
+        if len(dimensions) != 1:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Column {column_name}: tensors have different dimensions {sorted(dimensions)}")
+        column_vector = length_prefixed_bytes([tensor.astype(element_dtype, copy=False).tobytes() for tensor in tensors])
+        data_type.physical_type = ttypes.PhysicalType(
+            embedding_type=ttypes.EmbeddingType(dimension=dimensions.pop(),
+                                                element_type=insert_element_type(column_name,
+                                                                                 np.empty(0, element_dtype))))
+    else:
+        if first is not None and np.ndim(first) == 1:
+            data = insert_array(np.stack([np.asarray(value) for value in values]), True)
+        else:
+            data = insert_array(values)
+        if data.ndim == 2:
+            column_type = ttypes.ColumnType.ColumnEmbedding
+            data_type.logic_type = ttypes.LogicType.Embedding
+            data_type.physical_type = ttypes.PhysicalType(
+                embedding_type=ttypes.EmbeddingType(dimension=data.shape[1],
+                                                    element_type=insert_element_type(column_name, data)))
+        elif data.ndim == 1 and data.dtype in INSERT_COLUMN_TYPES:
+            column_type, data_type.logic_type = INSERT_COLUMN_TYPES[data.dtype]
+            data_type.physical_type = ttypes.PhysicalType(number_type=ttypes.NumberType())
+        else:
+            raise InfinityException(ErrorCode.INVALID_DATA_TYPE,
+                                    f"Column {column_name}: unsupported values of type {data.dtype} with shape "
+                                    f"{data.shape} for columnar insert")
+        column_vector = data.tobytes()
+
+    column_def = ttypes.ColumnDef(name=column_name, data_type=data_type)
+    column_field = ttypes.ColumnField(column_type=column_type, column_vectors=[column_vector], column_name=column_name)
+    return column_def, column_field
+
+
+def columns_to_insert_columns(columns: dict[str, Any]) -> tuple[list[ttypes.ColumnDef], list[ttypes.ColumnField]]:
+    column_defs = []
+    column_fields = []
+    row_count = None
+    for column_name, values in columns.items():
+        if row_count is None:
+            row_count = len(values)
+        elif len(values) != row_count:
+            raise InfinityException(ErrorCode.COLUMN_COUNT_MISMATCH,
+                                    f"Column {column_name} has {len(values)} rows, expected {row_count}")
+        column_def, column_field = values_to_insert_column(column_name, values)
+        column_defs.append(column_def)
+        column_fields.append(column_field)
+    if not column_fields or row_count == 0:
+        raise InfinityException(ErrorCode.INSERT_WITHOUT_VALUES, "Insert without values")
+    return column_defs, column_fields
+
+
+def arrow_column_to_values(column: pa.Array | pa.ChunkedArray):
+    """
+    Turn an arrow column into values accepted by values_to_insert_column, keeping fixed-width and fixed size list
+    columns as numpy arrays.
+    """
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    if column.null_count:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                "Null values are not supported by columnar insert")
+    if pa.types.is_fixed_size_list(column.type) and not pa.types.is_nested(column.type.value_type):
+        flat = column.flatten().to_numpy(zero_copy_only=False)
+        return flat.reshape(len(column), column.type.list_size)
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type) or pa.types.is_boolean(column.type):
+        return column.to_numpy(zero_copy_only=False)
+    if pa.types.is_struct(column.type):
+        # sparse vectors as produced by to_arrow: struct<indices: list, values: list>
+        return [SparseVector(**value) for value in column.to_pylist()]
+    return column.to_pylist()
+
+
+# arrow types import expects for the table column types (as listed by show_columns), columns of other types
+# are sent as they are and have to match already. Named by their pyarrow factory so that pyarrow is only
+# imported by an arrow import.
+IMPORT_ARROW_TYPES = {
+    "Boolean": "bool_",
+    "TinyInt": "int8",
+    "SmallInt": "int16",
+    "Integer": "int32",
+    "BigInt": "int64",
+    "Float16": "float16",
+    "Float": "float32",
+    "Double": "float64",
+    "Varchar": "string",
+}
+
+IMPORT_ARROW_ELEMENT_TYPES = {
+    "uint8": "uint8",
+    "int8": "int8",
+    "int16": "int16",
+    "int32": "int32",
+    "int64": "int64",
+    "float16": "float16",
+    "float": "float32",
+    "double": "float64",
+}
+
+
+def import_arrow_type(column_type: str) -> Optional[pa.DataType]:
+    if column_type in IMPORT_ARROW_TYPES:
+        return getattr(pa, IMPORT_ARROW_TYPES[column_type])()
+    match = re.fullmatch(r"Embedding\((\w+),(\d+)\)", column_type)
+    if match is not None and match.group(1) in IMPORT_ARROW_ELEMENT_TYPES:
+        return pa.list_(getattr(pa, IMPORT_ARROW_ELEMENT_TYPES[match.group(1)])(), int(match.group(2)))
+    return None
+
+
+IMPORT_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def arrow_to_import_chunks(data: pa.Table | pa.RecordBatchReader, column_types: dict[str, str],
+                           chunk_bytes: int = IMPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Serialize data as arrow IPC streams of about chunk_bytes each for import, with the columns in table order and
+    cast to the arrow types the import expects, e.g. int64 to int32 for an integer column or lists of doubles to
+    fixed size lists of floats for a float embedding. Record batches are read one at a time and larger ones are
+    sliced by rows, so the data is never materialized as a whole. At least one, possibly empty, stream is yielded.
+    """
+    if set(data.schema.names) != set(column_types) or len(data.schema.names) != len(column_types):
+        raise InfinityException(ErrorCode.COLUMN_COUNT_MISMATCH,
+                                f"Columns {data.schema.names} do not match the table columns {list(column_types)}")
+    schema = pa.schema([pa.field(name, import_arrow_type(column_type) or data.schema.field(name).type)
+                        for name, column_type in column_types.items()])
+
+    def cast(batch: pa.RecordBatch) -> pa.RecordBatch:
+        columns = []
+        for field, column_type in zip(schema, column_types.values()):
+            column = batch.column(field.name)
+            if column.type != field.type:
+                try:
+                    column = column.cast(field.type)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                    raise InfinityException(ErrorCode.DATA_TYPE_MISMATCH,
+                                            f"Column {field.name}: can't import {column.type} into {column_type}: {e}")
+            columns.append(column)
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    batches = data if isinstance(data, pa.RecordBatchReader) else data.to_batches()
+    sink, writer, written, yielded = None, None, 0, False
+    for batch in batches:
+        batch = cast(batch)
+        rows = max(1, batch.num_rows * chunk_bytes // batch.nbytes) if batch.nbytes > chunk_bytes else batch.num_rows
+        for offset in range(0, batch.num_rows, max(rows, 1)):
+            if writer is None:
+                sink = pa.BufferOutputStream()
+                writer = pa.ipc.new_stream(sink, schema)
+            piece = batch.slice(offset, rows)
+            writer.write_batch(piece)
+            written += piece.nbytes
+            if written >= chunk_bytes:
+                writer.close()
+                yield sink.getvalue().to_pybytes()
+                sink, writer, written, yielded = None, None, 0, True
+    if writer is None and not yielded:
+        sink = pa.BufferOutputStream()
+        writer = pa.ipc.new_stream(sink, schema)
+    if writer is not None:
+        writer.close()
+        yield sink.getvalue().to_pybytes()
+
+
 def parse_date_bytes(column_vector):
     parsed_list = list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
     date_list = []
@@ -507,34 +932,166 @@ def find_data_type(column_name: str, column_defs: list[ttypes.ColumnDef]) -> tty
     raise KeyError(f"column name {column_name} not found in column defs")
 
 
-def build_result(res: ttypes.SelectResponse) -> tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any], {}]:
+def build_result(res: ttypes.SelectResponse, as_numpy: bool = False) -> \
+        tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any], {}]:
+    """
+    Decode a SelectResponse into (data_dict, data_type_dict, extra_result).
+    With as_numpy=True fixed-width and embedding columns are returned as numpy arrays (see column_vector_to_array)
+    instead of python lists.
+    """
+    decode_column = column_vector_to_array if as_numpy else column_vector_to_list
     data_dict = {}
     data_type_dict = {}
-    column_counter = defaultdict(int)
+    for column_name, column_def, column_field in zip(result_column_names(res.column_defs), res.column_defs,
+                                                     res.column_fields):
+        column_type = column_field.column_type
+        column_data_type = column_def.data_type
+        column_vectors = column_field.column_vectors
+
+        data_list = decode_column(column_type, column_data_type, column_vectors)
+        data_dict[column_name] = data_list
+        data_type_dict[column_name] = column_data_type
+
+    return data_dict, data_type_dict, parse_extra_result(res)
+
+
+def build_arrow_result(res: ttypes.SelectResponse) -> tuple[pa.Table, {}]:
+    arrays = []
     for column_def, column_field in zip(res.column_defs, res.column_fields):
+        arrays.append(column_vector_to_arrow(column_field.column_type, column_def.data_type,
+                                             column_field.column_vectors))
+    return pa.Table.from_arrays(arrays, names=result_column_names(res.column_defs)), parse_extra_result(res)
+
+
+def result_column_names(column_defs: list[ttypes.ColumnDef]) -> list[str]:
+    # duplicated output columns are suffixed: c1, c1_2, c1_3, ...
+    column_names = []
+    column_counter = defaultdict(int)
+    for column_def in column_defs:
         original_column_name = column_def.name
         column_counter[original_column_name] += 1
         column_name = f"{original_column_name}_{column_counter[original_column_name]}" \
             if column_counter[original_column_name] > 1 \
             else original_column_name
+        column_names.append(column_name)
+    return column_names
 
-        column_type = column_field.column_type
-        column_data_type = column_def.data_type
-        column_vectors = column_field.column_vectors
-
-        data_list = column_vector_to_list(column_type, column_data_type, column_vectors)
-        # data_series = pd.Series(data_list, dtype=logic_type_to_dtype(column_data_type))
-        data_dict[column_name] = data_list
-        data_type_dict[column_name] = column_data_type
 
+def parse_extra_result(res: ttypes.SelectResponse):
     extra_result = None
     if res.extra_result is not None:
         try:
             extra_result = json.loads(res.extra_result)
         except json.JSONDecodeError:
             pass
+    return extra_result
+
+
+
+def split_batch_result(res: ttypes.SelectResponse) -> list[ttypes.SelectResponse]:
+    """
+    Split the response of a batched select into one SelectResponse per query vector.
+    The server appends the blocks of every query in order and reports how many belong to each in batch_block_counts.
+    """
+    results = []
+    offset = 0
+    for block_count in res.batch_block_counts:
+        column_fields = [ColumnField(column_type=column_field.column_type,
+                                     column_vectors=column_field.column_vectors[offset:offset + block_count],
+                                     column_name=column_field.column_name)
+                         for column_field in res.column_fields]
+        results.append(SelectResponse(error_code=res.error_code, error_msg=res.error_msg, column_defs=res.column_defs,
+                                      column_fields=column_fields, extra_result=None))
+        offset += block_count
+    return results
 
-    return data_dict, data_type_dict, extra_result
+
+# embedding data type name -> element type
+EMBEDDING_DATA_TYPES = {
+    "bit": ElementType.ElementBit,
+    "uint8": ElementType.ElementUInt8,
+    "int8": ElementType.ElementInt8,
+    "int16": ElementType.ElementInt16,
+    "int": ElementType.ElementInt32,
+    "int32": ElementType.ElementInt32,
+    "int64": ElementType.ElementInt64,
+    "float": ElementType.ElementFloat32,
+    "float32": ElementType.ElementFloat32,
+    "double": ElementType.ElementFloat64,
+    "float64": ElementType.ElementFloat64,
+    "float16": ElementType.ElementFloat16,
+    "bfloat16": ElementType.ElementBFloat16,
+}
+
+# match_tensor also accepts the sql type names and short names
+TENSOR_DATA_TYPES = {
+    "unsigned tinyint": ElementType.ElementUInt8,
+    "uint8": ElementType.ElementUInt8,
+    "u8": ElementType.ElementUInt8,
+    "tinyint": ElementType.ElementInt8,
+    "int8": ElementType.ElementInt8,
+    "i8": ElementType.ElementInt8,
+    "smallint": ElementType.ElementInt16,
+    "int16": ElementType.ElementInt16,
+    "i16": ElementType.ElementInt16,
+    "int": ElementType.ElementInt32,
+    "int32": ElementType.ElementInt32,
+    "i32": ElementType.ElementInt32,
+    "bigint": ElementType.ElementInt64,
+    "int64": ElementType.ElementInt64,
+    "i64": ElementType.ElementInt64,
+    "float": ElementType.ElementFloat32,
+    "float32": ElementType.ElementFloat32,
+    "f32": ElementType.ElementFloat32,
+    "double": ElementType.ElementFloat64,
+    "float64": ElementType.ElementFloat64,
+    "f64": ElementType.ElementFloat64,
+    "float16": ElementType.ElementFloat16,
+    "fp16": ElementType.ElementFloat16,
+    "f16": ElementType.ElementFloat16,
+    "bfloat16": ElementType.ElementBFloat16,
+    "bf16": ElementType.ElementBFloat16,
+}
+
+
+def embedding_element_type(embedding_data_type: str) -> ElementType:
+    if embedding_data_type not in EMBEDDING_DATA_TYPES:
+        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
+                                f"Invalid embedding data type {embedding_data_type}")
+    return EMBEDDING_DATA_TYPES[embedding_data_type]
+
+
+def float32_array_to_bf16_bytes(array) -> bytes:
+    # keep the upper half of every float32, the same truncation the server applies
+    return (np.asarray(array, dtype='<f4').view('<u4') >> 16).astype('<u2').tobytes()
+
+
+def embedding_to_bytes(embedding_data: VEC, element_type: ElementType) -> bytes:
+    """
+    Encode a query embedding as the little-endian buffer carried by EmbeddingData.raw_data. Arrays of the target
+    dtype are copied in one piece, bit embeddings are packed 8 dimensions per byte, the first one in the lowest bit.
+    """
+    if not isinstance(embedding_data, (list, tuple, np.ndarray)):
+        raise InfinityException(
+            ErrorCode.INVALID_DATA_TYPE,
+            f"Invalid embedding data, type should be embedded, but get {type(embedding_data)}",
+        )
+    if element_type == ElementType.ElementBit:
+        bits = np.asarray(embedding_data).reshape(-1)
+        if len(bits) % 8 != 0:
+            raise InfinityException(
+                ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
+                f"Embeddings with data bit must have dimension of times of 8!"
+            )
+        return np.packbits(bits > 0, bitorder='little').tobytes()
+    if element_type == ElementType.ElementBFloat16:
+        return float32_array_to_bf16_bytes(embedding_data)
+    return np.ascontiguousarray(embedding_data, dtype=EMBEDDING_ELEMENT_DTYPES[element_type]).tobytes()
+
+
+def make_embedding_data(embedding_data: VEC, embedding_data_type: str) -> tuple[EmbeddingData, ElementType]:
+    elem_type = embedding_element_type(embedding_data_type)
+    return EmbeddingData(raw_data=embedding_to_bytes(embedding_data, elem_type)), elem_type
 
 
 def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embedding_data_type: str, method_type: str,
@@ -544,41 +1101,11 @@ def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embeddi
     match_tensor_expr.search_method = method_type
     match_tensor_expr.extra_options = extra_option
     match_tensor_expr.filter_expr = filter_expr
-    data = EmbeddingData()
-    if embedding_data_type == 'bit':
+    if embedding_data_type not in TENSOR_DATA_TYPES:
         raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding {embedding_data[0]} type")
-    elif embedding_data_type in ['unsigned tinyint', 'uint8', 'u8']:
-        elem_type = ElementType.ElementUInt8
-        data.u8_array_value = np.asarray(embedding_data, dtype=np.uint8).flatten()
-    elif embedding_data_type in ['tinyint', 'int8', 'i8']:
-        elem_type = ElementType.ElementInt8
-        data.i8_array_value = np.asarray(embedding_data, dtype=np.int8).flatten()
-    elif embedding_data_type in ['smallint', 'int16', 'i16']:
-        elem_type = ElementType.ElementInt16
-        data.i16_array_value = np.asarray(embedding_data, dtype=np.int16).flatten()
-    elif embedding_data_type in ['int', 'int32', 'i32']:
-        elem_type = ElementType.ElementInt32
-        data.i32_array_value = np.asarray(embedding_data, dtype=np.int32).flatten()
-    elif embedding_data_type in ['bigint', 'int64', 'i64']:
-        elem_type = ElementType.ElementInt64
-        data.i64_array_value = np.asarray(embedding_data, dtype=np.int64).flatten()
-    elif embedding_data_type in ['float', 'float32', 'f32']:
-        elem_type = ElementType.ElementFloat32
-        data.f32_array_value = np.asarray(embedding_data, dtype=np.float32).flatten()
-    elif embedding_data_type in ['double', 'float64', 'f64']:
-        elem_type = ElementType.ElementFloat64
-        data.f64_array_value = np.asarray(embedding_data, dtype=np.float64).flatten()
-    elif embedding_data_type in ['float16', 'fp16', 'f16']:
-        elem_type = ElementType.ElementFloat16
-        data.f16_array_value = np.asarray(embedding_data, dtype=np.float16).flatten()
-    elif embedding_data_type in ['bfloat16', 'bf16']:
-        elem_type = ElementType.ElementBFloat16
-        data.bf16_array_value = np.asarray(embedding_data, dtype=np.float32).flatten()
-    else:
-        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding {embedding_data[0]} type")
-
+    elem_type = TENSOR_DATA_TYPES[embedding_data_type]
     match_tensor_expr.embedding_data_type = elem_type
-    match_tensor_expr.embedding_data = data
+    match_tensor_expr.embedding_data = EmbeddingData(raw_data=embedding_to_bytes(embedding_data, elem_type))
     return match_tensor_expr
 
 
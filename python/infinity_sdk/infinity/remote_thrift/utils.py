@@ -12,21 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import re
+import copy
 import functools
 import inspect
 from typing import Any
-import pandas as pd
-import polars as pl
-from sqlglot import condition
-import sqlglot.expressions as exp
 import numpy as np
+from thrift.Thrift import TType
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
-from infinity.remote_thrift.types import build_result, logic_type_to_dtype
-from infinity.utils import binary_exp_to_paser_exp
+from infinity.remote_thrift.types import build_arrow_result, make_embedding_data
+from infinity.utils import binary_exp_to_paser_exp, LazyModule
 from infinity.common import InfinityException, SparseVector, Array
 from infinity.errors import ErrorCode
 
+# only string filters and outputs are parsed with sqlglot, and only polars results need polars
+sqlglot = LazyModule("sqlglot")
+exp = LazyModule("sqlglot.expressions")
+pl = LazyModule("polars")
+
 
 def parsed_expression_to_string(expr: ttypes.ParsedExpr) -> str:
     if expr is None:
@@ -387,6 +392,8 @@ def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
         expr_type = ttypes.ParsedExprType(in_expr=in_expr)
         parsed_expr = ttypes.ParsedExpr(type=expr_type)
         return parsed_expr
+    elif isinstance(cons, exp.Placeholder):
+        return ParamExpr(cons.name)
     else:
         raise InfinityException(ErrorCode.INVALID_EXPRESSION, f"unknown condition type: {cons}")
 
@@ -407,6 +414,91 @@ def parse_expr(expr) -> ttypes.ParsedExpr:
             raise InfinityException(ErrorCode.INVALID_EXPRESSION, f"unknown expression type: {expr}")
 
 
+# parsed expressions are shared between the queries using the same string, they must never be modified in place
+PARSE_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_condition(cond: str) -> ttypes.ParsedExpr:
+    return traverse_conditions(sqlglot.condition(cond))
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_column(column: str) -> ttypes.ParsedExpr:
+    return parse_expr(sqlglot.maybe_parse(column))
+
+
+def unbound_parameter(name: str) -> InfinityException:
+    return InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Parameter :{name} is not bound, use prepare()")
+
+
+class ParamExpr(ttypes.ParsedExpr):
+    # ":name" in a filter, replaced by a constant when a prepared query is bound
+    def __init__(self, name: str):
+        super().__init__()
+        self.param_name = name
+
+    def bind(self, params: dict[str, Any]) -> ttypes.ParsedExpr:
+        if self.param_name not in params:
+            raise unbound_parameter(self.param_name)
+        return ttypes.ParsedExpr(type=ttypes.ParsedExprType(constant_expr=value_to_constant_expr(params[self.param_name])))
+
+
+class EmbeddingParam(ttypes.EmbeddingData):
+    # Param(name) given as query vector, encoded when a prepared query is bound
+    def __init__(self, name: str, embedding_data_type: str):
+        super().__init__()
+        self.param_name = name
+        self.embedding_data_type = embedding_data_type
+
+    def bind(self, params: dict[str, Any]) -> ttypes.EmbeddingData:
+        if self.param_name not in params:
+            raise unbound_parameter(self.param_name)
+        return make_embedding_data(params[self.param_name], self.embedding_data_type)[0]
+
+
+def value_to_constant_expr(value) -> ttypes.ConstantExpr:
+    if isinstance(value, (bool, np.bool_)):
+        return ttypes.ConstantExpr(literal_type=ttypes.LiteralType.Boolean, bool_value=bool(value))
+    elif isinstance(value, (int, np.integer)):
+        return ttypes.ConstantExpr(literal_type=ttypes.LiteralType.Int64, i64_value=int(value))
+    elif isinstance(value, (float, np.floating)):
+        return ttypes.ConstantExpr(literal_type=ttypes.LiteralType.Double, f64_value=float(value))
+    elif isinstance(value, str):
+        return ttypes.ConstantExpr(literal_type=ttypes.LiteralType.String, str_value=value)
+    else:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid parameter value type: {type(value)}")
+
+
+def bind_params(node, params: dict[str, Any]):
+    """
+    Return node with every parameter bound. Only the nodes on the way to a parameter are copied, the rest of the
+    tree is shared with the template, so one prepared query can be bound by many threads at once.
+    """
+    if isinstance(node, (ParamExpr, EmbeddingParam)):
+        return node.bind(params)
+    if isinstance(node, list):
+        if not node or not hasattr(node[0], "thrift_spec"):
+            return node
+        bound = [bind_params(item, params) for item in node]
+        return node if all(a is b for a, b in zip(bound, node)) else bound
+    if not hasattr(node, "thrift_spec") or isinstance(node, ttypes.EmbeddingData):
+        return node
+    copied = None
+    for field_spec in node.thrift_spec:
+        if field_spec is None or field_spec[1] not in (TType.STRUCT, TType.LIST):
+            continue
+        value = getattr(node, field_spec[2])
+        if value is None:
+            continue
+        bound = bind_params(value, params)
+        if bound is not value:
+            if copied is None:
+                copied = copy.copy(node)
+            setattr(copied, field_spec[2], bound)
+    return node if copied is None else copied
+
+
 def get_search_optional_filter_from_opt_params(opt_params: dict):
     optional_filter = None
     k_to_pop = []
@@ -418,7 +510,7 @@ def get_search_optional_filter_from_opt_params(opt_params: dict):
             if not isinstance(v, str):
                 raise InfinityException(ErrorCode.INVALID_EXPRESSION,
                                         f"Invalid filter expression '{v}', type should be string, but get {type(v)}")
-            optional_filter = traverse_conditions(condition(v))
+            optional_filter = parse_condition(v)
             k_to_pop.append(k)
     for k in k_to_pop:
         opt_params.pop(k)
@@ -570,13 +662,8 @@ def name_validity_check(arg_name: str, name_type: str = "Table"):
 
 
 def select_res_to_polars(res) -> (pl.DataFrame, Any):
-    df_dict = {}
-    data_dict, data_type_dict, extra_result = build_result(res)
-    for k, v in data_dict.items():
-        data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
-        df_dict[k] = data_series
-
-    return pl.from_pandas(pd.DataFrame(df_dict))
+    arrow_table, extra_result = build_arrow_result(res)
+    return pl.from_arrow(arrow_table)
 
 
 def get_constant_expr(column_info):
@@ -798,3 +885,149 @@ def get_ordinary_info(column_info_, column_defs, column_name, index):
     proto_column_def.constraints = get_constraints(column_info)
     proto_column_def.comment = column_info.get("comment")
     column_defs.append(proto_column_def)
+
+
+def check_response(res):
+    if res.error_code == ErrorCode.OK:
+        return res
+    raise InfinityException(res.error_code, res.error_msg)
+
+
+def get_insert_fields(data) -> list[ttypes.Field]:
+    # [{"c1": 1, "c2": 1.1}, {"c1": 2, "c2": 2.2}]
+    fields: list[ttypes.Field] = []
+    if isinstance(data, dict):
+        data = [data]
+    for row in data:
+        column_names = []
+        parse_exprs = []
+        for column_name, value in row.items():
+            column_names.append(column_name)
+            constant_expression = get_remote_constant_expr_from_python_value(value)
+            expr_type = ttypes.ParsedExprType(constant_expr=constant_expression)
+            paser_expr = ttypes.ParsedExpr(type=expr_type)
+            parse_exprs.append(paser_expr)
+
+        field = ttypes.Field(column_names=column_names, parse_exprs=parse_exprs)
+        fields.append(field)
+    return fields
+
+
+def get_update_exprs(data: dict[str, Any]) -> list[ttypes.UpdateExpr]:
+    # {"c1": 1, "c2": 1.1}
+    update_expr_array: list[ttypes.UpdateExpr] = []
+    for column_name, value in data.items():
+        constant_expression = get_remote_constant_expr_from_python_value(value)
+        expr_type = ttypes.ParsedExprType(constant_expr=constant_expression)
+        paser_expr = ttypes.ParsedExpr(type=expr_type)
+        update_expr = ttypes.UpdateExpr(column_name=column_name, value=paser_expr)
+        update_expr_array.append(update_expr)
+    return update_expr_array
+
+
+def get_import_options(import_options: dict = None) -> ttypes.ImportOption:
+    options = ttypes.ImportOption()
+    options.has_header = False
+    options.delimiter = ','
+    options.copy_file_type = ttypes.CopyFileType.CSV
+    if import_options != None:
+        for k, v in import_options.items():
+            key = k.lower()
+            if key == 'file_type':
+                file_type = v.lower()
+                if file_type == 'csv':
+                    options.copy_file_type = ttypes.CopyFileType.CSV
+                elif file_type == 'json':
+                    options.copy_file_type = ttypes.CopyFileType.JSON
+                elif file_type == 'jsonl':
+                    options.copy_file_type = ttypes.CopyFileType.JSONL
+                elif file_type == 'fvecs':
+                    options.copy_file_type = ttypes.CopyFileType.FVECS
+                elif file_type == 'csr':
+                    options.copy_file_type = ttypes.CopyFileType.CSR
+                elif file_type == 'bvecs':
+                    options.copy_file_type = ttypes.CopyFileType.BVECS
+                elif file_type == 'parquet':
+                    options.copy_file_type = ttypes.CopyFileType.PARQUET
+                elif file_type in ('arrow', 'feather'):
+                    options.copy_file_type = ttypes.CopyFileType.ARROW
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            f"Unrecognized export file type: {file_type}")
+            elif key == 'delimiter':
+                delimiter = v.lower()
+                if len(delimiter) != 1:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            f"Unrecognized export file delimiter: {delimiter}")
+                options.delimiter = delimiter[0]
+            elif key == 'header':
+                if isinstance(v, bool):
+                    options.has_header = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            "Boolean value is expected in header field")
+            else:
+                raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
+    return options
+
+
+def get_export_options(export_options: dict = None) -> ttypes.ExportOption:
+    options = ttypes.ExportOption()
+    options.has_header = False
+    options.delimiter = ','
+    options.copy_file_type = ttypes.CopyFileType.CSV
+    options.offset = 0
+    options.limit = 0
+    options.row_limit = 0
+
+    if export_options != None:
+        for k, v in export_options.items():
+            key = k.lower()
+            if key == 'file_type':
+                file_type = v.lower()
+                if file_type == 'csv':
+                    options.copy_file_type = ttypes.CopyFileType.CSV
+                elif file_type == 'jsonl':
+                    options.copy_file_type = ttypes.CopyFileType.JSONL
+                elif file_type == 'fvecs':
+                    options.copy_file_type = ttypes.CopyFileType.FVECS
+                elif file_type == 'parquet':
+                    options.copy_file_type = ttypes.CopyFileType.PARQUET
+                elif file_type in ('arrow', 'feather'):
+                    options.copy_file_type = ttypes.CopyFileType.ARROW
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            f"Unrecognized export file type: {file_type}")
+            elif key == 'delimiter':
+                delimiter = v.lower()
+                if len(delimiter) != 1:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            f"Unrecognized export file delimiter: {delimiter}")
+                options.delimiter = delimiter[0]
+            elif key == 'header':
+                if isinstance(v, bool):
+                    options.has_header = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            "Boolean value is expected in header field")
+            elif key == 'offset':
+                if isinstance(v, int):
+                    options.offset = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            "Integer value is expected in 'offset' field")
+            elif key == 'limit':
+                if isinstance(v, int):
+                    options.limit = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            "Integer value is expected in 'limit' field")
+            elif key == 'row_limit':
+                if isinstance(v, int):
+                    options.row_limit = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
+                                            "Integer value is expected in 'row_limit' field")
+            else:
+                raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
+    return options
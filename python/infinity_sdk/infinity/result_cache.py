@@ -0,0 +1,117 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from infinity.common import InfinityException
+from infinity.errors import ErrorCode
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL = 60.0
+
+
+class ResultCache:
+    """
+    Client side cache of decoded select results, shared by the tables of a connection:
+        conn = infinity.connect(uri, result_cache=infinity.result_cache.ResultCache(max_bytes=256 << 20, ttl=10))
+    A query sent again within ttl seconds is answered without a round trip and without decoding, the result is the
+    very object the first call returned, so don't modify it. The least recently used results are evicted beyond
+    max_bytes, counted as the bytes of the response columns. Inserts, deletes, updates, imports and column changes this
+    connection makes to a table drop its results unless invalidate_on_write is False, writes from other clients are
+    seen once the ttl expires.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, ttl: float = DEFAULT_TTL, invalidate_on_write: bool = True):
+        if max_bytes <= 0:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid max_bytes: {max_bytes}")
+        if ttl <= 0:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid ttl: {ttl}")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.invalidate_on_write = invalidate_on_write
+        self._lock = Lock()
+        # key -> (result, nbytes, expire time, (db_name, table_name))
+        self._entries = OrderedDict()
+        self._tables = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key):
+        _, nbytes, _, table = self._entries.pop(key)
+        self.bytes -= nbytes
+        keys = self._tables[table]
+        keys.discard(key)
+        if not keys:
+            del self._tables[table]
+
+    def get(self, key):
+        """
+        The cached result of key, None if there is none or it expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, table: tuple[str, str], result, nbytes: int):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if nbytes > self.max_bytes:
+                return
+            while self.bytes + nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._entries[key] = (result, nbytes, time.monotonic() + self.ttl, table)
+            self._tables.setdefault(table, set()).add(key)
+            self.bytes += nbytes
+
+    def invalidate_table(self, db_name: str, table_name: str):
+        with self._lock:
+            for key in list(self._tables.get((db_name, table_name), ())):
+                self._remove(key)
+                self.invalidations += 1
+
+    def invalidate_database(self, db_name: str):
+        with self._lock:
+            for table in [table for table in self._tables if table[0] == db_name]:
+                for key in list(self._tables[table]):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tables.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes, "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions, "invalidations": self.invalidations}
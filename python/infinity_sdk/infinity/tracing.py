@@ -0,0 +1,248 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+
+from infinity.errors import ErrorCode
+
+# build: turning arguments into a thrift request, serialize: writing the request to the socket,
+# rpc: waiting for and reading the response, decode: turning the response into the result (select only)
+PHASES = ("build", "serialize", "rpc", "decode")
+
+# seconds, the prometheus client defaults extended down to 100us
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0)
+
+_current_trace = ContextVar("infinity_call_trace", default=None)
+
+
+class CallTrace:
+    """
+    Timings of one SDK call, handed to Tracer.on_call once the call returns or raises.
+    """
+
+    def __init__(self, method: str):
+        self.method = method
+        self.start_time_ns = time.time_ns()
+        self._start = time.perf_counter_ns()
+        self.duration = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        # (phase, start_time_ns, end_time_ns) of every timed interval, in wall clock nanoseconds
+        self.intervals = []
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.error_code = ErrorCode.OK
+        self.error_msg = None
+
+    def _now_ns(self) -> int:
+        return self.start_time_ns + time.perf_counter_ns() - self._start
+
+    @property
+    def io_time(self) -> float:
+        return self.phases["serialize"] + self.phases["rpc"]
+
+    @property
+    def end_time_ns(self) -> int:
+        return self.start_time_ns + int(self.duration * 1e9)
+
+    @contextmanager
+    def phase(self, name: str):
+        start = self._now_ns()
+        try:
+            yield
+        finally:
+            end = self._now_ns()
+            self.phases[name] += (end - start) / 1e9
+            self.intervals.append((name, start, end))
+
+    def add(self, name: str, seconds: float):
+        # time measured elsewhere, no interval is recorded for it
+        self.phases[name] += max(seconds, 0.0)
+
+    def _finish(self):
+        self.duration = (time.perf_counter_ns() - self._start) / 1e9
+
+
+def current_trace() -> CallTrace | None:
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_call(tracer, method: str):
+    """
+    Trace the block as one call of method. Nested blocks, e.g. the client rpc inside a table select,
+    add to the outermost trace. Yields None and costs nothing when tracer is None.
+    """
+    if tracer is None:
+        yield None
+        return
+    trace = _current_trace.get()
+    if trace is not None:
+        yield trace
+        return
+    trace = CallTrace(method)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    except Exception as e:
+        trace.error_code = getattr(e, "error_code", ErrorCode.UNKNOWN)
+        trace.error_msg = str(e)
+        raise
+    finally:
+        _current_trace.reset(token)
+        trace._finish()
+        tracer.on_call(trace)
+
+
+class Tracer:
+    """
+    Base class of the tracers given to infinity.connect(uri, tracer=...).
+    on_call runs on the calling thread after every call, it should be quick and must not raise.
+    """
+
+    def on_call(self, trace: CallTrace):
+        pass
+
+
+class MultiTracer(Tracer):
+    def __init__(self, *tracers: Tracer):
+        self.tracers = tracers
+
+    def on_call(self, trace: CallTrace):
+        for tracer in self.tracers:
+            tracer.on_call(trace)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+
+
+class PrometheusTracer(Tracer):
+    """
+    Aggregates calls into prometheus histograms and counters, expose() renders them in the text exposition format:
+        tracer = PrometheusTracer()
+        infinity_obj = infinity.connect(uri, tracer=tracer)
+        ...
+        print(tracer.expose())
+    """
+
+    def __init__(self, namespace: str = "infinity_client", buckets=DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = Lock()
+        # (method, phase) -> Histogram, phase "total" is the whole call
+        self._latency = {}
+        # method -> [calls, errors, retries, bytes sent, bytes received]
+        self._counters = {}
+
+    def on_call(self, trace: CallTrace):
+        with self._lock:
+            for phase, seconds in (("total", trace.duration), *trace.phases.items()):
+                if phase != "total" and seconds == 0.0:
+                    continue
+                histogram = self._latency.get((trace.method, phase))
+                if histogram is None:
+                    histogram = self._latency[(trace.method, phase)] = Histogram(self.buckets)
+                histogram.observe(seconds)
+            counters = self._counters.setdefault(trace.method, [0, 0, 0, 0, 0])
+            counters[0] += 1
+            counters[1] += trace.error_code != ErrorCode.OK
+            counters[2] += trace.retries
+            counters[3] += trace.bytes_sent
+            counters[4] += trace.bytes_received
+
+    def expose(self) -> str:
+        name = f"{self.namespace}_request_duration_seconds"
+        lines = [f"# HELP {name} Client side latency of infinity calls by phase.", f"# TYPE {name} histogram"]
+        with self._lock:
+            for (method, phase), histogram in sorted(self._latency.items()):
+                cumulative = 0
+                for bound, count in zip((*self.buckets, "+Inf"), histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_labels(method=method, phase=phase, le=bound)} {cumulative}")
+                lines.append(f"{name}_sum{_labels(method=method, phase=phase)} {histogram.sum}")
+                lines.append(f"{name}_count{_labels(method=method, phase=phase)} {cumulative}")
+            for i, (metric, help_text) in enumerate((("requests", "Infinity calls."),
+                                                     ("errors", "Infinity calls that failed."),
+                                                     ("retries", "Reconnects while calling infinity."),
+                                                     ("sent_bytes", "Request bytes written."),
+                                                     ("received_bytes", "Response bytes read."))):
+                counter = f"{self.namespace}_{metric}_total"
+                lines.append(f"# HELP {counter} {help_text}")
+                lines.append(f"# TYPE {counter} counter")
+                for method, counters in sorted(self._counters.items()):
+                    lines.append(f"{counter}{_labels(method=method)} {counters[i]}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Reports every call as an OpenTelemetry span with one child span per serialize, rpc and decode interval:
+        from opentelemetry import trace
+        infinity_obj = infinity.connect(uri, tracer=OpenTelemetryTracer(trace.get_tracer("infinity")))
+    The span of the call is a child of the span active when the call was made.
+    """
+
+    def __init__(self, otel_tracer):
+        self.otel_tracer = otel_tracer
+
+    def on_call(self, trace: CallTrace):
+        span = self.otel_tracer.start_span(f"infinity.{trace.method}", start_time=trace.start_time_ns)
+        span.set_attribute("rpc.system", "thrift")
+        span.set_attribute("rpc.method", trace.method)
+        span.set_attribute("infinity.bytes_sent", trace.bytes_sent)
+        span.set_attribute("infinity.bytes_received", trace.bytes_received)
+        span.set_attribute("infinity.retries", trace.retries)
+        for phase, seconds in trace.phases.items():
+            span.set_attribute(f"infinity.{phase}_seconds", seconds)
+        if trace.error_code != ErrorCode.OK:
+            span.set_attribute("infinity.error_code", int(trace.error_code))
+            try:
+                from opentelemetry.trace import Status, StatusCode
+                span.set_status(Status(StatusCode.ERROR, trace.error_msg))
+            except ImportError:
+                pass
+        context = _span_context(span)
+        for phase, start, end in trace.intervals:
+            child = self.otel_tracer.start_span(f"infinity.{trace.method}.{phase}", context=context, start_time=start)
+            child.end(end_time=end)
+        span.end(end_time=trace.end_time_ns)
+
+
+def _span_context(span):
+    try:
+        from opentelemetry.trace import set_span_in_context
+    except ImportError:
+        return None
+    return set_span_in_context(span)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
+import sys
 import warnings
 from infinity.common import InfinityException
 from infinity.errors import ErrorCode
@@ -50,3 +52,29 @@ def binary_exp_to_paser_exp(binary_expr_key) -> str:
 
 def deprecated_api(message):
     warnings.warn(message, DeprecationWarning, stacklevel=2)
+
+
+class LazyModule:
+    """
+    Stands in for a dependency only some calls need, the module is imported on first attribute access:
+        pd = LazyModule("pandas")
+    Modules using it need `from __future__ import annotations` so that annotations don't import it either.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        return f"<lazy module '{self._name}'>"
+
+
+def is_instance_of(obj, module_name: str, class_name: str) -> bool:
+    # nothing can be an instance of a class from a module nobody imported yet, so don't import it to find out
+    module = sys.modules.get(module_name)
+    return module is not None and isinstance(obj, getattr(module, class_name))
@@ -3,6 +3,8 @@ import pytest
 import time
 from httpapibase import HttpTest
 from common.common_values import *
+from common.common_data import default_url
+from infinity.metrics import scrape, show_buffer
 
 
 class TestShow(HttpTest):
@@ -134,3 +136,43 @@ class TestShow(HttpTest):
         return
     
 
+    def test_http_metrics(self):
+        db_name = "default_db"
+        table_name = "test_http_metrics"
+        before = scrape(default_url + "metrics")
+        self.drop_table(db_name, table_name)
+        self.create_table(db_name, table_name, [{"name": "num", "type": "integer"}])
+        for i in range(10):
+            self.insert(db_name, table_name, [{"num": i}])
+        self.select(db_name, table_name, ["num"], "num > 5")
+        delta = scrape(default_url + "metrics") - before
+
+        assert delta.value("infinity_statement_duration_seconds_count", operation="insert") == 10
+        assert delta.value("infinity_statement_duration_seconds_count", operation="select") >= 1
+        assert delta.value("infinity_statement_errors_total", operation="insert") == 0
+        assert 0 < delta.quantile("infinity_statement_duration_seconds", 0.5, operation="insert") < 10
+        assert delta.value("infinity_wal_flush_bytes_total") > 0
+        assert delta.value("infinity_buffer_memory_limit_bytes") > 0
+        assert "insert: 10 calls" in delta.summary()
+        self.drop_table(db_name, table_name)
+        return
+
+    def test_http_show_buffer_pools(self):
+        db_name = "default_db"
+        table_name = "test_http_show_buffer_pools"
+        before = scrape(default_url + "metrics")
+        self.drop_table(db_name, table_name)
+        self.create_table(db_name, table_name, [{"name": "num", "type": "integer"}])
+        self.insert(db_name, table_name, [{"num": i} for i in range(10)])
+        for _ in range(3):
+            self.select(db_name, table_name, ["num"], "num > 5")
+        delta = scrape(default_url + "metrics") - before
+
+        pools = show_buffer(default_url + "instance/buffer")
+        assert pools["data"]["requests"] > 0
+        assert 0 <= pools["data"]["hit_ratio"] <= 1
+        assert pools["data"]["quota"] == 0
+        assert delta.value("infinity_buffer_pool_requests_total", pool="data") > 0
+        assert "buffer data:" in delta.summary()
+        self.drop_table(db_name, table_name)
+        return
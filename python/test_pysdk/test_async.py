@@ -0,0 +1,92 @@
+import asyncio
+import sys
+import os
+import numpy as np
+import pytest
+from common import common_values
+from infinity.common import ConflictType, SortType
+
+import infinity
+from infinity.errors import ErrorCode
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+
+@pytest.mark.usefixtures("local_infinity")
+@pytest.mark.usefixtures("http")
+@pytest.mark.usefixtures("suffix")
+class TestInfinity:
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_connect_async(self, suffix):
+        async def run():
+            infinity_obj = await infinity.connect_async(common_values.TEST_LOCAL_HOST, pool_size=2)
+            db_obj = await infinity_obj.get_database("default_db")
+            await db_obj.drop_table("test_connect_async" + suffix, ConflictType.Ignore)
+            table_obj = await db_obj.create_table("test_connect_async" + suffix,
+                                                  {"c1": {"type": "int"}, "c2": {"type": "vector,4,float"}},
+                                                  ConflictType.Error)
+            res = await table_obj.insert([{"c1": i, "c2": [i] * 4} for i in range(10)])
+            assert res.error_code == ErrorCode.OK
+
+            # concurrent queries are pipelined over the two connections
+            results = await asyncio.gather(
+                *[table_obj.output(["c1"]).filter(f"c1 = {i}").to_result() for i in range(10)])
+            assert [data_dict["c1"] for data_dict, _, _ in results] == [[i] for i in range(10)]
+
+            res, extra_result = await table_obj.output(["c1", "c2"]).sort([["c1", SortType.Asc]]).to_df()
+            assert list(res["c1"]) == list(range(10))
+            assert np.array_equal(res["c2"][3], [3.0] * 4)
+
+            res = await db_obj.drop_table("test_connect_async" + suffix, ConflictType.Error)
+            assert res.error_code == ErrorCode.OK
+            res = await infinity_obj.disconnect()
+            assert res.error_code == ErrorCode.OK
+
+        asyncio.run(run())
+
+
+
+def test_read_loop_malformed_frame():
+    # a server that accepts Connect, then answers with a frame holding an unknown thrift type
+    from thrift.Thrift import TMessageType
+    from thrift.protocol import TBinaryProtocol
+    from thrift.transport import TTransport
+    from thrift.transport.TTransport import TTransportException
+    from infinity.common import NetworkAddress
+    from infinity.remote_thrift.async_client import PipelinedConnection, read_message
+    from infinity.remote_thrift.infinity_thrift_rpc import InfinityService
+    from infinity.remote_thrift.infinity_thrift_rpc.ttypes import CommonResponse, ListDatabaseRequest
+
+    def reply(method, seqid, result=None):
+        buffer = TTransport.TMemoryBuffer()
+        protocol = TBinaryProtocol.TBinaryProtocol(buffer)
+        protocol.writeMessageBegin(method, TMessageType.REPLY, seqid)
+        if result is not None:
+            result.write(protocol)
+            protocol.writeMessageEnd()
+        return buffer.getvalue()
+
+    async def serve(reader, writer):
+        await read_message(reader)
+        writer.write(reply("Connect", 1, InfinityService.Connect_result(
+            success=CommonResponse(error_code=ErrorCode.OK, session_id=1))))
+        await read_message(reader)
+        writer.write(reply("ListDatabase", 2) + bytes([99, 0, 0]))
+        await writer.drain()
+        await reader.read()
+
+    async def run():
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        connection = PipelinedConnection(NetworkAddress("127.0.0.1", server.sockets[0].getsockname()[1]))
+        await connection.open()
+        with pytest.raises(TTransportException):
+            await asyncio.wait_for(connection.call("ListDatabase", ListDatabaseRequest()), 5)
+        assert not connection.is_open
+        with pytest.raises(TTransportException):
+            await connection.call("ListDatabase", ListDatabaseRequest())
+        server.close()
+
+    asyncio.run(run())
@@ -39,7 +39,7 @@ class TestInfinity:
     #@pytest.mark.skip(reason = "cluster fail")
     @pytest.mark.usefixtures("skip_if_local_infinity")
     def test_connection_pool(self, suffix):
-        connection_pool = ConnectionPool(uri=self.uri, max_size=8)
+        connection_pool = ConnectionPool(uri=self.uri, max_size=8, min_size=8)
         assert len(connection_pool.free_pool_) == 8
 
         infinity_obj = connection_pool.get_conn()
@@ -77,3 +77,30 @@ class TestInfinity:
         else:
             assert "no exception when double release" == 0
         connection_pool.destroy()
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_connection_pool_lease(self, suffix):
+        connection_pool = ConnectionPool(uri=self.uri, max_size=2, timeout=0.5)
+        assert len(connection_pool.free_pool_) == 0
+
+        with connection_pool.connection() as infinity_obj:
+            res = infinity_obj.list_databases()
+            assert res.error_code == ErrorCode.OK
+        assert len(connection_pool.free_pool_) == 1
+
+        infinity_obj_1 = connection_pool.get_conn()
+        infinity_obj_2 = connection_pool.get_conn()
+        with pytest.raises(Exception) as e:
+            connection_pool.get_conn()
+        assert e.value.error_code == ErrorCode.TOO_MANY_CONNECTIONS
+
+        connection_pool.release_conn(infinity_obj_1)
+        connection_pool.release_conn(infinity_obj_2)
+        metrics = connection_pool.metrics()
+        assert metrics["created"] == 2
+        assert metrics["acquired"] == 3
+        assert metrics["timeouts"] == 1
+        assert metrics["in_use"] == 0
+        assert metrics["idle"] == 2
+        connection_pool.destroy()
@@ -2,12 +2,13 @@ import importlib
 import sys
 import os
 import pytest
+import numpy as np
 from infinity.errors import ErrorCode
 from common import common_values
 import infinity
 import infinity_embedded
 from infinity.remote_thrift.query_builder import InfinityThriftQueryBuilder
-from infinity.common import ConflictType, InfinityException
+from infinity.common import ConflictType, InfinityException, SortType
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
@@ -89,6 +90,37 @@ class TestInfinity:
         print(res)
         db_obj.drop_table("test_to_df"+suffix, ConflictType.Error)
 
+    def test_to_df_embedding(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_df_embedding"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_df_embedding"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_df_embedding"+suffix)
+        embeddings = np.arange(12, dtype=np.float32).reshape(3, 4)
+        table_obj.insert([{"c1": i, "c2": embeddings[i].tolist()} for i in range(3)])
+        res, extra_result = table_obj.output(["c1", "c2"]).sort([["c1", SortType.Asc]]).to_df()
+        assert res["c1"].tolist() == [0, 1, 2]
+        np.testing.assert_array_equal(np.stack([np.asarray(v) for v in res["c2"]]), embeddings)
+        db_obj.drop_table("test_to_df_embedding"+suffix, ConflictType.Error)
+
+    def test_to_arrow_embedding(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_arrow_embedding"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_arrow_embedding"+suffix, {
+            "c1": {"type": "varchar"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_arrow_embedding"+suffix)
+        embeddings = np.arange(12, dtype=np.float32).reshape(3, 4)
+        table_obj.insert([{"c1": str(i), "c2": embeddings[i].tolist()} for i in range(3)])
+        res, extra_result = table_obj.output(["c1", "c2"]).sort([["c1", SortType.Asc]]).to_arrow()
+        assert res.column("c1").to_pylist() == ["0", "1", "2"]
+        assert res.column("c2").to_pylist() == embeddings.tolist()
+        res, extra_result = table_obj.output(["c1", "c2"]).sort([["c1", SortType.Asc]]).to_pl()
+        assert res["c1"].to_list() == ["0", "1", "2"]
+        assert [list(v) for v in res["c2"].to_list()] == embeddings.tolist()
+        db_obj.drop_table("test_to_arrow_embedding"+suffix, ConflictType.Error)
+
     @pytest.mark.usefixtures("skip_if_http")
     def test_without_output_select_list(self, suffix):
         #from infinity_embedded.common import ConflictType, InfinityException
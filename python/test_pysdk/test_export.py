@@ -3,6 +3,8 @@ import sys
 import os
 import os
 import pytest
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from common import common_values
 import infinity
 import infinity_embedded
@@ -213,4 +215,47 @@ class TestInfinity:
         delete_file(test_export_fvecs_file_path+".part1")
 
         res = db_obj.drop_table("test_export_fvecs"+suffix, ConflictType.Error)
-        assert res.error_code == ErrorCode.OK
\ No newline at end of file
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.parametrize("file_type", ["parquet", "arrow"])
+    def test_export_parquet_arrow(self, file_type, suffix):
+        file_name = "enwiki_embedding_9999.csv"
+        copy_data(file_name)
+
+        test_csv_dir = common_values.TEST_TMP_DIR + file_name
+
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_export_parquet_arrow"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_export_parquet_arrow"+suffix, {"doctitle": {"type": "varchar"}, "docdate": {"type": "varchar"}, "body": {"type": "varchar"}, "num": {"type": "integer"}, "vec": {"type": "vector, 4, float"}})
+        res = table_obj.import_data(test_csv_dir, import_options={"file_type": "csv", "delimiter" : "\t"})
+        assert res.error_code == ErrorCode.OK
+
+        read_table = pq.read_table if file_type == "parquet" else feather.read_table
+        test_export_file_path = common_values.TEST_TMP_DIR + suffix + "test_export." + file_type
+        res = table_obj.export_data(test_export_file_path, {"file_type": file_type, "offset": 1000, "limit": 2000}, ["num", "vec"])
+        assert res.error_code == ErrorCode.OK
+        exported = read_table(test_export_file_path)
+        assert exported.num_rows == 2000
+        assert exported.column_names == ["num", "vec"]
+
+        # columns are matched by name, and the columns the table doesn't have are skipped
+        db_obj.drop_table("test_import_parquet_arrow"+suffix, ConflictType.Ignore)
+        import_table_obj = db_obj.create_table("test_import_parquet_arrow"+suffix, {"vec": {"type": "vector, 4, float"}, "num": {"type": "integer"}})
+        res = import_table_obj.import_data(test_export_file_path, import_options={"file_type": file_type})
+        assert res.error_code == ErrorCode.OK
+        res, extra_result = import_table_obj.output(["num"]).to_pl()
+        assert res["num"].to_list() == exported.column("num").to_pylist()
+        delete_file(test_export_file_path)
+
+        res = table_obj.export_data(test_export_file_path, {"file_type": file_type})
+        assert res.error_code == ErrorCode.OK
+        res = import_table_obj.import_data(test_export_file_path, import_options={"file_type": file_type})
+        assert res.error_code == ErrorCode.OK
+        res, extra_result = import_table_obj.output(["count(*)"]).to_pl()
+        assert res.item(0, 0) == 2000 + 9999
+        delete_file(test_export_file_path)
+
+        res = db_obj.drop_table("test_import_parquet_arrow"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+        res = db_obj.drop_table("test_export_parquet_arrow"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("module", ["infinity", "infinity.connection_pool"])
+def test_import_is_lazy(module):
+    # the dataframe libraries and sqlglot cost most of the import time, to_df / to_pl / to_arrow and string
+    # filters import them on first use. python/benchmark/import_time_benchmark.py reports the import time.
+    code = (f"import sys, {module}\n"
+            f"print(','.join(m for m in ('pandas', 'polars', 'pyarrow', 'sqlglot') if m in sys.modules))")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    loaded = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True,
+                            text=True).stdout.strip()
+    assert loaded == ""
@@ -5,6 +5,8 @@ import infinity
 import infinity_embedded
 from infinity.errors import ErrorCode
 from infinity.remote_thrift.client import ThriftInfinityClient
+from infinity.tracing import Tracer, PrometheusTracer, MultiTracer
+from infinity.common import ConflictType
 from common import common_values
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
@@ -45,3 +47,44 @@ class TestInfinity:
     def test_list_infinity(self):
         database_res = self.infinity_obj.list_databases()
         assert "default_db" in database_res.db_names
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_tracer(self):
+        traces = []
+
+        class RecordingTracer(Tracer):
+            def on_call(self, trace):
+                traces.append(trace)
+
+        prometheus_tracer = PrometheusTracer()
+        infinity_obj = infinity.connect(common_values.TEST_LOCAL_HOST,
+                                        tracer=MultiTracer(RecordingTracer(), prometheus_tracer))
+        db_obj = infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_tracer", ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_tracer", {"c1": {"type": "int"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i} for i in range(10)])
+        traces.clear()
+
+        res, extra_result = table_obj.output(["c1"]).to_df()
+        assert len(res) == 10
+        assert len(traces) == 1
+        trace = traces[0]
+        assert trace.method == "select"
+        assert trace.error_code == ErrorCode.OK
+        assert trace.bytes_sent > 0 and trace.bytes_received > 0
+        assert all(trace.phases[phase] > 0 for phase in ("build", "serialize", "rpc", "decode"))
+        assert sum(trace.phases.values()) <= trace.duration
+
+        with pytest.raises(Exception):
+            db_obj.get_table("test_tracer_not_exist")
+        assert traces[-1].method == "get_table"
+        assert traces[-1].error_code == ErrorCode.TABLE_NOT_EXIST
+
+        exposition = prometheus_tracer.expose()
+        assert 'infinity_client_requests_total{method="select"} 1' in exposition
+        assert 'infinity_client_request_duration_seconds_count{method="select",phase="total"} 1' in exposition
+
+        res = db_obj.drop_table("test_tracer", ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+        infinity_obj.disconnect()
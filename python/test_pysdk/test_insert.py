@@ -9,7 +9,7 @@ from common import common_values
 import infinity
 import infinity_embedded
 import infinity.index as index
-from infinity.common import ConflictType, InfinityException, SparseVector, Array
+from infinity.common import ConflictType, InfinityException, SparseVector, Array, SortType
 from infinity.errors import ErrorCode
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
@@ -761,6 +761,126 @@ class TestInfinity:
         res = db_obj.drop_table("python_test_insert_rows_mismatch"+suffix, ConflictType.Error)
         assert res.error_code == ErrorCode.OK
 
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_insert_columns(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_columns" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_columns" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "varchar"},
+                                         "c3": {"type": "vector,3,float"}, "c4": {"type": "sparse,100,float,int"},
+                                         "c5": {"type": "multivector,2,float"}},
+                                        ConflictType.Error)
+        assert table_obj
+        res = table_obj.insert_columns({"c1": np.array([1, 2], dtype=np.int32),
+                                        "c2": ["a", "bc"],
+                                        "c3": np.array([[1, 2, 3], [4, 5, 6]], dtype=np.float32),
+                                        "c4": [SparseVector([1, 10], [0.5, 1.5]), SparseVector([20], [2.5])],
+                                        "c5": [np.array([[1, 2], [3, 4]], dtype=np.float32),
+                                               np.array([[5, 6]], dtype=np.float32)]})
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.insert_df(pd.DataFrame({"c1": [3], "c2": ["def"], "c3": [np.array([7, 8, 9.0])],
+                                                "c4": [SparseVector([30], [3.5])], "c5": [[[7.0, 8.0]]]}))
+        assert res.error_code == ErrorCode.OK
+        res, extra_result = table_obj.output(["c1", "c2", "c3", "c5"]).sort([["c1", SortType.Asc]]).to_df()
+        pd.testing.assert_frame_equal(res, pd.DataFrame(
+            {'c1': (1, 2, 3), 'c2': ("a", "bc", "def"), 'c3': ([1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]),
+             'c5': ([[1.0, 2.0], [3.0, 4.0]], [[5.0, 6.0]], [[7.0, 8.0]])}).astype({'c1': dtype('int32')}),
+            check_dtype=False)
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.insert_columns({"c1": np.array([1, 2], dtype=np.int32), "c2": ["a"]})
+        assert e.value.args[0] == ErrorCode.COLUMN_COUNT_MISMATCH
+
+        res = db_obj.drop_table("test_insert_columns" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_remote_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_insert_columns_cast(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_columns_cast" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_columns_cast" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "float"},
+                                         "c3": {"type": "vector,4,float"}, "c4": {"type": "bool"},
+                                         "c5": {"type": "varchar", "default": "none"}},
+                                        ConflictType.Error)
+        row_count = 10000
+        res = table_obj.insert_columns({"c1": np.arange(row_count, dtype=np.int64),
+                                        "c2": np.arange(row_count, dtype=np.uint8),
+                                        "c3": np.ones((row_count, 4), dtype=np.float64),
+                                        "c4": np.arange(row_count) % 2 == 0})
+        assert res.error_code == ErrorCode.OK
+        res, extra_result = table_obj.output(["count(*)", "sum(c1)", "sum(c2)"]).to_pl()
+        assert res.row(0) == (row_count, row_count * (row_count - 1) // 2, sum(i % 256 for i in range(row_count)))
+        res, extra_result = table_obj.output(["c1", "c3", "c4", "c5"]).filter("c1 < 2").to_result()
+        assert list(res["c1"]) == [0, 1] and list(res["c4"]) == [True, False] and list(res["c5"]) == ["none", "none"]
+        assert [list(row) for row in res["c3"]] == [[1.0] * 4, [1.0] * 4]
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.insert_columns({"c1": np.array([1]), "c6": np.array([1])})
+        assert e.value.args[0] == ErrorCode.COLUMN_NOT_EXIST
+        with pytest.raises(InfinityException) as e:
+            table_obj.insert_columns({"c1": np.array([1]), "c2": np.array([1.0]), "c3": np.ones((1, 3), dtype=np.float32),
+                                      "c4": np.array([True])})
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_insert_columns_cast" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_bulk_load(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_bulk_load" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_bulk_load" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        progress = []
+        res = infinity.bulk.load(table_obj, ({"c1": i, "c2": [float(i)] * 4} for i in range(10000)), workers=4,
+                                 batch_rows=1000, progress=lambda rows, seconds: progress.append(rows))
+        assert res.rows == 10000 and res.batches == 10 and res.rows_per_second > 0
+        assert progress[-1] == 10000
+        res = infinity.bulk.load(table_obj, pd.DataFrame({"c1": np.arange(10000, 15000, dtype=np.int32),
+                                                          "c2": list(np.ones((5000, 4), dtype=np.float32))}),
+                                 workers=2, batch_rows=2048)
+        assert res.rows == 5000 and res.batches == 3
+        res, extra_result = table_obj.output(["count(*)", "sum(c1)"]).to_pl()
+        assert res.row(0) == (15000, sum(range(15000)))
+
+        with pytest.raises(InfinityException) as e:
+            infinity.bulk.load(table_obj, ({"c1": i, "c3": i} for i in range(100)), workers=2, batch_rows=10)
+        assert e.value.error_code == ErrorCode.COLUMN_NOT_EXIST
+
+        res = db_obj.drop_table("test_bulk_load" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_remote_infinity")
+    def test_insert_stream(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_stream" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_stream" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,3,float"}}, ConflictType.Error)
+
+        def rows():
+            for i in range(2500):
+                yield {"c1": i, "c2": np.full(3, i, dtype=np.float32)}
+            yield pd.DataFrame({"c1": [2500, 2501], "c2": [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]})
+
+        acks = []
+        res = table_obj.insert_stream(rows(), chunk_size=1000, on_chunk=lambda chunk_index, n: acks.append(n))
+        assert res.error_code == ErrorCode.OK
+        assert res.inserted_rows == 2502
+        assert acks == [1000, 1000, 502]
+        res, extra_result = table_obj.output(["count(*)", "sum(c1)"]).to_pl()
+        assert res.row(0) == (2502, sum(range(2502)))
+
+        with pytest.raises(InfinityException):
+            table_obj.insert_stream([{"c1": 1, "c3": 1}])
+
+        res = db_obj.drop_table("test_insert_stream" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
     @pytest.mark.parametrize("types", ["vector,16384,int", "vector,16384,float"])
     @pytest.mark.parametrize("types_examples", [[{"c1": [1] * 16384}],
                                                 [{"c1": [4] * 16384}],
@@ -1041,3 +1161,48 @@ class TestInfinity:
         assert res.height == 1 and res.width == 1 and res.item(0, 0) == total_row_count
 
         db_obj.drop_table("hr_data_mix"+suffix, ConflictType.Error)
+
+
+def test_bulk_load_connection_lost_after_commit():
+    # a server that commits every insert and then drops the connection before answering
+    import threading
+    from thrift.server import TServer
+    from thrift.transport import TSocket
+    from thrift.transport.TTransport import TTransportException
+    from infinity.common import NetworkAddress
+    from infinity.remote_thrift.client import ThriftInfinityClient
+    from infinity.remote_thrift.infinity_thrift_rpc import InfinityService
+    from infinity.remote_thrift.infinity_thrift_rpc.ttypes import CommonResponse
+    from infinity.remote_thrift.table import RemoteTable
+
+    class Handler:
+        def __init__(self):
+            self.sessions = 0
+            self.inserts = 0
+
+        def Connect(self, request):
+            self.sessions += 1
+            return CommonResponse(error_code=ErrorCode.OK, session_id=self.sessions)
+
+        def Insert(self, request):
+            self.inserts += 1
+            raise TTransportException(TTransportException.END_OF_FILE, "connection dropped after commit")
+
+    handler = Handler()
+    server_socket = TSocket.TServerSocket("127.0.0.1", 0)
+    server_socket.listen()
+    port = server_socket.handle.getsockname()[1]
+    server_socket.listen = lambda: None
+    server = TServer.TSimpleServer(InfinityService.Processor(handler), server_socket)
+    threading.Thread(target=server.serve, daemon=True).start()
+
+    client = ThriftInfinityClient(NetworkAddress("127.0.0.1", port))
+    table_obj = RemoteTable(client, "default_db", "test_bulk_load_connection_lost")
+    with pytest.raises(InfinityException) as e:
+        infinity.bulk.load(table_obj, [{"c1": i} for i in range(10)], workers=1, batch_rows=10, retries=3)
+    assert e.value.error_code == ErrorCode.CANT_CONNECT_SERVER
+    assert handler.inserts == 1
+    # the connection was reopened for the next request
+    assert handler.sessions == 2
+    # the server thread is a daemon blocked in accept, closing its socket under it would raise there
+    client.transport.close()
@@ -14,6 +14,7 @@ import pandas as pd
 from polars.testing import assert_frame_equal as pl_assert_frame_equal
 from polars.testing import assert_frame_not_equal as pl_assert_frame_not_equal
 from numpy import dtype
+import numpy as np
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
@@ -242,6 +243,89 @@ class TestInfinity:
         res = db_obj.drop_table("test_insert_multi_column" + suffix, ConflictType.Error)
         assert res.error_code == ErrorCode.OK
 
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_search_batch(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_search_batch" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_search_batch" + suffix, {
+            "c1": {"type": "int"},
+            "c2": {"type": "vector,4,float"}
+        }, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4} for i in range(16)])
+
+        queries = np.array([[i] * 4 for i in (0.0, 7.2, 15.0)], dtype=np.float32)
+        results = table_obj.output(["c1"]).filter("c1 != 1").search_batch("c2", queries, "float", "l2", 2)
+        assert [sorted(data_dict["c1"]) for data_dict, _, _ in results] == [[0, 2], [7, 8], [14, 15]]
+
+        # every query gets the same answer as its own match_dense
+        for query, (data_dict, _, _) in zip(queries, results):
+            res, _, _ = table_obj.output(["c1"]).filter("c1 != 1").match_dense("c2", query, "float", "l2",
+                                                                               2).to_result()
+            assert sorted(res["c1"]) == sorted(data_dict["c1"])
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).search_batch("c2", np.zeros((0, 4), dtype=np.float32), "float", "l2", 2)
+        assert e.value.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_search_batch" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_knn_numpy_query(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_knn_numpy_query" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_knn_numpy_query" + suffix, {
+            "c1": {"type": "int"},
+            "c2": {"type": "vector,4,float"},
+            "c3": {"type": "vector,16,bit"},
+            "c4": {"type": "tensor,2,float"},
+        }, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4, "c3": [j < i for j in range(16)],
+                           "c4": [[float(i), 0.0], [0.0, float(i)]]} for i in range(8)])
+
+        # numpy queries of any dtype are encoded as the column element type, same as lists
+        for query in ([5.2] * 4, np.full(4, 5.2), np.full(4, 5.2, dtype=np.float32)):
+            res, _, _ = table_obj.output(["c1"]).match_dense("c2", query, "float", "l2", 1).to_result()
+            assert res["c1"] == [5]
+        for query in ([j < 3 for j in range(16)], np.arange(16) < 3):
+            res, _, _ = table_obj.output(["c1"]).match_dense("c3", query, "bit", "hamming", 1).to_result()
+            assert res["c1"] == [3]
+        res, _, _ = table_obj.output(["c1"]).match_tensor("c4", np.array([[1.0, 0.0], [0.0, 1.0]]), "float",
+                                                          1).to_result()
+        assert res["c1"] == [7]
+
+        res = db_obj.drop_table("test_knn_numpy_query" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_remote_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_knn_embedded_numpy_result(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_knn_embedded_numpy_result" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_knn_embedded_numpy_result" + suffix, {
+            "c1": {"type": "int"},
+            "c2": {"type": "vector,4,float"},
+        }, ConflictType.Error)
+        # more rows than one data block, the result comes back in several column chunks
+        row_count = 10000
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4} for i in range(row_count)])
+
+        res, _, _ = table_obj.output(["c1", "c2"]).to_result()
+        assert res["c1"] == list(range(row_count))
+        assert res["c2"][3] == [3.0] * 4
+
+        res, _ = table_obj.output(["c1", "c2"]).match_dense("c2", [5.0] * 4, "float", "l2", 3).to_df()
+        assert res["c1"].dtype == dtype('int32')
+        assert sorted(res["c1"]) == [4, 5, 6]
+        for c1, c2 in zip(res["c1"], res["c2"]):
+            assert isinstance(c2, np.ndarray) and c2.dtype == np.float32
+            assert c2.tolist() == [float(c1)] * 4
+
+        res = db_obj.drop_table("test_knn_embedded_numpy_result" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
     @pytest.mark.parametrize("check_data", [{"file_name": "tmp_20240116.csv",
                                              "data_dir": common_values.TEST_TMP_DIR}], indirect=True)
     @pytest.mark.parametrize("column_name", ["gender_vector",
@@ -2,6 +2,9 @@ import importlib
 import sys
 import os
 import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import pytest
 from common import common_values
 import infinity
@@ -575,3 +578,31 @@ class TestInfinity:
         res, extra_result = table_obj.output(["*"]).to_pl()
         print(res)
         db_obj.drop_table("test_import_json_file_with_default"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_import_arrow(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_import_arrow" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_import_arrow" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "varchar"},
+                                         "c3": {"type": "vector,3,float"}}, ConflictType.Error)
+        row_count = 10000
+        res = table_obj.import_arrow(pa.table({"c3": pa.FixedSizeListArray.from_arrays(
+                                                   pa.array(np.ones(row_count * 3, dtype=np.float64)), 3),
+                                               "c1": pa.array(range(row_count), type=pa.int64()),
+                                               "c2": [str(i) for i in range(row_count)]}))
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.import_df(pd.DataFrame({"c1": [-1], "c2": ["df"], "c3": [np.array([1.0, 2.0, 3.0])]}))
+        assert res.error_code == ErrorCode.OK
+        res, extra_result = table_obj.output(["c1", "c2", "c3"]).filter("c1 < 1").to_pl()
+        assert res.sort("c1")["c2"].to_list() == ["df", "0"]
+        assert [list(row) for row in res.sort("c1")["c3"].to_list()] == [[1.0, 2.0, 3.0], [1.0, 1.0, 1.0]]
+        res, extra_result = table_obj.output(["count(*)"]).to_pl()
+        assert res.item() == row_count + 1
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.import_arrow(pa.table({"c1": [1]}))
+        assert e.value.args[0] == ErrorCode.COLUMN_COUNT_MISMATCH
+
+        res = db_obj.drop_table("test_import_arrow" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
@@ -1,4 +1,5 @@
 import importlib
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
 import os
@@ -10,7 +11,7 @@ import infinity.index as index
 import infinity_embedded
 from numpy import dtype
 from infinity.errors import ErrorCode
-from infinity.common import ConflictType, SortType
+from infinity.common import ConflictType, SortType, Param, InfinityException
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
@@ -1394,3 +1395,161 @@ class TestInfinity:
 
         res = db_obj.drop_table("test_select_date_part" + suffix)
         assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_to_batches(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_to_batches" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_to_batches" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "varchar"}}, ConflictType.Error)
+        for start in range(0, 10000, 2500):
+            table_obj.insert([{"c1": i, "c2": str(i)} for i in range(start, start + 2500)])
+
+        batches = list(table_obj.output(["c1", "c2"]).filter("c1 % 2 = 0").to_batches(batch_rows=1000))
+        assert [batch.num_rows for batch in batches] == [1000] * 5
+        assert batches[0].column_names == ["c1", "c2"]
+        c1 = [value for batch in batches for value in batch["c1"].to_pylist()]
+        assert c1 == list(range(0, 10000, 2))
+        assert batches[-1]["c2"].to_pylist()[-1] == "9998"
+
+        batches = list(table_obj.output(["c1"]).to_batches(batch_rows=3000, output_format="numpy"))
+        assert [len(batch["c1"]) for batch in batches] == [3000, 3000, 3000, 1000]
+
+        # without output() every column is returned
+        batches = list(table_obj.to_batches(batch_rows=6000))
+        assert [batch.num_rows for batch in batches] == [6000, 4000]
+        assert batches[0].column_names == ["c1", "c2"]
+
+        with pytest.raises(Exception) as e:
+            table_obj.output(["c1"]).limit(10).to_batches()
+        assert e.value.error_code == ErrorCode.NOT_SUPPORTED
+
+        res = db_obj.drop_table("test_select_to_batches" + suffix)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_prepared(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_prepared" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_prepared" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4} for i in range(10)])
+
+        query = table_obj.output(["c1"]).filter("c1 >= :lo and c1 < :hi").sort([["c1", SortType.Asc]]).prepare()
+        res, extra_result = query.to_df(lo=2, hi=5)
+        assert list(res["c1"]) == [2, 3, 4]
+        res, extra_result = query.to_df(lo=7, hi=100)
+        assert list(res["c1"]) == [7, 8, 9]
+
+        query = table_obj.output(["c1"]).match_dense("c2", Param("q"), "float", "l2", 1).prepare()
+        for i in (0, 6):
+            res, _, extra_result = query.to_result(q=[float(i)] * 4)
+            assert res["c1"] == [i]
+
+        with pytest.raises(InfinityException) as e:
+            query.to_result()
+        assert e.value.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).filter("c1 = :v").to_result()
+        assert e.value.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_select_prepared" + suffix)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_profile(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_profile" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_profile" + suffix, {"c1": {"type": "int"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i} for i in range(10)])
+
+        res, extra_result = table_obj.output(["c1"]).filter("c1 < 5").option({"profile": True}).to_df()
+        assert len(res) == 5
+        operators = infinity.profile.operators_df(extra_result)
+        assert list(operators.columns) == infinity.profile.OPERATOR_COLUMNS
+        assert len(operators) > 0
+        assert (operators["output_rows"] == 5).any()
+        assert (operators["elapsed_ms"] >= 0).all()
+        phases = infinity.profile.phases_df(extra_result)
+        assert "Execution" in list(phases["phase"])
+
+        # the next query of the builder is not profiled
+        res, extra_result = table_obj.output(["c1"]).to_df()
+        with pytest.raises(InfinityException) as e:
+            infinity.profile.operators_df(extra_result)
+        assert e.value.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_select_profile" + suffix)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_result_cache(self, suffix):
+        result_cache = infinity.result_cache.ResultCache(max_bytes=1 << 20, ttl=60)
+        infinity_obj = infinity.connect(common_values.TEST_LOCAL_HOST, result_cache=result_cache)
+        db_obj = infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_result_cache" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_result_cache" + suffix, {"c1": {"type": "int"}},
+                                        ConflictType.Error)
+        table_obj.insert([{"c1": i} for i in range(10)])
+
+        res1, _, _ = table_obj.output(["c1"]).filter("c1 < 5").to_result()
+        res2, _, _ = table_obj.output(["c1"]).filter("c1 < 5").to_result()
+        assert res1 is res2
+        assert result_cache.stats()["hits"] == 1
+        # another output format is another entry
+        res_df, _ = table_obj.output(["c1"]).filter("c1 < 5").to_df()
+        assert len(res_df) == 5
+        assert result_cache.stats()["hits"] == 1
+
+        # a write of this connection drops the results of the table
+        table_obj.insert([{"c1": -1}])
+        assert len(result_cache) == 0
+        res3, _, _ = table_obj.output(["c1"]).filter("c1 < 5").to_result()
+        assert len(res3["c1"]) == 6
+
+        # a replaced table doesn't return the results of the old one
+        table_obj = db_obj.create_table("test_select_result_cache" + suffix, {"c1": {"type": "int"}},
+                                        ConflictType.Replace)
+        assert len(result_cache) == 0
+        res4, _, _ = table_obj.output(["c1"]).filter("c1 < 5").to_result()
+        assert len(res4["c1"]) == 0
+
+        res = db_obj.drop_table("test_select_result_cache" + suffix)
+        assert res.error_code == ErrorCode.OK
+        assert len(result_cache) == 0
+
+        # dropping a database drops the results of all its tables
+        infinity_obj.drop_database("test_select_result_cache_db" + suffix, ConflictType.Ignore)
+        db_obj = infinity_obj.create_database("test_select_result_cache_db" + suffix)
+        table_obj = db_obj.create_table("test_select_result_cache" + suffix, {"c1": {"type": "int"}})
+        table_obj.insert([{"c1": 1}])
+        table_obj.output(["c1"]).to_result()
+        assert len(result_cache) == 1
+        infinity_obj.drop_database("test_select_result_cache_db" + suffix)
+        assert len(result_cache) == 0
+        infinity_obj.disconnect()
+
+    @pytest.mark.usefixtures("skip_if_remote_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_from_threads(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_from_threads" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_from_threads" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4} for i in range(100)])
+
+        # embedded infinity runs every thread on its own session without holding the GIL
+        def search(i):
+            res, extra_result = table_obj.output(["c1"]).match_dense("c2", [float(i)] * 4, "float", "l2", 1).to_df()
+            return list(res["c1"])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(search, range(100)))
+        assert results == [[i] for i in range(100)]
+
+        res = db_obj.drop_table("test_select_from_threads" + suffix)
+        assert res.error_code == ErrorCode.OK
@@ -170,6 +170,14 @@ class TestInfinity:
         assert var["error_code"] == ErrorCode.OK
         assert "result_cache" in var
 
+        var = self.infinity_obj.show_global_variable("cache_result_policy")
+        assert var["error_code"] == ErrorCode.OK
+        assert var["cache_result_policy"] in ("lru", "lfu", "tinylfu")
+
+        var = self.infinity_obj.show_global_variable("cache_result_stats")
+        assert var["error_code"] == ErrorCode.OK
+        assert "hits: " in var["cache_result_stats"]
+
         try:
             var = self.infinity_obj.show_global_variable("invalid_variable")
         except Exception as e:
@@ -183,6 +191,14 @@ class TestInfinity:
         res = self.infinity_obj.set_config({"cache_result_capacity": 100})
         assert res.error_code == ErrorCode.OK
 
+        res = self.infinity_obj.set_config({"cache_result_memory": 1 << 30})
+        assert res.error_code == ErrorCode.OK
+
+        res = self.infinity_obj.set_config({"cache_result_policy": "tinylfu"})
+        assert res.error_code == ErrorCode.OK
+        res = self.infinity_obj.set_config({"cache_result_policy": "lru"})
+        assert res.error_code == ErrorCode.OK
+
         res = self.infinity_obj.set_config({"result_cache": "clear"})
         assert res.error_code == ErrorCode.OK
 
@@ -190,6 +190,7 @@ export {
     constexpr SizeT DEFAULT_BUFFER_MANAGER_SIZE = 8 * 1024lu * 1024lu * 1024lu; // 8Gib
     constexpr SizeT DEFAULT_BUFFER_MANAGER_LRU_COUNT = 7;
     constexpr std::string_view DEFAULT_BUFFER_MANAGER_SIZE_STR = "8GB"; // 8Gib
+    constexpr std::string_view DEFAULT_BUFFER_MANAGER_QUOTA = "";       // no quota
 
     constexpr SizeT DEFAULT_MEMINDEX_MEMORY_QUOTA = 4 * 1024lu * 1024lu * 1024lu; // 4GB
     constexpr std::string_view DEFAULT_MEMINDEX_MEMORY_QUOTA_STR = "4GB";         // 4GB
@@ -201,6 +202,9 @@ export {
 
     constexpr std::string_view DEFAULT_RESULT_CACHE = "off";
     constexpr SizeT DEFAULT_CACHE_RESULT_CAPACITY = 10000;
+    constexpr SizeT DEFAULT_CACHE_RESULT_MEMORY = 1024lu * 1024lu * 1024lu; // 1GB
+    constexpr std::string_view DEFAULT_CACHE_RESULT_MEMORY_STR = "1GB";     // 1GB
+    constexpr std::string_view DEFAULT_CACHE_RESULT_POLICY = "lru";
 
     constexpr std::string_view DEFAULT_SNAPSHOT_DIR = "/var/infinity/snapshot";
 
@@ -220,6 +224,8 @@ export {
     constexpr SizeT DEFAULT_PEER_PORT = 23850;
     constexpr SizeT DEFAULT_POSTGRES_PORT = 5432;
     constexpr SizeT DEFAULT_CLIENT_PORT = 23817;
+    constexpr SizeT DEFAULT_STAGED_IMPORT_MEMORY = 1024lu * 1024lu * 1024lu; // 1GB per session
+    constexpr SizeT DEFAULT_STAGED_IMPORT_TIMEOUT_SEC = 600;                 // 10 minutes
 
     constexpr SizeT DEFAULT_PEER_RETRY_DELAY = 1000; // 1 second
     constexpr SizeT DEFAULT_PEER_RETRY_COUNT = 2;
@@ -277,11 +283,14 @@ export {
     constexpr std::string_view OBJECT_STORAGE_DISK_CACHE_LRU_COUNT_OPTION_NAME = "disk_cache_lru_count";
 
     constexpr std::string_view BUFFER_MANAGER_SIZE_OPTION_NAME = "buffer_manager_size";
+    constexpr std::string_view BUFFER_MANAGER_QUOTA_OPTION_NAME = "buffer_manager_quota";
     constexpr std::string_view LRU_NUM_OPTION_NAME = "lru_num";
     constexpr std::string_view TEMP_DIR_OPTION_NAME = "temp_dir";
     constexpr std::string_view MEMINDEX_MEMORY_QUOTA_OPTION_NAME = "memindex_memory_quota";
     constexpr std::string_view RESULT_CACHE_OPTION_NAME = "result_cache";
     constexpr std::string_view CACHE_RESULT_CAPACITY_OPTION_NAME = "cache_result_capacity";
+    constexpr std::string_view CACHE_RESULT_MEMORY_OPTION_NAME = "cache_result_memory";
+    constexpr std::string_view CACHE_RESULT_POLICY_OPTION_NAME = "cache_result_policy";
     constexpr std::string_view DENSE_INDEX_BUILDING_WORKER_OPTION_NAME = "dense_index_building_worker";
     constexpr std::string_view SPARSE_INDEX_BUILDING_WORKER_OPTION_NAME = "sparse_index_building_worker";
     constexpr std::string_view FULLTEXT_INDEX_BUILDING_WORKER_OPTION_NAME = "fulltext_index_building_worker";
@@ -323,6 +332,7 @@ export {
     constexpr std::string_view CPU_USAGE_VAR_NAME = "cpu_usage";                             // global
     constexpr std::string_view FOLLOWER_NUMBER_VAR_NAME = "follower_number";                 // global
     constexpr std::string_view CACHE_RESULT_NUM_VAR_NAME = "cache_result_num";               // global
+    constexpr std::string_view CACHE_RESULT_STATS_VAR_NAME = "cache_result_stats";           // global
     constexpr std::string_view MEMORY_CACHE_MISS_VAR_NAME = "memory_cache_miss";             // global
     constexpr std::string_view DISK_CACHE_MISS_VAR_NAME = "disk_cache_miss";                 // global
     constexpr std::string_view ENABLE_PROFILE_VAR_NAME = "profile";                          // global
@@ -55,6 +55,8 @@ module;
 #include "arrow/io/api.h"
 #include "arrow/io/caching.h"
 #include "arrow/io/file.h"
+#include "arrow/io/memory.h"
+#include "arrow/ipc/api.h"
 #include "arrow/memory_pool.h"
 #include "arrow/record_batch.h"
 #include "arrow/result.h"
@@ -216,6 +218,11 @@ export using FixedSizeListBuilder = arrow::FixedSizeListBuilder;
 export using StructBuilder = arrow::StructBuilder;
 
 export using RecordBatchReader = arrow::RecordBatchReader;
+export using RecordBatchStreamReader = arrow::ipc::RecordBatchStreamReader;
+export using RecordBatchFileReader = arrow::ipc::RecordBatchFileReader;
+export using Buffer = arrow::Buffer;
+export using BufferReader = arrow::io::BufferReader;
+export using InputStream = arrow::io::InputStream;
 export using RecordBatch = arrow::RecordBatch;
 export using MemoryPool = arrow::MemoryPool;
 export MemoryPool *DefaultMemoryPool() { return arrow::default_memory_pool(); }
@@ -2,6 +2,7 @@ module;
 #include <cassert>
 #include <cstring>
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <string>
 
 module wrap_infinity;
@@ -978,11 +979,36 @@ WrapQueryResult WrapInsert(Infinity &instance, const String &db_name, const Stri
     return WrapQueryResult(query_result.ErrorCode(), query_result.ErrorMsg());
 }
 
+WrapQueryResult
+WrapInsertColumns(Infinity &instance, const String &db_name, const String &table_name, Vector<WrapInsertColumn> &columns, SizeT row_count) {
+    Vector<InsertColumnData> column_data;
+    column_data.reserve(columns.size());
+    for (const auto &column : columns) {
+        column_data.push_back({column.column_name,
+                               column.element_type,
+                               Span<const char>(reinterpret_cast<const char *>(column.data.data()), column.data.size()),
+                               Span<const i64>(column.offsets.data(), column.offsets.size())});
+    }
+    auto query_result = instance.InsertColumns(db_name, table_name, column_data, row_count);
+    return WrapQueryResult(query_result.ErrorCode(), query_result.ErrorMsg());
+}
+
 WrapQueryResult WrapImport(Infinity &instance, const String &db_name, const String &table_name, const String &path, ImportOptions import_options) {
     auto query_result = instance.Import(db_name, table_name, path, import_options);
     return WrapQueryResult(query_result.ErrorCode(), query_result.ErrorMsg());
 }
 
+WrapQueryResult WrapImportData(Infinity &instance,
+                               const String &db_name,
+                               const String &table_name,
+                               nb::ndarray<const u8, nb::ndim<1>, nb::c_contig, nb::device::cpu> &data,
+                               ImportOptions import_options) {
+    auto import_data = MakeShared<Vector<String>>();
+    import_data->emplace_back(reinterpret_cast<const char *>(data.data()), data.size());
+    auto query_result = instance.ImportData(db_name, table_name, std::move(import_data), import_options);
+    return WrapQueryResult(query_result.ErrorCode(), query_result.ErrorMsg());
+}
+
 WrapQueryResult WrapExport(Infinity &instance,
                            const String &db_name,
                            const String &table_name,
@@ -1098,6 +1124,14 @@ WrapQueryResult WrapUpdate(Infinity &instance,
 }
 
 // WrapSearch related function
+// The first size bytes of the column vector as a read-only numpy uint8 array. Nothing is copied: the array owns a reference to the
+// column vector, which keeps the data valid after the query result is released.
+nanobind::object ColumnVectorView(const SharedPtr<ColumnVector> &column_vector, SizeT size) {
+    auto *holder = new SharedPtr<ColumnVector>(column_vector);
+    nanobind::capsule owner(holder, [](void *p) noexcept { delete static_cast<SharedPtr<ColumnVector> *>(p); });
+    return nanobind::cast(nanobind::ndarray<nanobind::numpy, const u8, nanobind::ndim<1>>(column_vector->data(), {size}, owner));
+}
+
 void HandleBoolType(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
     String dst;
     dst.reserve(row_count);
@@ -1105,12 +1139,12 @@ void HandleBoolType(ColumnField &output_column_field, SizeT row_count, const Sha
         const char c = column_vector->buffer_->GetCompactBit(index) ? 1 : 0;
         dst.push_back(c);
     }
-    output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
+    output_column_field.column_vectors.emplace_back(nanobind::bytes(dst.c_str(), dst.size()));
 }
 
 void HandlePodType(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
     auto size = column_vector->data_type()->Size() * row_count;
-    output_column_field.column_vectors.emplace_back(column_vector->data(), size);
+    output_column_field.column_vectors.emplace_back(ColumnVectorView(column_vector, size));
 }
 
 void HandleVarcharType(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
@@ -1131,13 +1165,13 @@ void HandleVarcharType(ColumnField &output_column_field, SizeT row_count, const
         current_offset += sizeof(i32) + length;
     }
 
-    output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
+    output_column_field.column_vectors.emplace_back(nanobind::bytes(dst.c_str(), dst.size()));
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
 void HandleEmbeddingType(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
     auto size = column_vector->data_type()->Size() * row_count;
-    output_column_field.column_vectors.emplace_back(column_vector->data(), size);
+    output_column_field.column_vectors.emplace_back(ColumnVectorView(column_vector, size));
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
@@ -1160,7 +1194,7 @@ void HandleMultiVectorType(ColumnField &output_column_field, SizeT row_count, co
         current_offset += sizeof(i32) + length;
     }
 
-    output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
+    output_column_field.column_vectors.emplace_back(nanobind::bytes(dst.c_str(), dst.size()));
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
@@ -1183,7 +1217,7 @@ void HandleTensorType(ColumnField &output_column_field, SizeT row_count, const S
         current_offset += sizeof(i32) + length;
     }
 
-    output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
+    output_column_field.column_vectors.emplace_back(nanobind::bytes(dst.c_str(), dst.size()));
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
@@ -1215,7 +1249,7 @@ void HandleTensorArrayType(ColumnField &output_column_field, SizeT row_count, co
         }
     }
 
-    output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
+    output_column_field.column_vectors.emplace_back(nanobind::bytes(dst.c_str(), dst.size()));
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
@@ -1240,22 +1274,19 @@ void HandleSparseType(ColumnField &output_column_field, SizeT row_count, const S
         current_offset += data_span.size();
     }
 
-    output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
+    output_column_field.column_vectors.emplace_back(nanobind::bytes(dst.c_str(), dst.size()));
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
 void HandleRowIDType(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
     auto size = column_vector->data_type()->Size() * row_count;
-    output_column_field.column_vectors.emplace_back(column_vector->data(), size);
+    output_column_field.column_vectors.emplace_back(ColumnVectorView(column_vector, size));
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
 void HandleTimeRelatedTypes(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
     auto size = column_vector->data_type()->Size() * row_count;
-    String dst;
-    dst.resize(size);
-    std::memcpy(dst.data(), column_vector->data(), size);
-    output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
+    output_column_field.column_vectors.emplace_back(ColumnVectorView(column_vector, size));
 }
 
 extern template void InfinityThriftService::HandleArrayTypeRecursively<ArrayT>(String &output_str, const DataType &data_type, const ArrayT &data_value, const SharedPtr<ColumnVector> &column_vector);
@@ -1270,7 +1301,7 @@ void HandleArrayType(ColumnField &output_column_field, SizeT row_count, const Sh
     for (SizeT index = 0; index < row_count; ++index) {
         InfinityThriftService::HandleArrayTypeRecursively(dst, column_data_type, array_data_ptr[index], column_vector);
     }
-    output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
+    output_column_field.column_vectors.emplace_back(nanobind::bytes(dst.c_str(), dst.size()));
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
@@ -1628,18 +1659,23 @@ WrapQueryResult WrapSearch(Infinity &instance,
         }
     }
 
-    auto query_result = instance.Search(db_name,
-                                        table_name,
-                                        search_expr,
-                                        filter,
-                                        limit,
-                                        offset,
-                                        output_columns,
-                                        highlight,
-                                        order_by_exprs,
-                                        group_by_exprs,
-                                        having,
-                                        total_hits_count_flag);
+    QueryResult query_result;
+    {
+        // the result is turned into python bytes below, only the query itself runs without the GIL
+        nanobind::gil_scoped_release release;
+        query_result = instance.Search(db_name,
+                                       table_name,
+                                       search_expr,
+                                       filter,
+                                       limit,
+                                       offset,
+                                       output_columns,
+                                       highlight,
+                                       order_by_exprs,
+                                       group_by_exprs,
+                                       having,
+                                       total_hits_count_flag);
+    }
     search_expr = nullptr;
     filter = nullptr;
     limit = nullptr;
@@ -1846,18 +1882,22 @@ WrapQueryResult WrapExplain(Infinity &instance,
         }
     }
 
-    auto query_result = instance.Explain(db_name,
-                                         table_name,
-                                         explain_type,
-                                         search_expr,
-                                         filter,
-                                         limit,
-                                         offset,
-                                         output_columns,
-                                         highlight,
-                                         order_by_exprs,
-                                         group_by_exprs,
-                                         having);
+    QueryResult query_result;
+    {
+        nanobind::gil_scoped_release release;
+        query_result = instance.Explain(db_name,
+                                        table_name,
+                                        explain_type,
+                                        search_expr,
+                                        filter,
+                                        limit,
+                                        offset,
+                                        output_columns,
+                                        highlight,
+                                        order_by_exprs,
+                                        group_by_exprs,
+                                        having);
+    }
     search_expr = nullptr;
     filter = nullptr;
     limit = nullptr;
@@ -3,6 +3,7 @@ module;
 #include "parser/type/complex/embedding_type.h"
 #include <cstring>
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <string>
 
 export module wrap_infinity;
@@ -55,7 +56,8 @@ namespace infinity {
 
 export struct ColumnField {
     LogicalType column_type;
-    Vector<nb::bytes> column_vectors;
+    // bytes for the types serialized into a new buffer, read-only numpy uint8 views of the result column for fixed width types
+    Vector<nb::object> column_vectors;
     String column_name;
 };
 
@@ -300,6 +302,14 @@ export struct WrapUpdateExpr {
     UpdateExpr *GetUpdateExpr(Status &status);
 };
 
+// One column of WrapInsertColumns, the raw bytes of a numpy array or arrow buffer, see InsertColumnData
+export struct WrapInsertColumn {
+    String column_name;
+    EmbeddingDataType element_type{EmbeddingDataType::kElemInvalid};
+    nb::ndarray<const u8, nb::ndim<1>, nb::c_contig, nb::device::cpu> data;
+    nb::ndarray<const i64, nb::ndim<1>, nb::c_contig, nb::device::cpu> offsets;
+};
+
 export struct WrapInsertRowExpr {
     Vector<String> columns;
     Vector<WrapConstantExpr> values;
@@ -398,9 +408,18 @@ export WrapQueryResult WrapShowCurrentNode(Infinity &instance);
 
 export WrapQueryResult WrapInsert(Infinity &instance, const String &db_name, const String &table_name, Vector<WrapInsertRowExpr> &insert_rows);
 
+export WrapQueryResult
+WrapInsertColumns(Infinity &instance, const String &db_name, const String &table_name, Vector<WrapInsertColumn> &columns, SizeT row_count);
+
 export WrapQueryResult
 WrapImport(Infinity &instance, const String &db_name, const String &table_name, const String &path, ImportOptions import_options);
 
+export WrapQueryResult WrapImportData(Infinity &instance,
+                                      const String &db_name,
+                                      const String &table_name,
+                                      nb::ndarray<const u8, nb::ndim<1>, nb::c_contig, nb::device::cpu> &data,
+                                      ImportOptions import_options);
+
 export WrapQueryResult WrapExport(Infinity &instance,
                                   const String &db_name,
                                   const String &table_name,
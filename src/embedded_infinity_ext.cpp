@@ -1,4 +1,5 @@
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <nanobind/stl/set.h>
 #include <nanobind/stl/shared_ptr.h>
 #include <nanobind/stl/string.h>
@@ -58,6 +59,13 @@ NB_MODULE(embedded_infinity_ext, m) {
         .def_rw("index_type", &WrapQueryResult::index_type)
         .def_rw("deleted_rows", &WrapQueryResult::deleted_rows);
 
+    nb::class_<WrapInsertColumn>(m, "WrapInsertColumn")
+        .def(nb::init<>())
+        .def_rw("column_name", &WrapInsertColumn::column_name)
+        .def_rw("element_type", &WrapInsertColumn::element_type)
+        .def_rw("data", &WrapInsertColumn::data)
+        .def_rw("offsets", &WrapInsertColumn::offsets);
+
     nb::class_<WrapColumnField>(m, "WrapColumnField")
         .def(nb::init<>())
         .def_rw("column_name", &WrapColumnField::column_name)
@@ -259,55 +267,69 @@ NB_MODULE(embedded_infinity_ext, m) {
         .def_static("LocalConnect", &Infinity::LocalConnect)
         .def("LocalDisconnect", &Infinity::LocalDisconnect)
 
-        .def("CreateDatabase", &WrapCreateDatabase)
-        .def("DropDatabase", &WrapDropDatabase)
-        .def("ListDatabases", &WrapListDatabases)
-        .def("GetDatabase", &WrapGetDatabase)
-        .def("ShowDatabase", &WrapShowDatabase)
-        .def("Flush", &WrapFlush)
-
-        .def("SetVariableOrConfig", nb::overload_cast<Infinity &, const String &, bool, SetScope>(&WrapSetVariableOrConfig))
-        .def("SetVariableOrConfig", nb::overload_cast<Infinity &, const String &, i64, SetScope>(&WrapSetVariableOrConfig))
-        .def("SetVariableOrConfig", nb::overload_cast<Infinity &, const String &, double, SetScope>(&WrapSetVariableOrConfig))
-        .def("SetVariableOrConfig", nb::overload_cast<Infinity &, const String &, String, SetScope>(&WrapSetVariableOrConfig))
-
-        .def("ShowVariable", &WrapShowVariable)
-        .def("ShowVariables", &WrapShowVariables)
-        .def("ShowConfig", &WrapShowConfig)
-        .def("ShowConfigs", &WrapShowConfigs)
-        .def("ShowInfo", &WrapShowInfo, nb::arg("info_name"))
-
-        .def("Query", &WrapQuery)
-
-        .def("CreateTable", &WrapCreateTable)
-        .def("DropTable", &WrapDropTable)
-        .def("ListTables", &WrapListTables)
-        .def("ShowTable", &WrapShowTable)
+        // infinity never calls back into python, so requests run without the GIL and threads using their own
+        // session run in parallel. Search and Explain build python bytes for their result and release the GIL only
+        // around the query itself, see wrap_infinity. ShowColumns and ShowTables also build python bytes and keep it.
+        .def("CreateDatabase", &WrapCreateDatabase, nb::call_guard<nb::gil_scoped_release>())
+        .def("DropDatabase", &WrapDropDatabase, nb::call_guard<nb::gil_scoped_release>())
+        .def("ListDatabases", &WrapListDatabases, nb::call_guard<nb::gil_scoped_release>())
+        .def("GetDatabase", &WrapGetDatabase, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowDatabase", &WrapShowDatabase, nb::call_guard<nb::gil_scoped_release>())
+        .def("Flush", &WrapFlush, nb::call_guard<nb::gil_scoped_release>())
+
+        .def("SetVariableOrConfig",
+             nb::overload_cast<Infinity &, const String &, bool, SetScope>(&WrapSetVariableOrConfig),
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("SetVariableOrConfig",
+             nb::overload_cast<Infinity &, const String &, i64, SetScope>(&WrapSetVariableOrConfig),
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("SetVariableOrConfig",
+             nb::overload_cast<Infinity &, const String &, double, SetScope>(&WrapSetVariableOrConfig),
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("SetVariableOrConfig",
+             nb::overload_cast<Infinity &, const String &, String, SetScope>(&WrapSetVariableOrConfig),
+             nb::call_guard<nb::gil_scoped_release>())
+
+        .def("ShowVariable", &WrapShowVariable, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowVariables", &WrapShowVariables, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowConfig", &WrapShowConfig, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowConfigs", &WrapShowConfigs, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowInfo", &WrapShowInfo, nb::arg("info_name"), nb::call_guard<nb::gil_scoped_release>())
+
+        .def("Query", &WrapQuery, nb::call_guard<nb::gil_scoped_release>())
+
+        .def("CreateTable", &WrapCreateTable, nb::call_guard<nb::gil_scoped_release>())
+        .def("DropTable", &WrapDropTable, nb::call_guard<nb::gil_scoped_release>())
+        .def("ListTables", &WrapListTables, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowTable", &WrapShowTable, nb::call_guard<nb::gil_scoped_release>())
         .def("ShowColumns", &WrapShowColumns)
-        .def("ListTableIndexes", &WrapListTableIndexes)
+        .def("ListTableIndexes", &WrapListTableIndexes, nb::call_guard<nb::gil_scoped_release>())
         .def("ShowTables", &WrapShowTables)
-        .def("GetTable", &WrapGetTable)
-
-        .def("CreateIndex", &WrapCreateIndex)
-        .def("DropIndex", &WrapDropIndex)
-        .def("ShowIndex", &WrapShowIndex)
-        .def("ShowSegment", &WrapShowSegment)
-        .def("ShowSegments", &WrapShowSegments)
-        .def("ShowBlock", &WrapShowBlock)
-        .def("ShowBlocks", &WrapShowBlocks)
-        .def("ShowBlockColumn", &WrapShowBlockColumn)
-        .def("ShowCurrentNode", &WrapShowCurrentNode)
-
-        .def("Insert", &WrapInsert)
-        .def("Import", &WrapImport)
-        .def("Export", &WrapExport)
-        .def("Delete", &WrapDelete, nb::arg("db_name"), nb::arg("table_name"), nb::arg("filter") = nullptr)
+        .def("GetTable", &WrapGetTable, nb::call_guard<nb::gil_scoped_release>())
+
+        .def("CreateIndex", &WrapCreateIndex, nb::call_guard<nb::gil_scoped_release>())
+        .def("DropIndex", &WrapDropIndex, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowIndex", &WrapShowIndex, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowSegment", &WrapShowSegment, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowSegments", &WrapShowSegments, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowBlock", &WrapShowBlock, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowBlocks", &WrapShowBlocks, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowBlockColumn", &WrapShowBlockColumn, nb::call_guard<nb::gil_scoped_release>())
+        .def("ShowCurrentNode", &WrapShowCurrentNode, nb::call_guard<nb::gil_scoped_release>())
+
+        .def("Insert", &WrapInsert, nb::call_guard<nb::gil_scoped_release>())
+        .def("InsertColumns", &WrapInsertColumns, nb::call_guard<nb::gil_scoped_release>())
+        .def("Import", &WrapImport, nb::call_guard<nb::gil_scoped_release>())
+        .def("ImportData", &WrapImportData, nb::call_guard<nb::gil_scoped_release>())
+        .def("Export", &WrapExport, nb::call_guard<nb::gil_scoped_release>())
+        .def("Delete", &WrapDelete, nb::arg("db_name"), nb::arg("table_name"), nb::arg("filter") = nullptr, nb::call_guard<nb::gil_scoped_release>())
         .def("Update",
              &WrapUpdate,
              nb::arg("db_name"),
              nb::arg("table_name"),
              nb::arg("wrap_filter") = nullptr,
-             nb::arg("wrap_update_list") = nullptr)
+             nb::arg("wrap_update_list") = nullptr,
+             nb::call_guard<nb::gil_scoped_release>())
         .def("Explain",
              &WrapExplain,
              nb::arg("db_name"),
@@ -336,9 +358,24 @@ NB_MODULE(embedded_infinity_ext, m) {
              nb::arg("where_expr") = nullptr,
              nb::arg("limit_expr") = nullptr,
              nb::arg("offset_expr") = nullptr)
-        .def("Optimize", &WrapOptimize, nb::arg("db_name"), nb::arg("table_name"), nb::arg("optimize_options"))
-        .def("AddColumns", &WrapAddColumns, nb::arg("db_name"), nb::arg("table_name"), nb::arg("column_defs"))
-        .def("DropColumns", &WrapDropColumns, nb::arg("db_name"), nb::arg("table_name"), nb::arg("column_names"));
+        .def("Optimize",
+             &WrapOptimize,
+             nb::arg("db_name"),
+             nb::arg("table_name"),
+             nb::arg("optimize_options"),
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("AddColumns",
+             &WrapAddColumns,
+             nb::arg("db_name"),
+             nb::arg("table_name"),
+             nb::arg("column_defs"),
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("DropColumns",
+             &WrapDropColumns,
+             nb::arg("db_name"),
+             nb::arg("table_name"),
+             nb::arg("column_names"),
+             nb::call_guard<nb::gil_scoped_release>());
 
     // extra_ddl_info
     nb::enum_<ConflictType>(m, "ConflictType")
@@ -355,6 +392,8 @@ NB_MODULE(embedded_infinity_ext, m) {
         .value("kFVECS", CopyFileType::kFVECS)
         .value("kCSR", CopyFileType::kCSR)
         .value("kBVECS", CopyFileType::kBVECS)
+        .value("kPARQUET", CopyFileType::kPARQUET)
+        .value("kARROW", CopyFileType::kARROW)
         .value("kInvalid", CopyFileType::kInvalid);
 
     nb::class_<InitParameter>(m, "InitParameter")
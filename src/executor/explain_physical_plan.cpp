@@ -2025,6 +2025,10 @@ void ExplainPhysicalPlan::Explain(const PhysicalImport *import_node, SharedPtr<V
             SharedPtr<String> file_type = MakeShared<String>(String(intent_size, ' ') + " - type: PARQUET");
             break;
         }
+        case CopyFileType::kARROW: {
+            SharedPtr<String> file_type = MakeShared<String>(String(intent_size, ' ') + " - type: ARROW");
+            break;
+        }
         case CopyFileType::kInvalid: {
             String error_message = "Invalid show type";
             UnrecoverableError(error_message);
@@ -2107,6 +2111,11 @@ void ExplainPhysicalPlan::Explain(const PhysicalExport *export_node, SharedPtr<V
             result->emplace_back(file_type);
             break;
         }
+        case CopyFileType::kARROW: {
+            SharedPtr<String> file_type = MakeShared<String>(String(intent_size, ' ') + " - type: ARROW");
+            result->emplace_back(file_type);
+            break;
+        }
         case CopyFileType::kInvalid: {
             String error_message = "Invalid file type";
             UnrecoverableError(error_message);
@@ -201,6 +201,44 @@ bool PhysicalCommand::Execute(QueryContext *query_context, OperatorState *operat
                             cache_mgr->ResetCacheNumCapacity(cache_num);
                             break;
                         }
+                        case GlobalOptionIndex::kCacheResultMemory: {
+                            if (set_command->value_type() != SetVarType::kInteger) {
+                                Status status = Status::DataTypeMismatch("Integer", set_command->value_type_str());
+                                RecoverableError(status);
+                            }
+                            i64 cache_memory = set_command->value_int();
+                            ResultCacheManager *cache_mgr = query_context->storage()->GetResultCacheManagerPtr();
+                            const String &result_cache_status = config->ResultCache();
+                            if (result_cache_status == "off") {
+                                Status status = Status::InvalidCommand(fmt::format("Result cache manager is off"));
+                                RecoverableError(status);
+                            }
+                            if (cache_memory < 0) {
+                                Status status = Status::InvalidCommand(fmt::format("Attempt to set cache result memory: {}", cache_memory));
+                                RecoverableError(status);
+                            }
+                            cache_mgr->ResetCacheMemoryCapacity(cache_memory);
+                            break;
+                        }
+                        case GlobalOptionIndex::kCacheResultPolicy: {
+                            if (set_command->value_type() != SetVarType::kString) {
+                                Status status = Status::DataTypeMismatch("String", set_command->value_type_str());
+                                RecoverableError(status);
+                            }
+                            ResultCacheManager *cache_mgr = query_context->storage()->GetResultCacheManagerPtr();
+                            const String &result_cache_status = config->ResultCache();
+                            if (result_cache_status == "off") {
+                                Status status = Status::InvalidCommand(fmt::format("Result cache manager is off"));
+                                RecoverableError(status);
+                            }
+                            ResultCachePolicy policy = ResultCachePolicyFromString(set_command->value_str());
+                            if (policy == ResultCachePolicy::kInvalid) {
+                                Status status = Status::SetInvalidVarValue("cache result policy", "lru, lfu, tinylfu");
+                                RecoverableError(status);
+                            }
+                            cache_mgr->ResetPolicy(policy);
+                            break;
+                        }
                         case GlobalOptionIndex::kLogLevel: {
                             if (set_command->value_type() != SetVarType::kString) {
                                 Status status = Status::DataTypeMismatch("String", set_command->value_type_str());
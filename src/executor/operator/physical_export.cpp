@@ -17,6 +17,7 @@ module;
 #include "arrow/type_fwd.h"
 #include <arrow/io/caching.h>
 #include <arrow/io/file.h>
+#include <arrow/ipc/writer.h>
 #include <parquet/arrow/writer.h>
 #include <parquet/properties.h>
 #include <string>
@@ -67,8 +68,9 @@ bool PhysicalExport::Execute(QueryContext *query_context, OperatorState *operato
             exported_row_count = ExportToFVECS(query_context, export_op_state);
             break;
         }
-        case CopyFileType::kPARQUET: {
-            exported_row_count = ExportToPARQUET(query_context, export_op_state);
+        case CopyFileType::kPARQUET:
+        case CopyFileType::kARROW: {
+            exported_row_count = ExportRecordBatches(query_context, export_op_state);
             break;
         }
         default: {
@@ -503,7 +505,8 @@ SharedPtr<arrow::DataType> GetArrowType(const DataType &column_data_type);
 
 SharedPtr<arrow::Array> BuildArrowArray(const ColumnDef *column_def, const ColumnVector &column_vector, const Vector<u32> &block_rows_for_output);
 
-SizeT PhysicalExport::ExportToPARQUET(QueryContext *query_context, ExportOperatorState *export_op_state) {
+// Parquet, or an arrow IPC file (feather v2) for kARROW
+SizeT PhysicalExport::ExportRecordBatches(QueryContext *query_context, ExportOperatorState *export_op_state) {
     const Vector<SharedPtr<ColumnDef>> &column_defs = table_info_->column_defs_;
     Vector<ColumnID> select_columns;
     // export all columns or export specific column index
@@ -530,6 +533,8 @@ SizeT PhysicalExport::ExportToPARQUET(QueryContext *query_context, ExportOperato
     SharedPtr<arrow::Schema> schema = ::arrow::schema(std::move(fields));
     SharedPtr<::arrow::io::FileOutputStream> file_stream;
     UniquePtr<::parquet::arrow::FileWriter> file_writer;
+    SharedPtr<::arrow::ipc::RecordBatchWriter> ipc_writer;
+    const String format_name = file_type_ == CopyFileType::kARROW ? "arrow" : "parquet";
 
     String parent_path = VirtualStore::GetParentPath(file_path_);
     if (!parent_path.empty()) {
@@ -539,20 +544,38 @@ SizeT PhysicalExport::ExportToPARQUET(QueryContext *query_context, ExportOperato
         }
     }
 
-    auto init_file_stream_writer = [&pool, &schema, &file_stream, &file_writer](const String &output_file_path) {
+    auto init_file_stream_writer = [&](const String &output_file_path) {
         file_writer.reset();
+        ipc_writer.reset();
         file_stream.reset();
         auto file_stream_result = ::arrow::io::FileOutputStream::Open(output_file_path, pool);
         if (!file_stream_result.ok()) {
             RecoverableError(Status::IOError(file_stream_result.status().ToString()));
         }
         file_stream = std::move(file_stream_result).ValueOrDie();
+        if (file_type_ == CopyFileType::kARROW) {
+            auto ipc_writer_result = ::arrow::ipc::MakeFileWriter(file_stream, schema);
+            if (!ipc_writer_result.ok()) {
+                RecoverableError(Status::IOError(ipc_writer_result.status().ToString()));
+            }
+            ipc_writer = std::move(ipc_writer_result).ValueOrDie();
+            return;
+        }
         auto file_writer_result = ::parquet::arrow::FileWriter::Open(*schema, pool, file_stream, ::parquet::default_writer_properties());
         if (!file_writer_result.ok()) {
             RecoverableError(Status::IOError(file_writer_result.status().ToString()));
         }
         file_writer = std::move(file_writer_result).ValueOrDie();
     };
+    auto close_file_stream_writer = [&] {
+        auto status = ipc_writer.get() != nullptr ? ipc_writer->Close() : file_writer->Close();
+        if (status.ok()) {
+            status = file_stream->Close();
+        }
+        if (!status.ok()) {
+            RecoverableError(Status::IOError(fmt::format("Failed to close {} file: {}", format_name, status.ToString())));
+        }
+    };
     init_file_stream_writer(file_path_);
 
     SizeT offset = offset_;
@@ -586,9 +609,7 @@ SizeT PhysicalExport::ExportToPARQUET(QueryContext *query_context, ExportOperato
                 continue;
             }
             if (switch_to_new_file) {
-                if (auto status = file_writer->Close(); !status.ok()) {
-                    RecoverableError(Status::IOError(fmt::format("Failed to close parquet file: {}", status.ToString())));
-                }
+                close_file_stream_writer();
                 const String new_file_path = fmt::format("{}.part{}", file_path_, ++file_no_);
                 init_file_stream_writer(new_file_path);
             }
@@ -600,8 +621,9 @@ SizeT PhysicalExport::ExportToPARQUET(QueryContext *query_context, ExportOperato
                 block_arrays.emplace_back(BuildArrowArray(column_def, column_vector, block_rows_for_output));
             }
             SharedPtr<arrow::RecordBatch> block_batch = arrow::RecordBatch::Make(schema, block_rows_for_output.size(), std::move(block_arrays));
-            if (auto status = file_writer->WriteRecordBatch(*block_batch); !status.ok()) {
-                RecoverableError(Status::IOError(fmt::format("Failed to write record batch to parquet file: {}", status.ToString())));
+            auto status = ipc_writer.get() != nullptr ? ipc_writer->WriteRecordBatch(*block_batch) : file_writer->WriteRecordBatch(*block_batch);
+            if (!status.ok()) {
+                RecoverableError(Status::IOError(fmt::format("Failed to write record batch to {} file: {}", format_name, status.ToString())));
             }
             switch_to_new_file = need_switch_to_new_file;
             if (row_count == limit_) {
@@ -663,10 +685,8 @@ SizeT PhysicalExport::ExportToPARQUET(QueryContext *query_context, ExportOperato
         }
     }
 label_return:
-    if (auto status = file_writer->Close(); !status.ok()) {
-        RecoverableError(Status::IOError(fmt::format("Failed to close parquet file: {}", status.ToString())));
-    }
-    LOG_DEBUG(fmt::format("Export to PARQUET, db {}, table {}, file: {}, row: {}", schema_name_, table_name_, file_path_, row_count));
+    close_file_stream_writer();
+    LOG_DEBUG(fmt::format("Export to {}, db {}, table {}, file: {}, row: {}", format_name, schema_name_, table_name_, file_path_, row_count));
     return row_count;
 }
 
@@ -74,7 +74,7 @@ public:
 
     SizeT ExportToFVECS(QueryContext *query_context, ExportOperatorState *export_op_state);
 
-    SizeT ExportToPARQUET(QueryContext *query_context, ExportOperatorState *export_op_state);
+    SizeT ExportRecordBatches(QueryContext *query_context, ExportOperatorState *export_op_state);
 
     inline CopyFileType FileType() const { return file_type_; }
 
@@ -23,7 +23,11 @@ module;
 #include <cerrno>
 #include <cstdio>
 #include <cstring>
-
+#include <numeric>
+#include <parquet/arrow/reader.h>
+#include <parquet/file_reader.h>
+#include <parquet/metadata.h>
+#include <parquet/schema.h>
 #include <vector>
 
 module physical_import;
@@ -122,6 +126,10 @@ bool PhysicalImport::Execute(QueryContext *query_context, OperatorState *operato
             ImportPARQUET(query_context, import_op_state);
             break;
         }
+        case CopyFileType::kARROW: {
+            ImportARROW(query_context, import_op_state);
+            break;
+        }
         case CopyFileType::kInvalid: {
             Status status = Status::ImportFileFormatError("Invalid import file type");
             RecoverableError(status);
@@ -1374,19 +1382,28 @@ void PhysicalImport::JSONLRowHandler(const nlohmann::json &line_json, Vector<Col
 
 namespace {
 
-Status CheckParquetColumns(TableInfo *table_info, arrow::ParquetFileReader *arrow_reader) {
-    SharedPtr<arrow::Schema> schema;
-    arrow::Status status = arrow_reader->GetSchema(&schema);
-    if (!status.ok()) {
-        return Status::ImportFileFormatError(status.ToString());
-    }
-    const arrow::FieldVector &fields = schema->fields();
+// Table column i is read from record batch column column_mapping[i]. Columns are matched by name when the file has all
+// of them, e.g. a parquet file with more columns than the table, and by position otherwise.
+Status MapArrowColumns(TableInfo *table_info, const arrow::Schema &schema, Vector<int> &column_mapping) {
+    const arrow::FieldVector &fields = schema.fields();
     const Vector<SharedPtr<ColumnDef>> &column_defs = table_info->column_defs_;
-    if (fields.size() != column_defs.size()) {
-        return Status::ColumnCountMismatch(fmt::format("Column count mismatch: {} != {}", fields.size(), column_defs.size()));
+    column_mapping.clear();
+    for (const auto &column_def : column_defs) {
+        int field_idx = schema.GetFieldIndex(column_def->name());
+        if (field_idx < 0) {
+            break;
+        }
+        column_mapping.push_back(field_idx);
+    }
+    if (column_mapping.size() != column_defs.size()) {
+        if (fields.size() != column_defs.size()) {
+            return Status::ColumnCountMismatch(fmt::format("Column count mismatch: {} != {}", fields.size(), column_defs.size()));
+        }
+        column_mapping.resize(fields.size());
+        std::iota(column_mapping.begin(), column_mapping.end(), 0);
     }
-    for (SizeT i = 0; i < fields.size(); ++i) {
-        const auto &field = fields[i];
+    for (SizeT i = 0; i < column_defs.size(); ++i) {
+        const auto &field = fields[column_mapping[i]];
         const auto &column_def = column_defs[i];
 
         if (*column_def->type() != *field->type()) {
@@ -1398,6 +1415,80 @@ Status CheckParquetColumns(TableInfo *table_info, arrow::ParquetFileReader *arro
     return Status::OK();
 }
 
+// Reads the record batches of an arrow IPC file (feather v2) one at a time
+class IpcFileBatchReader final : public arrow::RecordBatchReader {
+public:
+    explicit IpcFileBatchReader(SharedPtr<arrow::RecordBatchFileReader> file_reader) : file_reader_(std::move(file_reader)) {}
+
+    SharedPtr<arrow::Schema> schema() const override { return file_reader_->schema(); }
+
+    arrow::Status ReadNext(SharedPtr<arrow::RecordBatch> *batch) override {
+        if (batch_idx_ >= file_reader_->num_record_batches()) {
+            batch->reset();
+            return arrow::Status::OK();
+        }
+        auto batch_result = file_reader_->ReadRecordBatch(batch_idx_++);
+        if (!batch_result.ok()) {
+            return batch_result.status();
+        }
+        *batch = batch_result.MoveValueUnsafe();
+        return arrow::Status::OK();
+    }
+
+private:
+    SharedPtr<arrow::RecordBatchFileReader> file_reader_{};
+    int batch_idx_{0};
+};
+
+// Reads the record batches of several arrow IPC streams one after another, such as the chunks of an import sent in
+// several requests. The streams must have the same schema.
+class ChunkedStreamBatchReader final : public arrow::RecordBatchReader {
+public:
+    explicit ChunkedStreamBatchReader(SharedPtr<Vector<String>> chunks) : chunks_(std::move(chunks)) {}
+
+    arrow::Status Open() { return OpenChunk(); }
+
+    SharedPtr<arrow::Schema> schema() const override { return schema_; }
+
+    arrow::Status ReadNext(SharedPtr<arrow::RecordBatch> *batch) override {
+        while (true) {
+            arrow::Status status = chunk_reader_->ReadNext(batch);
+            if (!status.ok() || *batch != nullptr) {
+                return status;
+            }
+            if (++chunk_idx_ >= chunks_->size()) {
+                return arrow::Status::OK();
+            }
+            status = OpenChunk();
+            if (!status.ok()) {
+                return status;
+            }
+        }
+    }
+
+private:
+    arrow::Status OpenChunk() {
+        const String &chunk = (*chunks_)[chunk_idx_];
+        auto buffer = MakeShared<arrow::Buffer>(reinterpret_cast<const u8 *>(chunk.data()), chunk.size());
+        auto reader_result = arrow::RecordBatchStreamReader::Open(MakeShared<arrow::BufferReader>(std::move(buffer)));
+        if (!reader_result.ok()) {
+            return reader_result.status();
+        }
+        chunk_reader_ = reader_result.MoveValueUnsafe();
+        if (schema_ == nullptr) {
+            schema_ = chunk_reader_->schema();
+        } else if (!schema_->Equals(*chunk_reader_->schema())) {
+            return arrow::Status::Invalid(fmt::format("Arrow stream {} has a different schema than the first one", chunk_idx_));
+        }
+        return arrow::Status::OK();
+    }
+
+    SharedPtr<Vector<String>> chunks_{};
+    SizeT chunk_idx_{0};
+    SharedPtr<arrow::RecordBatchReader> chunk_reader_{};
+    SharedPtr<arrow::Schema> schema_{};
+};
+
 } // namespace
 
 void PhysicalImport::ImportPARQUET(QueryContext *query_context, ImportOperatorState *import_op_state) {
@@ -1407,9 +1498,12 @@ void PhysicalImport::ImportPARQUET(QueryContext *query_context, ImportOperatorSt
     auto reader_properties = arrow::ParquetReaderProperties(pool);
     reader_properties.enable_buffered_stream();
 
-    // Configure Arrow-specific Parquet reader settings
+    // Configure Arrow-specific Parquet reader settings, the column chunks of each row group are fetched in one go
+    // and decoded in parallel
     auto arrow_reader_props = arrow::ParquetArrowReaderProperties();
     arrow_reader_props.set_batch_size(DEFAULT_BLOCK_CAPACITY);
+    arrow_reader_props.set_use_threads(true);
+    arrow_reader_props.set_pre_buffer(true);
 
     arrow::ParquetFileReaderBuilder reader_builder;
     if (const auto status = reader_builder.OpenFile(file_path_, /*memory_map=*/true, reader_properties); !status.ok()) {
@@ -1424,14 +1518,79 @@ void PhysicalImport::ImportPARQUET(QueryContext *query_context, ImportOperatorSt
     }
     std::unique_ptr<arrow::ParquetFileReader> arrow_reader = build_result.MoveValueUnsafe();
 
-    if (Status status = CheckParquetColumns(table_info_.get(), arrow_reader.get()); !status.ok()) {
-        RecoverableError(status);
+    // Only decode the columns of the table when the file has all of them by name, a parquet column is one leaf per
+    // primitive value so the leaves are matched by the top level field they belong to
+    const parquet::SchemaDescriptor *file_schema = arrow_reader->parquet_reader()->metadata()->schema();
+    HashSet<String> column_names;
+    for (const auto &column_def : table_info_->column_defs_) {
+        column_names.insert(column_def->name());
+    }
+    HashSet<String> found_column_names;
+    Vector<int> leaf_indices;
+    for (int leaf_idx = 0; leaf_idx < file_schema->num_columns(); ++leaf_idx) {
+        String field_name = file_schema->Column(leaf_idx)->path()->ToDotVector()[0];
+        if (column_names.contains(field_name)) {
+            found_column_names.insert(field_name);
+            leaf_indices.push_back(leaf_idx);
+        }
     }
 
     std::shared_ptr<arrow::RecordBatchReader> rb_reader;
-    if (auto status = arrow_reader->GetRecordBatchReader(&rb_reader); !status.ok()) {
+    arrow::Status status;
+    if (found_column_names.size() == column_names.size() && (int)leaf_indices.size() < file_schema->num_columns()) {
+        Vector<int> row_group_indices(arrow_reader->num_row_groups());
+        std::iota(row_group_indices.begin(), row_group_indices.end(), 0);
+        status = arrow_reader->GetRecordBatchReader(row_group_indices, leaf_indices, &rb_reader);
+    } else {
+        status = arrow_reader->GetRecordBatchReader(&rb_reader);
+    }
+    if (!status.ok()) {
         RecoverableError(Status::ImportFileFormatError(status.ToString()));
     }
+    ImportRecordBatches(query_context, import_op_state, *rb_reader);
+}
+
+void PhysicalImport::ImportARROW(QueryContext *query_context, ImportOperatorState *import_op_state) {
+    // arrow IPC streams handed over in memory by ImportData, or an arrow IPC file (feather v2) or stream at file_path_
+    SharedPtr<arrow::RecordBatchReader> rb_reader;
+    if (data_.get() != nullptr) {
+        if (data_->empty()) {
+            RecoverableError(Status::ImportFileFormatError("No arrow stream to import"));
+        }
+        auto chunked_reader = MakeShared<ChunkedStreamBatchReader>(data_);
+        if (arrow::Status status = chunked_reader->Open(); !status.ok()) {
+            RecoverableError(Status::ImportFileFormatError(status.ToString()));
+        }
+        rb_reader = std::move(chunked_reader);
+    } else {
+        auto open_result = arrow::ReadableFile::Open(file_path_);
+        if (!open_result.ok()) {
+            RecoverableError(Status::IOError(open_result.status().ToString()));
+        }
+        SharedPtr<arrow::ReadableFile> file = open_result.MoveValueUnsafe();
+        auto magic_result = file->ReadAt(0, 6);
+        if (magic_result.ok() && magic_result.ValueUnsafe()->ToString() == "ARROW1") {
+            auto reader_result = arrow::RecordBatchFileReader::Open(file);
+            if (!reader_result.ok()) {
+                RecoverableError(Status::ImportFileFormatError(reader_result.status().ToString()));
+            }
+            rb_reader = MakeShared<IpcFileBatchReader>(reader_result.MoveValueUnsafe());
+        } else {
+            auto reader_result = arrow::RecordBatchStreamReader::Open(file);
+            if (!reader_result.ok()) {
+                RecoverableError(Status::ImportFileFormatError(reader_result.status().ToString()));
+            }
+            rb_reader = reader_result.MoveValueUnsafe();
+        }
+    }
+    ImportRecordBatches(query_context, import_op_state, *rb_reader);
+}
+
+void PhysicalImport::ImportRecordBatches(QueryContext *query_context, ImportOperatorState *import_op_state, arrow::RecordBatchReader &rb_reader) {
+    Vector<int> column_mapping;
+    if (Status status = MapArrowColumns(table_info_.get(), *rb_reader.schema(), column_mapping); !status.ok()) {
+        RecoverableError(status);
+    }
 
     Txn *txn = query_context->GetTxn();
     SizeT row_count = 0;
@@ -1452,45 +1611,49 @@ void PhysicalImport::ImportPARQUET(QueryContext *query_context, ImportOperatorSt
     };
     init_column_vectors_and_block_entry();
 
-    for (arrow::ArrowResult<std::shared_ptr<arrow::RecordBatch>> maybe_batch : *rb_reader) {
+    for (arrow::ArrowResult<std::shared_ptr<arrow::RecordBatch>> maybe_batch : rb_reader) {
         // Operate on each batch...
-        if (maybe_batch.ok()) {
-            auto batch = maybe_batch.MoveValueUnsafe();
-            const auto batch_row_count = batch->num_rows();
-            const auto batch_col_count = batch->num_columns();
-            for (i64 batch_row_id = 0; batch_row_id < batch_row_count; ++batch_row_id) {
-                for (int column_idx = 0; column_idx < batch_col_count; ++column_idx) {
-                    SharedPtr<arrow::Array> column = batch->column(column_idx);
-                    if (column->length() != batch_row_count) {
-                        UnrecoverableError("column length mismatch");
-                    }
-                    try {
-                        ParquetValueHandler(column, column_vectors[column_idx], batch_row_id);
-                    } catch (const RecoverableException &) {
-                        column_vectors.clear();
-                        std::move(*block_entry).Cleanup();
-                        std::move(*segment_entry).Cleanup();
-                        throw;
-                    }
+        if (!maybe_batch.ok()) {
+            column_vectors.clear();
+            std::move(*block_entry).Cleanup();
+            std::move(*segment_entry).Cleanup();
+            RecoverableError(Status::ImportFileFormatError(maybe_batch.status().ToString()));
+        }
+        auto batch = maybe_batch.MoveValueUnsafe();
+        const auto batch_row_count = batch->num_rows();
+        const auto column_count = static_cast<int>(column_mapping.size());
+        for (i64 batch_row_id = 0; batch_row_id < batch_row_count; ++batch_row_id) {
+            for (int column_idx = 0; column_idx < column_count; ++column_idx) {
+                SharedPtr<arrow::Array> column = batch->column(column_mapping[column_idx]);
+                if (column->length() != batch_row_count) {
+                    UnrecoverableError("column length mismatch");
+                }
+                try {
+                    ParquetValueHandler(column, column_vectors[column_idx], batch_row_id);
+                } catch (const RecoverableException &) {
+                    column_vectors.clear();
+                    std::move(*block_entry).Cleanup();
+                    std::move(*segment_entry).Cleanup();
+                    throw;
                 }
+            }
 
-                block_entry->IncreaseRowCount(1);
-                if (block_entry->GetAvailableCapacity() <= 0) {
-                    segment_entry->AppendBlockEntry(std::move(block_entry));
-                    if (segment_entry->Room() <= 0) {
-                        SaveSegmentData(table_info_.get(), txn, segment_entry);
-                        std::tie(segment_entry, segment_status) = txn->MakeNewSegment(*table_info_->db_name_, *table_info_->table_name_);
-                        if (!segment_status.ok()) {
-                            RecoverableError(segment_status);
-                        }
-                        //                        segment_id = Catalog::GetNextSegmentID(table_entry_);
-                        //                        segment_entry = SegmentEntry::NewSegmentEntry(table_entry_, segment_id, txn);
+            block_entry->IncreaseRowCount(1);
+            if (block_entry->GetAvailableCapacity() <= 0) {
+                segment_entry->AppendBlockEntry(std::move(block_entry));
+                if (segment_entry->Room() <= 0) {
+                    SaveSegmentData(table_info_.get(), txn, segment_entry);
+                    std::tie(segment_entry, segment_status) = txn->MakeNewSegment(*table_info_->db_name_, *table_info_->table_name_);
+                    if (!segment_status.ok()) {
+                        RecoverableError(segment_status);
                     }
-                    init_column_vectors_and_block_entry();
+                    //                        segment_id = Catalog::GetNextSegmentID(table_entry_);
+                    //                        segment_entry = SegmentEntry::NewSegmentEntry(table_entry_, segment_id, txn);
                 }
+                init_column_vectors_and_block_entry();
             }
-            row_count += batch_row_count;
         }
+        row_count += batch_row_count;
     }
 
     if (block_entry->row_count() > 0) {
@@ -72,9 +72,10 @@ public:
                             bool header,
                             char delimiter,
                             CopyFileType type,
+                            SharedPtr<Vector<String>> data,
                             SharedPtr<Vector<LoadMeta>> load_metas)
         : PhysicalOperator(PhysicalOperatorType::kImport, nullptr, nullptr, id, load_metas), table_info_(table_info), file_type_(type),
-          file_path_(std::move(file_path)), header_(header), delimiter_(delimiter) {}
+          file_path_(std::move(file_path)), data_(std::move(data)), header_(header), delimiter_(delimiter) {}
 
     ~PhysicalImport() override = default;
 
@@ -102,6 +103,8 @@ public:
 
     void ImportPARQUET(QueryContext *query_context, ImportOperatorState *import_op_state);
 
+    void ImportARROW(QueryContext *query_context, ImportOperatorState *import_op_state);
+
     inline const TableInfo* table_info() const { return table_info_.get(); }
 
     inline CopyFileType FileType() const { return file_type_; }
@@ -121,6 +124,8 @@ private:
 
     void JSONLRowHandler(const nlohmann::json &line_json, Vector<ColumnVector> &column_vectors);
 
+    void ImportRecordBatches(QueryContext *query_context, ImportOperatorState *import_op_state, arrow::RecordBatchReader &rb_reader);
+
     void ParquetValueHandler(const SharedPtr<arrow::Array> &array, ColumnVector &column_vector, u64 value_idx);
 
 private:
@@ -130,6 +135,8 @@ private:
     SharedPtr<TableInfo> table_info_{};
     CopyFileType file_type_{CopyFileType::kInvalid};
     String file_path_{};
+    // arrow IPC streams handed over in memory instead of read from file_path_, imported one after another
+    SharedPtr<Vector<String>> data_{};
     bool header_{false};
     char delimiter_{','};
 };
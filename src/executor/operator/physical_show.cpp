@@ -3939,6 +3939,92 @@ void PhysicalShow::ExecuteShowGlobalVariable(QueryContext *query_context, ShowOp
             value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
             break;
         }
+        case GlobalVariable::kCacheResultMemory: {
+            const String &result_cache_status = config->ResultCache();
+            if (result_cache_status == "off") {
+                operator_state->status_ = Status::NotSupport(fmt::format("Result cache is off"));
+                RecoverableError(operator_state->status_);
+            }
+            ResultCacheManager *cache_mgr = query_context->storage()->GetResultCacheManagerPtr();
+
+            Vector<SharedPtr<ColumnDef>> output_column_defs = {
+                MakeShared<ColumnDef>(0, integer_type, "value", std::set<ConstraintType>()),
+            };
+
+            SharedPtr<TableDef> table_def =
+                TableDef::Make(MakeShared<String>("default_db"), MakeShared<String>("variables"), nullptr, output_column_defs);
+            output_ = MakeShared<DataTable>(table_def, TableType::kResult);
+
+            Vector<SharedPtr<DataType>> output_column_types{
+                integer_type,
+            };
+
+            output_block_ptr->Init(output_column_types);
+            Value value = Value::MakeBigInt(cache_mgr->cache_memory_capacity());
+            ValueExpression value_expr(value);
+            value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+            break;
+        }
+        case GlobalVariable::kCacheResultPolicy: {
+            const String &result_cache_status = config->ResultCache();
+            if (result_cache_status == "off") {
+                operator_state->status_ = Status::NotSupport(fmt::format("Result cache is off"));
+                RecoverableError(operator_state->status_);
+            }
+            ResultCacheManager *cache_mgr = query_context->storage()->GetResultCacheManagerPtr();
+
+            Vector<SharedPtr<ColumnDef>> output_column_defs = {
+                MakeShared<ColumnDef>(0, varchar_type, "value", std::set<ConstraintType>()),
+            };
+
+            SharedPtr<TableDef> table_def =
+                TableDef::Make(MakeShared<String>("default_db"), MakeShared<String>("variables"), nullptr, output_column_defs);
+            output_ = MakeShared<DataTable>(table_def, TableType::kResult);
+
+            Vector<SharedPtr<DataType>> output_column_types{
+                varchar_type,
+            };
+
+            output_block_ptr->Init(output_column_types);
+            Value value = Value::MakeVarchar(ResultCachePolicyToString(cache_mgr->policy()));
+            ValueExpression value_expr(value);
+            value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+            break;
+        }
+        case GlobalVariable::kCacheResultStats: {
+            const String &result_cache_status = config->ResultCache();
+            if (result_cache_status == "off") {
+                operator_state->status_ = Status::NotSupport(fmt::format("Result cache is off"));
+                RecoverableError(operator_state->status_);
+            }
+            ResultCacheManager *cache_mgr = query_context->storage()->GetResultCacheManagerPtr();
+            ResultCacheStats stats = cache_mgr->Stats();
+            String stats_str = fmt::format("hits: {}, misses: {}, evictions: {}, invalidations: {}, rejections: {}, memory_used: {}",
+                                           stats.hits_,
+                                           stats.misses_,
+                                           stats.evictions_,
+                                           stats.invalidations_,
+                                           stats.rejections_,
+                                           stats.memory_used_);
+
+            Vector<SharedPtr<ColumnDef>> output_column_defs = {
+                MakeShared<ColumnDef>(0, varchar_type, "value", std::set<ConstraintType>()),
+            };
+
+            SharedPtr<TableDef> table_def =
+                TableDef::Make(MakeShared<String>("default_db"), MakeShared<String>("variables"), nullptr, output_column_defs);
+            output_ = MakeShared<DataTable>(table_def, TableType::kResult);
+
+            Vector<SharedPtr<DataType>> output_column_types{
+                varchar_type,
+            };
+
+            output_block_ptr->Init(output_column_types);
+            Value value = Value::MakeVarchar(stats_str);
+            ValueExpression value_expr(value);
+            value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+            break;
+        }
         case GlobalVariable::kMemoryCacheMiss: {
             Vector<SharedPtr<ColumnDef>> output_column_defs = {
                 MakeShared<ColumnDef>(0, varchar_type, "value", std::set<ConstraintType>()),
@@ -4580,6 +4666,92 @@ void PhysicalShow::ExecuteShowGlobalVariables(QueryContext *query_context, ShowO
                 }
                 break;
             }
+            case GlobalVariable::kCacheResultMemory: {
+                const String &result_cache_status = config->ResultCache();
+                if (result_cache_status == "off") {
+                    break;
+                }
+                ResultCacheManager *cache_mgr = query_context->storage()->GetResultCacheManagerPtr();
+                {
+                    // option name
+                    Value value = Value::MakeVarchar(var_name);
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+                }
+                {
+                    // option value
+                    Value value = Value::MakeVarchar(std::to_string(cache_mgr->cache_memory_capacity()));
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[1]);
+                }
+                {
+                    // option description
+                    Value value = Value::MakeVarchar("Result cache memory capacity in bytes");
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[2]);
+                }
+                break;
+            }
+            case GlobalVariable::kCacheResultPolicy: {
+                const String &result_cache_status = config->ResultCache();
+                if (result_cache_status == "off") {
+                    break;
+                }
+                ResultCacheManager *cache_mgr = query_context->storage()->GetResultCacheManagerPtr();
+                {
+                    // option name
+                    Value value = Value::MakeVarchar(var_name);
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+                }
+                {
+                    // option value
+                    Value value = Value::MakeVarchar(ResultCachePolicyToString(cache_mgr->policy()));
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[1]);
+                }
+                {
+                    // option description
+                    Value value = Value::MakeVarchar("Result cache eviction policy");
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[2]);
+                }
+                break;
+            }
+            case GlobalVariable::kCacheResultStats: {
+                const String &result_cache_status = config->ResultCache();
+                if (result_cache_status == "off") {
+                    break;
+                }
+                ResultCacheManager *cache_mgr = query_context->storage()->GetResultCacheManagerPtr();
+                ResultCacheStats stats = cache_mgr->Stats();
+                String stats_str = fmt::format("hits: {}, misses: {}, evictions: {}, invalidations: {}, rejections: {}, memory_used: {}",
+                                               stats.hits_,
+                                               stats.misses_,
+                                               stats.evictions_,
+                                               stats.invalidations_,
+                                               stats.rejections_,
+                                               stats.memory_used_);
+                {
+                    // option name
+                    Value value = Value::MakeVarchar(var_name);
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+                }
+                {
+                    // option value
+                    Value value = Value::MakeVarchar(stats_str);
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[1]);
+                }
+                {
+                    // option description
+                    Value value = Value::MakeVarchar("Result cache hits, misses, evictions, invalidations, rejections and memory used");
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[2]);
+                }
+                break;
+            }
             case GlobalVariable::kMemoryCacheMiss: {
                 BufferManager *buffer_manager = query_context->storage()->buffer_manager();
                 u64 total_request_count = buffer_manager->TotalRequestCount();
@@ -572,6 +572,7 @@ UniquePtr<PhysicalOperator> PhysicalPlanner::BuildImport(const SharedPtr<Logical
                                       logical_import->header(),
                                       logical_import->delimiter(),
                                       logical_import->FileType(),
+                                      logical_import->data(),
                                       logical_operator->load_metas());
 }
 
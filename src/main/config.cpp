@@ -33,6 +33,7 @@ import options;
 import command_statement;
 import infinity_exception;
 import global_resource_usage;
+import file_worker_type;
 
 namespace infinity {
 using namespace std::chrono;
@@ -86,6 +87,37 @@ Status Config::ParseByteSize(const String &byte_size_str, i64 &byte_size) {
     }
 }
 
+// Such as "hnsw:2GB,bmp:512MB", the pool names are in kBufferPoolNames
+Status Config::ParseBufferManagerQuota(const String &quota_str, Vector<Pair<FileWorkerType, u64>> &pool_quotas) {
+    SizeT begin = 0;
+    while (begin < quota_str.size()) {
+        SizeT end = quota_str.find(',', begin);
+        if (end == String::npos) {
+            end = quota_str.size();
+        }
+        String pool_quota = quota_str.substr(begin, end - begin);
+        begin = end + 1;
+
+        SizeT colon_pos = pool_quota.find(':');
+        if (colon_pos == String::npos) {
+            return Status::InvalidConfig(fmt::format("Invalid buffer manager quota: {}, such as \"hnsw:2GB\"", pool_quota));
+        }
+        String pool_name = pool_quota.substr(0, colon_pos);
+        ToLower(pool_name);
+        FileWorkerType file_type = BufferPoolNameToFileWorkerType(pool_name);
+        if (file_type == FileWorkerType::kInvalid) {
+            return Status::InvalidConfig(fmt::format("Invalid buffer pool: {}, should be one of {}", pool_name, fmt::join(kBufferPoolNames, ", ")));
+        }
+        i64 quota = 0;
+        Status status = ParseByteSize(pool_quota.substr(colon_pos + 1), quota);
+        if (!status.ok()) {
+            return status;
+        }
+        pool_quotas.emplace_back(file_type, quota);
+    }
+    return Status::OK();
+}
+
 Status Config::ParseTimeInfo(const String &time_info, i64 &time_seconds) {
     if (time_info.empty()) {
         return Status::EmptyConfigParameter();
@@ -551,6 +583,31 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
             UnrecoverableError(status.message());
         }
 
+        i64 cache_result_memory = DEFAULT_CACHE_RESULT_MEMORY;
+        auto cache_result_memory_option =
+            MakeUnique<IntegerOption>(CACHE_RESULT_MEMORY_OPTION_NAME, cache_result_memory, std::numeric_limits<i64>::max(), 0);
+        status = global_options_.AddOption(std::move(cache_result_memory_option));
+        if (!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
+        String cache_result_policy(DEFAULT_CACHE_RESULT_POLICY);
+        auto cache_result_policy_option = MakeUnique<StringOption>(CACHE_RESULT_POLICY_OPTION_NAME, cache_result_policy);
+        status = global_options_.AddOption(std::move(cache_result_policy_option));
+        if (!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
+        String buffer_manager_quota(DEFAULT_BUFFER_MANAGER_QUOTA);
+        auto buffer_manager_quota_option = MakeUnique<StringOption>(BUFFER_MANAGER_QUOTA_OPTION_NAME, buffer_manager_quota);
+        status = global_options_.AddOption(std::move(buffer_manager_quota_option));
+        if (!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
         // Temp Dir
         String temp_dir = "/var/infinity/tmp";
         if (default_config != nullptr) {
@@ -2108,6 +2165,54 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
                             global_options_.AddOption(std::move(cache_result_num_option));
                             break;
                         }
+                        case GlobalOptionIndex::kCacheResultMemory: {
+                            i64 cache_result_memory = DEFAULT_CACHE_RESULT_MEMORY;
+                            if (elem.second.is_string()) {
+                                String cache_result_memory_str = elem.second.value_or(DEFAULT_CACHE_RESULT_MEMORY_STR.data());
+                                auto res = ParseByteSize(cache_result_memory_str, cache_result_memory);
+                                if (!res.ok()) {
+                                    return res;
+                                }
+                            } else {
+                                return Status::InvalidConfig("'cache_result_memory' field isn't string, such as \"1GB\"");
+                            }
+                            auto cache_result_memory_option =
+                                MakeUnique<IntegerOption>(CACHE_RESULT_MEMORY_OPTION_NAME, cache_result_memory, std::numeric_limits<i64>::max(), 0);
+                            global_options_.AddOption(std::move(cache_result_memory_option));
+                            break;
+                        }
+                        case GlobalOptionIndex::kCacheResultPolicy: {
+                            String cache_result_policy_str(DEFAULT_CACHE_RESULT_POLICY);
+                            if (elem.second.is_string()) {
+                                cache_result_policy_str = elem.second.value_or(cache_result_policy_str);
+                            } else {
+                                return Status::InvalidConfig("'cache_result_policy' field isn't string.");
+                            }
+                            ToLower(cache_result_policy_str);
+                            if (cache_result_policy_str != "lru" && cache_result_policy_str != "lfu" && cache_result_policy_str != "tinylfu") {
+                                return Status::InvalidConfig(
+                                    fmt::format("Invalid cache result policy: {}, should be lru, lfu or tinylfu", cache_result_policy_str));
+                            }
+                            auto cache_result_policy_option = MakeUnique<StringOption>(CACHE_RESULT_POLICY_OPTION_NAME, cache_result_policy_str);
+                            global_options_.AddOption(std::move(cache_result_policy_option));
+                            break;
+                        }
+                        case GlobalOptionIndex::kBufferManagerQuota: {
+                            String buffer_manager_quota_str(DEFAULT_BUFFER_MANAGER_QUOTA);
+                            if (elem.second.is_string()) {
+                                buffer_manager_quota_str = elem.second.value_or(buffer_manager_quota_str);
+                            } else {
+                                return Status::InvalidConfig("'buffer_manager_quota' field isn't string, such as \"hnsw:2GB,bmp:512MB\"");
+                            }
+                            Vector<Pair<FileWorkerType, u64>> pool_quotas;
+                            auto res = ParseBufferManagerQuota(buffer_manager_quota_str, pool_quotas);
+                            if (!res.ok()) {
+                                return res;
+                            }
+                            auto buffer_manager_quota_option = MakeUnique<StringOption>(BUFFER_MANAGER_QUOTA_OPTION_NAME, buffer_manager_quota_str);
+                            global_options_.AddOption(std::move(buffer_manager_quota_option));
+                            break;
+                        }
                         default: {
                             return Status::InvalidConfig(fmt::format("Unrecognized config parameter: {} in 'buffer' field", var_name));
                         }
@@ -2173,6 +2278,36 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
                     }
                 }
 
+                if (global_options_.GetOptionByIndex(GlobalOptionIndex::kCacheResultMemory) == nullptr) {
+                    i64 cache_result_memory = DEFAULT_CACHE_RESULT_MEMORY;
+                    UniquePtr<IntegerOption> cache_result_memory_option =
+                        MakeUnique<IntegerOption>(CACHE_RESULT_MEMORY_OPTION_NAME, cache_result_memory, std::numeric_limits<i64>::max(), 0);
+                    Status status = global_options_.AddOption(std::move(cache_result_memory_option));
+                    if (!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
+
+                if (global_options_.GetOptionByIndex(GlobalOptionIndex::kCacheResultPolicy) == nullptr) {
+                    String cache_result_policy_str(DEFAULT_CACHE_RESULT_POLICY);
+                    UniquePtr<StringOption> cache_result_policy_option =
+                        MakeUnique<StringOption>(CACHE_RESULT_POLICY_OPTION_NAME, cache_result_policy_str);
+                    Status status = global_options_.AddOption(std::move(cache_result_policy_option));
+                    if (!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
+
+                if (global_options_.GetOptionByIndex(GlobalOptionIndex::kBufferManagerQuota) == nullptr) {
+                    String buffer_manager_quota_str(DEFAULT_BUFFER_MANAGER_QUOTA);
+                    UniquePtr<StringOption> buffer_manager_quota_option =
+                        MakeUnique<StringOption>(BUFFER_MANAGER_QUOTA_OPTION_NAME, buffer_manager_quota_str);
+                    Status status = global_options_.AddOption(std::move(buffer_manager_quota_option));
+                    if (!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
+
             } else {
                 return Status::InvalidConfig("No 'buffer' section in configure file.");
             }
@@ -2804,11 +2939,31 @@ String Config::ResultCache() {
     return global_options_.GetStringValue(GlobalOptionIndex::kResultCache);
 }
 
+Vector<Pair<FileWorkerType, u64>> Config::BufferManagerQuota() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    Vector<Pair<FileWorkerType, u64>> pool_quotas;
+    Status status = ParseBufferManagerQuota(global_options_.GetStringValue(GlobalOptionIndex::kBufferManagerQuota), pool_quotas);
+    if (!status.ok()) {
+        UnrecoverableError(status.message());
+    }
+    return pool_quotas;
+}
+
 i64 Config::CacheResultNum() {
     std::lock_guard<std::mutex> guard(mutex_);
     return global_options_.GetIntegerValue(GlobalOptionIndex::kCacheResultCapacity);
 }
 
+i64 Config::CacheResultMemory() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetIntegerValue(GlobalOptionIndex::kCacheResultMemory);
+}
+
+String Config::CacheResultPolicy() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetStringValue(GlobalOptionIndex::kCacheResultPolicy);
+}
+
 void Config::SetCacheResult(const String &mode) {
     std::lock_guard<std::mutex> guard(mutex_);
     BaseOption *base_option = global_options_.GetOptionByIndex(GlobalOptionIndex::kResultCache);
@@ -2990,6 +3145,9 @@ void Config::PrintAll() {
 
     // Buffer manager
     fmt::print(" - buffer_manager_size: {}\n", Utility::FormatByteSize(BufferManagerSize()));
+    for (const auto &[file_type, quota] : BufferManagerQuota()) {
+        fmt::print(" - buffer_manager_quota: {} {}\n", kBufferPoolNames[static_cast<SizeT>(file_type)], Utility::FormatByteSize(quota));
+    }
     fmt::print(" - temp_dir: {}\n", TempDir());
     fmt::print(" - memindex_memory_quota: {}\n", Utility::FormatByteSize(MemIndexMemoryQuota()));
 
@@ -21,6 +21,7 @@ import options;
 import status;
 import command_statement;
 import virtual_store;
+import file_worker_type;
 
 
 namespace infinity {
@@ -123,6 +124,7 @@ public:
 
     // Buffer
     i64 BufferManagerSize();
+    Vector<Pair<FileWorkerType, u64>> BufferManagerQuota();
     SizeT LRUNum();
     String TempDir();
 
@@ -130,6 +132,8 @@ public:
 
     String ResultCache();
     i64 CacheResultNum();
+    i64 CacheResultMemory();
+    String CacheResultPolicy();
     void SetCacheResult(const String &mode);
 
     // WAL
@@ -174,6 +178,8 @@ private:
 
     static Status ParseByteSize(const String &byte_size_str, i64 &byte_size);
 
+    static Status ParseBufferManagerQuota(const String &quota_str, Vector<Pair<FileWorkerType, u64>> &pool_quotas);
+
     static Status ParseTimeInfo(const String &time_info, i64 &time_seconds);
 
     static u64 GetAvailableMem();
@@ -63,6 +63,21 @@ import third_party;
 import defer_op;
 
 import infinity_exception;
+import txn;
+import table_entry;
+import data_block;
+import column_vector;
+import column_def;
+import data_type;
+import logical_type;
+import default_values;
+import internal_types;
+import embedding_info;
+import cast_function;
+import bound_cast_func;
+import constant_expr;
+import table_def;
+import data_table;
 
 namespace infinity {
 
@@ -136,7 +151,11 @@ SharedPtr<Infinity> Infinity::LocalConnect() {
 }
 
 void Infinity::LocalDisconnect() {
-    //    fmt::print("To disconnect the database.\n");
+    SessionManager *session_mgr = InfinityContext::instance().session_manager();
+    if (session_mgr != nullptr && session_ != nullptr) {
+        session_mgr->RemoveSessionByID(session_->session_id());
+    }
+    session_.reset();
 }
 
 SharedPtr<Infinity> Infinity::RemoteConnect() {
@@ -925,6 +944,221 @@ QueryResult Infinity::Insert(const String &db_name, const String &table_name, Ve
     return result;
 }
 
+namespace {
+
+// The type of the values in an insert column buffer, nullptr if the buffer can't hold values of the column type.
+// Numbers are cast to the column type afterwards, like the values of a row insert.
+SharedPtr<DataType> InsertColumnSourceType(const InsertColumnData &column, const DataType &column_type) {
+    switch (column_type.type()) {
+        case LogicalType::kVarchar: {
+            return column.element_type_ == EmbeddingDataType::kElemUInt8 ? MakeShared<DataType>(column_type) : nullptr;
+        }
+        case LogicalType::kEmbedding: {
+            const auto *embedding_info = static_cast<const EmbeddingInfo *>(column_type.type_info().get());
+            if (column.element_type_ == embedding_info->Type()) {
+                return MakeShared<DataType>(column_type);
+            }
+            if (column.element_type_ == EmbeddingDataType::kElemBit || embedding_info->Type() == EmbeddingDataType::kElemBit ||
+                column.element_type_ == EmbeddingDataType::kElemInvalid) {
+                return nullptr;
+            }
+            return MakeShared<DataType>(LogicalType::kEmbedding, EmbeddingInfo::Make(column.element_type_, embedding_info->Dimension()));
+        }
+        case LogicalType::kBoolean:
+        case LogicalType::kTinyInt:
+        case LogicalType::kSmallInt:
+        case LogicalType::kInteger:
+        case LogicalType::kBigInt:
+        case LogicalType::kFloat16:
+        case LogicalType::kBFloat16:
+        case LogicalType::kFloat:
+        case LogicalType::kDouble: {
+            switch (column.element_type_) {
+                case EmbeddingDataType::kElemBit:
+                    return MakeShared<DataType>(LogicalType::kBoolean);
+                case EmbeddingDataType::kElemInt8:
+                    return MakeShared<DataType>(LogicalType::kTinyInt);
+                case EmbeddingDataType::kElemInt16:
+                    return MakeShared<DataType>(LogicalType::kSmallInt);
+                case EmbeddingDataType::kElemInt32:
+                    return MakeShared<DataType>(LogicalType::kInteger);
+                case EmbeddingDataType::kElemInt64:
+                    return MakeShared<DataType>(LogicalType::kBigInt);
+                case EmbeddingDataType::kElemFloat16:
+                    return MakeShared<DataType>(LogicalType::kFloat16);
+                case EmbeddingDataType::kElemBFloat16:
+                    return MakeShared<DataType>(LogicalType::kBFloat16);
+                case EmbeddingDataType::kElemFloat:
+                    return MakeShared<DataType>(LogicalType::kFloat);
+                case EmbeddingDataType::kElemDouble:
+                    return MakeShared<DataType>(LogicalType::kDouble);
+                default:
+                    return nullptr;
+            }
+        }
+        default: {
+            return nullptr;
+        }
+    }
+}
+
+String InsertColumnElementTypeName(EmbeddingDataType element_type) {
+    return element_type == EmbeddingDataType::kElemInvalid ? "unknown" : EmbeddingType::EmbeddingDataType2String(element_type);
+}
+
+Status CheckInsertColumn(const InsertColumnData &column, const DataType &source_type, SizeT row_count) {
+    if (source_type.type() == LogicalType::kVarchar) {
+        if (column.offsets_.size() != row_count + 1 || column.offsets_[0] != 0 || column.offsets_[row_count] != (i64)column.data_.size()) {
+            return Status::InvalidParameterValue(column.column_name_,
+                                                 fmt::format("{} offsets", column.offsets_.size()),
+                                                 fmt::format("{} offsets from 0 to {}", row_count + 1, column.data_.size()));
+        }
+        for (SizeT row_idx = 0; row_idx < row_count; ++row_idx) {
+            if (column.offsets_[row_idx] > column.offsets_[row_idx + 1]) {
+                return Status::InvalidParameterValue(column.column_name_, "offsets", "non-decreasing offsets");
+            }
+        }
+        return Status::OK();
+    }
+    if (column.data_.size() != source_type.Size() * row_count) {
+        String recommend_value = fmt::format("{} bytes of {} for {} rows", source_type.Size() * row_count, source_type.ToString(), row_count);
+        return Status::InvalidParameterValue(column.column_name_, fmt::format("{} bytes", column.data_.size()), recommend_value);
+    }
+    return Status::OK();
+}
+
+void AppendInsertColumn(ColumnVector &column_vector, const InsertColumnData &column, SizeT row_begin, SizeT row_end) {
+    if (column_vector.data_type()->type() == LogicalType::kVarchar) {
+        for (SizeT row_idx = row_begin; row_idx < row_end; ++row_idx) {
+            column_vector.AppendVarchar(column.data_.subspan(column.offsets_[row_idx], column.offsets_[row_idx + 1] - column.offsets_[row_idx]));
+        }
+        return;
+    }
+    SizeT width = column_vector.data_type()->Size();
+    for (SizeT row_idx = row_begin; row_idx < row_end; ++row_idx) {
+        column_vector.AppendByPtr(reinterpret_cast<const_ptr_t>(column.data_.data() + row_idx * width));
+    }
+}
+
+} // namespace
+
+QueryResult
+Infinity::InsertColumns(const String &db_name, const String &table_name, const Vector<InsertColumnData> &columns, SizeT row_count) {
+    UniquePtr<QueryContext> query_context_ptr;
+    GET_QUERY_CONTEXT(GetQueryContext(), query_context_ptr);
+    QueryResult query_result;
+    if (InfinityContext::instance().storage()->GetStorageMode() != StorageMode::kWritable) {
+        query_result.status_ = Status::InvalidNodeRole("Attempt to write on non-writable node");
+        return query_result;
+    }
+    String lower_db_name = db_name;
+    ToLower(lower_db_name);
+    String lower_table_name = table_name;
+    ToLower(lower_table_name);
+
+    query_context_ptr->BeginTxn(nullptr);
+    Txn *txn = query_context_ptr->GetTxn();
+    try {
+        auto [table_entry, status] = txn->GetTableByName(lower_db_name, lower_table_name);
+        if (!status.ok()) {
+            RecoverableError(status);
+        }
+
+        // the given columns in table column order
+        HashMap<String, const InsertColumnData *> columns_by_name;
+        for (const auto &column : columns) {
+            String column_name = column.column_name_;
+            ToLower(column_name);
+            if (!columns_by_name.emplace(column_name, &column).second) {
+                RecoverableError(Status::DuplicateColumnName(column_name));
+            }
+        }
+        const auto &column_defs = table_entry->column_defs();
+        Vector<const InsertColumnData *> table_columns;
+        Vector<SharedPtr<DataType>> column_types;
+        // the buffers of other types than their column are read into a column vector of their own type and then cast
+        Vector<SharedPtr<DataType>> source_types;
+        Vector<BoundCastFunc> casts;
+        for (const auto &column_def : column_defs) {
+            column_types.push_back(column_def->type());
+            auto iter = columns_by_name.find(column_def->name());
+            if (iter == columns_by_name.end()) {
+                // filled with the default value, like a column missing from an imported file
+                if (!column_def->has_default_value()) {
+                    RecoverableError(Status::InvalidParameterValue("columns", column_def->name(), "a column with default value"));
+                }
+                table_columns.push_back(nullptr);
+                source_types.push_back(nullptr);
+                casts.emplace_back(nullptr);
+                continue;
+            }
+            const InsertColumnData &column = *iter->second;
+            SharedPtr<DataType> source_type = InsertColumnSourceType(column, *column_def->type());
+            if (source_type.get() == nullptr) {
+                RecoverableError(Status::DataTypeMismatch(column_def->type()->ToString(), InsertColumnElementTypeName(column.element_type_)));
+            }
+            status = CheckInsertColumn(column, *source_type, row_count);
+            if (!status.ok()) {
+                RecoverableError(status);
+            }
+            table_columns.push_back(&column);
+            if (*source_type == *column_def->type()) {
+                source_types.push_back(nullptr);
+                casts.emplace_back(nullptr);
+            } else {
+                casts.push_back(CastFunction::GetBoundFunc(*source_type, *column_def->type()));
+                source_types.push_back(std::move(source_type));
+            }
+            columns_by_name.erase(iter);
+        }
+        if (!columns_by_name.empty()) {
+            RecoverableError(Status::ColumnNotExist(columns_by_name.begin()->first));
+        }
+
+        for (SizeT row_begin = 0; row_begin < row_count; row_begin += DEFAULT_BLOCK_CAPACITY) {
+            SizeT row_end = std::min(row_count, row_begin + DEFAULT_BLOCK_CAPACITY);
+            SharedPtr<DataBlock> data_block = DataBlock::Make();
+            data_block->Init(column_types);
+            for (SizeT column_idx = 0; column_idx < table_columns.size(); ++column_idx) {
+                if (table_columns[column_idx] == nullptr) {
+                    auto default_value = column_defs[column_idx]->default_value();
+                    for (SizeT row_idx = row_begin; row_idx < row_end; ++row_idx) {
+                        data_block->column_vectors[column_idx]->AppendByConstantExpr(default_value.get());
+                    }
+                    continue;
+                }
+                if (source_types[column_idx].get() == nullptr) {
+                    AppendInsertColumn(*data_block->column_vectors[column_idx], *table_columns[column_idx], row_begin, row_end);
+                    continue;
+                }
+                auto source_column_vector = ColumnVector::Make(source_types[column_idx]);
+                source_column_vector->Initialize(ColumnVectorType::kFlat, row_end - row_begin);
+                AppendInsertColumn(*source_column_vector, *table_columns[column_idx], row_begin, row_end);
+                CastParameters cast_parameters;
+                if (!casts[column_idx].function(source_column_vector, data_block->column_vectors[column_idx], row_end - row_begin, cast_parameters)) {
+                    RecoverableError(Status::DataTypeMismatch(column_types[column_idx]->ToString(), source_types[column_idx]->ToString()));
+                }
+            }
+            data_block->Finalize();
+            status = txn->Append(lower_db_name, lower_table_name, data_block);
+            if (!status.ok()) {
+                RecoverableError(status);
+            }
+        }
+        query_context_ptr->CommitTxn();
+    } catch (RecoverableException &e) {
+        query_context_ptr->RollbackTxn();
+        query_result.status_.Init(e.ErrorCode(), e.what());
+        return query_result;
+    }
+
+    Vector<SharedPtr<ColumnDef>> column_defs;
+    SharedPtr<TableDef> result_table_def_ptr = TableDef::Make(MakeShared<String>("default_db"), MakeShared<String>("Tables"), nullptr, column_defs);
+    query_result.result_table_ = MakeShared<DataTable>(result_table_def_ptr, TableType::kDataTable);
+    query_result.result_table_->SetResultMsg(MakeUnique<String>(fmt::format("INSERTED {} Rows", row_count)));
+    return query_result;
+}
+
 QueryResult Infinity::Import(const String &db_name, const String &table_name, const String &path, ImportOptions import_options) {
 
     UniquePtr<QueryContext> query_context_ptr;
@@ -948,6 +1182,29 @@ QueryResult Infinity::Import(const String &db_name, const String &table_name, co
     return result;
 }
 
+QueryResult Infinity::ImportData(const String &db_name, const String &table_name, SharedPtr<Vector<String>> data, ImportOptions import_options) {
+
+    UniquePtr<QueryContext> query_context_ptr;
+    GET_QUERY_CONTEXT(GetQueryContext(), query_context_ptr);
+    UniquePtr<CopyStatement> import_statement = MakeUnique<CopyStatement>();
+
+    import_statement->copy_from_ = true;
+    import_statement->data_ = std::move(data);
+
+    import_statement->schema_name_ = db_name;
+    ToLower(import_statement->schema_name_);
+
+    import_statement->table_name_ = table_name;
+    ToLower(import_statement->table_name_);
+
+    import_statement->header_ = import_options.header_;
+    import_statement->copy_file_type_ = import_options.copy_file_type_;
+    import_statement->delimiter_ = import_options.delimiter_;
+
+    QueryResult result = query_context_ptr->QueryStatement(import_statement.get());
+    return result;
+}
+
 QueryResult
 Infinity::Export(const String &db_name, const String &table_name, Vector<ParsedExpr *> *columns, const String &path, ExportOptions export_options) {
     DeferFn free_column_expressions([&]() {
@@ -1137,7 +1394,8 @@ QueryResult Infinity::Search(const String &db_name,
                              Vector<OrderByExpr *> *order_by_list,
                              Vector<ParsedExpr *> *group_by_list,
                              ParsedExpr *having,
-                             bool total_hits_count_flag) {
+                             bool total_hits_count_flag,
+                             bool profile) {
     if (total_hits_count_flag) {
         if (limit == nullptr) {
             QueryResult query_result;
@@ -1189,6 +1447,10 @@ QueryResult Infinity::Search(const String &db_name,
     });
     UniquePtr<QueryContext> query_context_ptr;
     GET_QUERY_CONTEXT(GetQueryContext(), query_context_ptr);
+    if (profile) {
+        query_context_ptr->set_query_profile();
+        query_context_ptr->CreateQueryProfiler();
+    }
     UniquePtr<SelectStatement> select_statement = MakeUnique<SelectStatement>();
 
     auto *table_ref = new TableReference();
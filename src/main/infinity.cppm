@@ -36,9 +36,21 @@ import command_statement;
 import select_statement;
 import global_resource_usage;
 import query_context;
+import internal_types;
 
 namespace infinity {
 
+// One column of Infinity::InsertColumns. Fixed width values are packed back to back in data_, embeddings row by row.
+// element_type_ is the type of the packed values, numbers of another type than the column are cast to it. kElemBit stands
+// for booleans: one byte per value of a boolean column, bits packed little endian for a bit embedding. Varchar values are
+// concatenated bytes (kElemUInt8) in data_, offsets_ holds the row_count + 1 offsets of their boundaries.
+export struct InsertColumnData {
+    String column_name_;
+    EmbeddingDataType element_type_{EmbeddingDataType::kElemInvalid};
+    Span<const char> data_;
+    Span<const i64> offsets_;
+};
+
 export class Infinity {
 public:
     Infinity() = default;
@@ -163,8 +175,15 @@ public:
 
     QueryResult Insert(const String &db_name, const String &table_name, Vector<InsertRowExpr *> *insert_rows);
 
+    // Append row_count rows given as whole columns. A column of the table that isn't given is filled with its default value,
+    // it is an error if it has none. The data goes straight into data blocks, no expression is built or evaluated per cell.
+    QueryResult InsertColumns(const String &db_name, const String &table_name, const Vector<InsertColumnData> &columns, SizeT row_count);
+
     QueryResult Import(const String &db_name, const String &table_name, const String &path, ImportOptions import_options);
 
+    // Import arrow IPC streams held in memory, one after another in one transaction, through the same segment building as Import
+    QueryResult ImportData(const String &db_name, const String &table_name, SharedPtr<Vector<String>> data, ImportOptions import_options);
+
     QueryResult
     Export(const String &db_name, const String &table_name, Vector<ParsedExpr *> *columns, const String &path, ExportOptions export_options);
 
@@ -196,7 +215,8 @@ public:
                        Vector<OrderByExpr *> *order_by_list,
                        Vector<ParsedExpr *> *group_by_list,
                        ParsedExpr *having,
-                       bool total_hits_count_flag);
+                       bool total_hits_count_flag,
+                       bool profile = false);
 
     QueryResult Optimize(const String &db_name, const String &table_name, OptimizeOptions optimize_options = OptimizeOptions{});
 
@@ -84,6 +84,9 @@ GlobalOptions::GlobalOptions() {
 
     name2index_[String(RESULT_CACHE_OPTION_NAME)] = GlobalOptionIndex::kResultCache;
     name2index_[String(CACHE_RESULT_CAPACITY_OPTION_NAME)] = GlobalOptionIndex::kCacheResultCapacity;
+    name2index_[String(CACHE_RESULT_MEMORY_OPTION_NAME)] = GlobalOptionIndex::kCacheResultMemory;
+    name2index_[String(CACHE_RESULT_POLICY_OPTION_NAME)] = GlobalOptionIndex::kCacheResultPolicy;
+    name2index_[String(BUFFER_MANAGER_QUOTA_OPTION_NAME)] = GlobalOptionIndex::kBufferManagerQuota;
 
     name2index_[String(WAL_DIR_OPTION_NAME)] = GlobalOptionIndex::kWALDir;
     name2index_[String(WAL_COMPACT_THRESHOLD_OPTION_NAME)] = GlobalOptionIndex::kWALCompactThreshold;
@@ -172,7 +172,10 @@ export enum class GlobalOptionIndex : i8 {
     kSparseIndexBuildingWorker = 54,
     kFulltextIndexBuildingWorker = 55,
     kSnapshotDir = 56,
-    kInvalid = 57,
+    kCacheResultMemory = 57,
+    kCacheResultPolicy = 58,
+    kBufferManagerQuota = 59,
+    kInvalid = 60,
 };
 
 export struct GlobalOptions {
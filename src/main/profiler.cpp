@@ -374,6 +374,19 @@ nlohmann::json QueryProfiler::Serialize(const QueryProfiler *profiler) {
 
         json["fragments"].push_back(json_fragments);
     }
+
+    constexpr SizeT profilers_count = magic_enum::enum_integer(QueryPhase::kInvalid);
+    for (SizeT idx = 0; idx < profilers_count; ++idx) {
+        const BaseProfiler &phase_profiler = profiler->profilers_[idx];
+        if (phase_profiler.name().empty()) {
+            // the phase never started, e.g. rollback of a successful query
+            continue;
+        }
+        nlohmann::json json_phase;
+        json_phase["name"] = phase_profiler.name();
+        json_phase["elapsed"] = phase_profiler.Elapsed();
+        json["phases"].push_back(json_phase);
+    }
     json["total"] = end - start;
     json["time_unit"] = "ns";
 
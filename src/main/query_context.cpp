@@ -58,6 +58,7 @@ import admin_executor;
 import persistence_manager;
 import global_resource_usage;
 import infinity_context;
+import server_metrics;
 import txn_state;
 
 namespace infinity {
@@ -184,6 +185,7 @@ QueryResult QueryContext::QueryStatement(const BaseStatement *base_statement) {
     UniquePtr<Notifier> notifier{};
 
     query_id_ = session_ptr_->query_count();
+    auto begin_time = Clock::now();
     //    ProfilerStart("Query");
     //    BaseProfiler profiler;
     //    profiler.Begin();
@@ -270,6 +272,9 @@ QueryResult QueryContext::QueryStatement(const BaseStatement *base_statement) {
         StartProfile(QueryPhase::kCommit);
         this->CommitTxn();
         StopProfile(QueryPhase::kCommit);
+        if (query_profile_) {
+            query_result.query_profiler_ = query_profiler_;
+        }
 
     } catch (RecoverableException &e) {
 
@@ -293,6 +298,9 @@ QueryResult QueryContext::QueryStatement(const BaseStatement *base_statement) {
     }
 
     //    ProfilerStop();
+    ServerMetrics::instance().RecordStatement(base_statement->type_,
+                                              ChronoCast<NanoSeconds>(Clock::now() - begin_time).count(),
+                                              !query_result.status_.ok());
     session_ptr_->IncreaseQueryCount();
     session_manager_->IncreaseQueryCount();
 
@@ -323,7 +331,7 @@ void QueryContext::CreateQueryProfiler() {
         return;
     }
 
-    bool query_profiler_flag = InfinityContext::instance().storage()->catalog()->GetProfile();
+    bool query_profiler_flag = InfinityContext::instance().storage()->catalog()->GetProfile() or query_profile_;
 
     if (query_profiler_flag or explain_analyze_) {
         if (query_profiler_ == nullptr) {
@@ -333,6 +341,10 @@ void QueryContext::CreateQueryProfiler() {
 }
 
 void QueryContext::RecordQueryProfiler(const StatementType &type) {
+    if (query_profile_ and !InfinityContext::instance().storage()->catalog()->GetProfile()) {
+        // the profile goes back with the query result only, the profile history keeps what global profiling records
+        return;
+    }
     if (type != StatementType::kCommand && type != StatementType::kExplain && type != StatementType::kShow) {
         InfinityContext::instance().storage()->catalog()->AppendProfileRecord(query_profiler_);
     }
@@ -91,6 +91,10 @@ public:
     inline void set_explain_analyze() { explain_analyze_ = true; }
     [[nodiscard]] inline bool explain_analyze() const { return explain_analyze_; }
 
+    // Profiles this query alone and returns the profile with its result, global profiling may stay off
+    inline void set_query_profile() { query_profile_ = true; }
+    [[nodiscard]] inline bool query_profile() const { return query_profile_; }
+
     inline u64 GetNextNodeID() { return ++current_max_node_id_; }
 
     void BeginTxn(const BaseStatement *statement);
@@ -157,6 +161,7 @@ private:
 
     SharedPtr<QueryProfiler> query_profiler_{};
     bool explain_analyze_{};
+    bool query_profile_{};
 
     Config *global_config_{};
     TaskScheduler *scheduler_{};
@@ -19,6 +19,7 @@ import data_table;
 import status;
 import logical_node_type;
 import global_resource_usage;
+import profiler;
 
 namespace infinity {
 
@@ -63,6 +64,8 @@ public:
 
 export struct QueryResult : public BaseResult {
     LogicalNodeType root_operator_type_{LogicalNodeType::kInvalid};
+    // Only set when the query asked for its own profile, see QueryContext::set_query_profile
+    SharedPtr<QueryProfiler> query_profiler_{};
     String ToString() const;
 
     static QueryResult UnusedResult() { return {}; }
@@ -48,6 +48,9 @@ void VarUtil::InitVariablesMap() {
     global_name_map_[RESULT_CACHE_OPTION_NAME.data()] = GlobalVariable::kResultCache;
     global_name_map_[CACHE_RESULT_CAPACITY_OPTION_NAME.data()] = GlobalVariable::kCacheResultCapacity;
     global_name_map_[CACHE_RESULT_NUM_VAR_NAME.data()] = GlobalVariable::kCacheResultNum;
+    global_name_map_[CACHE_RESULT_MEMORY_OPTION_NAME.data()] = GlobalVariable::kCacheResultMemory;
+    global_name_map_[CACHE_RESULT_POLICY_OPTION_NAME.data()] = GlobalVariable::kCacheResultPolicy;
+    global_name_map_[CACHE_RESULT_STATS_VAR_NAME.data()] = GlobalVariable::kCacheResultStats;
     global_name_map_[MEMORY_CACHE_MISS_VAR_NAME.data()] = GlobalVariable::kMemoryCacheMiss;
     global_name_map_[DISK_CACHE_MISS_VAR_NAME.data()] = GlobalVariable::kDiskCacheMiss;
     global_name_map_[ENABLE_PROFILE_VAR_NAME.data()] = GlobalVariable::kEnableProfile;
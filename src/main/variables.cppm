@@ -49,6 +49,9 @@ export enum class GlobalVariable {
     kResultCache,             // global
     kCacheResultCapacity,     // global
     kCacheResultNum,          // global
+    kCacheResultMemory,       // global
+    kCacheResultPolicy,       // global
+    kCacheResultStats,        // global
     kMemoryCacheMiss,         // global
     kDiskCacheMiss,           // global
     kEnableProfile,           // global
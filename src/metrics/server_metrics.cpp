@@ -0,0 +1,192 @@
+// Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+module;
+
+#include <algorithm>
+
+module server_metrics;
+
+import stl;
+import third_party;
+import base_statement;
+
+namespace infinity {
+
+namespace {
+
+Atomic<SizeT> next_shard_index{0};
+
+constexpr Array<i64, kLatencyBuckets.size()> kLatencyBucketsNs = [] {
+    Array<i64, kLatencyBuckets.size()> bounds{};
+    for (SizeT i = 0; i < kLatencyBuckets.size(); ++i) {
+        bounds[i] = static_cast<i64>(kLatencyBuckets[i] * 1e9 + 0.5);
+    }
+    return bounds;
+}();
+
+const char *BackgroundTaskName(SizeT task) {
+    switch (static_cast<BackgroundTaskMetric>(task)) {
+        case BackgroundTaskMetric::kCheckpoint:
+            return "checkpoint";
+        case BackgroundTaskMetric::kCompact:
+            return "compact";
+        case BackgroundTaskMetric::kOptimize:
+            return "optimize";
+        case BackgroundTaskMetric::kDumpIndex:
+            return "dump_index";
+        case BackgroundTaskMetric::kCleanup:
+            return "cleanup";
+        case BackgroundTaskMetric::kInvalid:
+            break;
+    }
+    return "invalid";
+}
+
+void AppendHeader(String &output, const String &name, const char *type, const String &help) {
+    output += fmt::format("# HELP {} {}\n# TYPE {} {}\n", name, help, name, type);
+}
+
+void AppendHistogram(String &output, const String &name, const String &labels, const LatencyHistogram &histogram) {
+    Array<u64, kLatencyBuckets.size() + 1> bucket_counts{};
+    f64 sum_seconds = 0;
+    histogram.Collect(bucket_counts, sum_seconds);
+    String bucket_labels = labels.empty() ? "" : labels + ",";
+    String series_labels = labels.empty() ? "" : fmt::format("{{{}}}", labels);
+    u64 cumulative = 0;
+    for (SizeT i = 0; i < kLatencyBuckets.size(); ++i) {
+        cumulative += bucket_counts[i];
+        output += fmt::format("{}_bucket{{{}le=\"{}\"}} {}\n", name, bucket_labels, kLatencyBuckets[i], cumulative);
+    }
+    cumulative += bucket_counts.back();
+    output += fmt::format("{}_bucket{{{}le=\"+Inf\"}} {}\n", name, bucket_labels, cumulative);
+    output += fmt::format("{}_sum{} {}\n", name, series_labels, sum_seconds);
+    output += fmt::format("{}_count{} {}\n", name, series_labels, cumulative);
+}
+
+bool HistogramEmpty(const LatencyHistogram &histogram) {
+    Array<u64, kLatencyBuckets.size() + 1> bucket_counts{};
+    f64 sum_seconds = 0;
+    histogram.Collect(bucket_counts, sum_seconds);
+    return std::all_of(bucket_counts.begin(), bucket_counts.end(), [](u64 count) { return count == 0; });
+}
+
+} // namespace
+
+SizeT MetricShardIndex() {
+    thread_local SizeT shard_index = next_shard_index.fetch_add(1, std::memory_order_relaxed) % kMetricShardCount;
+    return shard_index;
+}
+
+u64 MetricCounter::Value() const {
+    u64 value = 0;
+    for (const auto &shard : shards_) {
+        value += shard.value_.load(std::memory_order_relaxed);
+    }
+    return value;
+}
+
+void LatencyHistogram::Observe(i64 nanoseconds) {
+    if (nanoseconds < 0) {
+        nanoseconds = 0;
+    }
+    // the first bucket whose bound is not below the observation, prometheus buckets are "less or equal"
+    SizeT bucket = std::lower_bound(kLatencyBucketsNs.begin(), kLatencyBucketsNs.end(), nanoseconds) - kLatencyBucketsNs.begin();
+    Shard &shard = shards_[MetricShardIndex()];
+    shard.bucket_counts_[bucket].fetch_add(1, std::memory_order_relaxed);
+    shard.sum_ns_.fetch_add(nanoseconds, std::memory_order_relaxed);
+}
+
+void LatencyHistogram::Collect(Array<u64, kLatencyBuckets.size() + 1> &bucket_counts, f64 &sum_seconds) const {
+    bucket_counts.fill(0);
+    u64 sum_ns = 0;
+    for (const auto &shard : shards_) {
+        for (SizeT i = 0; i < bucket_counts.size(); ++i) {
+            bucket_counts[i] += shard.bucket_counts_[i].load(std::memory_order_relaxed);
+        }
+        sum_ns += shard.sum_ns_.load(std::memory_order_relaxed);
+    }
+    sum_seconds = sum_ns / 1e9;
+}
+
+void ServerMetrics::RecordStatement(StatementType statement_type, i64 nanoseconds, bool failed) {
+    SizeT idx = static_cast<SizeT>(statement_type);
+    if (idx >= kStatementTypeCount) {
+        return;
+    }
+    statement_latencies_[idx].Observe(nanoseconds);
+    if (failed) {
+        statement_errors_[idx].Add();
+    }
+}
+
+void ServerMetrics::AppendPrometheus(String &output) const {
+    // rate(infinity_statement_duration_seconds_count[1m]) is the QPS of each statement type
+    String name = "infinity_statement_duration_seconds";
+    AppendHeader(output, name, "histogram", "Latency of statements by type, from planning to commit.");
+    Vector<Pair<String, SizeT>> statement_types;
+    for (SizeT idx = static_cast<SizeT>(StatementType::kInvalidStmt) + 1; idx < kStatementTypeCount; ++idx) {
+        if (HistogramEmpty(statement_latencies_[idx])) {
+            continue;
+        }
+        String operation = StatementType2Str(static_cast<StatementType>(idx));
+        ToLower(operation);
+        AppendHistogram(output, name, fmt::format("operation=\"{}\"", operation), statement_latencies_[idx]);
+        statement_types.emplace_back(std::move(operation), idx);
+    }
+
+    name = "infinity_statement_errors_total";
+    AppendHeader(output, name, "counter", "Statements that failed, by type.");
+    for (const auto &[operation, idx] : statement_types) {
+        output += fmt::format("{}{{operation=\"{}\"}} {}\n", name, operation, statement_errors_[idx].Value());
+    }
+
+    name = "infinity_background_task_duration_seconds";
+    AppendHeader(output, name, "histogram", "Duration of background checkpoint, compaction, optimize, index dump and cleanup tasks.");
+    for (SizeT task = 0; task < kBackgroundTaskCount; ++task) {
+        AppendHistogram(output, name, fmt::format("task=\"{}\"", BackgroundTaskName(task)), background_task_latencies_[task]);
+    }
+
+    name = "infinity_wal_flush_duration_seconds";
+    AppendHeader(output, name, "histogram", "Latency of writing and flushing a batch of WAL entries.");
+    AppendHistogram(output, name, "", wal_flush_latency_);
+
+    AppendPrometheusCounter(output, "infinity_wal_flush_bytes_total", "Bytes of WAL entries flushed.", wal_flush_bytes_.Value());
+}
+
+void AppendPrometheusCounter(String &output, const String &name, const String &help, u64 value) {
+    AppendHeader(output, name, "counter", help);
+    output += fmt::format("{} {}\n", name, value);
+}
+
+void AppendPrometheusGauge(String &output, const String &name, const String &help, f64 value) {
+    AppendHeader(output, name, "gauge", help);
+    output += fmt::format("{} {}\n", name, value);
+}
+
+void AppendPrometheusCounters(String &output, const String &name, const String &help, const String &label, const Vector<Pair<String, u64>> &values) {
+    AppendHeader(output, name, "counter", help);
+    for (const auto &[label_value, value] : values) {
+        output += fmt::format("{}{{{}=\"{}\"}} {}\n", name, label, label_value, value);
+    }
+}
+
+void AppendPrometheusGauges(String &output, const String &name, const String &help, const String &label, const Vector<Pair<String, f64>> &values) {
+    AppendHeader(output, name, "gauge", help);
+    for (const auto &[label_value, value] : values) {
+        output += fmt::format("{}{{{}=\"{}\"}} {}\n", name, label, label_value, value);
+    }
+}
+
+} // namespace infinity
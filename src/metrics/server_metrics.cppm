@@ -0,0 +1,120 @@
+// Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+module;
+
+export module server_metrics;
+
+import stl;
+import singleton;
+import base_statement;
+
+namespace infinity {
+
+// Counters and histograms are split into shards, each thread updates the shard picked by its thread index,
+// so threads recording the same metric rarely share a cache line. Scraping sums the shards.
+export constexpr SizeT kMetricShardCount = 16;
+
+// Upper bounds of the latency buckets in seconds, the last bucket is +Inf
+export constexpr Array<f64, 17> kLatencyBuckets = {0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                                                   0.05,    0.1,    0.25,    0.5,    1.0,   2.5,    5.0,   10.0};
+
+SizeT MetricShardIndex();
+
+export class MetricCounter {
+public:
+    inline void Add(u64 value = 1) { shards_[MetricShardIndex()].value_.fetch_add(value, std::memory_order_relaxed); }
+
+    u64 Value() const;
+
+private:
+    struct alignas(64) Shard {
+        Atomic<u64> value_{0};
+    };
+    Array<Shard, kMetricShardCount> shards_{};
+};
+
+export class LatencyHistogram {
+public:
+    void Observe(i64 nanoseconds);
+
+    // Bucket counts are not cumulative, bucket_counts.back() counts the observations above the last bound.
+    void Collect(Array<u64, kLatencyBuckets.size() + 1> &bucket_counts, f64 &sum_seconds) const;
+
+private:
+    struct alignas(64) Shard {
+        Array<Atomic<u64>, kLatencyBuckets.size() + 1> bucket_counts_{};
+        Atomic<u64> sum_ns_{0};
+    };
+    Array<Shard, kMetricShardCount> shards_{};
+};
+
+// Observes the time from construction to destruction.
+export class ScopedLatency {
+public:
+    explicit ScopedLatency(LatencyHistogram &histogram) : histogram_(histogram), begin_(Clock::now()) {}
+
+    ~ScopedLatency() { histogram_.Observe(ChronoCast<NanoSeconds>(Clock::now() - begin_).count()); }
+
+private:
+    LatencyHistogram &histogram_;
+    TimePoint<Clock> begin_;
+};
+
+export enum class BackgroundTaskMetric : u8 {
+    kCheckpoint,
+    kCompact,
+    kOptimize,
+    kDumpIndex,
+    kCleanup,
+    kInvalid,
+};
+
+export class ServerMetrics : public Singleton<ServerMetrics> {
+public:
+    void RecordStatement(StatementType statement_type, i64 nanoseconds, bool failed);
+
+    LatencyHistogram &BackgroundTask(BackgroundTaskMetric task) { return background_task_latencies_[static_cast<SizeT>(task)]; }
+
+    LatencyHistogram &WalFlush() { return wal_flush_latency_; }
+
+    MetricCounter &WalFlushBytes() { return wal_flush_bytes_; }
+
+    // Appends every metric recorded here in the prometheus text exposition format.
+    void AppendPrometheus(String &output) const;
+
+private:
+    static constexpr SizeT kStatementTypeCount = static_cast<SizeT>(StatementType::kCompact) + 1;
+    static constexpr SizeT kBackgroundTaskCount = static_cast<SizeT>(BackgroundTaskMetric::kInvalid);
+
+    Array<LatencyHistogram, kStatementTypeCount> statement_latencies_{};
+    Array<MetricCounter, kStatementTypeCount> statement_errors_{};
+    Array<LatencyHistogram, kBackgroundTaskCount> background_task_latencies_{};
+    LatencyHistogram wal_flush_latency_{};
+    MetricCounter wal_flush_bytes_{};
+};
+
+// Helpers to render metrics kept elsewhere, e.g. the buffer manager counters, next to the ones above.
+export void AppendPrometheusCounter(String &output, const String &name, const String &help, u64 value);
+
+export void AppendPrometheusGauge(String &output, const String &name, const String &help, f64 value);
+
+// One sample for each label value, e.g. the counters of each buffer pool.
+export void
+AppendPrometheusCounters(String &output, const String &name, const String &help, const String &label, const Vector<Pair<String, u64>> &values);
+
+export void
+AppendPrometheusGauges(String &output, const String &name, const String &help, const String &label, const Vector<Pair<String, f64>> &values);
+
+} // namespace infinity
@@ -37,6 +37,7 @@ import expr_parser;
 import expression_parser_result;
 import statement_common;
 import query_result;
+import profiler;
 import data_block;
 import value;
 import physical_import;
@@ -44,9 +45,107 @@ import explain_statement;
 import internal_types;
 import select_statement;
 import logical_type;
+import data_table;
+import embedding_info;
 
 namespace infinity {
 
+namespace {
+
+template <typename T>
+nlohmann::json EmbeddingToJson(const Span<char> &data, SizeT dimension) {
+    const auto *elements = reinterpret_cast<const T *>(data.data());
+    return nlohmann::json(Vector<T>(elements, elements + dimension));
+}
+
+// Typed cell of the columnar result: numbers, booleans and number embeddings keep their type, the rest is sent as text
+nlohmann::json ColumnarValueToJson(const Value &value) {
+    const DataType &data_type = value.type();
+    switch (data_type.type()) {
+        case LogicalType::kBoolean: {
+            return value.GetValue<BooleanT>();
+        }
+        case LogicalType::kTinyInt:
+        case LogicalType::kSmallInt:
+        case LogicalType::kInteger:
+        case LogicalType::kBigInt: {
+            return value.ToInteger();
+        }
+        case LogicalType::kFloat: {
+            return value.ToFloat();
+        }
+        case LogicalType::kDouble: {
+            return value.ToDouble();
+        }
+        case LogicalType::kEmbedding: {
+            const auto *embedding_info = static_cast<const EmbeddingInfo *>(data_type.type_info().get());
+            const SizeT dimension = embedding_info->Dimension();
+            switch (embedding_info->Type()) {
+                case EmbeddingDataType::kElemInt8: {
+                    return EmbeddingToJson<i8>(value.GetEmbedding(), dimension);
+                }
+                case EmbeddingDataType::kElemUInt8: {
+                    return EmbeddingToJson<u8>(value.GetEmbedding(), dimension);
+                }
+                case EmbeddingDataType::kElemInt16: {
+                    return EmbeddingToJson<i16>(value.GetEmbedding(), dimension);
+                }
+                case EmbeddingDataType::kElemInt32: {
+                    return EmbeddingToJson<i32>(value.GetEmbedding(), dimension);
+                }
+                case EmbeddingDataType::kElemInt64: {
+                    return EmbeddingToJson<i64>(value.GetEmbedding(), dimension);
+                }
+                case EmbeddingDataType::kElemFloat: {
+                    return EmbeddingToJson<f32>(value.GetEmbedding(), dimension);
+                }
+                case EmbeddingDataType::kElemDouble: {
+                    return EmbeddingToJson<f64>(value.GetEmbedding(), dimension);
+                }
+                default: {
+                    break;
+                }
+            }
+            break;
+        }
+        default: {
+            break;
+        }
+    }
+    return value.ToString();
+}
+
+// "columns" holds the name and type of every output column, "column_data" one array of cells per column
+void ColumnarOutput(DataTable &result_table, nlohmann::json &response) {
+    const SizeT column_cnt = result_table.ColumnCount();
+    nlohmann::json columns = nlohmann::json::array();
+    nlohmann::json column_data = nlohmann::json::array();
+    for (SizeT col = 0; col < column_cnt; ++col) {
+        nlohmann::json column;
+        column["name"] = result_table.GetColumnNameById(col);
+        column["type"] = result_table.GetColumnTypeById(col)->ToString();
+        columns.push_back(std::move(column));
+        column_data.push_back(nlohmann::json::array());
+    }
+
+    const SizeT block_count = result_table.DataBlockCount();
+    for (SizeT block_id = 0; block_id < block_count; ++block_id) {
+        DataBlock *data_block = result_table.GetDataBlockById(block_id).get();
+        const auto row_count = data_block->row_count();
+        for (SizeT col = 0; col < column_cnt; ++col) {
+            nlohmann::json &cells = column_data[col];
+            for (SizeT row = 0; row < row_count; ++row) {
+                cells.push_back(ColumnarValueToJson(data_block->GetValue(col, row)));
+            }
+        }
+    }
+
+    response["columns"] = std::move(columns);
+    response["column_data"] = std::move(column_data);
+}
+
+} // namespace
+
 void HTTPSearch::Process(Infinity *infinity_ptr,
                          const String &db_name,
                          const String &table_name,
@@ -64,12 +163,14 @@ void HTTPSearch::Process(Infinity *infinity_ptr,
         UniquePtr<ParsedExpr> limit{};
         UniquePtr<ParsedExpr> offset{};
         UniquePtr<SearchExpr> search_expr{};
+        bool columnar_result = false;
         Vector<ParsedExpr *> *output_columns{nullptr};
         Vector<ParsedExpr *> *highlight_columns{nullptr};
         Vector<OrderByExpr *> *order_by_list{nullptr};
         Vector<ParsedExpr *> *group_by_columns{nullptr};
         UniquePtr<ParsedExpr> having{};
         bool total_hits_count_flag{};
+        bool profile{};
         DeferFn defer_fn([&]() {
             if (output_columns != nullptr) {
                 for (auto &expr : *output_columns) {
@@ -246,6 +347,26 @@ void HTTPSearch::Process(Infinity *infinity_ptr,
                             response["error_message"] = "Invalid total hits count type";
                             return;
                         }
+                    } else if (key == "profile") {
+                        if (!option.value().is_boolean()) {
+                            response["error_code"] = ErrorCode::kInvalidExpression;
+                            response["error_message"] = "Invalid profile type";
+                            return;
+                        }
+                        profile = option.value();
+                    } else if (key == "result_format") {
+                        // "rows": an array of {column name: cell} per row, "columnar": one typed array per column
+                        String value = option.value().is_string() ? option.value().get<String>() : String();
+                        ToLower(value);
+                        if (value == "rows") {
+                            columnar_result = false;
+                        } else if (value == "columnar") {
+                            columnar_result = true;
+                        } else {
+                            response["error_code"] = ErrorCode::kInvalidExpression;
+                            response["error_message"] = fmt::format("Unknown result format: {}", option.value().dump());
+                            return;
+                        }
                     }
                 }
             } else {
@@ -266,13 +387,26 @@ void HTTPSearch::Process(Infinity *infinity_ptr,
                                                         order_by_list,
                                                         group_by_columns,
                                                         having.release(),
-                                                        total_hits_count_flag);
+                                                        total_hits_count_flag,
+                                                        profile);
 
         output_columns = nullptr;
         highlight_columns = nullptr;
         order_by_list = nullptr;
         group_by_columns = nullptr;
-        if (result.IsOk()) {
+        if (result.IsOk() && columnar_result) {
+            ColumnarOutput(*result.result_table_, response);
+
+            if (result.result_table_->total_hits_count_flag_) {
+                response["total_hits_count"] = result.result_table_->total_hits_count_;
+            }
+            if (result.query_profiler_ != nullptr) {
+                response["profile"] = QueryProfiler::Serialize(result.query_profiler_.get());
+            }
+
+            response["error_code"] = 0;
+            http_status = HTTPStatus::CODE_200;
+        } else if (result.IsOk()) {
             SizeT block_rows = result.result_table_->DataBlockCount();
             for (SizeT block_id = 0; block_id < block_rows; ++block_id) {
                 DataBlock *data_block = result.result_table_->GetDataBlockById(block_id).get();
@@ -315,6 +449,9 @@ void HTTPSearch::Process(Infinity *infinity_ptr,
             if (result.result_table_->total_hits_count_flag_) {
                 response["total_hits_count"] = result.result_table_->total_hits_count_;
             }
+            if (result.query_profiler_ != nullptr) {
+                response["profile"] = QueryProfiler::Serialize(result.query_profiler_.get());
+            }
 
             response["error_code"] = 0;
             http_status = HTTPStatus::CODE_200;
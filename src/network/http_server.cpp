@@ -62,6 +62,13 @@ import status;
 import constant_expr;
 import command_statement;
 import physical_import;
+import server_metrics;
+import storage;
+import buffer_manager;
+import file_worker_type;
+import virtual_store;
+import system_info;
+import result_cache_manager;
 
 namespace {
 
@@ -664,6 +671,10 @@ public:
                 export_options.copy_file_type_ = CopyFileType::kJSONL;
             } else if (file_type_str == "fvecs") {
                 export_options.copy_file_type_ = CopyFileType::kFVECS;
+            } else if (file_type_str == "parquet") {
+                export_options.copy_file_type_ = CopyFileType::kPARQUET;
+            } else if (file_type_str == "arrow" || file_type_str == "feather") {
+                export_options.copy_file_type_ = CopyFileType::kARROW;
             } else {
                 json_response["error_code"] = ErrorCode::kNotSupported;
                 json_response["error_message"] = fmt::format("Not supported file type {}", file_type_str);
@@ -826,6 +837,10 @@ public:
                 import_options.copy_file_type_ = CopyFileType::kJSONL;
             } else if (file_type_str == "fvecs") {
                 import_options.copy_file_type_ = CopyFileType::kFVECS;
+            } else if (file_type_str == "parquet") {
+                import_options.copy_file_type_ = CopyFileType::kPARQUET;
+            } else if (file_type_str == "arrow" || file_type_str == "feather") {
+                import_options.copy_file_type_ = CopyFileType::kARROW;
             } else {
                 json_response["error_code"] = ErrorCode::kNotSupported;
                 json_response["error_message"] = fmt::format("Not supported file type {}", file_type_str);
@@ -879,7 +894,25 @@ public:
 
         String data_body = request->readBodyToString();
         try {
-            nlohmann::json http_body_json = nlohmann::json::parse(data_body);
+            nlohmann::json http_body_json;
+            const auto content_type = request->getHeader("Content-Type");
+            if (content_type != nullptr && content_type->find("application/x-ndjson") != String::npos) {
+                // NDJSON: one row object per line, how clients streaming their rows send each chunk
+                http_body_json = nlohmann::json::array();
+                for (SizeT line_start = 0; line_start < data_body.size();) {
+                    SizeT line_end = data_body.find('\n', line_start);
+                    if (line_end == String::npos) {
+                        line_end = data_body.size();
+                    }
+                    std::string_view line(data_body.data() + line_start, line_end - line_start);
+                    if (line.find_first_not_of(" \t\r") != std::string_view::npos) {
+                        http_body_json.push_back(nlohmann::json::parse(line));
+                    }
+                    line_start = line_end + 1;
+                }
+            } else {
+                http_body_json = nlohmann::json::parse(data_body);
+            }
 
             const SizeT row_count = http_body_json.size();
             if (!(http_body_json.is_array() && row_count > 0)) {
@@ -1284,6 +1317,7 @@ public:
             insert_rows = nullptr;
             if (result.IsOk()) {
                 json_response["error_code"] = 0;
+                json_response["inserted_rows"] = row_count;
                 http_status = HTTPStatus::CODE_200;
             } else {
                 json_response["error_code"] = result.ErrorCode();
@@ -2760,6 +2794,19 @@ public:
                     json_response["buffer"].push_back(json_table);
                 }
             }
+            BufferManager *buffer_manager = InfinityContext::instance().storage()->buffer_manager();
+            for (const auto &pool_info : buffer_manager->GetBufferPoolsInfo()) {
+                nlohmann::json json_pool;
+                json_pool["file_type"] = String(kBufferPoolNames[static_cast<SizeT>(pool_info.file_type_)]);
+                json_pool["memory_usage"] = pool_info.memory_usage_;
+                json_pool["quota"] = pool_info.quota_;
+                json_pool["requests"] = pool_info.request_count_;
+                json_pool["misses"] = pool_info.cache_miss_count_;
+                json_pool["evictions"] = pool_info.evict_count_;
+                u64 request_count = pool_info.request_count_;
+                json_pool["hit_ratio"] = request_count == 0 ? 0.0 : 1.0 - static_cast<f64>(pool_info.cache_miss_count_) / request_count;
+                json_response["pools"].push_back(json_pool);
+            }
             json_response["error_code"] = 0;
             http_status = HTTPStatus::CODE_200;
         } else {
@@ -3338,6 +3385,103 @@ public:
     }
 };
 
+class MetricsHandler final : public HttpRequestHandler {
+public:
+    SharedPtr<OutgoingResponse> handle(const SharedPtr<IncomingRequest> &request) final {
+        // Read straight from the counters, scraping runs no query and takes no lock the workers take
+        String output;
+        ServerMetrics::instance().AppendPrometheus(output);
+
+        Storage *storage = InfinityContext::instance().storage();
+        BufferManager *buffer_manager = storage == nullptr ? nullptr : storage->buffer_manager();
+        if (buffer_manager != nullptr) {
+            AppendPrometheusCounter(output, "infinity_buffer_requests_total", "Buffer object loads.", buffer_manager->TotalRequestCount());
+            AppendPrometheusCounter(output,
+                                    "infinity_buffer_misses_total",
+                                    "Buffer object loads that had to read the file.",
+                                    buffer_manager->CacheMissCount());
+            AppendPrometheusCounter(output,
+                                    "infinity_buffer_evictions_total",
+                                    "Buffer objects freed to make room for others.",
+                                    buffer_manager->EvictCount());
+            AppendPrometheusGauge(output, "infinity_buffer_memory_usage_bytes", "Memory held by loaded buffers.", buffer_manager->memory_usage());
+            AppendPrometheusGauge(output, "infinity_buffer_memory_limit_bytes", "Buffer manager memory limit.", buffer_manager->memory_limit());
+
+            Vector<Pair<String, u64>> pool_requests, pool_misses, pool_evictions;
+            Vector<Pair<String, f64>> pool_memory_usages, pool_quotas;
+            for (const auto &pool_info : buffer_manager->GetBufferPoolsInfo()) {
+                String pool_name(kBufferPoolNames[static_cast<SizeT>(pool_info.file_type_)]);
+                pool_requests.emplace_back(pool_name, pool_info.request_count_);
+                pool_misses.emplace_back(pool_name, pool_info.cache_miss_count_);
+                pool_evictions.emplace_back(pool_name, pool_info.evict_count_);
+                pool_memory_usages.emplace_back(pool_name, pool_info.memory_usage_);
+                if (pool_info.quota_ != 0) {
+                    pool_quotas.emplace_back(pool_name, pool_info.quota_);
+                }
+            }
+            AppendPrometheusCounters(output, "infinity_buffer_pool_requests_total", "Buffer object loads, by file type.", "pool", pool_requests);
+            AppendPrometheusCounters(output,
+                                     "infinity_buffer_pool_misses_total",
+                                     "Buffer object loads that had to read the file, by file type.",
+                                     "pool",
+                                     pool_misses);
+            AppendPrometheusCounters(output,
+                                     "infinity_buffer_pool_evictions_total",
+                                     "Buffer objects freed to make room for others, by file type.",
+                                     "pool",
+                                     pool_evictions);
+            AppendPrometheusGauges(output,
+                                   "infinity_buffer_pool_memory_usage_bytes",
+                                   "Memory held by loaded buffers, by file type.",
+                                   "pool",
+                                   pool_memory_usages);
+            AppendPrometheusGauges(output,
+                                   "infinity_buffer_pool_quota_bytes",
+                                   "Memory quota of the file type, set by buffer_manager_quota.",
+                                   "pool",
+                                   pool_quotas);
+        }
+        ResultCacheManager *cache_mgr = storage == nullptr ? nullptr : storage->GetResultCacheManagerPtr();
+        if (cache_mgr != nullptr) {
+            ResultCacheStats stats = cache_mgr->Stats();
+            AppendPrometheusCounter(output, "infinity_result_cache_hits_total", "Queries answered from the result cache.", stats.hits_);
+            AppendPrometheusCounter(output, "infinity_result_cache_misses_total", "Result cache lookups that found nothing.", stats.misses_);
+            AppendPrometheusCounter(output,
+                                    "infinity_result_cache_evictions_total",
+                                    "Results evicted to stay in the result cache budget.",
+                                    stats.evictions_);
+            AppendPrometheusCounter(output,
+                                    "infinity_result_cache_invalidations_total",
+                                    "Results dropped because their table changed.",
+                                    stats.invalidations_);
+            AppendPrometheusCounter(output,
+                                    "infinity_result_cache_rejections_total",
+                                    "Results not cached, too large or not admitted.",
+                                    stats.rejections_);
+            AppendPrometheusGauge(output, "infinity_result_cache_entries", "Results in the result cache.", stats.cache_num_used_);
+            AppendPrometheusGauge(output, "infinity_result_cache_memory_usage_bytes", "Memory held by cached results.", stats.memory_used_);
+            AppendPrometheusGauge(output,
+                                  "infinity_result_cache_memory_limit_bytes",
+                                  "Result cache memory limit.",
+                                  cache_mgr->cache_memory_capacity());
+        }
+        AppendPrometheusCounter(output,
+                                "infinity_persistence_requests_total",
+                                "Reads of persisted objects.",
+                                VirtualStore::TotalRequestCount());
+        AppendPrometheusCounter(output,
+                                "infinity_persistence_misses_total",
+                                "Reads of persisted objects not in the local cache.",
+                                VirtualStore::CacheMissCount());
+        AppendPrometheusGauge(output, "infinity_process_resident_memory_bytes", "Resident memory of the server.", SystemInfo::MemoryUsage());
+        AppendPrometheusGauge(output, "infinity_process_open_fds", "Open files of the server.", SystemInfo::OpenFileCount());
+
+        auto response = ResponseFactory::createResponse(HTTPStatus::CODE_200, output);
+        response->putHeader("Content-Type", "text/plain; version=0.0.4; charset=utf-8");
+        return response;
+    }
+};
+
 class ForceGlobalCheckpointHandler final : public HttpRequestHandler {
 public:
     SharedPtr<OutgoingResponse> handle(const SharedPtr<IncomingRequest> &request) final {
@@ -3905,6 +4049,7 @@ Thread HTTPServer::Start(const String &ip_address, u16 port) {
     router->route("GET", "/instance/memory/objects", MakeShared<ShowMemoryObjectsHandler>());
     router->route("GET", "/instance/memory/allocations", MakeShared<ShowMemoryAllocationsHandler>());
     router->route("POST", "/instance/flush", MakeShared<ForceGlobalCheckpointHandler>());
+    router->route("GET", "/metrics", MakeShared<MetricsHandler>());
     router->route("POST", "/instance/table/compact", MakeShared<CompactTableHandler>());
 
     // variable
@@ -326,7 +326,9 @@ int _kCopyFileTypeValues[] = {
   CopyFileType::JSONL,
   CopyFileType::FVECS,
   CopyFileType::CSR,
-  CopyFileType::BVECS
+  CopyFileType::BVECS,
+  CopyFileType::PARQUET,
+  CopyFileType::ARROW
 };
 const char* _kCopyFileTypeNames[] = {
   "CSV",
@@ -334,9 +336,11 @@ const char* _kCopyFileTypeNames[] = {
   "JSONL",
   "FVECS",
   "CSR",
-  "BVECS"
+  "BVECS",
+  "PARQUET",
+  "ARROW"
 };
-const std::map<int, const char*> _CopyFileType_VALUES_TO_NAMES(::apache::thrift::TEnumIterator(6, _kCopyFileTypeValues, _kCopyFileTypeNames), ::apache::thrift::TEnumIterator(-1, nullptr, nullptr));
+const std::map<int, const char*> _CopyFileType_VALUES_TO_NAMES(::apache::thrift::TEnumIterator(8, _kCopyFileTypeValues, _kCopyFileTypeNames), ::apache::thrift::TEnumIterator(-1, nullptr, nullptr));
 
 std::ostream& operator<<(std::ostream& out, const CopyFileType::type& val) {
   std::map<int, const char*>::const_iterator it = _CopyFileType_VALUES_TO_NAMES.find(val);
@@ -2405,6 +2409,11 @@ void EmbeddingData::__set_bf16_array_value(const std::vector<double> & val) {
   this->bf16_array_value = val;
 __isset.bf16_array_value = true;
 }
+
+void EmbeddingData::__set_raw_data(const std::string& val) {
+  this->raw_data = val;
+__isset.raw_data = true;
+}
 std::ostream& operator<<(std::ostream& out, const EmbeddingData& obj)
 {
   obj.printTo(out);
@@ -2633,6 +2642,14 @@ uint32_t EmbeddingData::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 11:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->raw_data);
+          this->__isset.raw_data = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -2780,6 +2797,11 @@ uint32_t EmbeddingData::write(::apache::thrift::protocol::TProtocol* oprot) cons
     }
     xfer += oprot->writeFieldEnd();
   }
+  if (this->__isset.raw_data) {
+    xfer += oprot->writeFieldBegin("raw_data", ::apache::thrift::protocol::T_STRING, 11);
+    xfer += oprot->writeBinary(this->raw_data);
+    xfer += oprot->writeFieldEnd();
+  }
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -2797,6 +2819,7 @@ void swap(EmbeddingData &a, EmbeddingData &b) {
   swap(a.f64_array_value, b.f64_array_value);
   swap(a.f16_array_value, b.f16_array_value);
   swap(a.bf16_array_value, b.bf16_array_value);
+  swap(a.raw_data, b.raw_data);
   swap(a.__isset, b.__isset);
 }
 
@@ -2811,6 +2834,7 @@ EmbeddingData::EmbeddingData(const EmbeddingData& other104) {
   f64_array_value = other104.f64_array_value;
   f16_array_value = other104.f16_array_value;
   bf16_array_value = other104.bf16_array_value;
+  raw_data = other104.raw_data;
   __isset = other104.__isset;
 }
 EmbeddingData& EmbeddingData::operator=(const EmbeddingData& other105) {
@@ -2824,6 +2848,7 @@ EmbeddingData& EmbeddingData::operator=(const EmbeddingData& other105) {
   f64_array_value = other105.f64_array_value;
   f16_array_value = other105.f16_array_value;
   bf16_array_value = other105.bf16_array_value;
+  raw_data = other105.raw_data;
   __isset = other105.__isset;
   return *this;
 }
@@ -2840,6 +2865,7 @@ void EmbeddingData::printTo(std::ostream& out) const {
   out << ", " << "f64_array_value="; (__isset.f64_array_value ? (out << to_string(f64_array_value)) : (out << "<null>"));
   out << ", " << "f16_array_value="; (__isset.f16_array_value ? (out << to_string(f16_array_value)) : (out << "<null>"));
   out << ", " << "bf16_array_value="; (__isset.bf16_array_value ? (out << to_string(bf16_array_value)) : (out << "<null>"));
+  out << ", " << "raw_data="; (__isset.raw_data ? (out << to_string(raw_data)) : (out << "<null>"));
   out << ")";
 }
 
@@ -10562,6 +10588,14 @@ void InsertRequest::__set_fields(const std::vector<Field> & val) {
 void InsertRequest::__set_session_id(const int64_t val) {
   this->session_id = val;
 }
+
+void InsertRequest::__set_column_defs(const std::vector<ColumnDef> & val) {
+  this->column_defs = val;
+}
+
+void InsertRequest::__set_column_fields(const std::vector<ColumnField> & val) {
+  this->column_fields = val;
+}
 std::ostream& operator<<(std::ostream& out, const InsertRequest& obj)
 {
   obj.printTo(out);
@@ -10634,6 +10668,46 @@ uint32_t InsertRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->column_defs.clear();
+            uint32_t _size601;
+            ::apache::thrift::protocol::TType _etype604;
+            xfer += iprot->readListBegin(_etype604, _size601);
+            this->column_defs.resize(_size601);
+            uint32_t _i605;
+            for (_i605 = 0; _i605 < _size601; ++_i605)
+            {
+              xfer += this->column_defs[_i605].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.column_defs = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->column_fields.clear();
+            uint32_t _size607;
+            ::apache::thrift::protocol::TType _etype610;
+            xfer += iprot->readListBegin(_etype610, _size607);
+            this->column_fields.resize(_size607);
+            uint32_t _i611;
+            for (_i611 = 0; _i611 < _size607; ++_i611)
+            {
+              xfer += this->column_fields[_i611].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.column_fields = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -10675,6 +10749,30 @@ uint32_t InsertRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeI64(this->session_id);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("column_defs", ::apache::thrift::protocol::T_LIST, 5);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->column_defs.size()));
+    std::vector<ColumnDef> ::const_iterator _iter606;
+    for (_iter606 = this->column_defs.begin(); _iter606 != this->column_defs.end(); ++_iter606)
+    {
+      xfer += (*_iter606).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("column_fields", ::apache::thrift::protocol::T_LIST, 6);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->column_fields.size()));
+    std::vector<ColumnField> ::const_iterator _iter612;
+    for (_iter612 = this->column_fields.begin(); _iter612 != this->column_fields.end(); ++_iter612)
+    {
+      xfer += (*_iter612).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -10686,6 +10784,8 @@ void swap(InsertRequest &a, InsertRequest &b) {
   swap(a.table_name, b.table_name);
   swap(a.fields, b.fields);
   swap(a.session_id, b.session_id);
+  swap(a.column_defs, b.column_defs);
+  swap(a.column_fields, b.column_fields);
   swap(a.__isset, b.__isset);
 }
 
@@ -10694,6 +10794,8 @@ InsertRequest::InsertRequest(const InsertRequest& other405) {
   table_name = other405.table_name;
   fields = other405.fields;
   session_id = other405.session_id;
+  column_defs = other405.column_defs;
+  column_fields = other405.column_fields;
   __isset = other405.__isset;
 }
 InsertRequest& InsertRequest::operator=(const InsertRequest& other406) {
@@ -10701,6 +10803,8 @@ InsertRequest& InsertRequest::operator=(const InsertRequest& other406) {
   table_name = other406.table_name;
   fields = other406.fields;
   session_id = other406.session_id;
+  column_defs = other406.column_defs;
+  column_fields = other406.column_fields;
   __isset = other406.__isset;
   return *this;
 }
@@ -10711,6 +10815,8 @@ void InsertRequest::printTo(std::ostream& out) const {
   out << ", " << "table_name=" << to_string(table_name);
   out << ", " << "fields=" << to_string(fields);
   out << ", " << "session_id=" << to_string(session_id);
+  out << ", " << "column_defs=" << to_string(column_defs);
+  out << ", " << "column_fields=" << to_string(column_fields);
   out << ")";
 }
 
@@ -10738,6 +10844,26 @@ void ImportRequest::__set_import_option(const ImportOption& val) {
 void ImportRequest::__set_session_id(const int64_t val) {
   this->session_id = val;
 }
+
+void ImportRequest::__set_data(const std::string& val) {
+  this->data = val;
+}
+
+void ImportRequest::__set_import_id(const int64_t val) {
+  this->import_id = val;
+}
+
+void ImportRequest::__set_last_chunk(const bool val) {
+  this->last_chunk = val;
+}
+
+void ImportRequest::__set_chunk_index(const int64_t val) {
+  this->chunk_index = val;
+}
+
+void ImportRequest::__set_abort_import(const bool val) {
+  this->abort_import = val;
+}
 std::ostream& operator<<(std::ostream& out, const ImportRequest& obj)
 {
   obj.printTo(out);
@@ -10806,6 +10932,46 @@ uint32_t ImportRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->data);
+          this->__isset.data = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 7:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->import_id);
+          this->__isset.import_id = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 8:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->last_chunk);
+          this->__isset.last_chunk = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 9:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->chunk_index);
+          this->__isset.chunk_index = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 10:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->abort_import);
+          this->__isset.abort_import = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -10843,6 +11009,26 @@ uint32_t ImportRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeI64(this->session_id);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("data", ::apache::thrift::protocol::T_STRING, 6);
+  xfer += oprot->writeBinary(this->data);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("import_id", ::apache::thrift::protocol::T_I64, 7);
+  xfer += oprot->writeI64(this->import_id);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("last_chunk", ::apache::thrift::protocol::T_BOOL, 8);
+  xfer += oprot->writeBool(this->last_chunk);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("chunk_index", ::apache::thrift::protocol::T_I64, 9);
+  xfer += oprot->writeI64(this->chunk_index);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("abort_import", ::apache::thrift::protocol::T_BOOL, 10);
+  xfer += oprot->writeBool(this->abort_import);
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -10855,6 +11041,11 @@ void swap(ImportRequest &a, ImportRequest &b) {
   swap(a.file_name, b.file_name);
   swap(a.import_option, b.import_option);
   swap(a.session_id, b.session_id);
+  swap(a.data, b.data);
+  swap(a.import_id, b.import_id);
+  swap(a.last_chunk, b.last_chunk);
+  swap(a.chunk_index, b.chunk_index);
+  swap(a.abort_import, b.abort_import);
   swap(a.__isset, b.__isset);
 }
 
@@ -10864,6 +11055,11 @@ ImportRequest::ImportRequest(const ImportRequest& other407) {
   file_name = other407.file_name;
   import_option = other407.import_option;
   session_id = other407.session_id;
+  data = other407.data;
+  import_id = other407.import_id;
+  last_chunk = other407.last_chunk;
+  chunk_index = other407.chunk_index;
+  abort_import = other407.abort_import;
   __isset = other407.__isset;
 }
 ImportRequest& ImportRequest::operator=(const ImportRequest& other408) {
@@ -10872,6 +11068,11 @@ ImportRequest& ImportRequest::operator=(const ImportRequest& other408) {
   file_name = other408.file_name;
   import_option = other408.import_option;
   session_id = other408.session_id;
+  data = other408.data;
+  import_id = other408.import_id;
+  last_chunk = other408.last_chunk;
+  chunk_index = other408.chunk_index;
+  abort_import = other408.abort_import;
   __isset = other408.__isset;
   return *this;
 }
@@ -10883,6 +11084,11 @@ void ImportRequest::printTo(std::ostream& out) const {
   out << ", " << "file_name=" << to_string(file_name);
   out << ", " << "import_option=" << to_string(import_option);
   out << ", " << "session_id=" << to_string(session_id);
+  out << ", " << "data=" << to_string(data);
+  out << ", " << "import_id=" << to_string(import_id);
+  out << ", " << "last_chunk=" << to_string(last_chunk);
+  out << ", " << "chunk_index=" << to_string(chunk_index);
+  out << ", " << "abort_import=" << to_string(abort_import);
   out << ")";
 }
 
@@ -11785,6 +11991,15 @@ void SelectRequest::__set_total_hits_count(const bool val) {
   this->total_hits_count = val;
 __isset.total_hits_count = true;
 }
+
+void SelectRequest::__set_batch_embedding_data(const std::vector<EmbeddingData> & val) {
+  this->batch_embedding_data = val;
+}
+
+void SelectRequest::__set_profile(const bool val) {
+  this->profile = val;
+__isset.profile = true;
+}
 std::ostream& operator<<(std::ostream& out, const SelectRequest& obj)
 {
   obj.printTo(out);
@@ -11965,6 +12180,34 @@ uint32_t SelectRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 14:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->batch_embedding_data.clear();
+            uint32_t _size613;
+            ::apache::thrift::protocol::TType _etype616;
+            xfer += iprot->readListBegin(_etype616, _size613);
+            this->batch_embedding_data.resize(_size613);
+            uint32_t _i617;
+            for (_i617 = 0; _i617 < _size613; ++_i617)
+            {
+              xfer += this->batch_embedding_data[_i617].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.batch_embedding_data = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 15:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->profile);
+          this->__isset.profile = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -12075,6 +12318,23 @@ uint32_t SelectRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
     xfer += oprot->writeBool(this->total_hits_count);
     xfer += oprot->writeFieldEnd();
   }
+  xfer += oprot->writeFieldBegin("batch_embedding_data", ::apache::thrift::protocol::T_LIST, 14);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->batch_embedding_data.size()));
+    std::vector<EmbeddingData> ::const_iterator _iter618;
+    for (_iter618 = this->batch_embedding_data.begin(); _iter618 != this->batch_embedding_data.end(); ++_iter618)
+    {
+      xfer += (*_iter618).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+  if (this->__isset.profile) {
+    xfer += oprot->writeFieldBegin("profile", ::apache::thrift::protocol::T_BOOL, 15);
+    xfer += oprot->writeBool(this->profile);
+    xfer += oprot->writeFieldEnd();
+  }
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -12095,6 +12355,8 @@ void swap(SelectRequest &a, SelectRequest &b) {
   swap(a.offset_expr, b.offset_expr);
   swap(a.order_by_list, b.order_by_list);
   swap(a.total_hits_count, b.total_hits_count);
+  swap(a.batch_embedding_data, b.batch_embedding_data);
+  swap(a.profile, b.profile);
   swap(a.__isset, b.__isset);
 }
 
@@ -12112,6 +12374,8 @@ SelectRequest::SelectRequest(const SelectRequest& other482) {
   offset_expr = other482.offset_expr;
   order_by_list = other482.order_by_list;
   total_hits_count = other482.total_hits_count;
+  batch_embedding_data = other482.batch_embedding_data;
+  profile = other482.profile;
   __isset = other482.__isset;
 }
 SelectRequest& SelectRequest::operator=(const SelectRequest& other483) {
@@ -12128,6 +12392,8 @@ SelectRequest& SelectRequest::operator=(const SelectRequest& other483) {
   offset_expr = other483.offset_expr;
   order_by_list = other483.order_by_list;
   total_hits_count = other483.total_hits_count;
+  batch_embedding_data = other483.batch_embedding_data;
+  profile = other483.profile;
   __isset = other483.__isset;
   return *this;
 }
@@ -12147,6 +12413,8 @@ void SelectRequest::printTo(std::ostream& out) const {
   out << ", " << "offset_expr="; (__isset.offset_expr ? (out << to_string(offset_expr)) : (out << "<null>"));
   out << ", " << "order_by_list="; (__isset.order_by_list ? (out << to_string(order_by_list)) : (out << "<null>"));
   out << ", " << "total_hits_count="; (__isset.total_hits_count ? (out << to_string(total_hits_count)) : (out << "<null>"));
+  out << ", " << "batch_embedding_data=" << to_string(batch_embedding_data);
+  out << ", " << "profile="; (__isset.profile ? (out << to_string(profile)) : (out << "<null>"));
   out << ")";
 }
 
@@ -12174,6 +12442,10 @@ void SelectResponse::__set_column_fields(const std::vector<ColumnField> & val) {
 void SelectResponse::__set_extra_result(const std::string& val) {
   this->extra_result = val;
 }
+
+void SelectResponse::__set_batch_block_counts(const std::vector<int64_t> & val) {
+  this->batch_block_counts = val;
+}
 std::ostream& operator<<(std::ostream& out, const SelectResponse& obj)
 {
   obj.printTo(out);
@@ -12266,6 +12538,26 @@ uint32_t SelectResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->batch_block_counts.clear();
+            uint32_t _size619;
+            ::apache::thrift::protocol::TType _etype622;
+            xfer += iprot->readListBegin(_etype622, _size619);
+            this->batch_block_counts.resize(_size619);
+            uint32_t _i623;
+            for (_i623 = 0; _i623 < _size619; ++_i623)
+            {
+              xfer += iprot->readI64(this->batch_block_counts[_i623]);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.batch_block_counts = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -12319,6 +12611,18 @@ uint32_t SelectResponse::write(::apache::thrift::protocol::TProtocol* oprot) con
   xfer += oprot->writeString(this->extra_result);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("batch_block_counts", ::apache::thrift::protocol::T_LIST, 6);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_I64, static_cast<uint32_t>(this->batch_block_counts.size()));
+    std::vector<int64_t> ::const_iterator _iter624;
+    for (_iter624 = this->batch_block_counts.begin(); _iter624 != this->batch_block_counts.end(); ++_iter624)
+    {
+      xfer += oprot->writeI64((*_iter624));
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -12331,6 +12635,7 @@ void swap(SelectResponse &a, SelectResponse &b) {
   swap(a.column_defs, b.column_defs);
   swap(a.column_fields, b.column_fields);
   swap(a.extra_result, b.extra_result);
+  swap(a.batch_block_counts, b.batch_block_counts);
   swap(a.__isset, b.__isset);
 }
 
@@ -12340,6 +12645,7 @@ SelectResponse::SelectResponse(const SelectResponse& other496) {
   column_defs = other496.column_defs;
   column_fields = other496.column_fields;
   extra_result = other496.extra_result;
+  batch_block_counts = other496.batch_block_counts;
   __isset = other496.__isset;
 }
 SelectResponse& SelectResponse::operator=(const SelectResponse& other497) {
@@ -12348,6 +12654,7 @@ SelectResponse& SelectResponse::operator=(const SelectResponse& other497) {
   column_defs = other497.column_defs;
   column_fields = other497.column_fields;
   extra_result = other497.extra_result;
+  batch_block_counts = other497.batch_block_counts;
   __isset = other497.__isset;
   return *this;
 }
@@ -12359,6 +12666,7 @@ void SelectResponse::printTo(std::ostream& out) const {
   out << ", " << "column_defs=" << to_string(column_defs);
   out << ", " << "column_fields=" << to_string(column_fields);
   out << ", " << "extra_result=" << to_string(extra_result);
+  out << ", " << "batch_block_counts=" << to_string(batch_block_counts);
   out << ")";
 }
 
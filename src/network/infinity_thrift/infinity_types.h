@@ -171,7 +171,9 @@ struct CopyFileType {
     JSONL = 2,
     FVECS = 3,
     CSR = 4,
-    BVECS = 5
+    BVECS = 5,
+    PARQUET = 6,
+    ARROW = 7
   };
 };
 
@@ -1162,7 +1164,7 @@ void swap(ColumnExpr &a, ColumnExpr &b);
 std::ostream& operator<<(std::ostream& out, const ColumnExpr& obj);
 
 typedef struct _EmbeddingData__isset {
-  _EmbeddingData__isset() : bool_array_value(false), u8_array_value(false), i8_array_value(false), i16_array_value(false), i32_array_value(false), i64_array_value(false), f32_array_value(false), f64_array_value(false), f16_array_value(false), bf16_array_value(false) {}
+  _EmbeddingData__isset() : bool_array_value(false), u8_array_value(false), i8_array_value(false), i16_array_value(false), i32_array_value(false), i64_array_value(false), f32_array_value(false), f64_array_value(false), f16_array_value(false), bf16_array_value(false), raw_data(false) {}
   bool bool_array_value :1;
   bool u8_array_value :1;
   bool i8_array_value :1;
@@ -1173,6 +1175,7 @@ typedef struct _EmbeddingData__isset {
   bool f64_array_value :1;
   bool f16_array_value :1;
   bool bf16_array_value :1;
+  bool raw_data :1;
 } _EmbeddingData__isset;
 
 class EmbeddingData : public virtual ::apache::thrift::TBase {
@@ -1180,7 +1183,8 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
 
   EmbeddingData(const EmbeddingData&);
   EmbeddingData& operator=(const EmbeddingData&);
-  EmbeddingData() noexcept {
+  EmbeddingData() noexcept
+                     : raw_data() {
   }
 
   virtual ~EmbeddingData() noexcept;
@@ -1194,6 +1198,7 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
   std::vector<double>  f64_array_value;
   std::vector<double>  f16_array_value;
   std::vector<double>  bf16_array_value;
+  std::string raw_data;
 
   _EmbeddingData__isset __isset;
 
@@ -1217,6 +1222,8 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
 
   void __set_bf16_array_value(const std::vector<double> & val);
 
+  void __set_raw_data(const std::string& val);
+
   bool operator == (const EmbeddingData & rhs) const
   {
     if (__isset.bool_array_value != rhs.__isset.bool_array_value)
@@ -1259,6 +1266,10 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
       return false;
     else if (__isset.bf16_array_value && !(bf16_array_value == rhs.bf16_array_value))
       return false;
+    if (__isset.raw_data != rhs.__isset.raw_data)
+      return false;
+    else if (__isset.raw_data && !(raw_data == rhs.raw_data))
+      return false;
     return true;
   }
   bool operator != (const EmbeddingData &rhs) const {
@@ -4240,11 +4251,13 @@ void swap(DropTableRequest &a, DropTableRequest &b);
 std::ostream& operator<<(std::ostream& out, const DropTableRequest& obj);
 
 typedef struct _InsertRequest__isset {
-  _InsertRequest__isset() : db_name(false), table_name(false), fields(true), session_id(false) {}
+  _InsertRequest__isset() : db_name(false), table_name(false), fields(true), session_id(false), column_defs(true), column_fields(true) {}
   bool db_name :1;
   bool table_name :1;
   bool fields :1;
   bool session_id :1;
+  bool column_defs :1;
+  bool column_fields :1;
 } _InsertRequest__isset;
 
 class InsertRequest : public virtual ::apache::thrift::TBase {
@@ -4264,6 +4277,8 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
   std::string table_name;
   std::vector<Field>  fields;
   int64_t session_id;
+  std::vector<ColumnDef>  column_defs;
+  std::vector<ColumnField>  column_fields;
 
   _InsertRequest__isset __isset;
 
@@ -4275,6 +4290,10 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
 
   void __set_session_id(const int64_t val);
 
+  void __set_column_defs(const std::vector<ColumnDef> & val);
+
+  void __set_column_fields(const std::vector<ColumnField> & val);
+
   bool operator == (const InsertRequest & rhs) const
   {
     if (!(db_name == rhs.db_name))
@@ -4285,6 +4304,10 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
       return false;
     if (!(session_id == rhs.session_id))
       return false;
+    if (!(column_defs == rhs.column_defs))
+      return false;
+    if (!(column_fields == rhs.column_fields))
+      return false;
     return true;
   }
   bool operator != (const InsertRequest &rhs) const {
@@ -4304,12 +4327,17 @@ void swap(InsertRequest &a, InsertRequest &b);
 std::ostream& operator<<(std::ostream& out, const InsertRequest& obj);
 
 typedef struct _ImportRequest__isset {
-  _ImportRequest__isset() : db_name(false), table_name(false), file_name(false), import_option(false), session_id(false) {}
+  _ImportRequest__isset() : db_name(false), table_name(false), file_name(false), import_option(false), session_id(false), data(false), import_id(false), last_chunk(false), chunk_index(false), abort_import(false) {}
   bool db_name :1;
   bool table_name :1;
   bool file_name :1;
   bool import_option :1;
   bool session_id :1;
+  bool data :1;
+  bool import_id :1;
+  bool last_chunk :1;
+  bool chunk_index :1;
+  bool abort_import :1;
 } _ImportRequest__isset;
 
 class ImportRequest : public virtual ::apache::thrift::TBase {
@@ -4321,7 +4349,12 @@ class ImportRequest : public virtual ::apache::thrift::TBase {
                 : db_name(),
                   table_name(),
                   file_name(),
-                  session_id(0) {
+                  session_id(0),
+                  data(),
+                  import_id(0),
+                  last_chunk(0),
+                  chunk_index(0),
+                  abort_import(0) {
   }
 
   virtual ~ImportRequest() noexcept;
@@ -4330,6 +4363,11 @@ class ImportRequest : public virtual ::apache::thrift::TBase {
   std::string file_name;
   ImportOption import_option;
   int64_t session_id;
+  std::string data;
+  int64_t import_id;
+  bool last_chunk;
+  int64_t chunk_index;
+  bool abort_import;
 
   _ImportRequest__isset __isset;
 
@@ -4343,6 +4381,16 @@ class ImportRequest : public virtual ::apache::thrift::TBase {
 
   void __set_session_id(const int64_t val);
 
+  void __set_data(const std::string& val);
+
+  void __set_import_id(const int64_t val);
+
+  void __set_last_chunk(const bool val);
+
+  void __set_chunk_index(const int64_t val);
+
+  void __set_abort_import(const bool val);
+
   bool operator == (const ImportRequest & rhs) const
   {
     if (!(db_name == rhs.db_name))
@@ -4355,6 +4403,16 @@ class ImportRequest : public virtual ::apache::thrift::TBase {
       return false;
     if (!(session_id == rhs.session_id))
       return false;
+    if (!(data == rhs.data))
+      return false;
+    if (!(import_id == rhs.import_id))
+      return false;
+    if (!(last_chunk == rhs.last_chunk))
+      return false;
+    if (!(chunk_index == rhs.chunk_index))
+      return false;
+    if (!(abort_import == rhs.abort_import))
+      return false;
     return true;
   }
   bool operator != (const ImportRequest &rhs) const {
@@ -4656,7 +4714,7 @@ void swap(ExplainResponse &a, ExplainResponse &b);
 std::ostream& operator<<(std::ostream& out, const ExplainResponse& obj);
 
 typedef struct _SelectRequest__isset {
-  _SelectRequest__isset() : session_id(false), db_name(false), table_name(false), select_list(true), highlight_list(true), search_expr(false), where_expr(false), group_by_list(true), having_expr(false), limit_expr(false), offset_expr(false), order_by_list(true), total_hits_count(false) {}
+  _SelectRequest__isset() : session_id(false), db_name(false), table_name(false), select_list(true), highlight_list(true), search_expr(false), where_expr(false), group_by_list(true), having_expr(false), limit_expr(false), offset_expr(false), order_by_list(true), total_hits_count(false), batch_embedding_data(true), profile(false) {}
   bool session_id :1;
   bool db_name :1;
   bool table_name :1;
@@ -4670,6 +4728,8 @@ typedef struct _SelectRequest__isset {
   bool offset_expr :1;
   bool order_by_list :1;
   bool total_hits_count :1;
+  bool batch_embedding_data :1;
+  bool profile :1;
 } _SelectRequest__isset;
 
 class SelectRequest : public virtual ::apache::thrift::TBase {
@@ -4681,7 +4741,8 @@ class SelectRequest : public virtual ::apache::thrift::TBase {
                 : session_id(0),
                   db_name(),
                   table_name(),
-                  total_hits_count(0) {
+                  total_hits_count(0),
+                  profile(0) {
 
 
 
@@ -4702,6 +4763,8 @@ class SelectRequest : public virtual ::apache::thrift::TBase {
   ParsedExpr offset_expr;
   std::vector<OrderByExpr>  order_by_list;
   bool total_hits_count;
+  std::vector<EmbeddingData>  batch_embedding_data;
+  bool profile;
 
   _SelectRequest__isset __isset;
 
@@ -4731,6 +4794,10 @@ class SelectRequest : public virtual ::apache::thrift::TBase {
 
   void __set_total_hits_count(const bool val);
 
+  void __set_batch_embedding_data(const std::vector<EmbeddingData> & val);
+
+  void __set_profile(const bool val);
+
   bool operator == (const SelectRequest & rhs) const
   {
     if (!(session_id == rhs.session_id))
@@ -4777,6 +4844,12 @@ class SelectRequest : public virtual ::apache::thrift::TBase {
       return false;
     else if (__isset.total_hits_count && !(total_hits_count == rhs.total_hits_count))
       return false;
+    if (!(batch_embedding_data == rhs.batch_embedding_data))
+      return false;
+    if (__isset.profile != rhs.__isset.profile)
+      return false;
+    else if (__isset.profile && !(profile == rhs.profile))
+      return false;
     return true;
   }
   bool operator != (const SelectRequest &rhs) const {
@@ -4796,12 +4869,13 @@ void swap(SelectRequest &a, SelectRequest &b);
 std::ostream& operator<<(std::ostream& out, const SelectRequest& obj);
 
 typedef struct _SelectResponse__isset {
-  _SelectResponse__isset() : error_code(false), error_msg(false), column_defs(true), column_fields(true), extra_result(false) {}
+  _SelectResponse__isset() : error_code(false), error_msg(false), column_defs(true), column_fields(true), extra_result(false), batch_block_counts(true) {}
   bool error_code :1;
   bool error_msg :1;
   bool column_defs :1;
   bool column_fields :1;
   bool extra_result :1;
+  bool batch_block_counts :1;
 } _SelectResponse__isset;
 
 class SelectResponse : public virtual ::apache::thrift::TBase {
@@ -4823,6 +4897,7 @@ class SelectResponse : public virtual ::apache::thrift::TBase {
   std::vector<ColumnDef>  column_defs;
   std::vector<ColumnField>  column_fields;
   std::string extra_result;
+  std::vector<int64_t>  batch_block_counts;
 
   _SelectResponse__isset __isset;
 
@@ -4836,6 +4911,8 @@ class SelectResponse : public virtual ::apache::thrift::TBase {
 
   void __set_extra_result(const std::string& val);
 
+  void __set_batch_block_counts(const std::vector<int64_t> & val);
+
   bool operator == (const SelectResponse & rhs) const
   {
     if (!(error_code == rhs.error_code))
@@ -4848,6 +4925,8 @@ class SelectResponse : public virtual ::apache::thrift::TBase {
       return false;
     if (!(extra_result == rhs.extra_result))
       return false;
+    if (!(batch_block_counts == rhs.batch_block_counts))
+      return false;
     return true;
   }
   bool operator != (const SelectResponse &rhs) const {
@@ -21,6 +21,7 @@ module;
 module infinity_thrift_service;
 
 import third_party;
+import profiler;
 import logger;
 import query_options;
 import infinity_thrift_types;
@@ -61,6 +62,7 @@ import data_block;
 import table_def;
 import extra_ddl_info;
 import defer_op;
+import default_values;
 
 import column_vector;
 import query_result;
@@ -109,9 +111,15 @@ Pair<const char *, Status> ClientVersions::GetVersionByIndex(i64 version_index)
 
 std::mutex InfinityThriftService::infinity_session_map_mutex_;
 HashMap<u64, SharedPtr<Infinity>> InfinityThriftService::infinity_session_map_;
+std::mutex InfinityThriftService::import_chunks_mutex_;
+HashMap<u64, HashMap<i64, InfinityThriftService::StagedImport>> InfinityThriftService::import_chunks_map_;
 ClientVersions InfinityThriftService::client_version_;
 
 u32 InfinityThriftService::ClearSessionMap() {
+    {
+        std::lock_guard lock(import_chunks_mutex_);
+        import_chunks_map_.clear();
+    }
     std::lock_guard lock(infinity_session_map_mutex_);
     const auto session_count = infinity_session_map_.size();
     infinity_session_map_.clear();
@@ -303,7 +311,7 @@ void InfinityThriftService::Insert(infinity_thrift_rpc::CommonResponse &response
         return;
     }
 
-    if (request.fields.empty()) {
+    if (request.fields.empty() && request.column_fields.empty()) {
         ProcessStatus(response, Status::InsertWithoutValues());
         return;
     }
@@ -320,7 +328,15 @@ void InfinityThriftService::Insert(infinity_thrift_rpc::CommonResponse &response
             insert_rows = nullptr;
         }
     });
-    insert_rows->reserve(request.fields.size());
+    if (!request.column_fields.empty()) {
+        // Columnar insert: every column arrives as one packed buffer, decode it into rows here.
+        constant_status = GetInsertRowsFromColumnsProto(request, *insert_rows);
+        if (!constant_status.ok()) {
+            ProcessStatus(response, constant_status);
+            return;
+        }
+    }
+    insert_rows->reserve(insert_rows->size() + request.fields.size());
     for (auto &field : request.fields) {
         auto insert_row = std::make_unique<InsertRowExpr>();
         insert_row->columns_ = std::move(field.column_names);
@@ -354,12 +370,90 @@ Tuple<CopyFileType, Status> InfinityThriftService::GetCopyFileType(infinity_thri
             return {CopyFileType::kCSR, Status::OK()};
         case infinity_thrift_rpc::CopyFileType::BVECS:
             return {CopyFileType::kBVECS, Status::OK()};
+        case infinity_thrift_rpc::CopyFileType::PARQUET:
+            return {CopyFileType::kPARQUET, Status::OK()};
+        case infinity_thrift_rpc::CopyFileType::ARROW:
+            return {CopyFileType::kARROW, Status::OK()};
         default: {
             return {CopyFileType::kInvalid, Status::ImportFileFormatError("Not implemented yet")};
         }
     }
 }
 
+Tuple<SharedPtr<Vector<String>>, Status> InfinityThriftService::StageImportChunk(const infinity_thrift_rpc::ImportRequest &request) {
+    const auto now = chrono::system_clock::now();
+    std::lock_guard lock(import_chunks_mutex_);
+    for (auto session_iter = import_chunks_map_.begin(); session_iter != import_chunks_map_.end();) {
+        auto &session_imports = session_iter->second;
+        for (auto import_iter = session_imports.begin(); import_iter != session_imports.end();) {
+            if (now - import_iter->second.last_chunk_time_ > chrono::seconds(DEFAULT_STAGED_IMPORT_TIMEOUT_SEC)) {
+                LOG_WARN(fmt::format("THRIFT: Drop import {} of session {}, no chunk for {}s",
+                                     import_iter->first,
+                                     session_iter->first,
+                                     DEFAULT_STAGED_IMPORT_TIMEOUT_SEC));
+                import_iter = session_imports.erase(import_iter);
+            } else {
+                ++import_iter;
+            }
+        }
+        if (session_imports.empty()) {
+            session_iter = import_chunks_map_.erase(session_iter);
+        } else {
+            ++session_iter;
+        }
+    }
+
+    auto &session_imports = import_chunks_map_[request.session_id];
+    DeferFn clear_session([&] {
+        if (session_imports.empty()) {
+            import_chunks_map_.erase(request.session_id);
+        }
+    });
+    auto import_iter = session_imports.find(request.import_id);
+    if (request.abort_import) {
+        if (import_iter != session_imports.end()) {
+            session_imports.erase(import_iter);
+        }
+        return {nullptr, Status::OK()};
+    }
+
+    // the chunks are numbered, so a chunk of an import that was aborted or timed out can't start a partial import
+    if (request.chunk_index == 0) {
+        if (import_iter != session_imports.end()) {
+            session_imports.erase(import_iter);
+            return {nullptr, Status::UnexpectedError(fmt::format("Import {} is already in progress", request.import_id))};
+        }
+        import_iter = session_imports.emplace(request.import_id, StagedImport{MakeShared<Vector<String>>(), 0, now}).first;
+    } else if (import_iter == session_imports.end() || import_iter->second.chunks_->size() != static_cast<SizeT>(request.chunk_index)) {
+        if (import_iter != session_imports.end()) {
+            session_imports.erase(import_iter);
+        }
+        return {nullptr, Status::DataNotExist(fmt::format("chunk {} of import {}, the import was aborted, timed out or lost a chunk", request.chunk_index, request.import_id))};
+    }
+
+    SizeT session_bytes = 0;
+    for (const auto &[import_id, staged_import] : session_imports) {
+        session_bytes += staged_import.bytes_;
+    }
+    if (session_bytes + request.data.size() > DEFAULT_STAGED_IMPORT_MEMORY) {
+        session_imports.erase(import_iter);
+        return {nullptr,
+                Status::OutOfMemory(fmt::format("Import {} would stage more than {} bytes in the session, import fewer rows at a time",
+                                                request.import_id,
+                                                DEFAULT_STAGED_IMPORT_MEMORY))};
+    }
+    auto &staged_import = import_iter->second;
+    staged_import.bytes_ += request.data.size();
+    staged_import.last_chunk_time_ = now;
+    staged_import.chunks_->emplace_back(request.data);
+    if (!request.last_chunk) {
+        return {nullptr, Status::OK()};
+    }
+    auto data = std::move(staged_import.chunks_);
+    session_imports.erase(import_iter);
+    return {std::move(data), Status::OK()};
+}
+
 void InfinityThriftService::Import(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::ImportRequest &request) {
     auto [infinity, infinity_status] = GetInfinityBySessionID(request.session_id);
     if (!infinity_status.ok()) {
@@ -367,6 +461,28 @@ void InfinityThriftService::Import(infinity_thrift_rpc::CommonResponse &response
         return;
     }
 
+    if (request.import_id != 0 || !request.data.empty()) {
+        // arrow streams sent along with the requests, imported without touching the server's filesystem. A chunked import
+        // sends one stream per request with the same import_id, they are kept until the last chunk and imported together
+        // in one transaction. The request belongs to the processor, so its data is copied once into the engine-owned buffer.
+        auto data = MakeShared<Vector<String>>();
+        if (request.import_id != 0) {
+            auto [staged_data, status] = StageImportChunk(request);
+            if (!status.ok() || staged_data.get() == nullptr) {
+                ProcessStatus(response, status);
+                return;
+            }
+            data = std::move(staged_data);
+        } else {
+            data->emplace_back(request.data);
+        }
+        ImportOptions import_options;
+        import_options.copy_file_type_ = CopyFileType::kARROW;
+        const QueryResult result = infinity->ImportData(request.db_name, request.table_name, std::move(data), import_options);
+        ProcessQueryResult(response, result);
+        return;
+    }
+
     auto [copy_file_type, status] = GetCopyFileType(request.import_option.copy_file_type);
     if (!status.ok()) {
         ProcessStatus(response, status);
@@ -445,6 +561,11 @@ void InfinityThriftService::Select(infinity_thrift_rpc::SelectResponse &response
         return;
     }
 
+    if (!request.batch_embedding_data.empty()) {
+        SelectRoundTripBatch(response, request);
+        return;
+    }
+
     // auto end1 = std::chrono::steady_clock::now();
     //
     // phase_1_duration_ += end1 - start1;
@@ -714,7 +835,8 @@ void InfinityThriftService::Select(infinity_thrift_rpc::SelectResponse &response
                                                 order_by_list,
                                                 group_by_list,
                                                 having,
-                                                request.total_hits_count);
+                                                request.total_hits_count,
+                                                request.profile);
     output_columns = nullptr;
     highlight_columns = nullptr;
     filter = nullptr;
@@ -762,6 +884,63 @@ void InfinityThriftService::Select(infinity_thrift_rpc::SelectResponse &response
     // }
 }
 
+void InfinityThriftService::SelectRoundTripBatch(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::SelectRequest &request) {
+    // Saves the network round trips only: each query vector replaces the embedding of the single match_dense
+    // expression and the request goes through Select() again, session lookup, expression decoding, planning and
+    // execution included. The results are concatenated block by block and batch_block_counts tells the client where
+    // each one ends.
+    if (!request.__isset.search_expr) {
+        ProcessStatus(response, Status::NotSupport("Batch search without match_dense expression"));
+        return;
+    }
+    SizeT knn_expr_count = 0;
+    SizeT knn_expr_idx = 0;
+    for (SizeT idx = 0; idx < request.search_expr.match_exprs.size(); ++idx) {
+        if (request.search_expr.match_exprs[idx].__isset.match_vector_expr) {
+            knn_expr_idx = idx;
+            ++knn_expr_count;
+        }
+    }
+    if (knn_expr_count != 1) {
+        ProcessStatus(response, Status::NotSupport(fmt::format("Batch search needs one match_dense expression, got {}", knn_expr_count)));
+        return;
+    }
+
+    infinity_thrift_rpc::SelectRequest query_request = request;
+    query_request.batch_embedding_data.clear();
+    auto &query_embedding_data = query_request.search_expr.match_exprs[knn_expr_idx].match_vector_expr.embedding_data;
+
+    response.batch_block_counts.reserve(request.batch_embedding_data.size());
+    for (const auto &embedding_data : request.batch_embedding_data) {
+        query_embedding_data = embedding_data;
+        infinity_thrift_rpc::SelectResponse query_response;
+        Select(query_response, query_request);
+        if (query_response.error_code != (i64)(ErrorCode::kOk)) {
+            response = std::move(query_response);
+            return;
+        }
+
+        if (response.column_defs.empty()) {
+            response.column_defs = std::move(query_response.column_defs);
+            response.column_fields.resize(query_response.column_fields.size());
+        }
+        SizeT block_count = query_response.column_fields.empty() ? 0 : query_response.column_fields[0].column_vectors.size();
+        for (SizeT col_idx = 0; col_idx < query_response.column_fields.size(); ++col_idx) {
+            auto &query_column_field = query_response.column_fields[col_idx];
+            if (query_column_field.column_vectors.empty()) {
+                continue;
+            }
+            auto &column_field = response.column_fields[col_idx];
+            column_field.__set_column_type(query_column_field.column_type);
+            for (auto &column_vector : query_column_field.column_vectors) {
+                column_field.column_vectors.emplace_back(std::move(column_vector));
+            }
+        }
+        response.batch_block_counts.emplace_back(block_count);
+    }
+    response.__set_error_code((i64)(ErrorCode::kOk));
+}
+
 void InfinityThriftService::Explain(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::ExplainRequest &request) {
     auto [infinity, infinity_status] = GetInfinityBySessionID(request.session_id);
     if (!infinity_status.ok()) {
@@ -1883,6 +2062,11 @@ Status InfinityThriftService::GetAndRemoveSessionID(i64 session_id) {
     }
     iter->second->RemoteDisconnect();
     infinity_session_map_.erase(session_id);
+    {
+        // chunks of imports the session never finished
+        std::lock_guard import_lock(import_chunks_mutex_);
+        import_chunks_map_.erase(session_id);
+    }
     LOG_TRACE(fmt::format("THRIFT: Remove session {}", session_id));
     return Status::OK();
 }
@@ -2219,6 +2403,308 @@ ConstantExpr *InfinityThriftService::GetConstantFromProto(Status &status, const
     }
 }
 
+namespace {
+
+struct ColumnBufferReader {
+    explicit ColumnBufferReader(const String &buffer) : buffer_(buffer) {}
+
+    bool Remain(SizeT bytes) const { return offset_ + bytes <= buffer_.size(); }
+
+    bool Finished() const { return offset_ == buffer_.size(); }
+
+    template <typename T>
+    T Read() {
+        T value;
+        std::memcpy(&value, buffer_.data() + offset_, sizeof(T));
+        offset_ += sizeof(T);
+        return value;
+    }
+
+    const String &buffer_;
+    SizeT offset_{0};
+};
+
+Status ColumnBufferTruncated(const String &column_name) {
+    return Status::InvalidParameterValue(fmt::format("Column {}", column_name), "truncated buffer", "a buffer holding every row");
+}
+
+template <typename T, typename U>
+void ReadColumnElements(ColumnBufferReader &reader, SizeT count, Vector<U> &output) {
+    output.reserve(output.size() + count);
+    for (SizeT i = 0; i < count; ++i) {
+        output.emplace_back(static_cast<U>(reader.Read<T>()));
+    }
+}
+
+// Read `count` packed elements as an integer or double array constant.
+UniquePtr<ConstantExpr>
+ReadElementArray(Status &status, const String &column_name, ColumnBufferReader &reader, EmbeddingDataType element_type, SizeT count) {
+    if (!reader.Remain(count * EmbeddingT::EmbeddingDataWidth(element_type))) {
+        status = ColumnBufferTruncated(column_name);
+        return nullptr;
+    }
+    switch (element_type) {
+        case EmbeddingDataType::kElemUInt8:
+        case EmbeddingDataType::kElemInt8:
+        case EmbeddingDataType::kElemInt16:
+        case EmbeddingDataType::kElemInt32:
+        case EmbeddingDataType::kElemInt64: {
+            auto expr = MakeUnique<ConstantExpr>(LiteralType::kIntegerArray);
+            switch (element_type) {
+                case EmbeddingDataType::kElemUInt8: {
+                    ReadColumnElements<u8>(reader, count, expr->long_array_);
+                    break;
+                }
+                case EmbeddingDataType::kElemInt8: {
+                    ReadColumnElements<i8>(reader, count, expr->long_array_);
+                    break;
+                }
+                case EmbeddingDataType::kElemInt16: {
+                    ReadColumnElements<i16>(reader, count, expr->long_array_);
+                    break;
+                }
+                case EmbeddingDataType::kElemInt32: {
+                    ReadColumnElements<i32>(reader, count, expr->long_array_);
+                    break;
+                }
+                default: {
+                    ReadColumnElements<i64>(reader, count, expr->long_array_);
+                    break;
+                }
+            }
+            return expr;
+        }
+        case EmbeddingDataType::kElemFloat: {
+            auto expr = MakeUnique<ConstantExpr>(LiteralType::kDoubleArray);
+            ReadColumnElements<f32>(reader, count, expr->double_array_);
+            return expr;
+        }
+        case EmbeddingDataType::kElemDouble: {
+            auto expr = MakeUnique<ConstantExpr>(LiteralType::kDoubleArray);
+            ReadColumnElements<f64>(reader, count, expr->double_array_);
+            return expr;
+        }
+        default: {
+            status = Status::NotSupport(
+                fmt::format("Columnar insert of {} elements is not supported", EmbeddingT::EmbeddingDataType2String(element_type)));
+            return nullptr;
+        }
+    }
+}
+
+Status ReadColumnValues(const DataType &data_type,
+                        const infinity_thrift_rpc::ColumnField &column_field,
+                        ColumnBufferReader &reader,
+                        Vector<UniquePtr<ConstantExpr>> &values) {
+    Status status;
+    while (!reader.Finished()) {
+        switch (column_field.column_type) {
+            case infinity_thrift_rpc::ColumnType::ColumnBool: {
+                if (!reader.Remain(sizeof(u8))) {
+                    return ColumnBufferTruncated(column_field.column_name);
+                }
+                auto expr = MakeUnique<ConstantExpr>(LiteralType::kBoolean);
+                expr->bool_value_ = reader.Read<u8>() != 0;
+                values.emplace_back(std::move(expr));
+                break;
+            }
+            case infinity_thrift_rpc::ColumnType::ColumnInt8:
+            case infinity_thrift_rpc::ColumnType::ColumnInt16:
+            case infinity_thrift_rpc::ColumnType::ColumnInt32:
+            case infinity_thrift_rpc::ColumnType::ColumnInt64: {
+                auto expr = MakeUnique<ConstantExpr>(LiteralType::kInteger);
+                switch (column_field.column_type) {
+                    case infinity_thrift_rpc::ColumnType::ColumnInt8: {
+                        if (!reader.Remain(sizeof(i8))) {
+                            return ColumnBufferTruncated(column_field.column_name);
+                        }
+                        expr->integer_value_ = reader.Read<i8>();
+                        break;
+                    }
+                    case infinity_thrift_rpc::ColumnType::ColumnInt16: {
+                        if (!reader.Remain(sizeof(i16))) {
+                            return ColumnBufferTruncated(column_field.column_name);
+                        }
+                        expr->integer_value_ = reader.Read<i16>();
+                        break;
+                    }
+                    case infinity_thrift_rpc::ColumnType::ColumnInt32: {
+                        if (!reader.Remain(sizeof(i32))) {
+                            return ColumnBufferTruncated(column_field.column_name);
+                        }
+                        expr->integer_value_ = reader.Read<i32>();
+                        break;
+                    }
+                    default: {
+                        if (!reader.Remain(sizeof(i64))) {
+                            return ColumnBufferTruncated(column_field.column_name);
+                        }
+                        expr->integer_value_ = reader.Read<i64>();
+                        break;
+                    }
+                }
+                values.emplace_back(std::move(expr));
+                break;
+            }
+            case infinity_thrift_rpc::ColumnType::ColumnFloat32: {
+                if (!reader.Remain(sizeof(f32))) {
+                    return ColumnBufferTruncated(column_field.column_name);
+                }
+                auto expr = MakeUnique<ConstantExpr>(LiteralType::kDouble);
+                expr->double_value_ = reader.Read<f32>();
+                values.emplace_back(std::move(expr));
+                break;
+            }
+            case infinity_thrift_rpc::ColumnType::ColumnFloat64: {
+                if (!reader.Remain(sizeof(f64))) {
+                    return ColumnBufferTruncated(column_field.column_name);
+                }
+                auto expr = MakeUnique<ConstantExpr>(LiteralType::kDouble);
+                expr->double_value_ = reader.Read<f64>();
+                values.emplace_back(std::move(expr));
+                break;
+            }
+            case infinity_thrift_rpc::ColumnType::ColumnVarchar: {
+                if (!reader.Remain(sizeof(u32))) {
+                    return ColumnBufferTruncated(column_field.column_name);
+                }
+                const auto length = reader.Read<u32>();
+                if (!reader.Remain(length)) {
+                    return ColumnBufferTruncated(column_field.column_name);
+                }
+                auto expr = MakeUnique<ConstantExpr>(LiteralType::kString);
+                expr->str_value_ = static_cast<char *>(malloc(length + 1));
+                std::memcpy(expr->str_value_, reader.buffer_.data() + reader.offset_, length);
+                expr->str_value_[length] = '\0';
+                reader.offset_ += length;
+                values.emplace_back(std::move(expr));
+                break;
+            }
+            case infinity_thrift_rpc::ColumnType::ColumnEmbedding: {
+                const auto *embedding_info = static_cast<EmbeddingInfo *>(data_type.type_info().get());
+                auto expr = ReadElementArray(status, column_field.column_name, reader, embedding_info->Type(), embedding_info->Dimension());
+                if (!status.ok()) {
+                    return status;
+                }
+                values.emplace_back(std::move(expr));
+                break;
+            }
+            case infinity_thrift_rpc::ColumnType::ColumnTensor:
+            case infinity_thrift_rpc::ColumnType::ColumnMultiVector: {
+                const auto *embedding_info = static_cast<EmbeddingInfo *>(data_type.type_info().get());
+                const SizeT element_width = EmbeddingT::EmbeddingDataWidth(embedding_info->Type());
+                const SizeT dimension = embedding_info->Dimension();
+                if (!reader.Remain(sizeof(u32))) {
+                    return ColumnBufferTruncated(column_field.column_name);
+                }
+                const SizeT bytes = reader.Read<u32>();
+                if (element_width == 0 || dimension == 0 || bytes % (element_width * dimension) != 0) {
+                    return Status::InvalidParameterValue(fmt::format("Column {}", column_field.column_name),
+                                                         fmt::format("row of {} bytes", bytes),
+                                                         "a multiple of the embedding size");
+                }
+                const SizeT embedding_count = bytes / (element_width * dimension);
+                auto expr = MakeUnique<ConstantExpr>(LiteralType::kSubArrayArray);
+                expr->sub_array_array_.reserve(embedding_count);
+                for (SizeT i = 0; i < embedding_count; ++i) {
+                    auto sub_expr = ReadElementArray(status, column_field.column_name, reader, embedding_info->Type(), dimension);
+                    if (!status.ok()) {
+                        return status;
+                    }
+                    expr->sub_array_array_.emplace_back(std::move(sub_expr));
+                }
+                values.emplace_back(std::move(expr));
+                break;
+            }
+            case infinity_thrift_rpc::ColumnType::ColumnSparse: {
+                const auto *sparse_info = static_cast<SparseInfo *>(data_type.type_info().get());
+                if (!reader.Remain(sizeof(u32))) {
+                    return ColumnBufferTruncated(column_field.column_name);
+                }
+                const SizeT nnz = reader.Read<u32>();
+                auto indices = ReadElementArray(status, column_field.column_name, reader, sparse_info->IndexType(), nnz);
+                if (!status.ok()) {
+                    return status;
+                }
+                auto data = ReadElementArray(status, column_field.column_name, reader, sparse_info->DataType(), nnz);
+                if (!status.ok()) {
+                    return status;
+                }
+                UniquePtr<ConstantExpr> expr;
+                if (data->literal_type_ == LiteralType::kIntegerArray) {
+                    expr = MakeUnique<ConstantExpr>(LiteralType::kLongSparseArray);
+                    expr->long_sparse_array_.first = std::move(indices->long_array_);
+                    expr->long_sparse_array_.second = std::move(data->long_array_);
+                } else {
+                    expr = MakeUnique<ConstantExpr>(LiteralType::kDoubleSparseArray);
+                    expr->double_sparse_array_.first = std::move(indices->long_array_);
+                    expr->double_sparse_array_.second = std::move(data->double_array_);
+                }
+                values.emplace_back(std::move(expr));
+                break;
+            }
+            default: {
+                return Status::NotSupport(fmt::format("Columnar insert of column {} with type {} is not supported",
+                                                      column_field.column_name,
+                                                      infinity_thrift_rpc::to_string(column_field.column_type)));
+            }
+        }
+    }
+    return Status::OK();
+}
+
+} // namespace
+
+Status InfinityThriftService::GetInsertRowsFromColumnsProto(const infinity_thrift_rpc::InsertRequest &request,
+                                                            Vector<InsertRowExpr *> &insert_rows) {
+    if (request.column_defs.size() != request.column_fields.size()) {
+        return Status::ColumnCountMismatch(
+            fmt::format("{} column definitions for {} columns", request.column_defs.size(), request.column_fields.size()));
+    }
+
+    Vector<String> column_names;
+    Vector<Vector<UniquePtr<ConstantExpr>>> column_values(request.column_fields.size());
+    column_names.reserve(request.column_fields.size());
+    for (SizeT column_idx = 0; column_idx < request.column_fields.size(); ++column_idx) {
+        const auto &column_field = request.column_fields[column_idx];
+        const auto data_type = GetColumnTypeFromProto(request.column_defs[column_idx].data_type);
+        if (data_type->type() == infinity::LogicalType::kInvalid) {
+            return Status::InvalidDataType();
+        }
+        for (const auto &column_vector : column_field.column_vectors) {
+            ColumnBufferReader reader(column_vector);
+            Status status = ReadColumnValues(*data_type, column_field, reader, column_values[column_idx]);
+            if (!status.ok()) {
+                return status;
+            }
+        }
+        if (column_values[column_idx].size() != column_values[0].size()) {
+            return Status::ColumnCountMismatch(fmt::format("Column {} has {} rows, column {} has {} rows",
+                                                           column_field.column_name,
+                                                           column_values[column_idx].size(),
+                                                           request.column_fields[0].column_name,
+                                                           column_values[0].size()));
+        }
+        column_names.emplace_back(column_field.column_name);
+    }
+
+    const SizeT row_count = column_values[0].size();
+    if (row_count == 0) {
+        return Status::InsertWithoutValues();
+    }
+    insert_rows.reserve(insert_rows.size() + row_count);
+    for (SizeT row_idx = 0; row_idx < row_count; ++row_idx) {
+        auto insert_row = std::make_unique<InsertRowExpr>();
+        insert_row->columns_ = column_names;
+        insert_row->values_.reserve(column_values.size());
+        for (auto &values : column_values) {
+            insert_row->values_.emplace_back(values[row_idx].release());
+        }
+        insert_rows.emplace_back(insert_row.release());
+    }
+    return Status::OK();
+}
+
 ColumnExpr *InfinityThriftService::GetColumnExprFromProto(const infinity_thrift_rpc::ColumnExpr &column_expr) {
     auto parsed_expr = new ColumnExpr();
 
@@ -2275,7 +2761,7 @@ KnnExpr *InfinityThriftService::GetKnnExprFromProto(Status &status, const infini
         return nullptr;
     }
 
-    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data);
+    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data, knn_expr->embedding_data_type_);
     knn_expr->embedding_data_ptr_ = embedding_data_ptr;
     if (knn_expr->embedding_data_type_ == EmbeddingDataType::kElemBit) {
         knn_expr->dimension_ = dimension * 8;
@@ -2378,7 +2864,7 @@ MatchTensorExpr *InfinityThriftService::GetMatchTensorExprFromProto(Status &stat
     match_tensor_expr->SetSearchMethodStr(expr.search_method);
     match_tensor_expr->column_expr_.reset(GetColumnExprFromProto(expr.column_expr));
     match_tensor_expr->embedding_data_type_ = GetEmbeddingDataTypeFromProto(expr.embedding_data_type);
-    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data);
+    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data, match_tensor_expr->embedding_data_type_);
     if (!status2.ok()) {
         status = status2;
         return nullptr;
@@ -2547,8 +3033,23 @@ ExplainType InfinityThriftService::GetExplainTypeFromProto(const infinity_thrift
     }
 }
 
-Tuple<void *, i64, Status> InfinityThriftService::GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data) {
-    if (embedding_data.__isset.u8_array_value) {
+Tuple<void *, i64, Status> InfinityThriftService::GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data,
+                                                                                       EmbeddingDataType element_type) {
+    if (embedding_data.__isset.raw_data) {
+        // little endian values of element_type, bits are packed 8 per byte
+        if (element_type == EmbeddingDataType::kElemInvalid) {
+            return {nullptr, 0, Status::InvalidEmbeddingDataType("invalid")};
+        }
+        const SizeT element_width = element_type == EmbeddingDataType::kElemBit ? 1 : EmbeddingT::EmbeddingDataWidth(element_type);
+        if (embedding_data.raw_data.size() % element_width != 0) {
+            return {nullptr,
+                    0,
+                    Status::InvalidParameterValue("embedding data",
+                                                  std::to_string(embedding_data.raw_data.size()) + " bytes",
+                                                  "should be a multiple of the element width")};
+        }
+        return {(void *)embedding_data.raw_data.data(), embedding_data.raw_data.size() / element_width, Status::OK()};
+    } else if (embedding_data.__isset.u8_array_value) {
         auto ptr_i16 = (int16_t *)(embedding_data.u8_array_value.data());
         auto ptr_u8 = (uint8_t *)(embedding_data.u8_array_value.data());
         for (size_t i = 0; i < embedding_data.u8_array_value.size(); ++i) {
@@ -2867,9 +3368,14 @@ void InfinityThriftService::ProcessDataBlocks(const QueryResult &result,
         }
     }
 
+    nlohmann::json json_response;
     if (result.result_table_->total_hits_count_flag_) {
-        nlohmann::json json_response;
         json_response["total_hits_count"] = result.result_table_->total_hits_count_;
+    }
+    if (result.query_profiler_ != nullptr) {
+        json_response["profile"] = QueryProfiler::Serialize(result.query_profiler_.get());
+    }
+    if (!json_response.empty()) {
         response.extra_result = json_response.dump();
     }
 
@@ -26,6 +26,7 @@ import data_type;
 import status;
 import embedding_info;
 import constant_expr;
+import insert_row_expr;
 import column_expr;
 import function_expr;
 import in_expr;
@@ -65,6 +66,17 @@ private:
     static std::mutex infinity_session_map_mutex_;
     static HashMap<u64, SharedPtr<Infinity>> infinity_session_map_;
 
+    struct StagedImport {
+        SharedPtr<Vector<String>> chunks_{};
+        SizeT bytes_{0};
+        chrono::system_clock::time_point last_chunk_time_{};
+    };
+
+    // arrow streams of the chunked imports in progress, by session and import id, imported with the last chunk.
+    // A session stages at most DEFAULT_STAGED_IMPORT_MEMORY bytes, imports idle for DEFAULT_STAGED_IMPORT_TIMEOUT_SEC are dropped
+    static std::mutex import_chunks_mutex_;
+    static HashMap<u64, HashMap<i64, StagedImport>> import_chunks_map_;
+
     static ClientVersions client_version_;
 
 public:
@@ -98,6 +110,9 @@ public:
 
     Tuple<CopyFileType, Status> GetCopyFileType(infinity_thrift_rpc::CopyFileType::type copy_file_type);
 
+    // Stages a chunk of a chunked import, returning all its arrow streams with the last chunk and null before that or on abort
+    static Tuple<SharedPtr<Vector<String>>, Status> StageImportChunk(const infinity_thrift_rpc::ImportRequest &request);
+
     void Import(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::ImportRequest &request) final;
 
     void Export(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::ExportRequest &request) final;
@@ -181,6 +196,8 @@ private:
 
     static ConstantExpr *GetConstantFromProto(Status &status, const infinity_thrift_rpc::ConstantExpr &expr);
 
+    static Status GetInsertRowsFromColumnsProto(const infinity_thrift_rpc::InsertRequest &request, Vector<InsertRowExpr *> &insert_rows);
+
     static ColumnExpr *GetColumnExprFromProto(const infinity_thrift_rpc::ColumnExpr &column_expr);
 
     static FunctionExpr *GetFunctionExprFromProto(Status &status, const infinity_thrift_rpc::FunctionExpr &function_expr);
@@ -207,7 +224,8 @@ private:
 
     static ExplainType GetExplainTypeFromProto(const infinity_thrift_rpc::ExplainType::type &type);
 
-    static Tuple<void *, i64, Status> GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data);
+    static Tuple<void *, i64, Status> GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data,
+                                                                           EmbeddingDataType element_type);
 
     static Tuple<UpdateExpr *, Status> GetUpdateExprFromProto(const infinity_thrift_rpc::UpdateExpr &update_expr);
 
@@ -219,6 +237,8 @@ private:
 
     infinity_thrift_rpc::ElementType::type EmbeddingDataTypeToProtoElementType(const EmbeddingDataType &embedding_data_type);
 
+    void SelectRoundTripBatch(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::SelectRequest &request);
+
     void
     ProcessDataBlocks(const QueryResult &result, infinity_thrift_rpc::SelectResponse &response, Vector<infinity_thrift_rpc::ColumnField> &columns);
 
@@ -9235,6 +9235,9 @@ Return4:
     } else if (strcasecmp((yyvsp[0].str_value), "parquet") == 0) {
         (yyval.copy_option_t)->file_type_ = infinity::CopyFileType::kPARQUET;
         free((yyvsp[0].str_value));
+    } else if (strcasecmp((yyvsp[0].str_value), "arrow") == 0 || strcasecmp((yyvsp[0].str_value), "feather") == 0) {
+        (yyval.copy_option_t)->file_type_ = infinity::CopyFileType::kARROW;
+        free((yyvsp[0].str_value));
     } else {
         free((yyvsp[0].str_value));
         delete (yyval.copy_option_t);
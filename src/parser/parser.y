@@ -3877,6 +3877,9 @@ copy_option : FORMAT IDENTIFIER {
     } else if (strcasecmp($2, "parquet") == 0) {
         $$->file_type_ = infinity::CopyFileType::kPARQUET;
         free($2);
+    } else if (strcasecmp($2, "arrow") == 0 || strcasecmp($2, "feather") == 0) {
+        $$->file_type_ = infinity::CopyFileType::kARROW;
+        free($2);
     } else {
         free($2);
         delete $$;
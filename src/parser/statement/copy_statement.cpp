@@ -66,6 +66,10 @@ std::string CopyStatement::ToString() const {
             file_format = "PARQUET";
             break;
         }
+        case CopyFileType::kARROW: {
+            file_format = "ARROW";
+            break;
+        }
         case CopyFileType::kInvalid: {
             file_format = "Invalid";
             break;
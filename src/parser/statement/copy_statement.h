@@ -49,6 +49,8 @@ public:
 
     bool copy_from_{false};
     std::string file_path_{};
+    // import only: arrow IPC streams handed over in memory, read one after another instead of file_path_ when set
+    std::shared_ptr<std::vector<std::string>> data_{};
     std::string table_name_{};
     std::string schema_name_{};
     bool header_{false};
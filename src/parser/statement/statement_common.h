@@ -32,6 +32,7 @@ enum class CopyFileType {
     kCSR,
     kBVECS,
     kPARQUET,
+    kARROW,
     kInvalid,
 };
 
@@ -51,6 +52,8 @@ inline std::shared_ptr<std::string> CopyFileTypeToStr(CopyFileType copy_file_typ
             return std::make_shared<std::string>("BVECS");
         case CopyFileType::kPARQUET:
             return std::make_shared<std::string>("PARQUET");
+        case CopyFileType::kARROW:
+            return std::make_shared<std::string>("ARROW");
         case CopyFileType::kInvalid:
             return std::make_shared<std::string>("Invalid");
     }
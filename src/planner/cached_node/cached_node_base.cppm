@@ -35,6 +35,12 @@ public:
 
     virtual bool Eq(const CachedNodeBase &other) const { return type_ == other.type_; }
 
+    // The table whose commits make the cached result stale, empty if the node doesn't read a table.
+    virtual String table_key() const { return {}; }
+
+    // The commit timestamp of that table the result was computed at.
+    virtual TxnTimeStamp query_ts() const { return 0; }
+
     LogicalNodeType type() const { return type_; }
 
     SharedPtr<Vector<String>> output_names() const { return output_names_; }
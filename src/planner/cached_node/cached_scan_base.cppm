@@ -35,6 +35,12 @@ public:
 
     bool Eq(const CachedNodeBase &other) const override;
 
+    String table_key() const override { return TableKey(*schema_name_, *table_name_); }
+
+    TxnTimeStamp query_ts() const override { return query_ts_; }
+
+    static String TableKey(const String &schema_name, const String &table_name) { return schema_name + "." + table_name; }
+
     const String &schema_name() const { return *schema_name_; }
     const String &table_name() const { return *table_name_; }
 
@@ -896,6 +896,11 @@ Status ExplainAST::BuildCopy(const CopyStatement *copy_statement, SharedPtr<Vect
             result->emplace_back(file_type);
             break;
         }
+        case CopyFileType::kARROW: {
+            SharedPtr<String> file_type = MakeShared<String>(String(intent_size, ' ') + "file type: ARROW");
+            result->emplace_back(file_type);
+            break;
+        }
         case CopyFileType::kInvalid: {
             String error_message = "Invalid file type";
             UnrecoverableError(error_message);
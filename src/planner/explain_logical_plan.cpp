@@ -2379,6 +2379,11 @@ Status ExplainLogicalPlan::Explain(const LogicalImport *import_node, SharedPtr<V
             result->emplace_back(file_type);
             break;
         }
+        case CopyFileType::kARROW: {
+            SharedPtr<String> file_type = MakeShared<String>(fmt::format("{} - type: ARROW", String(intent_size, ' ')));
+            result->emplace_back(file_type);
+            break;
+        }
         case CopyFileType::kInvalid: {
             String error_message = "Invalid file type";
             UnrecoverableError(error_message);
@@ -2467,6 +2472,11 @@ Status ExplainLogicalPlan::Explain(const LogicalExport *export_node, SharedPtr<V
             result->emplace_back(file_type);
             break;
         }
+        case CopyFileType::kARROW: {
+            SharedPtr<String> file_type = MakeShared<String>(fmt::format("{} - type: ARROW", String(intent_size, ' ')));
+            result->emplace_back(file_type);
+            break;
+        }
         case CopyFileType::kInvalid: {
             String error_message = "Invalid file type";
             UnrecoverableError(error_message);
@@ -1003,7 +1003,8 @@ Status LogicalPlanner::BuildExport(const CopyStatement *statement, SharedPtr<Bin
         case CopyFileType::kJSONL:
         case CopyFileType::kFVECS:
         case CopyFileType::kCSV:
-        case CopyFileType::kPARQUET: {
+        case CopyFileType::kPARQUET:
+        case CopyFileType::kARROW: {
             break;
         }
         default: {
@@ -1173,9 +1174,14 @@ Status LogicalPlanner::BuildImport(const CopyStatement *statement, SharedPtr<Bin
         RecoverableError(status);
     }
 
-    // Check the file existence
-    String to_write_path;
-    if (!VirtualStore::Exists(statement->file_path_)) {
+    if (statement->data_.get() != nullptr) {
+        // Data handed over in memory, only arrow streams are read from memory
+        if (statement->copy_file_type_ != CopyFileType::kARROW) {
+            String file_type = *CopyFileTypeToStr(statement->copy_file_type_);
+            RecoverableError(Status::NotSupport(fmt::format("Importing file type: {} from memory isn't supported.", file_type)));
+        }
+    } else if (!VirtualStore::Exists(statement->file_path_)) {
+        // Check the file existence
         RecoverableError(Status::FileNotFound(statement->file_path_));
     }
 
@@ -1184,7 +1190,8 @@ Status LogicalPlanner::BuildImport(const CopyStatement *statement, SharedPtr<Bin
                                                                       statement->file_path_,
                                                                       statement->header_,
                                                                       statement->delimiter_,
-                                                                      statement->copy_file_type_);
+                                                                      statement->copy_file_type_,
+                                                                      statement->data_);
 
     this->logical_plan_ = logical_import;
     return Status::OK();
@@ -71,6 +71,10 @@ String LogicalExport::ToString(i64 &space) const {
             ss << "(PARQUET) ";
             break;
         }
+        case CopyFileType::kARROW: {
+            ss << "(ARROW) ";
+            break;
+        }
         case CopyFileType::kInvalid: {
             ss << "(Invalid) ";
             break;
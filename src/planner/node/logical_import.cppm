@@ -35,9 +35,10 @@ public:
                                   String file_path,
                                   bool header,
                                   char delimiter,
-                                  CopyFileType type)
+                                  CopyFileType type,
+                                  SharedPtr<Vector<String>> data)
         : LogicalNode(node_id, LogicalNodeType::kImport), table_info_(table_info), file_type_(type), file_path_(std::move(file_path)),
-          header_(header), delimiter_(delimiter) {}
+          data_(std::move(data)), header_(header), delimiter_(delimiter) {}
 
     [[nodiscard]] Vector<ColumnBinding> GetColumnBindings() const final;
 
@@ -55,6 +56,8 @@ public:
 
     [[nodiscard]] inline const String &file_path() const { return file_path_; }
 
+    [[nodiscard]] inline const SharedPtr<Vector<String>> &data() const { return data_; }
+
     [[nodiscard]] bool header() const { return header_; }
 
     [[nodiscard]] char delimiter() const { return delimiter_; }
@@ -63,6 +66,7 @@ private:
     SharedPtr<TableInfo> table_info_{};
     CopyFileType file_type_{CopyFileType::kInvalid};
     String file_path_{};
+    SharedPtr<Vector<String>> data_{};
     bool header_{false};
     char delimiter_{','};
 };
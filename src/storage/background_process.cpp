@@ -31,6 +31,7 @@ import third_party;
 import buffer_manager;
 import periodic_trigger;
 import infinity_context;
+import server_metrics;
 
 namespace infinity {
 
@@ -128,6 +129,7 @@ void BGTaskProcessor::Process() {
                             task_text_ = task->ToString();
                         }
 
+                        ScopedLatency checkpoint_latency(ServerMetrics::instance().BackgroundTask(BackgroundTaskMetric::kCheckpoint));
                         SizeT retry_count = 0;
                         while (true) {
                             bool success = true;
@@ -164,6 +166,7 @@ void BGTaskProcessor::Process() {
                             std::unique_lock<std::mutex> locker(task_mutex_);
                             task_text_ = task->ToString();
                         }
+                        ScopedLatency cleanup_latency(ServerMetrics::instance().BackgroundTask(BackgroundTaskMetric::kCleanup));
                         task->Execute();
                         LOG_DEBUG("Cleanup in background done");
                     }
@@ -33,12 +33,14 @@ import global_resource_usage;
 
 namespace infinity {
 
+// Share of the memory of a pool the protected segments of its caches may take.
+constexpr f64 kProtectedRatio = 0.8;
+
 void LRUCache::RemoveClean(const Vector<BufferObj *> &buffer_obj) {
     std::unique_lock lock(locker_);
     for (auto *buffer_obj : buffer_obj) {
         if (auto iter = gc_map_.find(buffer_obj); iter != gc_map_.end()) {
-            gc_list_.erase(iter->second);
-            gc_map_.erase(iter);
+            Erase(iter);
         }
     }
 }
@@ -48,52 +50,93 @@ SizeT LRUCache::WaitingGCObjectCount() {
     return gc_map_.size();
 }
 
-SizeT LRUCache::RequestSpace(SizeT need_space) {
-    SizeT free_space = 0;
+SizeT LRUCache::RequestSpace(SizeT need_space, bool protected_segment, SizeT &evict_count) {
     std::unique_lock lock(locker_);
-    auto iter = gc_list_.begin();
-    while (free_space < need_space && iter != gc_list_.end()) {
-        auto *buffer_obj = *iter;
-        // Free return false when the buffer is freed by cleanup
-        // will not dead lock because caller is in kNew or kFree state, and `buffer_obj` is in kUnloaded or state
-        if (buffer_obj->Free()) {
-            free_space += buffer_obj->GetBufferSize();
-            iter = gc_list_.erase(iter);
-            gc_map_.erase(buffer_obj);
-        } else {
-            ++iter;
-        }
-    }
-    return free_space;
+    return Evict(protected_segment ? protected_list_ : probation_list_, need_space, evict_count);
 }
 
-void LRUCache::PushGCQueue(BufferObj *buffer_obj) {
+void LRUCache::PushGCQueue(BufferObj *buffer_obj, bool reloaded) {
     std::unique_lock lock(locker_);
-    auto iter = gc_map_.find(buffer_obj);
-    if (iter != gc_map_.end()) {
-        gc_list_.erase(iter->second);
+    if (auto iter = gc_map_.find(buffer_obj); iter != gc_map_.end()) {
+        Erase(iter);
+    }
+    SizeT buffer_size = buffer_obj->GetBufferSize();
+    if (!reloaded) {
+        probation_list_.push_back(buffer_obj);
+        gc_map_[buffer_obj] = GCEntry{--probation_list_.end(), buffer_size, false};
+        return;
+    }
+    protected_list_.push_back(buffer_obj);
+    gc_map_[buffer_obj] = GCEntry{--protected_list_.end(), buffer_size, true};
+    protected_size_ += buffer_size;
+    while (protected_size_ > protected_capacity_) {
+        // the demoted buffer is the most recently used one of the probation segment
+        auto *demoted_obj = protected_list_.front();
+        protected_list_.pop_front();
+        probation_list_.push_back(demoted_obj);
+        GCEntry &entry = gc_map_[demoted_obj];
+        entry.iter_ = --probation_list_.end();
+        entry.protected_ = false;
+        protected_size_ -= entry.size_;
     }
-    gc_list_.push_back(buffer_obj);
-    gc_map_[buffer_obj] = --gc_list_.end();
 }
 
 bool LRUCache::RemoveFromGCQueue(BufferObj *buffer_obj) {
     std::unique_lock lock(locker_);
     if (auto iter = gc_map_.find(buffer_obj); iter != gc_map_.end()) {
-        gc_list_.erase(iter->second);
-        gc_map_.erase(iter);
+        Erase(iter);
         return true;
     }
     return false;
 }
 
+void LRUCache::Erase(HashMap<BufferObj *, GCEntry>::iterator map_iter) {
+    const GCEntry &entry = map_iter->second;
+    if (entry.protected_) {
+        protected_list_.erase(entry.iter_);
+        protected_size_ -= entry.size_;
+    } else {
+        probation_list_.erase(entry.iter_);
+    }
+    gc_map_.erase(map_iter);
+}
+
+SizeT LRUCache::Evict(List<BufferObj *> &gc_list, SizeT need_space, SizeT &evict_count) {
+    SizeT free_space = 0;
+    auto iter = gc_list.begin();
+    while (free_space < need_space && iter != gc_list.end()) {
+        auto *buffer_obj = *iter;
+        ++iter;
+        // Free return false when the buffer is freed by cleanup
+        // will not dead lock because caller is in kNew or kFree state, and `buffer_obj` is in kUnloaded or state
+        if (buffer_obj->Free()) {
+            free_space += buffer_obj->GetBufferSize();
+            ++evict_count;
+            Erase(gc_map_.find(buffer_obj));
+        }
+    }
+    return free_space;
+}
+
 BufferManager::BufferManager(u64 memory_limit,
                              SharedPtr<String> data_dir,
                              SharedPtr<String> temp_dir,
                              PersistenceManager *persistence_manager,
-                             SizeT lru_count)
+                             SizeT lru_count,
+                             const Vector<Pair<FileWorkerType, u64>> &pool_quotas)
     : data_dir_(std::move(data_dir)), temp_dir_(std::move(temp_dir)), memory_limit_(memory_limit), persistence_manager_(persistence_manager),
-      current_memory_size_(0), lru_caches_(lru_count) {
+      current_memory_size_(0), lru_count_(lru_count), lru_caches_(kFileWorkerTypeCount * lru_count) {
+    for (const auto &[file_type, quota] : pool_quotas) {
+        pools_[static_cast<SizeT>(file_type)].quota_ = quota;
+    }
+    for (SizeT type_idx = 0; type_idx < kFileWorkerTypeCount; ++type_idx) {
+        u64 quota = pools_[type_idx].quota_;
+        u64 pool_limit = quota == 0 ? memory_limit_ : std::min(quota, memory_limit_);
+        SizeT protected_capacity = static_cast<SizeT>(pool_limit * kProtectedRatio) / lru_count_;
+        for (SizeT i = 0; i < lru_count_; ++i) {
+            lru_caches_[type_idx * lru_count_ + i].SetProtectedCapacity(protected_capacity);
+        }
+    }
 #ifdef INFINITY_DEBUG
     GlobalResourceUsage::IncrObjectCount("BufferManager");
 #endif
@@ -221,32 +264,80 @@ Vector<BufferObjectInfo> BufferManager::GetBufferObjectsInfo() {
     return result;
 }
 
-bool BufferManager::RequestSpace(SizeT need_size) {
+Vector<BufferPoolInfo> BufferManager::GetBufferPoolsInfo() {
+    Vector<BufferPoolInfo> result;
+    for (SizeT type_idx = 0; type_idx < kFileWorkerTypeCount; ++type_idx) {
+        const BufferPool &pool = pools_[type_idx];
+        BufferPoolInfo buffer_pool_info;
+        buffer_pool_info.file_type_ = static_cast<FileWorkerType>(type_idx);
+        buffer_pool_info.memory_usage_ = pool.memory_usage_;
+        buffer_pool_info.quota_ = pool.quota_;
+        buffer_pool_info.request_count_ = pool.request_count_;
+        buffer_pool_info.cache_miss_count_ = pool.cache_miss_count_;
+        buffer_pool_info.evict_count_ = pool.evict_count_;
+        if (buffer_pool_info.request_count_ == 0 && buffer_pool_info.memory_usage_ == 0 && buffer_pool_info.quota_ == 0) {
+            continue;
+        }
+        result.emplace_back(buffer_pool_info);
+    }
+    return result;
+}
+
+bool BufferManager::RequestSpace(SizeT need_size, FileWorkerType file_type) {
     std::unique_lock lock(gc_locker_);
+    bool free_success = MakeRoom(need_size, file_type);
+    current_memory_size_ += need_size;
+    pools_[static_cast<SizeT>(file_type)].memory_usage_ += need_size;
+    return free_success;
+}
+
+SizeT BufferManager::Evict(SizeT need_size, SizeT cache_begin, SizeT cache_end) {
+    SizeT cache_count = cache_end - cache_begin;
     SizeT freed_space = 0;
-    const SizeT free_space = memory_limit_ - current_memory_size_;
-    if (free_space >= need_size) {
-        [[maybe_unused]] auto cur_mem_size = current_memory_size_.fetch_add(need_size);
-        return true;
+    auto evict_segment = [&](bool protected_segment) {
+        for (SizeT i = 0; i < cache_count && freed_space < need_size; ++i) {
+            SizeT cache_idx = cache_begin + (round_robin_ + i) % cache_count;
+            SizeT evict_count = 0;
+            SizeT freed = lru_caches_[cache_idx].RequestSpace(need_size - freed_space, protected_segment, evict_count);
+            if (evict_count == 0) {
+                continue;
+            }
+            BufferPool &pool = pools_[cache_idx / lru_count_];
+            pool.memory_usage_ -= freed;
+            pool.evict_count_ += evict_count;
+            current_memory_size_ -= freed;
+            evict_count_ += evict_count;
+            freed_space += freed;
+        }
+    };
+    evict_segment(false);
+    evict_segment(true);
+    ++round_robin_;
+    return freed_space;
+}
+
+bool BufferManager::MakeRoom(SizeT need_size, FileWorkerType file_type) {
+    SizeT type_idx = static_cast<SizeT>(file_type);
+    const BufferPool &pool = pools_[type_idx];
+    if (u64 pool_usage = pool.memory_usage_ + need_size; pool.quota_ != 0 && pool_usage > pool.quota_) {
+        Evict(pool_usage - pool.quota_, type_idx * lru_count_, (type_idx + 1) * lru_count_);
     }
-    SizeT round_robin = round_robin_;
-    do {
-        freed_space += lru_caches_[round_robin_].RequestSpace(need_size);
-        round_robin_ = (round_robin_ + 1) % lru_caches_.size();
-    } while (freed_space + free_space < need_size && round_robin_ != round_robin);
-    bool free_success = freed_space + free_space >= need_size;
-    [[maybe_unused]] auto cur_mem_size = current_memory_size_.fetch_add(need_size - freed_space); // It's ok to add minus value
-    return free_success;
+    if (u64 mem_usage = current_memory_size_ + need_size; mem_usage > memory_limit_) {
+        Evict(mem_usage - memory_limit_, 0, lru_caches_.size());
+    }
+    return current_memory_size_ + need_size <= memory_limit_;
 }
 
-void BufferManager::PushGCQueue(BufferObj *buffer_obj) {
+void BufferManager::PushGCQueue(BufferObj *buffer_obj, bool reloaded) {
     SizeT idx = LRUIdx(buffer_obj);
-    lru_caches_[idx].PushGCQueue(buffer_obj);
-
-    if (auto mem_usage = memory_usage(); mem_usage > memory_limit_) {
-        SizeT need_size = mem_usage - memory_limit_;
-        // caller buffer obj is in kLoad state, and RequestSpace will lock those in kNew or kFree state, so no dead lock
-        RequestSpace(need_size);
+    lru_caches_[idx].PushGCQueue(buffer_obj, reloaded);
+
+    FileWorkerType file_type = buffer_obj->file_worker()->Type();
+    const BufferPool &pool = pools_[static_cast<SizeT>(file_type)];
+    if (memory_usage() > memory_limit_ || (pool.quota_ != 0 && pool.memory_usage_ > pool.quota_)) {
+        // caller buffer obj is in kLoad state, and Evict will lock those in kNew or kFree state, so no dead lock
+        std::unique_lock lock(gc_locker_);
+        MakeRoom(0, file_type);
     }
 }
 
@@ -262,6 +353,7 @@ void BufferManager::AddToCleanList(BufferObj *buffer_obj, bool do_free) {
     }
     if (do_free) {
         SizeT buffer_size = buffer_obj->GetBufferSize();
+        pools_[static_cast<SizeT>(buffer_obj->file_worker()->Type())].memory_usage_ -= buffer_size;
         [[maybe_unused]] auto memory_size = current_memory_size_.fetch_sub(buffer_size);
         if (memory_size < buffer_size) {
             UnrecoverableError(fmt::format("BufferManager::AddToCleanList: memory_size < buffer_size: {} < {}", memory_size, buffer_size));
@@ -275,6 +367,7 @@ void BufferManager::AddToCleanList(BufferObj *buffer_obj, bool do_free) {
 
 void BufferManager::FreeUnloadBuffer(BufferObj *buffer_obj) {
     SizeT buffer_size = buffer_obj->GetBufferSize();
+    pools_[static_cast<SizeT>(buffer_obj->file_worker()->Type())].memory_usage_ -= buffer_size;
     [[maybe_unused]] auto memory_size = current_memory_size_.fetch_sub(buffer_size);
     if (memory_size < buffer_size) {
         UnrecoverableError(fmt::format("BufferManager::FreeUnloadBuffer: memory_size < buffer_size: {} < {}", memory_size, buffer_size));
@@ -316,7 +409,7 @@ void BufferManager::MoveTemp(BufferObj *buffer_obj) {
 
 SizeT BufferManager::LRUIdx(BufferObj *buffer_obj) const {
     auto id = buffer_obj->id();
-    return id % lru_caches_.size();
+    return static_cast<SizeT>(buffer_obj->file_worker()->Type()) * lru_count_ + id % lru_count_;
 }
 
 UniquePtr<BufferObj> BufferManager::MakeBufferObj(UniquePtr<FileWorker> file_worker, bool is_ephemeral) {
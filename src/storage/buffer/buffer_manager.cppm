@@ -19,6 +19,7 @@ import file_worker;
 // import specific_concurrent_queue;
 import default_values;
 import persistence_manager;
+import file_worker_type;
 
 export module buffer_manager;
 
@@ -27,23 +28,54 @@ namespace infinity {
 class BufferObj;
 class BufferObjectInfo;
 
+// Segmented LRU of the unloaded buffers. A buffer unloaded after its first load since it was read waits in the probation
+// segment, a buffer loaded again moves to the protected segment. The probation segment is evicted first, so a scan
+// touching every block once can't push out the buffers loaded over and over, like HNSW graphs and BMP indexes.
+// Beyond protected_capacity the oldest protected buffers are moved back to the probation segment.
 class LRUCache {
 public:
+    void SetProtectedCapacity(SizeT protected_capacity) { protected_capacity_ = protected_capacity; }
+
     void RemoveClean(const Vector<BufferObj *> &buffer_obj);
 
     SizeT WaitingGCObjectCount();
 
-    SizeT RequestSpace(SizeT need_space);
+    // Frees unloaded buffers of the probation segment, or of the protected segment if protected_segment is set, until
+    // need_space is freed, evict_count is the number of buffers freed.
+    SizeT RequestSpace(SizeT need_space, bool protected_segment, SizeT &evict_count);
 
-    void PushGCQueue(BufferObj *buffer_obj);
+    void PushGCQueue(BufferObj *buffer_obj, bool reloaded);
 
     bool RemoveFromGCQueue(BufferObj *buffer_obj);
 
 private:
-    std::mutex locker_{};
     using GCListIter = List<BufferObj *>::iterator;
-    HashMap<BufferObj *, GCListIter> gc_map_{};
-    List<BufferObj *> gc_list_{};
+    struct GCEntry {
+        GCListIter iter_;
+        SizeT size_{};
+        bool protected_{};
+    };
+
+    void Erase(HashMap<BufferObj *, GCEntry>::iterator map_iter);
+
+    SizeT Evict(List<BufferObj *> &gc_list, SizeT need_space, SizeT &evict_count);
+
+    std::mutex locker_{};
+    HashMap<BufferObj *, GCEntry> gc_map_{};
+    List<BufferObj *> probation_list_{};
+    List<BufferObj *> protected_list_{};
+    SizeT protected_size_{};
+    SizeT protected_capacity_{};
+};
+
+export struct BufferPoolInfo {
+    FileWorkerType file_type_{FileWorkerType::kInvalid};
+    u64 memory_usage_{};
+    // 0 if the pool has no quota of its own
+    u64 quota_{};
+    u64 request_count_{};
+    u64 cache_miss_count_{};
+    u64 evict_count_{};
 };
 
 export class BufferManager {
@@ -52,7 +84,8 @@ public:
                            SharedPtr<String> data_dir,
                            SharedPtr<String> temp_dir,
                            PersistenceManager *persistence_manager,
-                           SizeT lru_count = DEFAULT_BUFFER_MANAGER_LRU_COUNT);
+                           SizeT lru_count = DEFAULT_BUFFER_MANAGER_LRU_COUNT,
+                           const Vector<Pair<FileWorkerType, u64>> &pool_quotas = {});
 
     ~BufferManager();
 
@@ -87,25 +120,44 @@ public:
 
     inline PersistenceManager *persistence_manager() const { return persistence_manager_; }
 
-    inline void AddRequestCount() { ++total_request_count_; }
-    inline void AddCacheMissCount() { ++cache_miss_count_; }
+    inline void AddRequestCount(FileWorkerType file_type) {
+        ++total_request_count_;
+        ++pools_[static_cast<SizeT>(file_type)].request_count_;
+    }
+    inline void AddCacheMissCount(FileWorkerType file_type) {
+        ++cache_miss_count_;
+        ++pools_[static_cast<SizeT>(file_type)].cache_miss_count_;
+    }
     inline u64 TotalRequestCount() { return total_request_count_; }
     inline u64 CacheMissCount() { return cache_miss_count_; }
+    inline u64 EvictCount() { return evict_count_; }
+
+    // The pools that were ever used or have a quota.
+    Vector<BufferPoolInfo> GetBufferPoolsInfo();
 
 private:
     friend class BufferObj;
 
     // BufferHandle calls it, before allocate memory. It will start GC if necessary.
     // Return whether need_size is freed successfully.
-    bool RequestSpace(SizeT need_size);
+    // A pool over its quota frees its own buffers first, the quota is soft: loaded buffers are never freed.
+    bool RequestSpace(SizeT need_size, FileWorkerType file_type);
 
     // BufferHandle calls it, after unload.
-    void PushGCQueue(BufferObj *buffer_obj);
+    void PushGCQueue(BufferObj *buffer_obj, bool reloaded);
 
     bool RemoveFromGCQueue(BufferObj *buffer_obj);
 
     void AddToCleanList(BufferObj *buffer_obj, bool do_free);
 
+    // Frees unloaded buffers of the caches in [cache_begin, cache_end) until need_size is freed, the probation segments
+    // first. gc_locker_ must be held.
+    SizeT Evict(SizeT need_size, SizeT cache_begin, SizeT cache_end);
+
+    // Frees unloaded buffers until need_size more fits in the pool of file_type and in memory_limit_, return whether it
+    // fits. gc_locker_ must be held.
+    bool MakeRoom(SizeT need_size, FileWorkerType file_type);
+
     void FreeUnloadBuffer(BufferObj *buffer_obj);
 
     void AddTemp(BufferObj *buffer_obj);
@@ -130,9 +182,20 @@ private:
     Atomic<u32> buffer_id_{};
 
     std::mutex gc_locker_{};
+    // lru_count_ caches for each file worker type, the caches of a type are its pool
+    SizeT lru_count_{};
     Vector<LRUCache> lru_caches_{};
     SizeT round_robin_{};
 
+    struct BufferPool {
+        Atomic<u64> memory_usage_{};
+        u64 quota_{};
+        Atomic<u64> request_count_{};
+        Atomic<u64> cache_miss_count_{};
+        Atomic<u64> evict_count_{};
+    };
+    Array<BufferPool, kFileWorkerTypeCount> pools_{};
+
     std::mutex clean_locker_{};
     Vector<BufferObj *> clean_list_{};
 
@@ -142,6 +205,7 @@ private:
 
     Atomic<u64> total_request_count_{0};
     Atomic<u64> cache_miss_count_{0};
+    Atomic<u64> evict_count_{0};
 };
 
 } // namespace infinity
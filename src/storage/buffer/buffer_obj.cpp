@@ -68,7 +68,7 @@ void BufferObj::UpdateFileWorkerInfo(UniquePtr<FileWorker> new_file_worker) {
 }
 
 BufferHandle BufferObj::Load() {
-    buffer_mgr_->AddRequestCount();
+    buffer_mgr_->AddRequestCount(file_worker_->Type());
     std::unique_lock<std::mutex> locker(w_locker_);
     if (type_ == BufferType::kMmap) {
         switch (status_) {
@@ -100,11 +100,12 @@ BufferHandle BufferObj::Load() {
                 String error_message = fmt::format("attempt to buffer: {} status is UNLOADED, but not in GC queue", GetFilename());
                 UnrecoverableError(error_message);
             }
+            reloaded_ = true;
             break;
         }
         case BufferStatus::kFreed: {
-            buffer_mgr_->AddCacheMissCount();
-            bool free_success = buffer_mgr_->RequestSpace(GetBufferSize());
+            buffer_mgr_->AddCacheMissCount(file_worker_->Type());
+            bool free_success = buffer_mgr_->RequestSpace(GetBufferSize(), file_worker_->Type());
             if (!free_success) {
                 String error_message = "Out of memory.";
                 UnrecoverableError(error_message);
@@ -115,18 +116,20 @@ BufferHandle BufferObj::Load() {
             }
             bool from_spill = type_ != BufferType::kPersistent;
             file_worker_->ReadFromFile(from_spill);
+            reloaded_ = false;
             break;
         }
         case BufferStatus::kNew: {
-            buffer_mgr_->AddCacheMissCount();
+            buffer_mgr_->AddCacheMissCount(file_worker_->Type());
             LOG_TRACE(fmt::format("Request memory {}", GetBufferSize()));
-            bool free_success = buffer_mgr_->RequestSpace(GetBufferSize());
+            bool free_success = buffer_mgr_->RequestSpace(GetBufferSize(), file_worker_->Type());
             if (!free_success) {
                 String error_message = "Out of memory.";
                 UnrecoverableError(error_message);
             }
             file_worker_->AllocateInMemory();
             LOG_TRACE(fmt::format("Allocated memory {}", GetBufferSize()));
+            reloaded_ = false;
             break;
         }
         default: {
@@ -322,7 +325,7 @@ void *BufferObj::GetMutPointer() {
     if (type_ == BufferType::kTemp) {
         buffer_mgr_->RemoveTemp(this);
     } else if (type_ == BufferType::kMmap) {
-        bool free_success = buffer_mgr_->RequestSpace(GetBufferSize());
+        bool free_success = buffer_mgr_->RequestSpace(GetBufferSize(), file_worker_->Type());
         if (!free_success) {
             String error_message = "Out of memory.";
             UnrecoverableError(error_message);
@@ -350,7 +353,7 @@ void BufferObj::UnloadInner() {
             file_worker_->MmapNotNeed();
             status_ = BufferStatus::kUnloaded;
         } else {
-            buffer_mgr_->PushGCQueue(this);
+            buffer_mgr_->PushGCQueue(this, reloaded_);
             status_ = BufferStatus::kUnloaded;
         }
     }
@@ -361,7 +364,7 @@ bool BufferObj::AddBufferSize(SizeT add_size) {
         UnrecoverableError("Invalid file worker type");
     }
 
-    bool free_success = buffer_mgr_->RequestSpace(add_size);
+    bool free_success = buffer_mgr_->RequestSpace(add_size, FileWorkerType::kVarFile);
     if (!free_success) {
         String warn_msg = fmt::format("Request memory {} failed, current memory usage: {}", add_size, buffer_mgr_->memory_usage());
         LOG_WARN(warn_msg);
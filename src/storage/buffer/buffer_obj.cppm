@@ -159,6 +159,8 @@ protected:
     BufferStatus status_{BufferStatus::kNew};
     BufferType type_{BufferType::kTemp};
     u64 rc_{0};
+    // whether the buffer was loaded again since it was last read or allocated, decides its segment in the LRU cache
+    bool reloaded_{false};
     UniquePtr<FileWorker> file_worker_;
 
 private:
@@ -78,4 +78,19 @@ export String FileWorkerType2Str(FileWorkerType type) {
     return error_message;
 }
 
+export constexpr SizeT kFileWorkerTypeCount = static_cast<SizeT>(FileWorkerType::kInvalid);
+
+// Names of the buffer pools of each file worker type, as written in the buffer_manager_quota option.
+export constexpr Array<std::string_view, kFileWorkerTypeCount> kBufferPoolNames = {
+    "data", "var", "ivf", "hnsw", "raw", "secondary", "version", "index", "emvb", "bmp"};
+
+export FileWorkerType BufferPoolNameToFileWorkerType(const String &pool_name) {
+    for (SizeT i = 0; i < kFileWorkerTypeCount; ++i) {
+        if (kBufferPoolNames[i] == pool_name) {
+            return static_cast<FileWorkerType>(i);
+        }
+    }
+    return FileWorkerType::kInvalid;
+}
+
 } // namespace infinity
@@ -46,6 +46,7 @@ import default_values;
 import wal_manager;
 import global_resource_usage;
 import txn_state;
+import server_metrics;
 
 namespace infinity {
 
@@ -241,6 +242,7 @@ void CompactionProcessor::Process() {
                     }
                     if (storage_mode == StorageMode::kWritable) {
                         LOG_DEBUG("Do compact start.");
+                        ScopedLatency compact_latency(ServerMetrics::instance().BackgroundTask(BackgroundTaskMetric::kCompact));
                         DoCompact();
                         LOG_DEBUG("Do compact end.");
                     }
@@ -253,6 +255,7 @@ void CompactionProcessor::Process() {
                     }
                     if (storage_mode == StorageMode::kWritable) {
                         LOG_DEBUG("Optimize start.");
+                        ScopedLatency optimize_latency(ServerMetrics::instance().BackgroundTask(BackgroundTaskMetric::kOptimize));
                         ScanAndOptimize();
                         LOG_DEBUG("Optimize done.");
                     }
@@ -267,6 +270,7 @@ void CompactionProcessor::Process() {
                         auto dump_task = static_cast<DumpIndexTask *>(bg_task.get());
                         LOG_DEBUG(dump_task->ToString());
                         // Trigger transaction to save the mem index
+                        ScopedLatency dump_latency(ServerMetrics::instance().BackgroundTask(BackgroundTaskMetric::kDumpIndex));
                         DoDump(dump_task);
                         LOG_DEBUG("Dump index done.");
                     }
@@ -54,76 +54,313 @@ UniquePtr<CacheContent> CacheContent::Clone() const {
     return MakeUnique<CacheContent>(std::move(data_blocks), column_names_);
 }
 
+ResultCachePolicy ResultCachePolicyFromString(const String &policy_str) {
+    String policy = policy_str;
+    ToLower(policy);
+    if (policy == "lru") {
+        return ResultCachePolicy::kLRU;
+    }
+    if (policy == "lfu") {
+        return ResultCachePolicy::kLFU;
+    }
+    if (policy == "tinylfu") {
+        return ResultCachePolicy::kTinyLFU;
+    }
+    return ResultCachePolicy::kInvalid;
+}
+
+String ResultCachePolicyToString(ResultCachePolicy policy) {
+    switch (policy) {
+        case ResultCachePolicy::kLRU:
+            return "lru";
+        case ResultCachePolicy::kLFU:
+            return "lfu";
+        case ResultCachePolicy::kTinyLFU:
+            return "tinylfu";
+        case ResultCachePolicy::kInvalid:
+            break;
+    }
+    return "invalid";
+}
+
+namespace {
+
+SizeT ContentSize(const Vector<UniquePtr<DataBlock>> &data_blocks) {
+    SizeT memory_size = 0;
+    for (const auto &data_block : data_blocks) {
+        if (data_block->Finalized()) {
+            memory_size += data_block->GetSizeInBytes();
+        }
+    }
+    return memory_size;
+}
+
+} // namespace
+
+FrequencySketch::FrequencySketch(SizeT capacity) {
+    SizeT width = 64;
+    while (width < capacity && width < (1ul << 20)) {
+        width <<= 1;
+    }
+    width_mask_ = width - 1;
+    counters_.resize(kDepth * width);
+    sample_size_ = 10 * width;
+}
+
+SizeT FrequencySketch::Index(u64 hash, SizeT row) const {
+    static constexpr u64 kSeeds[kDepth] = {0x97cb3127ull, 0xab0b6c17ull, 0x4a0bd67bull, 0xe8f0f8f3ull};
+    u64 h = (hash + kSeeds[row]) * 0x9e3779b97f4a7c15ull;
+    h ^= h >> 32;
+    return row * (width_mask_ + 1) + (h & width_mask_);
+}
+
+void FrequencySketch::Increment(u64 hash) {
+    for (SizeT row = 0; row < kDepth; ++row) {
+        u8 &counter = counters_[Index(hash, row)];
+        if (counter < 15) {
+            ++counter;
+        }
+    }
+    if (++additions_ >= sample_size_) {
+        Reset();
+    }
+}
+
+u32 FrequencySketch::Estimate(u64 hash) const {
+    u32 estimate = 15;
+    for (SizeT row = 0; row < kDepth; ++row) {
+        estimate = std::min<u32>(estimate, counters_[Index(hash, row)]);
+    }
+    return estimate;
+}
+
+void FrequencySketch::Reset() {
+    for (u8 &counter : counters_) {
+        counter >>= 1;
+    }
+    additions_ >>= 1;
+}
+
+CacheResultMap::CacheResultMap(SizeT cache_num_capacity, SizeT cache_memory_capacity, ResultCachePolicy policy)
+    : cache_num_capacity_(cache_num_capacity), cache_memory_capacity_(cache_memory_capacity), policy_(policy), sketch_(cache_num_capacity) {}
+
+CacheResultMap::EvictKey CacheResultMap::GetEvictKey(const CacheEntry &entry) const {
+    return {policy_ == ResultCachePolicy::kLFU ? entry.frequency_ : 0, entry.last_access_};
+}
+
+void CacheResultMap::Touch(CacheEntry &entry) {
+    evict_order_.erase(GetEvictKey(entry));
+    ++entry.frequency_;
+    entry.last_access_ = ++access_clock_;
+    evict_order_.emplace(GetEvictKey(entry), &entry);
+}
+
+void CacheResultMap::RemoveEntry(CacheEntry *entry) {
+    evict_order_.erase(GetEvictKey(*entry));
+    if (!entry->table_key_.empty()) {
+        auto table_iter = table_entries_.find(entry->table_key_);
+        table_iter->second.erase(entry);
+        if (table_iter->second.empty()) {
+            table_entries_.erase(table_iter);
+        }
+    }
+    memory_used_ -= entry->memory_size_;
+    auto mp_iter = cache_map_.find(entry->cached_node_.get());
+    if (mp_iter == cache_map_.end()) {
+        UnrecoverableError("Failed to remove cache entry from cache_map_");
+    }
+    cache_map_.erase(mp_iter);
+}
+
+void CacheResultMap::InvalidateTable(const String &table_key, TxnTimeStamp query_ts) {
+    if (table_key.empty()) {
+        return;
+    }
+    TxnTimeStamp &table_query_ts = table_query_ts_[table_key];
+    if (query_ts <= table_query_ts) {
+        return;
+    }
+    table_query_ts = query_ts;
+    auto table_iter = table_entries_.find(table_key);
+    if (table_iter == table_entries_.end()) {
+        return;
+    }
+    Vector<CacheEntry *> stale_entries;
+    for (CacheEntry *entry : table_iter->second) {
+        if (entry->cached_node_->query_ts() < query_ts) {
+            stale_entries.push_back(entry);
+        }
+    }
+    for (CacheEntry *entry : stale_entries) {
+        RemoveEntry(entry);
+    }
+    stats_.invalidations_ += stale_entries.size();
+}
+
+bool CacheResultMap::OverCapacity(SizeT extra_num, SizeT extra_memory) const {
+    return cache_map_.size() + extra_num > cache_num_capacity_ || memory_used_ + extra_memory > cache_memory_capacity_;
+}
+
 bool CacheResultMap::AddCache(
     UniquePtr<CachedNodeBase> cached_node,
     Vector<UniquePtr<DataBlock>> data_blocks,
     const std::function<void(UniquePtr<CachedNodeBase>, CacheContent &, Vector<UniquePtr<DataBlock>>)> &update_content_func) {
     std::lock_guard<std::mutex> lock(mtx_);
-    auto mp_iter = lru_map_.find(cached_node.get());
-    if (mp_iter != lru_map_.end()) {
-        CacheContent &old_content = *mp_iter->second->cache_content_;
-        update_content_func(std::move(cached_node), old_content, std::move(data_blocks));
+    String table_key = cached_node->table_key();
+    if (!table_key.empty()) {
+        // computed before the last commit of the table another query has seen, no later query can hit it
+        auto ts_iter = table_query_ts_.find(table_key);
+        if (ts_iter != table_query_ts_.end() && cached_node->query_ts() < ts_iter->second) {
+            ++stats_.rejections_;
+            return false;
+        }
+        InvalidateTable(table_key, cached_node->query_ts());
+    }
+    auto mp_iter = cache_map_.find(cached_node.get());
+    if (mp_iter != cache_map_.end()) {
+        CacheEntry &entry = *mp_iter->second;
+        update_content_func(std::move(cached_node), *entry.cache_content_, std::move(data_blocks));
+        memory_used_ -= entry.memory_size_;
+        entry.memory_size_ = ContentSize(entry.cache_content_->data_blocks_);
+        memory_used_ += entry.memory_size_;
+        Touch(entry);
+        while (OverCapacity(0, 0)) {
+            RemoveEntry(evict_order_.begin()->second);
+            ++stats_.evictions_;
+        }
         return false;
     }
-    if (lru_list_.size() >= cache_num_capacity_) {
-        LRUEntry &envict_entry = lru_list_.back();
-        SizeT remove_n = lru_map_.erase(envict_entry.cached_node_.get());
-        if (remove_n != 1) {
-            UnrecoverableError("Failed to remove cache entry from lru_map_");
+    SizeT memory_size = ContentSize(data_blocks);
+    if (cache_num_capacity_ == 0 || memory_size > cache_memory_capacity_) {
+        ++stats_.rejections_;
+        return false;
+    }
+    if (policy_ == ResultCachePolicy::kTinyLFU && OverCapacity(1, memory_size)) {
+        // admit the new entry only if it is looked up more often than every entry it would evict
+        u32 frequency = sketch_.Estimate(cached_node->Hash());
+        SizeT cache_num = cache_map_.size();
+        SizeT memory_used = memory_used_;
+        for (auto iter = evict_order_.begin(); iter != evict_order_.end(); ++iter) {
+            if (cache_num + 1 <= cache_num_capacity_ && memory_used + memory_size <= cache_memory_capacity_) {
+                break;
+            }
+            const CacheEntry &victim = *iter->second;
+            if (sketch_.Estimate(victim.cached_node_->Hash()) >= frequency) {
+                ++stats_.rejections_;
+                return false;
+            }
+            --cache_num;
+            memory_used -= victim.memory_size_;
         }
-        lru_list_.pop_back();
     }
-    auto *cached_node_ptr = cached_node.get();
-    auto cache_content = MakeShared<CacheContent>(std::move(data_blocks), cached_node->output_names());
-    lru_list_.emplace_front(std::move(cached_node), cache_content);
-    lru_map_.emplace_hint(mp_iter, cached_node_ptr, lru_list_.begin());
+    while (OverCapacity(1, memory_size)) {
+        RemoveEntry(evict_order_.begin()->second);
+        ++stats_.evictions_;
+    }
+
+    auto entry = MakeUnique<CacheEntry>();
+    entry->cache_content_ = MakeShared<CacheContent>(std::move(data_blocks), cached_node->output_names());
+    entry->table_key_ = std::move(table_key);
+    entry->memory_size_ = memory_size;
+    entry->frequency_ = 1;
+    entry->last_access_ = ++access_clock_;
+    entry->cached_node_ = std::move(cached_node);
+    CacheEntry *entry_ptr = entry.get();
+    if (!entry_ptr->table_key_.empty()) {
+        table_entries_[entry_ptr->table_key_].insert(entry_ptr);
+    }
+    evict_order_.emplace(GetEvictKey(*entry_ptr), entry_ptr);
+    memory_used_ += memory_size;
+    cache_map_.emplace(entry_ptr->cached_node_.get(), std::move(entry));
     return true;
 }
 
 SharedPtr<CacheContent> CacheResultMap::GetCache(const CachedNodeBase &cached_node) {
     std::lock_guard<std::mutex> lock(mtx_);
-    auto mp_iter = lru_map_.find(&cached_node);
-    if (mp_iter == lru_map_.end()) {
+    sketch_.Increment(cached_node.Hash());
+    InvalidateTable(cached_node.table_key(), cached_node.query_ts());
+    auto mp_iter = cache_map_.find(&cached_node);
+    if (mp_iter == cache_map_.end()) {
+        ++stats_.misses_;
         return nullptr;
     }
-    auto iter = mp_iter->second;
-    lru_list_.splice(lru_list_.begin(), lru_list_, iter);
-    return iter->cache_content_;
+    ++stats_.hits_;
+    CacheEntry &entry = *mp_iter->second;
+    Touch(entry);
+    return entry.cache_content_;
 }
 
 SizeT CacheResultMap::DropIF(std::function<bool(const CachedNodeBase &)> pred) {
     std::lock_guard<std::mutex> lock(mtx_);
-    SizeT removed = 0;
-    for (auto mp_iter = lru_map_.begin(); mp_iter != lru_map_.end();) {
-        const auto &[cached_node, iter] = *mp_iter;
+    Vector<CacheEntry *> drop_entries;
+    for (const auto &[cached_node, entry] : cache_map_) {
         if (pred(*cached_node)) {
-            lru_list_.erase(iter);
-            mp_iter = lru_map_.erase(mp_iter);
-            ++removed;
-        } else {
-            ++mp_iter;
+            drop_entries.push_back(entry.get());
         }
     }
-    return removed;
+    for (CacheEntry *entry : drop_entries) {
+        RemoveEntry(entry);
+    }
+    return drop_entries.size();
+}
+
+SizeT CacheResultMap::DropTable(const String &table_key) {
+    std::lock_guard<std::mutex> lock(mtx_);
+    table_query_ts_.erase(table_key);
+    auto table_iter = table_entries_.find(table_key);
+    if (table_iter == table_entries_.end()) {
+        return 0;
+    }
+    Vector<CacheEntry *> drop_entries(table_iter->second.begin(), table_iter->second.end());
+    for (CacheEntry *entry : drop_entries) {
+        RemoveEntry(entry);
+    }
+    stats_.invalidations_ += drop_entries.size();
+    return drop_entries.size();
 }
 
 void CacheResultMap::ResetCacheNumCapacity(SizeT cache_num_capacity) {
     std::lock_guard<std::mutex> lock(mtx_);
     cache_num_capacity_ = cache_num_capacity;
-    while (lru_list_.size() > cache_num_capacity_) {
-        LRUEntry &envict_entry = lru_list_.back();
-        SizeT remove_n = lru_map_.erase(envict_entry.cached_node_.get());
-        if (remove_n != 1) {
-            UnrecoverableError("Failed to remove cache entry from lru_map_");
-        }
-        lru_list_.pop_back();
+    while (OverCapacity(0, 0)) {
+        RemoveEntry(evict_order_.begin()->second);
+        ++stats_.evictions_;
+    }
+}
+
+void CacheResultMap::ResetCacheMemoryCapacity(SizeT cache_memory_capacity) {
+    std::lock_guard<std::mutex> lock(mtx_);
+    cache_memory_capacity_ = cache_memory_capacity;
+    while (OverCapacity(0, 0)) {
+        RemoveEntry(evict_order_.begin()->second);
+        ++stats_.evictions_;
+    }
+}
+
+void CacheResultMap::ResetPolicy(ResultCachePolicy policy) {
+    std::lock_guard<std::mutex> lock(mtx_);
+    policy_ = policy;
+    evict_order_.clear();
+    for (const auto &[cached_node, entry] : cache_map_) {
+        evict_order_.emplace(GetEvictKey(*entry), entry.get());
     }
 }
 
 void CacheResultMap::ClearCache() {
     std::lock_guard<std::mutex> lock(mtx_);
-    lru_list_.clear();
-    lru_map_.clear();
+    evict_order_.clear();
+    table_entries_.clear();
+    table_query_ts_.clear();
+    cache_map_.clear();
+    memory_used_ = 0;
+}
+
+ResultCacheStats CacheResultMap::Stats() {
+    std::lock_guard<std::mutex> lock(mtx_);
+    ResultCacheStats stats = stats_;
+    stats.cache_num_used_ = cache_map_.size();
+    stats.memory_used_ = memory_used_;
+    return stats;
 }
 
 bool ResultCacheManager::AddCache(UniquePtr<CachedNodeBase> cached_node, Vector<UniquePtr<DataBlock>> data_blocks) {
@@ -177,18 +414,7 @@ Optional<CacheOutput> ResultCacheManager::GetCache(const CachedNodeBase &cached_
 }
 
 SizeT ResultCacheManager::DropTable(const String &schema_name, const String &table_name) {
-    auto pred = [&](const CachedNodeBase &cached_node_base) {
-        switch (cached_node_base.type()) {
-            case LogicalNodeType::kMatch: {
-                const auto &cached_scan_base = static_cast<const CachedScanBase &>(cached_node_base);
-                return cached_scan_base.schema_name() == schema_name && cached_scan_base.table_name() == table_name;
-            }
-            default: {
-                return false;
-            }
-        }
-    };
-    return cache_map_.DropIF(pred);
+    return cache_map_.DropTable(CachedScanBase::TableKey(schema_name, table_name));
 }
 
 } // namespace infinity
\ No newline at end of file
@@ -47,7 +47,57 @@ export struct CacheOutput {
     Vector<SizeT> column_map_;
 };
 
-class CacheResultMap {
+// How the result cache picks the entry to evict when it is over its entry count or byte budget:
+// kLRU evicts the least recently used entry, kLFU the least frequently used one (the least recently used among equals),
+// kTinyLFU evicts like kLRU but admits a new entry only if it was looked up more often than the entries it would evict,
+// so a burst of one-off queries can't flush the hot results.
+export enum class ResultCachePolicy : u8 {
+    kLRU,
+    kLFU,
+    kTinyLFU,
+    kInvalid,
+};
+
+export ResultCachePolicy ResultCachePolicyFromString(const String &policy_str);
+
+export String ResultCachePolicyToString(ResultCachePolicy policy);
+
+export struct ResultCacheStats {
+    u64 hits_{};
+    u64 misses_{};
+    u64 evictions_{};
+    // entries dropped because their table committed after they were computed, or was dropped
+    u64 invalidations_{};
+    // results not cached, because they were larger than the byte budget or lost the TinyLFU admission
+    u64 rejections_{};
+    SizeT cache_num_used_{};
+    SizeT memory_used_{};
+};
+
+// Count-min sketch of how often each key was looked up, with 4 bit saturating counters that are halved every
+// 10 * width additions so the estimate follows the recent access pattern.
+export class FrequencySketch {
+public:
+    explicit FrequencySketch(SizeT capacity);
+
+    void Increment(u64 hash);
+
+    u32 Estimate(u64 hash) const;
+
+private:
+    static constexpr SizeT kDepth = 4;
+
+    SizeT Index(u64 hash, SizeT row) const;
+
+    void Reset();
+
+    SizeT width_mask_{};
+    Vector<u8> counters_{};
+    SizeT additions_{};
+    SizeT sample_size_{};
+};
+
+export class CacheResultMap {
 public:
     struct CachedLogicalMatchBaseHash {
         using is_transparent = std::true_type;
@@ -61,7 +111,7 @@ public:
         bool operator()(const CachedNodeBase *key1, const CachedNodeBase *key2) const { return key1->Eq(*key2); }
     };
 
-    CacheResultMap(SizeT cache_num_capacity) : cache_num_capacity_(cache_num_capacity) {}
+    CacheResultMap(SizeT cache_num_capacity, SizeT cache_memory_capacity, ResultCachePolicy policy);
 
     bool AddCache(UniquePtr<CachedNodeBase> cached_node,
                   Vector<UniquePtr<DataBlock>> data_blocks,
@@ -71,35 +121,76 @@ public:
 
     SizeT DropIF(std::function<bool(const CachedNodeBase &)> pred);
 
+    SizeT DropTable(const String &table_key);
+
     void ResetCacheNumCapacity(SizeT cache_num_capacity);
 
+    void ResetCacheMemoryCapacity(SizeT cache_memory_capacity);
+
+    void ResetPolicy(ResultCachePolicy policy);
+
     void ClearCache();
 
     SizeT cache_num_capacity() const { return cache_num_capacity_; }
 
+    SizeT cache_memory_capacity() const { return cache_memory_capacity_; }
+
+    ResultCachePolicy policy() const { return policy_; }
+
     SizeT cache_num_used() {
         std::lock_guard<std::mutex> lock(mtx_);
-        return lru_map_.size();
+        return cache_map_.size();
     }
 
+    ResultCacheStats Stats();
+
 private:
-    struct LRUEntry {
+    struct CacheEntry {
         UniquePtr<CachedNodeBase> cached_node_;
         SharedPtr<CacheContent> cache_content_;
+        String table_key_;
+        SizeT memory_size_{};
+        u64 frequency_{};
+        u64 last_access_{};
     };
-    using LRUList = List<LRUEntry>;
-    using LRUMap = HashMap<CachedNodeBase *, LRUList::iterator, CachedLogicalMatchBaseHash, CachedLogicalMatchBaseEq>;
+    // entries are evicted in ascending order of (frequency for kLFU or 0, last access)
+    using EvictKey = Pair<u64, u64>;
+    using CacheMap = HashMap<CachedNodeBase *, UniquePtr<CacheEntry>, CachedLogicalMatchBaseHash, CachedLogicalMatchBaseEq>;
+
+    EvictKey GetEvictKey(const CacheEntry &entry) const;
+
+    void Touch(CacheEntry &entry);
+
+    void RemoveEntry(CacheEntry *entry);
+
+    // Drops the entries of the table computed before query_ts, no new query can hit them.
+    void InvalidateTable(const String &table_key, TxnTimeStamp query_ts);
+
+    bool OverCapacity(SizeT extra_num, SizeT extra_memory) const;
 
     std::mutex mtx_;
 
     SizeT cache_num_capacity_;
-    LRUList lru_list_;
-    LRUMap lru_map_;
+    SizeT cache_memory_capacity_;
+    ResultCachePolicy policy_;
+
+    CacheMap cache_map_;
+    Map<EvictKey, CacheEntry *> evict_order_;
+    HashMap<String, HashSet<CacheEntry *>> table_entries_;
+    // the newest commit timestamp each table was cached at
+    HashMap<String, TxnTimeStamp> table_query_ts_;
+    FrequencySketch sketch_;
+    u64 access_clock_{};
+    SizeT memory_used_{};
+    ResultCacheStats stats_{};
 };
 
 export class ResultCacheManager {
 public:
-    ResultCacheManager(SizeT cache_num_capacity) : cache_map_(cache_num_capacity) {
+    ResultCacheManager(SizeT cache_num_capacity,
+                       SizeT cache_memory_capacity = std::numeric_limits<SizeT>::max(),
+                       ResultCachePolicy policy = ResultCachePolicy::kLRU)
+        : cache_map_(cache_num_capacity, cache_memory_capacity, policy) {
 #ifdef INFINITY_DEBUG
         GlobalResourceUsage::IncrObjectCount("ResultCacheManager");
 #endif
@@ -118,12 +209,22 @@ public:
 
     void ResetCacheNumCapacity(SizeT cache_num_capacity) { cache_map_.ResetCacheNumCapacity(cache_num_capacity); }
 
+    void ResetCacheMemoryCapacity(SizeT cache_memory_capacity) { cache_map_.ResetCacheMemoryCapacity(cache_memory_capacity); }
+
+    void ResetPolicy(ResultCachePolicy policy) { cache_map_.ResetPolicy(policy); }
+
     void ClearCache() { cache_map_.ClearCache(); }
 
     SizeT cache_num_capacity() const { return cache_map_.cache_num_capacity(); }
 
+    SizeT cache_memory_capacity() const { return cache_map_.cache_memory_capacity(); }
+
+    ResultCachePolicy policy() const { return cache_map_.policy(); }
+
     SizeT cache_num_used() { return cache_map_.cache_num_used(); }
 
+    ResultCacheStats Stats() { return cache_map_.Stats(); }
+
 private:
     CacheResultMap cache_map_;
 };
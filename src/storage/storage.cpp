@@ -190,8 +190,10 @@ Status Storage::AdminToReader() {
         result_cache_manager_.reset();
     }
     SizeT cache_result_num = config_ptr_->CacheResultNum();
+    SizeT cache_result_memory = config_ptr_->CacheResultMemory();
+    ResultCachePolicy cache_result_policy = ResultCachePolicyFromString(config_ptr_->CacheResultPolicy());
     if (result_cache_manager_ == nullptr) {
-        result_cache_manager_ = MakeUnique<ResultCacheManager>(cache_result_num);
+        result_cache_manager_ = MakeUnique<ResultCacheManager>(cache_result_num, cache_result_memory, cache_result_policy);
     }
 
     // Construct buffer manager
@@ -203,7 +205,8 @@ Status Storage::AdminToReader() {
                                             MakeShared<String>(config_ptr_->DataDir()),
                                             MakeShared<String>(config_ptr_->TempDir()),
                                             persistence_manager_.get(),
-                                            config_ptr_->LRUNum());
+                                            config_ptr_->LRUNum(),
+                                            config_ptr_->BufferManagerQuota());
     buffer_mgr_->Start();
 
     LOG_INFO("No checkpoint found in READER mode, waiting for log replication");
@@ -236,8 +239,10 @@ Status Storage::AdminToWriter() {
         result_cache_manager_.reset();
     }
     SizeT cache_result_num = config_ptr_->CacheResultNum();
+    SizeT cache_result_memory = config_ptr_->CacheResultMemory();
+    ResultCachePolicy cache_result_policy = ResultCachePolicyFromString(config_ptr_->CacheResultPolicy());
     if (result_cache_manager_ == nullptr) {
-        result_cache_manager_ = MakeUnique<ResultCacheManager>(cache_result_num);
+        result_cache_manager_ = MakeUnique<ResultCacheManager>(cache_result_num, cache_result_memory, cache_result_policy);
     }
 
     // Construct buffer manager
@@ -249,7 +254,8 @@ Status Storage::AdminToWriter() {
                                             MakeShared<String>(config_ptr_->DataDir()),
                                             MakeShared<String>(config_ptr_->TempDir()),
                                             persistence_manager_.get(),
-                                            config_ptr_->LRUNum());
+                                            config_ptr_->LRUNum(),
+                                            config_ptr_->BufferManagerQuota());
     buffer_mgr_->Start();
 
     // Must init catalog before txn manager.
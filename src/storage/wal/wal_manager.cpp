@@ -58,6 +58,7 @@ import base_table_ref;
 import cluster_manager;
 import admin_statement;
 import cleanup_scanner;
+import server_metrics;
 import global_resource_usage;
 import txn_state;
 import meta_info;
@@ -293,6 +294,7 @@ void WalManager::Flush() {
 
     Deque<Txn *> txn_batch{};
     ClusterManager *cluster_manager = nullptr;
+    ServerMetrics &server_metrics = ServerMetrics::instance();
     while (running_.load()) {
         wait_flush_.DequeueBulk(txn_batch);
         if (txn_batch.empty()) {
@@ -339,6 +341,7 @@ void WalManager::Flush() {
                 UnrecoverableError(error_message);
             }
             ofs_.write(buf->data(), ptr - buf->data());
+            server_metrics.WalFlushBytes().Add(act_size);
 
             if (InfinityContext::instance().GetServerRole() == NodeRole::kLeader) {
                 if (cluster_manager == nullptr) {
@@ -356,18 +359,21 @@ void WalManager::Flush() {
             break;
         }
 
-        switch (flush_option_) {
-            case FlushOptionType::kFlushAtOnce: {
-                ofs_.flush();
-                break;
-            }
-            case FlushOptionType::kOnlyWrite: {
-                ofs_.flush(); // FIXME: not flush, only write
-                break;
-            }
-            case FlushOptionType::kFlushPerSecond: {
-                ofs_.flush(); // FIXME: not flush, flush per second
-                break;
+        {
+            ScopedLatency flush_latency(server_metrics.WalFlush());
+            switch (flush_option_) {
+                case FlushOptionType::kFlushAtOnce: {
+                    ofs_.flush();
+                    break;
+                }
+                case FlushOptionType::kOnlyWrite: {
+                    ofs_.flush(); // FIXME: not flush, only write
+                    break;
+                }
+                case FlushOptionType::kFlushPerSecond: {
+                    ofs_.flush(); // FIXME: not flush, flush per second
+                    break;
+                }
             }
         }
 
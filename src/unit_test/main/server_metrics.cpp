@@ -0,0 +1,81 @@
+// Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "gtest/gtest.h"
+import base_test;
+
+import stl;
+import server_metrics;
+import base_statement;
+
+using namespace infinity;
+class ServerMetricsTest : public BaseTest {};
+
+TEST_F(ServerMetricsTest, counter) {
+    MetricCounter counter;
+    Vector<Thread> threads;
+    for (SizeT i = 0; i < 8; ++i) {
+        threads.emplace_back([&counter] {
+            for (SizeT j = 0; j < 1000; ++j) {
+                counter.Add();
+            }
+        });
+    }
+    for (auto &thread : threads) {
+        thread.join();
+    }
+    counter.Add(5);
+    EXPECT_EQ(counter.Value(), 8005u);
+}
+
+TEST_F(ServerMetricsTest, histogram) {
+    LatencyHistogram histogram;
+    histogram.Observe(0);
+    histogram.Observe(50'000);         // exactly 50us, a bucket counts values less or equal its bound
+    histogram.Observe(50'001);         // 100us bucket
+    histogram.Observe(3'000'000);      // 5ms bucket
+    histogram.Observe(20'000'000'000); // above 10s
+    Array<u64, kLatencyBuckets.size() + 1> bucket_counts{};
+    f64 sum_seconds = 0;
+    histogram.Collect(bucket_counts, sum_seconds);
+    EXPECT_EQ(bucket_counts[0], 2u);
+    EXPECT_EQ(bucket_counts[1], 1u);
+    EXPECT_EQ(bucket_counts[6], 1u);
+    EXPECT_EQ(bucket_counts.back(), 1u);
+    EXPECT_NEAR(sum_seconds, 20.003100001, 1e-9);
+}
+
+TEST_F(ServerMetricsTest, prometheus) {
+    ServerMetrics metrics;
+    metrics.RecordStatement(StatementType::kSelect, 2'000'000, false);
+    metrics.RecordStatement(StatementType::kSelect, 4'000'000, true);
+    metrics.WalFlushBytes().Add(128);
+    String output;
+    metrics.AppendPrometheus(output);
+    AppendPrometheusGauge(output, "infinity_test_gauge", "Test gauge.", 1.5);
+    AppendPrometheusCounters(output, "infinity_test_pool_total", "Test counters.", "pool", {{"hnsw", 3}, {"data", 4}});
+
+    EXPECT_NE(output.find("# TYPE infinity_statement_duration_seconds histogram\n"), String::npos);
+    EXPECT_NE(output.find("infinity_statement_duration_seconds_bucket{operation=\"select\",le=\"0.001\"} 0\n"), String::npos);
+    EXPECT_NE(output.find("infinity_statement_duration_seconds_bucket{operation=\"select\",le=\"0.0025\"} 1\n"), String::npos);
+    EXPECT_NE(output.find("infinity_statement_duration_seconds_bucket{operation=\"select\",le=\"+Inf\"} 2\n"), String::npos);
+    EXPECT_NE(output.find("infinity_statement_duration_seconds_count{operation=\"select\"} 2\n"), String::npos);
+    EXPECT_NE(output.find("infinity_statement_errors_total{operation=\"select\"} 1\n"), String::npos);
+    // statement types that never ran are left out
+    EXPECT_EQ(output.find("operation=\"insert\""), String::npos);
+    EXPECT_NE(output.find("infinity_wal_flush_duration_seconds_count 0\n"), String::npos);
+    EXPECT_NE(output.find("infinity_wal_flush_bytes_total 128\n"), String::npos);
+    EXPECT_NE(output.find("# TYPE infinity_test_gauge gauge\ninfinity_test_gauge 1.5\n"), String::npos);
+    EXPECT_NE(output.find("infinity_test_pool_total{pool=\"hnsw\"} 3\ninfinity_test_pool_total{pool=\"data\"} 4\n"), String::npos);
+}
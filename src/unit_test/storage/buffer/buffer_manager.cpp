@@ -32,6 +32,7 @@ import config;
 import infinity_exception;
 import persistence_manager;
 import default_values;
+import file_worker_type;
 
 using namespace infinity;
 
@@ -263,6 +264,99 @@ TEST_F(BufferManagerTest, varfile_test) {
     }
 }
 
+TEST_F(BufferManagerTest, scan_resistance_test) {
+    const SizeT file_size = 100;
+    const SizeT hot_num = 2;
+    const SizeT scan_num = 10;
+
+    BufferManager buffer_mgr(4 * file_size, data_dir_, temp_dir_, nullptr, 1);
+    auto AllocateBuffer = [&](const String &name) {
+        auto file_name = MakeShared<String>(name);
+        auto file_worker =
+            MakeUnique<DataFileWorker>(data_dir_, temp_dir_, MakeShared<String>(""), file_name, file_size, buffer_mgr.persistence_manager());
+        auto *buffer_obj = buffer_mgr.AllocateBufferObject(std::move(file_worker));
+        buffer_obj->AddObjRc();
+        return buffer_obj;
+    };
+
+    Vector<BufferObj *> hot_objs;
+    for (SizeT i = 0; i < hot_num; ++i) {
+        hot_objs.push_back(AllocateBuffer(fmt::format("hot_{}", i)));
+        // loaded again after the first load, so they are protected
+        for (SizeT j = 0; j < 2; ++j) {
+            auto buffer_handle = hot_objs.back()->Load();
+        }
+    }
+    // a scan loading every block once evicts the blocks of the scan, not the hot ones
+    for (SizeT i = 0; i < scan_num; ++i) {
+        auto *buffer_obj = AllocateBuffer(fmt::format("scan_{}", i));
+        auto buffer_handle = buffer_obj->Load();
+    }
+    for (auto *buffer_obj : hot_objs) {
+        EXPECT_EQ(buffer_obj->status(), BufferStatus::kUnloaded);
+    }
+    EXPECT_EQ(buffer_mgr.memory_usage(), 4 * file_size);
+    EXPECT_EQ(buffer_mgr.EvictCount(), hot_num + scan_num - 4);
+
+    Vector<BufferPoolInfo> pools_info = buffer_mgr.GetBufferPoolsInfo();
+    ASSERT_EQ(pools_info.size(), 1u);
+    EXPECT_EQ(pools_info[0].file_type_, FileWorkerType::kDataFile);
+    EXPECT_EQ(pools_info[0].request_count_, 2 * hot_num + scan_num);
+    EXPECT_EQ(pools_info[0].cache_miss_count_, hot_num + scan_num);
+    EXPECT_EQ(pools_info[0].evict_count_, hot_num + scan_num - 4);
+}
+
+TEST_F(BufferManagerTest, pool_quota_test) {
+    const SizeT file_size = 100;
+    const SizeT file_num = 5;
+    const SizeT data_size = 25;
+
+    SharedPtr<PersistenceManager> persistence_manager_ =
+        MakeShared<PersistenceManager>(*persistence_dir_, *data_dir_, DEFAULT_PERSISTENCE_OBJECT_SIZE_LIMIT);
+    BufferManager buffer_mgr(10 * file_size,
+                             data_dir_,
+                             temp_dir_,
+                             persistence_manager_.get(),
+                             DEFAULT_BUFFER_MANAGER_LRU_COUNT,
+                             {{FileWorkerType::kDataFile, 2 * file_size}});
+
+    auto var_file_worker =
+        MakeUnique<VarFileWorker>(data_dir_, temp_dir_, MakeShared<String>(), MakeShared<String>("var"), 0, buffer_mgr.persistence_manager());
+    auto *var_obj = buffer_mgr.AllocateBufferObject(std::move(var_file_worker));
+    var_obj->AddObjRc();
+    {
+        auto data = MakeUnique<char[]>(data_size);
+        auto handle = var_obj->Load();
+        auto *buffer = reinterpret_cast<VarBuffer *>(handle.GetDataMut());
+        buffer->Append(data.get(), data_size);
+    }
+
+    for (SizeT i = 0; i < file_num; ++i) {
+        auto file_name = MakeShared<String>(fmt::format("file_{}", i));
+        auto file_worker =
+            MakeUnique<DataFileWorker>(data_dir_, temp_dir_, MakeShared<String>(""), file_name, file_size, buffer_mgr.persistence_manager());
+        auto *buffer_obj = buffer_mgr.AllocateBufferObject(std::move(file_worker));
+        buffer_obj->AddObjRc();
+        auto buffer_handle = buffer_obj->Load();
+    }
+    // the data files over the quota are evicted though there is memory left, the var file stays
+    EXPECT_EQ(var_obj->status(), BufferStatus::kUnloaded);
+    EXPECT_EQ(buffer_mgr.memory_usage(), 2 * file_size + data_size);
+
+    for (const auto &pool_info : buffer_mgr.GetBufferPoolsInfo()) {
+        if (pool_info.file_type_ == FileWorkerType::kDataFile) {
+            EXPECT_EQ(pool_info.quota_, 2 * file_size);
+            EXPECT_EQ(pool_info.memory_usage_, 2 * file_size);
+            EXPECT_EQ(pool_info.evict_count_, file_num - 2);
+        } else {
+            EXPECT_EQ(pool_info.file_type_, FileWorkerType::kVarFile);
+            EXPECT_EQ(pool_info.quota_, 0u);
+            EXPECT_EQ(pool_info.memory_usage_, data_size);
+            EXPECT_EQ(pool_info.evict_count_, 0u);
+        }
+    }
+}
+
 struct FileInfo {
     FileInfo(int file_id) : file_id_(file_id) {}
 
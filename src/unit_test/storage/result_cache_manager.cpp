@@ -18,11 +18,14 @@ using namespace infinity;
 
 class MockCachedNode : public CachedNodeBase {
 public:
-    MockCachedNode(String key, SharedPtr<Vector<String>> output_names) : CachedNodeBase(LogicalNodeType::kMock, output_names), key_(std::move(key)) {}
+    MockCachedNode(String key, SharedPtr<Vector<String>> output_names, String table_key = {}, TxnTimeStamp query_ts = 0)
+        : CachedNodeBase(LogicalNodeType::kMock, output_names), key_(std::move(key)), table_key_(std::move(table_key)), query_ts_(query_ts) {}
 
     u64 Hash() const override {
         u64 h = CachedNodeBase::Hash();
         h ^= std::hash<String>{}(key_);
+        h ^= std::hash<String>{}(table_key_);
+        h ^= std::hash<TxnTimeStamp>{}(query_ts_);
         return h;
     }
 
@@ -31,13 +34,34 @@ public:
             return false;
         }
         const auto &other = static_cast<const MockCachedNode &>(other_base);
-        return key_ == other.key_;
+        return key_ == other.key_ && table_key_ == other.table_key_ && query_ts_ == other.query_ts_;
     }
 
+    String table_key() const override { return table_key_; }
+
+    TxnTimeStamp query_ts() const override { return query_ts_; }
+
 private:
     String key_;
+    String table_key_;
+    TxnTimeStamp query_ts_;
 };
 
+namespace {
+
+Vector<UniquePtr<DataBlock>> MakeBlocks(SizeT &memory_size) {
+    auto output_types = Vector<SharedPtr<DataType>>{MakeUnique<DataType>(LogicalType::kInteger)};
+    auto block = MakeUnique<DataBlock>();
+    block->Init(output_types, 1);
+    block->Finalize();
+    memory_size = block->GetSizeInBytes();
+    Vector<UniquePtr<DataBlock>> blocks;
+    blocks.push_back(std::move(block));
+    return blocks;
+}
+
+} // namespace
+
 TEST(ResultCacheManagerTest, test1) {
     ResultCacheManager cache_manager(100);
 
@@ -135,3 +159,106 @@ TEST(ResultCacheManagerTest, test2) {
     auto res2 = cache_manager.GetCache(*cached_node21);
     EXPECT_FALSE(res2.has_value());
 }
+
+TEST(ResultCacheManagerTest, memory_budget) {
+    SizeT block_size = 0;
+    MakeBlocks(block_size);
+    ResultCacheManager cache_manager(100, block_size * 2 + block_size / 2);
+    auto output_names = MakeShared<Vector<String>>(Vector<String>{"col1"});
+
+    for (const char *key : {"key1", "key2", "key3"}) {
+        EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>(key, output_names), MakeBlocks(block_size)));
+    }
+    // key1 was evicted to stay in the byte budget
+    EXPECT_FALSE(cache_manager.GetCache(MockCachedNode("key1", output_names)).has_value());
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("key2", output_names)).has_value());
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("key3", output_names)).has_value());
+
+    ResultCacheStats stats = cache_manager.Stats();
+    EXPECT_EQ(stats.evictions_, 1u);
+    EXPECT_EQ(stats.cache_num_used_, 2u);
+    EXPECT_EQ(stats.memory_used_, block_size * 2);
+    EXPECT_EQ(stats.hits_, 2u);
+    EXPECT_EQ(stats.misses_, 1u);
+
+    // a result larger than the whole budget is not cached
+    cache_manager.ResetCacheMemoryCapacity(block_size / 2);
+    EXPECT_EQ(cache_manager.cache_num_used(), 0u);
+    EXPECT_FALSE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key4", output_names), MakeBlocks(block_size)));
+    EXPECT_EQ(cache_manager.Stats().rejections_, 1u);
+}
+
+TEST(ResultCacheManagerTest, lfu) {
+    SizeT block_size = 0;
+    auto output_names = MakeShared<Vector<String>>(Vector<String>{"col1"});
+    ResultCacheManager cache_manager(2, std::numeric_limits<SizeT>::max(), ResultCachePolicy::kLFU);
+
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key1", output_names), MakeBlocks(block_size)));
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("key1", output_names)).has_value());
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("key1", output_names)).has_value());
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key2", output_names), MakeBlocks(block_size)));
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("key2", output_names)).has_value());
+
+    // key2 is the most recently used but the least frequently used one
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key3", output_names), MakeBlocks(block_size)));
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("key1", output_names)).has_value());
+    EXPECT_FALSE(cache_manager.GetCache(MockCachedNode("key2", output_names)).has_value());
+
+    // with lru key1 goes first
+    cache_manager.ResetPolicy(ResultCachePolicy::kLRU);
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key4", output_names), MakeBlocks(block_size)));
+    EXPECT_FALSE(cache_manager.GetCache(MockCachedNode("key3", output_names)).has_value());
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("key1", output_names)).has_value());
+}
+
+TEST(ResultCacheManagerTest, tinylfu) {
+    SizeT block_size = 0;
+    auto output_names = MakeShared<Vector<String>>(Vector<String>{"col1"});
+    ResultCacheManager cache_manager(1, std::numeric_limits<SizeT>::max(), ResultCachePolicy::kTinyLFU);
+
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("hot", output_names), MakeBlocks(block_size)));
+    for (SizeT i = 0; i < 3; ++i) {
+        EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("hot", output_names)).has_value());
+    }
+    // a one-off query doesn't push out the hot result
+    EXPECT_FALSE(cache_manager.GetCache(MockCachedNode("cold", output_names)).has_value());
+    EXPECT_FALSE(cache_manager.AddCache(MakeUnique<MockCachedNode>("cold", output_names), MakeBlocks(block_size)));
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("hot", output_names)).has_value());
+
+    // once it is looked up more often it is admitted
+    for (SizeT i = 0; i < 5; ++i) {
+        EXPECT_FALSE(cache_manager.GetCache(MockCachedNode("cold", output_names)).has_value());
+    }
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("cold", output_names), MakeBlocks(block_size)));
+    EXPECT_FALSE(cache_manager.GetCache(MockCachedNode("hot", output_names)).has_value());
+
+    ResultCacheStats stats = cache_manager.Stats();
+    EXPECT_EQ(stats.rejections_, 1u);
+    EXPECT_EQ(stats.evictions_, 1u);
+}
+
+TEST(ResultCacheManagerTest, table_invalidation) {
+    SizeT block_size = 0;
+    auto output_names = MakeShared<Vector<String>>(Vector<String>{"col1"});
+    ResultCacheManager cache_manager(100);
+
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key1", output_names, "db.t1", 10), MakeBlocks(block_size)));
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key2", output_names, "db.t1", 10), MakeBlocks(block_size)));
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key1", output_names, "db.t2", 10), MakeBlocks(block_size)));
+    EXPECT_EQ(cache_manager.cache_num_used(), 3u);
+
+    // a query seeing a later commit of t1 drops the results of t1 computed before it
+    EXPECT_FALSE(cache_manager.GetCache(MockCachedNode("key3", output_names, "db.t1", 20)).has_value());
+    EXPECT_EQ(cache_manager.cache_num_used(), 1u);
+    // a result computed before that commit is not cached any more
+    EXPECT_FALSE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key1", output_names, "db.t1", 10), MakeBlocks(block_size)));
+    EXPECT_TRUE(cache_manager.AddCache(MakeUnique<MockCachedNode>("key1", output_names, "db.t1", 20), MakeBlocks(block_size)));
+
+    EXPECT_EQ(cache_manager.DropTable("db", "t2"), 1u);
+    EXPECT_FALSE(cache_manager.GetCache(MockCachedNode("key1", output_names, "db.t2", 10)).has_value());
+    EXPECT_TRUE(cache_manager.GetCache(MockCachedNode("key1", output_names, "db.t1", 20)).has_value());
+
+    ResultCacheStats stats = cache_manager.Stats();
+    EXPECT_EQ(stats.invalidations_, 3u);
+    EXPECT_EQ(stats.rejections_, 1u);
+}
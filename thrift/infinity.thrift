@@ -171,6 +171,7 @@ union EmbeddingData {
 8: list<double> f64_array_value,
 9: list<double> f16_array_value,
 10: list<double> bf16_array_value,
+11: binary raw_data,
 }
 
 struct InitParameter {
@@ -297,6 +298,8 @@ JSONL,
 FVECS,
 CSR,
 BVECS,
+PARQUET,
+ARROW,
 }
 
 enum ColumnType {
@@ -544,6 +547,8 @@ struct InsertRequest {
 2:  string table_name,
 3:  list<Field> fields = [],
 4:  i64 session_id,
+5:  list<ColumnDef> column_defs = [],
+6:  list<ColumnField> column_fields = [],
 }
 
 struct ImportRequest{
@@ -552,6 +557,11 @@ struct ImportRequest{
 3:  string file_name,
 4:  ImportOption import_option,
 5:  i64 session_id,
+6:  binary data,
+7:  i64 import_id,
+8:  bool last_chunk,
+9:  i64 chunk_index,
+10: bool abort_import,
 }
 
 struct ExportRequest{
@@ -610,6 +620,9 @@ struct SelectRequest {
 11: optional ParsedExpr offset_expr,
 12: optional list<OrderByExpr> order_by_list = [],
 13: optional bool total_hits_count,
+// query vectors sent in one round trip, the server runs the select once per vector
+14: list<EmbeddingData> batch_embedding_data = [],
+15: optional bool profile,
 }
 
 struct SelectResponse {
@@ -618,6 +631,7 @@ struct SelectResponse {
 3: list<ColumnDef> column_defs = [],
 4: list<ColumnField> column_fields = [];
 5: string extra_result;
+6: list<i64> batch_block_counts = [];
 }
 
 struct DeleteRequest {